@@ -0,0 +1,120 @@
+"""Persistent, size-bounded cache for downloaded podcast audio.
+
+Audio is stored already clipped to max_audio_minutes, keyed by a hash of the
+episode's audio_url, so a retry run (e.g. the 17:00 cron after a failed
+transcription at 14:00) can skip the download entirely.  Interrupted direct
+downloads are kept as ``.part`` files and resumed with an HTTP Range request.
+
+Layout::
+
+    <cache_dir>/
+      <key>.<N>m.mp3    ← complete, clipped audio (N = max_audio_minutes)
+      <key>.<N>m.part   ← partial direct download, resumed on the next attempt
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Cached audio untouched for longer than this is removed on the next prune
+AUDIO_CACHE_TTL_DAYS = 3
+
+_KEY_LENGTH = 16
+
+
+def audio_cache_key(audio_url: str) -> str:
+    """Return the stable cache key for an audio URL."""
+    return hashlib.sha1(audio_url.encode()).hexdigest()[:_KEY_LENGTH]
+
+
+def audio_cache_paths(cache_dir: Path, audio_url: str, max_audio_minutes: int) -> tuple[Path, Path]:
+    """Return (final_path, partial_path) for an audio URL clipped to max_audio_minutes.
+
+    The clip length is part of the file name so that changing max_audio_minutes
+    in config.yaml never serves audio clipped to the old length.
+    """
+    stem = f"{audio_cache_key(audio_url)}.{max_audio_minutes}m"
+    return cache_dir / f"{stem}.mp3", cache_dir / f"{stem}.part"
+
+
+def get_cached_audio(cache_dir: Path, audio_url: str, max_audio_minutes: int) -> Optional[Path]:
+    """Return the cached audio path if a complete file exists, else None.
+
+    Touches the file so that size-based pruning evicts least recently used first.
+    """
+    final_path, _ = audio_cache_paths(cache_dir, audio_url, max_audio_minutes)
+    if not final_path.exists() or final_path.stat().st_size == 0:
+        return None
+    final_path.touch()
+    return final_path
+
+
+def evict_audio(cache_dir: Path, audio_url: str) -> int:
+    """Remove every cached file (complete or partial) for an audio URL.
+
+    Called once the episode is marked processed.  Returns the number of files removed.
+    """
+    if not cache_dir.exists():
+        return 0
+    removed = 0
+    for path in cache_dir.glob(f"{audio_cache_key(audio_url)}.*"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError as e:
+            logger.debug(f"Could not remove cached audio {path.name}: {e}")
+    return removed
+
+
+def prune_audio_cache(
+    cache_dir: Path,
+    max_bytes: int,
+    max_age_days: int = AUDIO_CACHE_TTL_DAYS,
+) -> list[str]:
+    """Remove expired cache files, then the least recently used until under max_bytes.
+
+    Returns list of removed file names (for logging).
+    """
+    return prune_cache_dir(cache_dir, max_bytes, max_age_days, label="Audio cache")
+
+
+def prune_cache_dir(cache_dir: Path, max_bytes: int, max_age_days: int, label: str) -> list[str]:
+    """Size/TTL eviction shared by the on-disk caches (audio, Gemini responses).
+
+    Files untouched for max_age_days are removed first, then the least recently
+    used until the directory is under max_bytes.  Returns removed file names.
+    """
+    if not cache_dir.exists():
+        return []
+
+    cutoff = time.time() - max_age_days * 86400
+    removed = []
+    survivors = []
+    for path in cache_dir.iterdir():
+        if not path.is_file():
+            continue
+        stat = path.stat()
+        if stat.st_mtime < cutoff:
+            path.unlink()
+            removed.append(path.name)
+        else:
+            survivors.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in survivors)
+    for _, size, path in sorted(survivors):
+        if total <= max_bytes:
+            break
+        path.unlink()
+        removed.append(path.name)
+        total -= size
+
+    if removed:
+        logger.info(f"{label}: removed {len(removed)} file(s), {total // (1024 * 1024)}MB retained")
+    return removed
+
@@ -0,0 +1,174 @@
+"""Per-source posting cadence learned from earlier fetches.
+
+Every run used to list every channel and feed in full, although a channel
+that posts weekly has nothing new on most days.  CadenceModel keeps the
+publication times of each source's recent uploads (in state, like the
+scheduler's DurationModel) and plans the next fetch from them:
+
+- a source is skipped while less than half its median gap between uploads
+  has passed since its last upload;
+- a source whose uploads cluster around one time of day is skipped until
+  that time has come round again since the last fetch (feeds with real
+  publication times only — YouTube upload dates carry no time);
+- the fetch size follows the source's busiest stretch: bursty channels get
+  a larger --playlist-end than max_videos_per_channel, quiet ones a smaller.
+
+No source is skipped for longer than cadence_max_skip_hours, and a fetch
+after a skip widens its lookback to cover everything since the last one,
+so skipping only ever delays an item.  Sources with too little history are
+always fetched at the configured size.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import statistics
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Publication times kept per source
+_MAX_UPLOADS = 30
+# Fewer uploads than this and the source is always fetched as configured
+_MIN_UPLOADS = 5
+# Skip while less than this share of the median gap has passed since the last upload
+_SKIP_GAP_FRACTION = 0.5
+# Time-of-day skipping: uploads within this many hours of the typical hour ...
+_SLOT_TOLERANCE_HOURS = 2
+# ... must make up this share of the history, for sources posting at most daily
+_SLOT_SHARE = 0.8
+_SLOT_MIN_GAP = timedelta(hours=20)
+# A bursty source's fetch size is capped at this multiple of the configured one
+_MAX_FETCH_FACTOR = 3
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """What the next fetch of one source should do."""
+    fetch: bool
+    max_items: int
+    lookback_hours: int
+    reason: str = ""            # why the fetch is skipped
+
+
+def _hours(delta: timedelta) -> str:
+    hours = delta.total_seconds() / 3600
+    return f"{hours / 24:.1f} days" if hours >= 48 else f"{hours:.0f}h"
+
+
+class CadenceModel:
+    """Recent upload times and last fetch time per source name.
+
+    history is the dict returned by history() on a previous run (kept in state).
+    """
+
+    def __init__(self, history: Optional[dict] = None):
+        self._uploads: dict[str, list[datetime]] = {}
+        self._checked: dict[str, datetime] = {}
+        for name, entry in (history or {}).items():
+            if not isinstance(entry, dict):
+                continue
+            try:
+                self._uploads[name] = sorted(datetime.fromisoformat(u) for u in entry.get("uploads", []))
+                if entry.get("checked"):
+                    self._checked[name] = datetime.fromisoformat(entry["checked"])
+            except (TypeError, ValueError):
+                logger.debug(f"Ignoring unreadable cadence history for {name}")
+                self._uploads.pop(name, None)
+
+    def plan(
+        self,
+        name: str,
+        max_items: int,
+        lookback_hours: int,
+        max_skip_hours: int,
+        now: Optional[datetime] = None,
+    ) -> FetchPlan:
+        now = now or datetime.now(timezone.utc)
+        checked = self._checked.get(name)
+        if checked is not None:
+            # Cover everything since the last fetch, however long the skip was
+            since_check = math.ceil((now - checked).total_seconds() / 3600) + 1
+            lookback_hours = max(lookback_hours, since_check)
+        uploads = self._uploads.get(name, [])
+        if len(uploads) < _MIN_UPLOADS:
+            return FetchPlan(True, max_items, lookback_hours)
+
+        fetch_size = self._fetch_size(uploads, max_items, lookback_hours)
+        if checked is None or now - checked >= timedelta(hours=max_skip_hours):
+            return FetchPlan(True, fetch_size, lookback_hours)
+        gap = statistics.median(b - a for a, b in zip(uploads, uploads[1:]))
+        since_upload = now - uploads[-1]
+        if since_upload < gap * _SKIP_GAP_FRACTION:
+            return FetchPlan(
+                False, fetch_size, lookback_hours,
+                f"posts every ~{_hours(gap)}, last {_hours(since_upload)} ago",
+            )
+        hour = self._typical_hour(uploads)
+        if hour is not None and gap >= _SLOT_MIN_GAP and not self._slot_since(hour, checked, now):
+            return FetchPlan(False, fetch_size, lookback_hours, f"usually posts around {hour:02d}:00 UTC")
+        return FetchPlan(True, fetch_size, lookback_hours)
+
+    def observe(self, name: str, published: Iterable[datetime], now: Optional[datetime] = None) -> None:
+        """Record a successful fetch of name and the publication times it found."""
+        uploads = set(self._uploads.get(name, []))
+        uploads.update(p.astimezone(timezone.utc) for p in published)
+        self._uploads[name] = sorted(uploads)[-_MAX_UPLOADS:]
+        self._checked[name] = now or datetime.now(timezone.utc)
+
+    def history(self) -> dict:
+        """The learned history, for state."""
+        names = set(self._uploads) | set(self._checked)
+        history = {}
+        for name in sorted(names):
+            entry = {"uploads": [u.isoformat() for u in self._uploads.get(name, [])]}
+            if name in self._checked:
+                entry["checked"] = self._checked[name].isoformat()
+            history[name] = entry
+        return history
+
+    @staticmethod
+    def _fetch_size(uploads: list[datetime], max_items: int, lookback_hours: int) -> int:
+        """Most uploads seen in any lookback-long stretch, plus one; capped around max_items."""
+        window = timedelta(hours=lookback_hours)
+        peak, start = 0, 0
+        for end, upload in enumerate(uploads):
+            while upload - uploads[start] > window:
+                start += 1
+            peak = max(peak, end - start + 1)
+        return max(min(peak + 1, max_items * _MAX_FETCH_FACTOR), min(2, max_items))
+
+    @staticmethod
+    def _typical_hour(uploads: list[datetime]) -> Optional[int]:
+        """The UTC hour most uploads fall near, if they cluster; None for date-only times."""
+        times = [u.astimezone(timezone.utc) for u in uploads]
+        if all(t.hour == t.minute == t.second == 0 for t in times):
+            return None
+
+        def distance(t: datetime, hour: int) -> float:
+            hours = abs(t.hour + t.minute / 60 - hour)
+            return min(hours, 24 - hours)
+
+        def near_count(hour: int) -> int:
+            return sum(distance(t, hour) <= _SLOT_TOLERANCE_HOURS for t in times)
+
+        # Most uploads nearby, ties going to the hour closest to them all
+        best = max(range(24), key=lambda hour: (near_count(hour), -sum(distance(t, hour) for t in times)))
+        if near_count(best) >= _SLOT_SHARE * len(times):
+            return best
+        return None
+
+    @staticmethod
+    def _slot_since(hour: int, checked: datetime, now: datetime) -> bool:
+        """Whether a posting window around hour (UTC) has been open since checked."""
+        now = now.astimezone(timezone.utc)
+        opens = now.replace(hour=hour, minute=0, second=0, microsecond=0) - timedelta(hours=_SLOT_TOLERANCE_HOURS)
+        # The latest window to open: today's, yesterday's, or (near midnight) tomorrow's slot
+        if opens > now:
+            opens -= timedelta(days=1)
+        elif opens + timedelta(days=1) <= now:
+            opens += timedelta(days=1)
+        return opens + timedelta(hours=2 * _SLOT_TOLERANCE_HOURS) > checked
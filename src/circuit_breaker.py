@@ -0,0 +1,148 @@
+"""Run-wide circuit breaker for Gemini server-error storms.
+
+During a Gemini outage every item would otherwise spend its full retry
+budget (five attempts with up to 40s backoff) on calls that cannot succeed.
+The breaker watches every Gemini request in the process:
+
+- closed:    requests flow; consecutive 5xx / UNAVAILABLE / timeout errors
+             are counted and a success resets the count.  Other errors
+             (400, 429, auth) say nothing about an outage and leave it as is.
+- open:      after failure_threshold consecutive server errors, requests fail
+             fast with CircuitOpenError for cooldown_seconds.  The caller
+             defers the item to state["pending"] for the next run.
+- half-open: once the cooldown has passed, a single probe request is let
+             through.  Success closes the breaker and work resumes; a server
+             error opens it again for another cooldown; any other error
+             frees the probe slot for the next request without closing it.
+
+A run that ends with the breaker open records that in state, and the next
+run starts half-open, so its first request is a probe rather than the start
+of another full retry storm.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Consecutive server errors that trip the breaker
+BREAKER_FAILURE_THRESHOLD = 5
+# How long the breaker stays open before a half-open probe
+BREAKER_COOLDOWN_SECONDS = 120
+
+_CLOSED = "closed"
+_OPEN = "open"
+_HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Gemini while the breaker is open."""
+    pass
+
+
+def is_server_error(error: Exception) -> bool:
+    """True for 5xx / UNAVAILABLE / deadline errors — the ones that count towards tripping."""
+    text = str(error)
+    lowered = text.lower()
+    return (
+        any(code in text for code in ("500", "502", "503", "504"))
+        or "unavailable" in lowered
+        or "deadline_exceeded" in lowered
+    )
+
+
+class CircuitBreaker:
+    """Thread-safe closed / open / half-open breaker (see module docstring)."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds: float = BREAKER_COOLDOWN_SECONDS,
+        half_open: bool = False,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._state = _HALF_OPEN if half_open else _CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._tripped_at: Optional[str] = datetime.now(timezone.utc).isoformat() if half_open else None
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def tripped_at(self) -> Optional[str]:
+        """UTC ISO time the breaker last opened, or None while it is closed."""
+        return self._tripped_at
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now."""
+        with self._lock:
+            if self._state == _OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown_seconds:
+                    raise CircuitOpenError("Gemini circuit breaker is open — deferring request")
+                self._state = _HALF_OPEN
+                logger.info("Gemini circuit breaker half-open — sending a probe request")
+            if self._state == _HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError("Gemini circuit breaker is half-open — probe already in flight")
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != _CLOSED:
+                logger.info("Gemini circuit breaker closed — service responding again")
+            self._state = _CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+            self._tripped_at = None
+
+    def record_failure(self, error: Exception) -> None:
+        """Count a failed request; only server errors move the breaker towards open."""
+        if not is_server_error(error):
+            # A 4xx / 429 is no evidence either way: leave the count and state as they
+            # are, but let the next request probe if this one was the half-open probe
+            with self._lock:
+                self._probe_in_flight = False
+            return
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == _HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != _OPEN:
+                    logger.warning(
+                        f"Gemini circuit breaker open after {self._failures} consecutive server "
+                        f"error(s) — deferring Gemini work for {self.cooldown_seconds:.0f}s"
+                    )
+                self._state = _OPEN
+                self._opened_at = time.monotonic()
+                self._tripped_at = datetime.now(timezone.utc).isoformat()
+
+    def is_open(self) -> bool:
+        return self._state == _OPEN
+
+
+# The process-wide breaker every Gemini call goes through
+_breaker = CircuitBreaker()
+
+
+def configure_circuit_breaker(
+    failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+    cooldown_seconds: float = BREAKER_COOLDOWN_SECONDS,
+    half_open: bool = False,
+) -> None:
+    """Replace the process-wide breaker (half_open: start with a probe, e.g. after a tripped run)."""
+    global _breaker
+    _breaker = CircuitBreaker(failure_threshold, cooldown_seconds, half_open)
+
+
+def circuit_breaker() -> CircuitBreaker:
+    return _breaker
@@ -0,0 +1,349 @@
+"""Multi-key / multi-model Gemini client pool with rate-limit failover.
+
+One API key on the free tier caps the run at ~15 RPM and a daily request
+budget; when either runs out the whole run stops.  ClientPool spreads
+requests over several keys (read from the environment variables named in
+config.yaml) and an ordered list of models:
+
+- Each request goes to the highest-priority model that still has a usable
+  key, and among its keys to the one whose next request slot comes first.
+  Every key+model lane is paced on its own (POOL_RPM_PER_LANE requests a
+  minute, evenly spaced), so the shared throttle is not needed on top.
+- A 429 / RESOURCE_EXHAUSTED response benches that key+model lane (for a
+  minute on rate limits, for the rest of the run on daily quota) and the
+  request is retried on the next lane immediately.
+- Only when every lane is benched does the last error reach the caller, so
+  the existing retry/backoff and QuotaExhaustedError handling still apply.
+- A response served by another model after failover comes back as a
+  ServedResponse, so usage is recorded against the model that actually
+  answered (see served_model).
+
+ClientPool exposes the same ``models`` / ``files`` / ``caches`` surface the
+pipeline already uses on genai.Client, so it can be passed anywhere a client
+is.  Uploads and cached content are spread over the keys like requests,
+but each can only be read by the key that created it: the pool remembers
+the owner of every name and pins requests that reference it to that key
+(and, for cached content, to its model).  Files from earlier runs are found
+by asking each key in turn.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from google import genai
+
+logger = logging.getLogger(__name__)
+
+# Free-tier requests per minute per key and model
+POOL_RPM_PER_LANE = 15
+# A rate-limited lane is skipped for this long
+_RATE_LIMIT_COOLDOWN_SECONDS = 60
+_MINUTE_SECONDS = 60
+# Requests on one lane start at least this far apart
+_LANE_SPACING_SECONDS = _MINUTE_SECONDS / POOL_RPM_PER_LANE
+
+
+@dataclass
+class _Lane:
+    """One (key, model) pair and its recent usage."""
+    key_index: int
+    client: genai.Client
+    model: str
+    recent: deque = field(default_factory=deque)   # monotonic request times
+    next_slot: float = 0.0                          # earliest start of the next request
+    cooldown_until: float = 0.0
+    exhausted: bool = False
+
+    def remaining(self, now: float) -> int:
+        while self.recent and now - self.recent[0] >= _MINUTE_SECONDS:
+            self.recent.popleft()
+        return POOL_RPM_PER_LANE - len(self.recent)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """True for 429 / RESOURCE_EXHAUSTED responses (per-minute or daily)."""
+    return "429" in str(error) or "resource_exhausted" in str(error).lower()
+
+
+def is_daily_quota_error(error: Exception) -> bool:
+    """True if a rate-limit error is the daily quota rather than RPM."""
+    error_str = str(error).lower()
+    return "daily" in error_str or "per day" in error_str or "quota exceeded" in error_str
+
+
+class ServedResponse:
+    """A response (or stream chunk) from a fallback model; reads through to the response."""
+
+    def __init__(self, response, served_model: str):
+        self._response = response
+        self.served_model = served_model
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+
+def served_model(response, requested: str) -> str:
+    """The model that answered response: requested, unless a pool failed over to another."""
+    return response.served_model if isinstance(response, ServedResponse) else requested
+
+
+def create_client_pool(
+    api_key_envs: tuple[str, ...],
+    models: tuple[str, ...],
+) -> "ClientPool":
+    """Build a ClientPool from the API keys in the named environment variables.
+
+    Variables that are unset are skipped with a warning; at least one must be set.
+    """
+    clients = []
+    for name in api_key_envs:
+        key = os.environ.get(name)
+        if key:
+            clients.append(genai.Client(api_key=key))
+        else:
+            logger.warning(f"Gemini key variable {name} is not set — skipping it")
+    if not clients:
+        raise ValueError(
+            f"None of the Gemini key variables are set: {', '.join(api_key_envs)}. "
+            "Set at least one of them in the environment."
+        )
+    logger.info(f"Gemini client pool: {len(clients)} key(s) × {len(models)} model(s)")
+    return ClientPool(clients, models)
+
+
+class ClientPool:
+    """Routes generate_content calls across keys and models (see module docstring)."""
+
+    def __init__(self, clients: list[genai.Client], models: tuple[str, ...]):
+        self._lanes = [
+            _Lane(key_index=i, client=client, model=model)
+            for model in models
+            for i, client in enumerate(clients)
+        ]
+        self._clients = list(clients)
+        self._models = tuple(models)
+        self._lock = threading.Lock()
+        # File / cached-content name -> index of the key that created it
+        self._owners: dict[str, int] = {}
+        self.models = _PoolModels(self)
+        self.files = _PoolFiles(self)
+        self.caches = _PoolCaches(self)
+
+    @property
+    def key_count(self) -> int:
+        return len({lane.key_index for lane in self._lanes})
+
+    def _ensure_lanes(self, model: str) -> None:
+        """Give a model outside the fallback list (e.g. from model_routes) its own lanes."""
+        with self._lock:
+            if any(lane.model == model for lane in self._lanes):
+                return
+            self._lanes.extend(
+                _Lane(key_index=i, client=client, model=model)
+                for i, client in enumerate(self._clients)
+            )
+
+    def _usable(self, model: str, now: float, pin_key: Optional[int] = None, tried: frozenset = frozenset()) -> list:
+        return [
+            lane for lane in self._lanes
+            if lane.model == model
+            and not lane.exhausted
+            and lane.cooldown_until <= now
+            and (lane.key_index, lane.model) not in tried
+            and (pin_key is None or lane.key_index == pin_key)
+        ]
+
+    @staticmethod
+    def _soonest(lanes: list, now: float) -> _Lane:
+        """The lane that can start a request first, most budget left on ties."""
+        return min(lanes, key=lambda l: (max(l.next_slot, now), -l.remaining(now)))
+
+    def _pick(self, models: tuple[str, ...], pin_key: Optional[int], tried: set) -> tuple[Optional[_Lane], float]:
+        """Reserve the next slot on the best lane; returns it and how long to wait for it."""
+        now = time.monotonic()
+        with self._lock:
+            for model in models:
+                candidates = self._usable(model, now, pin_key, frozenset(tried))
+                if candidates:
+                    lane = self._soonest(candidates, now)
+                    start = max(lane.next_slot, now)
+                    lane.next_slot = start + _LANE_SPACING_SECONDS
+                    lane.recent.append(start)
+                    return lane, start - now
+        return None, 0.0
+
+    def _key_for_new(self, model: str) -> int:
+        """The key a new upload or cache should live on: the one least busy on model."""
+        self._ensure_lanes(model)
+        now = time.monotonic()
+        with self._lock:
+            candidates = self._usable(model, now)
+            return self._soonest(candidates, now).key_index if candidates else 0
+
+    def _record_owner(self, name: str, key_index: int) -> None:
+        with self._lock:
+            self._owners[name] = key_index
+
+    def _owner_of(self, name) -> Optional[int]:
+        if not isinstance(name, str):
+            return None
+        with self._lock:
+            return self._owners.get(name)
+
+    def _call_owner(self, surface: str, method: str, name: str, **kwargs):
+        """Call files/caches.<method>(name=...) on the key that owns name.
+
+        A name the pool has not seen (an upload from an earlier run) is tried
+        on each key in turn, and the key that answers is recorded as its owner.
+        """
+        owner = self._owner_of(name)
+        if owner is not None:
+            return getattr(getattr(self._clients[owner], surface), method)(name=name, **kwargs)
+        last_error: Optional[Exception] = None
+        for index, client in enumerate(self._clients):
+            try:
+                result = getattr(getattr(client, surface), method)(name=name, **kwargs)
+            except Exception as e:
+                last_error = e
+                continue
+            self._record_owner(name, index)
+            return result
+        raise last_error
+
+    def _pinned_key(self, contents, cached_content) -> Optional[int]:
+        """The key that owns the cached content or an uploaded file in contents, if any."""
+        if cached_content:
+            owner = self._owner_of(cached_content)
+            return 0 if owner is None else owner
+        if isinstance(contents, list):
+            for part in contents:
+                if not isinstance(part, str):
+                    owner = self._owner_of(getattr(part, "name", None))
+                    if owner is not None:
+                        return owner
+        return None
+
+    def _bench(self, lane: _Lane, error: Exception) -> None:
+        with self._lock:
+            if is_daily_quota_error(error):
+                lane.exhausted = True
+                logger.warning(f"  Gemini key #{lane.key_index + 1} / {lane.model}: daily quota exhausted — failing over")
+            else:
+                lane.cooldown_until = time.monotonic() + _RATE_LIMIT_COOLDOWN_SECONDS
+                logger.warning(f"  Gemini key #{lane.key_index + 1} / {lane.model}: rate limited — failing over")
+
+    def dispatch(self, method: str, model: str, contents, config=None):
+        """Send one request, failing over between lanes on rate limits."""
+        self._ensure_lanes(model)
+        cached_content = getattr(config, "cached_content", None)
+        if cached_content:
+            models = (model,)
+        else:
+            models = (model,) + tuple(m for m in self._models if m != model)
+        # Uploaded files and cached content can only be read by the key that created them
+        pin_key = self._pinned_key(contents, cached_content)
+
+        tried: set = set()
+        last_error: Optional[Exception] = None
+        while True:
+            lane, wait = self._pick(models, pin_key, tried)
+            if lane is None:
+                if last_error is not None:
+                    raise last_error
+                raise RuntimeError(
+                    "429 RESOURCE_EXHAUSTED: daily quota exhausted on every configured Gemini key/model"
+                )
+            tried.add((lane.key_index, lane.model))
+            if wait > 0:
+                time.sleep(wait)
+            kwargs = {"model": lane.model, "contents": contents}
+            if config is not None:
+                kwargs["config"] = config
+            try:
+                result = getattr(lane.client.models, method)(**kwargs)
+                if method == "generate_content_stream":
+                    # Rate limits surface on the first chunk of a stream
+                    result = _prime_stream(result)
+                    if lane.model != model:
+                        result = (ServedResponse(chunk, lane.model) for chunk in result)
+                elif lane.model != model:
+                    result = ServedResponse(result, lane.model)
+                return result
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    raise
+                self._bench(lane, e)
+                last_error = e
+
+
+class _PoolModels:
+    """The ``client.models`` surface of a ClientPool."""
+
+    def __init__(self, pool: ClientPool):
+        self._pool = pool
+
+    def generate_content(self, *, model: str, contents, config=None):
+        return self._pool.dispatch("generate_content", model, contents, config)
+
+    def generate_content_stream(self, *, model: str, contents, config=None):
+        return self._pool.dispatch("generate_content_stream", model, contents, config)
+
+
+class _PoolFiles:
+    """The ``client.files`` surface of a ClientPool: uploads go to the least busy key."""
+
+    def __init__(self, pool: ClientPool):
+        self._pool = pool
+
+    def upload(self, *, file, config=None):
+        key_index = self._pool._key_for_new(self._pool._models[0])
+        uploaded = self._pool._clients[key_index].files.upload(file=file, config=config)
+        self._pool._record_owner(uploaded.name, key_index)
+        return uploaded
+
+    def get(self, *, name: str, **kwargs):
+        return self._pool._call_owner("files", "get", name, **kwargs)
+
+    def delete(self, *, name: str, **kwargs):
+        return self._pool._call_owner("files", "delete", name, **kwargs)
+
+
+class _PoolCaches:
+    """The ``client.caches`` surface of a ClientPool: caches go to the least busy key."""
+
+    def __init__(self, pool: ClientPool):
+        self._pool = pool
+
+    def create(self, *, model: str, config=None):
+        key_index = self._pool._key_for_new(model)
+        cached = self._pool._clients[key_index].caches.create(model=model, config=config)
+        self._pool._record_owner(cached.name, key_index)
+        return cached
+
+    def get(self, *, name: str, **kwargs):
+        return self._pool._call_owner("caches", "get", name, **kwargs)
+
+    def delete(self, *, name: str, **kwargs):
+        return self._pool._call_owner("caches", "delete", name, **kwargs)
+
+
+def _prime_stream(stream) -> Iterator:
+    """Pull the first chunk now (so errors raise inside dispatch), then replay it."""
+    iterator = iter(stream)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+
+    def chained():
+        yield first
+        yield from iterator
+
+    return chained()
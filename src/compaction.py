@@ -0,0 +1,157 @@
+"""Deterministic transcript compaction before summarisation.
+
+Auto-generated YouTube captions are noisy: rolling captions repeat the tail of
+the previous line, non-speech markers like ``[Music]`` appear throughout, and
+filler words ("um", "uh") add tokens without meaning.  Prompt size drives both
+latency and quota, so transcripts are compacted once, right after fetching:
+
+1. Non-speech markers (``[Music]``, ``(applause)``, ``♪``, ``>>``) are removed.
+2. Standalone filler words are removed from English transcripts ("um" is a
+   real word in Portuguese and German, so other languages keep theirs).
+3. Runs of two or more words repeated from the end of the previous caption
+   are dropped, and captions that become empty are skipped.  A single
+   repeated word ("that | that") is left alone: speakers do repeat words.
+
+The timestamp index is sampled from the compacted snippets at an interval that
+grows with transcript length, so long videos don't get one anchor per 30s.
+The tokens saved are logged per item and added to the run's usage ledger.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from dataclasses import dataclass
+
+from src.usage_ledger import usage_ledger
+
+logger = logging.getLogger(__name__)
+
+# Rough token estimate for transcript text (Gemini averages ~4 chars/token)
+CHARS_PER_TOKEN = 4
+
+# Anchor spacing: never denser than every 30s, never more than 120 anchors
+_MIN_ANCHOR_INTERVAL_SECONDS = 30
+_MAX_ANCHORS = 120
+
+# Rolling captions rarely repeat more than a line's worth of words
+_MAX_OVERLAP_WORDS = 20
+# Shorter matches are as likely to be real repetition as rolling captions
+_MIN_OVERLAP_WORDS = 2
+
+# [Music], [Applause], [inaudible] — square brackets are never speech in captions;
+# parentheses only for known sound descriptions, since speakers do use them
+_NON_SPEECH_RE = re.compile(
+    r"\[[^\]]{1,30}\]"
+    r"|\((?:music|applause|laughter|laughs|inaudible|silence|cheering|crosstalk)\)"
+    r"|♪+|>>",
+    re.IGNORECASE,
+)
+_FILLER_RE = re.compile(r"\b(?:um+|uh+|uhm|erm|hmm+|mhm)\b[,.]?\s*", re.IGNORECASE)
+_SPACES_RE = re.compile(r"\s+")
+_WORD_STRIP = ".,!?;:\"'"
+
+
+@dataclass(frozen=True)
+class Snippet:
+    """One timed transcript line (caption or published-transcript cue).
+
+    Same shape as a youtube-transcript-api snippet, so fetched captions and
+    parsed podcast transcripts go through the same code.
+    """
+    start: float
+    text: str
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for prompt-size accounting."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def anchor_interval(total_seconds: float) -> int:
+    """Return the timestamp-anchor spacing for a transcript of total_seconds.
+
+    30s for anything up to an hour; longer transcripts are spread out so the
+    index stays at most _MAX_ANCHORS lines.  Rounded up to a multiple of 30s.
+    """
+    needed = math.ceil(total_seconds / _MAX_ANCHORS) if total_seconds > 0 else 0
+    steps = max(1, math.ceil(needed / _MIN_ANCHOR_INTERVAL_SECONDS))
+    return steps * _MIN_ANCHOR_INTERVAL_SECONDS
+
+
+def compact_snippets(raw: list, language: str = "en") -> list[Snippet]:
+    """Return cleaned, de-duplicated snippets (objects with .start and .text).
+
+    language is the transcript's language code; filler words are only
+    removed from English ("en", "en-US", ...).
+    """
+    strip_fillers = language.lower().split("-")[0] == "en"
+    compacted = []
+    previous_words: list[str] = []
+    for item in raw:
+        text = _NON_SPEECH_RE.sub(" ", item.text or "")
+        if strip_fillers:
+            text = _FILLER_RE.sub("", text)
+        words = _SPACES_RE.sub(" ", text).strip().split()
+        if not words:
+            continue
+        overlap = _overlap_length(previous_words, words)
+        words = words[overlap:]
+        if not words:
+            continue
+        compacted.append(Snippet(start=float(item.start), text=" ".join(words)))
+        previous_words = (previous_words + words)[-_MAX_OVERLAP_WORDS:]
+    return compacted
+
+
+def sample_segments(raw: list, interval_seconds: int = 30) -> tuple:
+    """Return a sparse sample of transcript segments for timestamp citation.
+
+    Picks one segment per `interval_seconds` window to give Gemini ~30s-resolution
+    time anchors without bloating the prompt with every line.
+
+    Returns a tuple of (start_seconds: int, text: str) pairs.
+    """
+    if not raw:
+        return ()
+    samples = []
+    next_threshold = 0.0
+    for snippet in raw:
+        # Snippets, or youtube-transcript-api v1.x snippet objects (.start, .text)
+        start = float(snippet.start)
+        if start >= next_threshold:
+            text = snippet.text.strip() if snippet.text else ""
+            if text:
+                samples.append((int(start), text))
+                next_threshold = start + interval_seconds
+            # If text is empty, don't advance the threshold — keep looking
+    return tuple(samples)
+
+
+def _overlap_length(previous: list[str], current: list[str]) -> int:
+    """Length of the longest suffix of previous that is a prefix of current (0 below _MIN_OVERLAP_WORDS)."""
+    prev = [_normalise(w) for w in previous[-_MAX_OVERLAP_WORDS:]]
+    curr = [_normalise(w) for w in current[:_MAX_OVERLAP_WORDS]]
+    for size in range(min(len(prev), len(curr)), _MIN_OVERLAP_WORDS - 1, -1):
+        if prev[-size:] == curr[:size]:
+            return size
+    return 0
+
+
+def _normalise(word: str) -> str:
+    return word.strip(_WORD_STRIP).lower()
+
+
+def log_savings(label: str, original_text: str, compacted_text: str) -> int:
+    """Log the per-item token saving, add it to the usage ledger and return it."""
+    before = estimate_tokens(original_text)
+    after = estimate_tokens(compacted_text)
+    saved = before - after
+    if before:
+        usage_ledger().record_compaction(saved)
+        logger.info(
+            f"  Transcript compacted for {label}: ~{before:,} → ~{after:,} tokens "
+            f"(saved ~{saved:,}, {saved * 100 // before}%)"
+        )
+    return saved
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+_DEADLINE_RE = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+
 
 @dataclass(frozen=True)
 class Category:
     name: str
     color: str
+    priority: int = 0
 
 
 @dataclass(frozen=True)
@@ -21,6 +25,8 @@ class YouTubeSource:
     name: str
     category: str
     language: str = "en"
+    priority: int = 0
+    poll_minutes: Optional[int] = None      # --daemon polling interval (default: daemon_poll_minutes)
 
 
 @dataclass(frozen=True)
@@ -29,6 +35,31 @@ class PodcastShow:
     name: str
     category: str
     language: str = "en"
+    priority: int = 0
+    poll_minutes: Optional[int] = None      # --daemon polling interval (default: daemon_poll_minutes)
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """Model and output limits for items in one duration / length bucket.
+
+    A route matches an item whose duration is at most max_minutes and whose
+    (estimated) input is at most max_input_tokens; unset bounds always match.
+    Unset model / max_output_tokens / thinking_budget keep the defaults.
+    """
+    name: str
+    max_minutes: Optional[int] = None
+    max_input_tokens: Optional[int] = None
+    model: Optional[str] = None
+    max_output_tokens: Optional[int] = None
+    thinking_budget: Optional[int] = None
+
+    def matches(self, duration_seconds: int, input_tokens: int) -> bool:
+        if self.max_minutes is not None and (duration_seconds <= 0 or duration_seconds > self.max_minutes * 60):
+            return False
+        if self.max_input_tokens is not None and input_tokens > self.max_input_tokens:
+            return False
+        return True
 
 
 @dataclass(frozen=True)
@@ -40,6 +71,38 @@ class Settings:
     max_episodes_per_show: int = 3
     min_episodes_per_show: int = 1
     max_audio_minutes: int = 60
+    audio_cache_max_mb: int = 1024
+    response_cache_max_mb: int = 256
+    chunk_long_episodes: bool = False
+    podcast_chunk_minutes: int = 20
+    max_chunked_audio_minutes: int = 240
+    max_parallel_chunks: int = 3
+    chunk_long_transcripts: bool = False
+    transcript_chunk_tokens: int = 30000
+    pack_short_videos: bool = False
+    max_videos_per_pack: int = 5
+    stream_summaries: bool = False
+    max_generation_seconds: int = 300
+    cache_prompt_prefix: bool = False
+    request_timeout_seconds: int = 600
+    hedge_requests: bool = False
+    breaker_failure_threshold: int = 5
+    breaker_cooldown_seconds: int = 120
+    max_input_tokens: int = 1_000_000
+    daily_request_budget: int = 250
+    # "HH:MM" PST by which the run must be done (None = no deadline)
+    run_deadline: Optional[str] = None
+    deadline_reserve_minutes: int = 10
+    backfill_parallel_items: int = 3
+    daemon_poll_minutes: int = 30
+    # Skip fetches of sources unlikely to have posted (see src/cadence.py)
+    learn_source_cadence: bool = True
+    cadence_max_skip_hours: int = 72
+    # Client pool: env var names holding API keys, extra models to fail over to
+    gemini_api_key_envs: tuple[str, ...] = ()
+    fallback_models: tuple[str, ...] = ()
+    # Duration / length buckets, first match wins (see ModelRoute)
+    model_routes: tuple[ModelRoute, ...] = ()
     notify_email: Optional[str] = None
 
 
@@ -120,7 +183,9 @@ def _parse_categories(raw: list) -> list[Category]:
         if name in seen:
             raise ConfigError(f"Duplicate category name: '{name}'")
         seen.add(name)
-        categories.append(Category(name=name, color=color))
+        categories.append(Category(
+            name=name, color=color, priority=_parse_priority(item, f"Category '{name}'"),
+        ))
 
     return categories
 
@@ -149,6 +214,8 @@ def _parse_youtube_sources(raw: dict) -> list[YouTubeSource]:
         sources.append(YouTubeSource(
             channel_url=channel_url, name=name, category=category,
             language=item.get("language", "en"),
+            priority=_parse_priority(item, f"YouTube source '{name}'"),
+            poll_minutes=_parse_poll_minutes(item, f"YouTube source '{name}'"),
         ))
 
     return sources
@@ -178,11 +245,29 @@ def _parse_podcast_shows(raw: dict) -> list[PodcastShow]:
         shows.append(PodcastShow(
             podcast_url=podcast_url, name=name, category=category,
             language=item.get("language", "en"),
+            priority=_parse_priority(item, f"Podcast show '{name}'"),
+            poll_minutes=_parse_poll_minutes(item, f"Podcast show '{name}'"),
         ))
 
     return shows
 
 
+def _parse_priority(item: dict, label: str) -> int:
+    val = item.get("priority", 0)
+    if not isinstance(val, int) or isinstance(val, bool):
+        raise ConfigError(f"{label}: 'priority' must be an int, got: {type(val).__name__}")
+    return val
+
+
+def _parse_poll_minutes(item: dict, label: str) -> Optional[int]:
+    val = item.get("poll_minutes")
+    if val is None:
+        return None
+    if not isinstance(val, int) or isinstance(val, bool) or val <= 0:
+        raise ConfigError(f"{label}: 'poll_minutes' must be a positive int, got: {val!r}")
+    return val
+
+
 def _parse_settings(raw: dict) -> Settings:
     if not isinstance(raw, dict):
         raise ConfigError("'settings' must be a mapping")
@@ -196,6 +281,23 @@ def _parse_settings(raw: dict) -> Settings:
         "max_episodes_per_show": int,
         "min_episodes_per_show": int,
         "max_audio_minutes": int,
+        "audio_cache_max_mb": int,
+        "response_cache_max_mb": int,
+        "podcast_chunk_minutes": int,
+        "max_chunked_audio_minutes": int,
+        "max_parallel_chunks": int,
+        "transcript_chunk_tokens": int,
+        "max_videos_per_pack": int,
+        "max_generation_seconds": int,
+        "request_timeout_seconds": int,
+        "breaker_failure_threshold": int,
+        "breaker_cooldown_seconds": int,
+        "max_input_tokens": int,
+        "daily_request_budget": int,
+        "deadline_reserve_minutes": int,
+        "backfill_parallel_items": int,
+        "daemon_poll_minutes": int,
+        "cadence_max_skip_hours": int,
     }
 
     for key, expected_type in field_types.items():
@@ -209,6 +311,30 @@ def _parse_settings(raw: dict) -> Settings:
                 raise ConfigError(f"Setting '{key}' must be positive, got: {val}")
             kwargs[key] = val
 
+    for key in ("chunk_long_episodes", "chunk_long_transcripts", "pack_short_videos",
+                "stream_summaries", "cache_prompt_prefix", "hedge_requests", "learn_source_cadence"):
+        if key in raw:
+            val = raw[key]
+            if not isinstance(val, bool):
+                raise ConfigError(f"Setting '{key}' must be bool, got: {type(val).__name__}")
+            kwargs[key] = val
+
+    for key in ("gemini_api_key_envs", "fallback_models"):
+        if key in raw:
+            val = raw[key]
+            if not isinstance(val, list) or not all(isinstance(v, str) and v for v in val):
+                raise ConfigError(f"Setting '{key}' must be a list of non-empty strings")
+            kwargs[key] = tuple(val)
+
+    if "model_routes" in raw:
+        kwargs["model_routes"] = _parse_model_routes(raw["model_routes"])
+
+    if "run_deadline" in raw:
+        val = raw["run_deadline"]
+        if val is not None and (not isinstance(val, str) or not _DEADLINE_RE.match(val)):
+            raise ConfigError(f"Setting 'run_deadline' must be an \"HH:MM\" string, got: {val!r}")
+        kwargs["run_deadline"] = val
+
     # notify_email is optional string
     if "notify_email" in raw:
         val = raw["notify_email"]
@@ -217,3 +343,34 @@ def _parse_settings(raw: dict) -> Settings:
         kwargs["notify_email"] = val or None
 
     return Settings(**kwargs)
+
+
+def _parse_model_routes(raw: list) -> tuple[ModelRoute, ...]:
+    if not isinstance(raw, list):
+        raise ConfigError("'model_routes' must be a list")
+
+    routes = []
+    for i, item in enumerate(raw):
+        if not isinstance(item, dict):
+            raise ConfigError(f"Model route #{i + 1} must be a mapping, got: {item}")
+        name = item.get("name") or f"route-{i + 1}"
+        for key in ("max_minutes", "max_input_tokens", "max_output_tokens"):
+            val = item.get(key)
+            if val is not None and (not isinstance(val, int) or isinstance(val, bool) or val <= 0):
+                raise ConfigError(f"Model route '{name}': '{key}' must be a positive int, got: {val}")
+        budget = item.get("thinking_budget")
+        # 0 disables thinking; -1 lets the model decide
+        if budget is not None and (not isinstance(budget, int) or isinstance(budget, bool) or budget < -1):
+            raise ConfigError(f"Model route '{name}': 'thinking_budget' must be an int >= -1, got: {budget}")
+        model = item.get("model")
+        if model is not None and (not isinstance(model, str) or not model):
+            raise ConfigError(f"Model route '{name}': 'model' must be a non-empty string")
+        routes.append(ModelRoute(
+            name=name,
+            max_minutes=item.get("max_minutes"),
+            max_input_tokens=item.get("max_input_tokens"),
+            model=model,
+            max_output_tokens=item.get("max_output_tokens"),
+            thinking_budget=budget,
+        ))
+    return tuple(routes)
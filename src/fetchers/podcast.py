@@ -2,27 +2,52 @@
 
 from __future__ import annotations
 
+import contextvars
 import hashlib
+import http.client
 import json
 import logging
 import os
 import subprocess
 import tempfile
+import re
 import time
 import urllib.request
 import urllib.parse
 import urllib.error
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Optional
 from urllib.error import URLError, HTTPError
 
 from google import genai
 
-from src.config import PodcastShow
-from src.summarizer import LANGUAGE_NAMES
+from src.audio_cache import audio_cache_paths, get_cached_audio
+from src.circuit_breaker import CircuitOpenError, circuit_breaker
+from src.client_pool import served_model
+from src.compaction import Snippet, anchor_interval, compact_snippets, log_savings, sample_segments
+from src.config import ModelRoute, PodcastShow
+from src.response_cache import get_cached_response, response_cache_key, store_response
+from src.usage_ledger import record_call
+from src.summarizer import (
+    LANGUAGE_NAMES,
+    SUMMARY_SYSTEM_INSTRUCTION,
+    forget_prefix_cache,
+    generate_text,
+    generate_with_timeout,
+    prefix_caching_enabled,
+    prefix_request_config,
+    record_route_latency,
+    route_cache_parts,
+    route_request_config,
+    select_route,
+    summarize,
+    throttle,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +58,35 @@ ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
 MAX_RETRIES = 3
 RETRY_BACKOFF_SECONDS = 5
 
+# Read size when hashing audio files for upload reuse
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+# Gemini bills audio input at ~32 tokens per second (model_routes buckets, pre-flight checks)
+AUDIO_TOKENS_PER_SECOND = 32
+# Gemini Files API per-file upload limit
+_MAX_UPLOAD_BYTES = 2 * 1024 ** 3
+
 # Namespace map for iTunes RSS extensions
 _NS = {
     "itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd",
     "content": "http://purl.org/rss/1.0/modules/content/",
+    "podcast": "https://podcastindex.org/namespace/1.0",
+}
+
+# Podcasting 2.0 <podcast:transcript> formats we can parse, in order of preference
+_TRANSCRIPT_FORMATS = {
+    "text/vtt": "vtt",
+    "application/x-subrip": "srt",
+    "application/srt": "srt",
+    "text/srt": "srt",
+    "application/json": "json",
 }
+_TRANSCRIPT_EXTENSIONS = {".vtt": "vtt", ".srt": "srt", ".json": "json"}
+
+_CUE_TIME_RE = re.compile(
+    r"(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{1,3})\s*-->"
+)
+_CUE_TAG_RE = re.compile(r"<[^>]+>")
 
 
 class RSSLookupError(Exception):
@@ -65,6 +114,17 @@ class EpisodeInfo:
     duration_seconds: int
     language: str = "en"
     transcript: Optional[str] = None
+    # Published Podcasting 2.0 transcript, if the feed has one we can parse
+    transcript_url: Optional[str] = None
+    transcript_format: str = ""     # "vtt" | "srt" | "json"
+
+
+@dataclass(frozen=True)
+class ChunkingOptions:
+    """Settings for chunked (map-reduce) transcription of long episodes."""
+    chunk_minutes: int          # target segment length; episodes longer than this are chunked
+    max_audio_minutes: int      # download cap in chunked mode (replaces max_audio_minutes)
+    max_parallel: int           # segments summarised concurrently
 
 
 # ---------------------------------------------------------------------------
@@ -99,19 +159,7 @@ def fetch_new_episodes(
     logger.info(f"Fetching episodes for {show.name} ({show.podcast_url})")
 
     # Step 1: Resolve RSS feed URL (use cache to avoid repeated API calls)
-    rss_url = rss_cache.get(show.podcast_url)
-    if not rss_url:
-        try:
-            rss_url = resolve_rss_feed(show.name, show.podcast_url)
-            rss_cache[show.podcast_url] = rss_url
-            logger.info(f"  RSS resolved: {rss_url}")
-        except RSSLookupError as e:
-            logger.error(
-                f"  Cannot find RSS feed for '{show.name}': {e}\n"
-                f"  Fix: Add the show to a podcast directory (podcastindex.org) "
-                f"or provide the RSS URL directly in config.yaml."
-            )
-            raise
+    rss_url = _show_rss_url(show, rss_cache)
 
     # Step 2: Parse RSS and get episodes
     try:
@@ -153,29 +201,148 @@ def fetch_new_episodes(
     return within_window
 
 
+def fetch_episodes_published_between(
+    show: PodcastShow,
+    processed_ids: set,
+    start: datetime,
+    end: datetime,
+    rss_cache: dict,
+) -> list[EpisodeInfo]:
+    """Return every unprocessed episode of show published in [start, end) — for backfills.
+
+    Unlike fetch_new_episodes there is no per-show cap or minimum.
+    rss_cache is updated in-place.
+    """
+    logger.info(f"Fetching episodes for {show.name} published from {start:%Y-%m-%d %H:%M} until {end:%Y-%m-%d %H:%M} UTC")
+    rss_url = _show_rss_url(show, rss_cache)
+    episodes = [
+        ep for ep in _parse_rss_feed(rss_url, show)
+        if start <= ep.published_at < end and ep.episode_id not in processed_ids
+    ]
+    logger.info(f"  {len(episodes)} episode(s) from {show.name} in range")
+    return episodes
+
+
+def find_episode(show: PodcastShow, episode_id: str, rss_cache: dict) -> Optional[EpisodeInfo]:
+    """Return one episode of show by ID, regardless of lookback window or processed state.
+
+    None if the show's feed has no such episode.  rss_cache is updated in-place.
+    """
+    rss_url = _show_rss_url(show, rss_cache)
+    return next((ep for ep in _parse_rss_feed(rss_url, show) if ep.episode_id == episode_id), None)
+
+
+def _show_rss_url(show: PodcastShow, rss_cache: dict) -> str:
+    """Resolve a show's RSS feed URL through rss_cache (updated in-place)."""
+    rss_url = rss_cache.get(show.podcast_url)
+    if not rss_url:
+        try:
+            rss_url = resolve_rss_feed(show.name, show.podcast_url)
+            rss_cache[show.podcast_url] = rss_url
+            logger.info(f"  RSS resolved: {rss_url}")
+        except RSSLookupError as e:
+            logger.error(
+                f"  Cannot find RSS feed for '{show.name}': {e}\n"
+                f"  Fix: Add the show to a podcast directory (podcastindex.org) "
+                f"or provide the RSS URL directly in config.yaml."
+            )
+            raise
+    return rss_url
+
+
 def download_and_transcribe(
     episode: EpisodeInfo,
     gemini_client: genai.Client,
     gemini_model: str,
     max_audio_minutes: int,
+    audio_cache_dir: Optional[Path] = None,
+    upload_cache: Optional[dict] = None,
+    chunking: Optional[ChunkingOptions] = None,
+    routes: tuple[ModelRoute, ...] = (),
+    max_input_tokens: int = 0,
 ) -> str:
     """Download episode audio and transcribe+summarize using Gemini.
 
-    Downloads to a temp file (deleted after use), clips to max_audio_minutes,
-    then sends to Gemini audio API.
+    Clips audio to max_audio_minutes, then sends it to the Gemini audio API.
+    Without audio_cache_dir the download goes to a temp dir that is deleted
+    after use.  With audio_cache_dir the clipped audio is kept across runs, so a
+    failed transcription is retried later without downloading again; the caller
+    evicts the entry once the episode is processed.  upload_cache is passed
+    through to _transcribe_and_summarize to reuse Gemini uploads across runs.
+
+    With chunking, episodes longer than chunking.chunk_minutes are downloaded up
+    to chunking.max_audio_minutes instead, split at silences and summarised
+    segment-by-segment in parallel (see _transcribe_in_chunks).  Needs ffmpeg;
+    without it the normal single-call path is used.
+
+    Episodes with a published transcript (transcript_url) are summarised from
+    the text via summarizer.summarize instead; audio is only touched if the
+    transcript cannot be fetched or parsed.
+
+    routes (settings.model_routes) picks the model and output limits for
+    single-call summaries by episode duration and input size; chunked episodes
+    use gemini_model throughout.
+
+    Pre-flight: if the clipped audio is estimated above max_input_tokens it is
+    chunked (when chunking is available and a segment fits) or rejected with
+    TranscriptionError before anything is downloaded or uploaded.
 
     Returns the summary text.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        audio_path = _download_audio(episode.audio_url, tmpdir, max_audio_minutes)
-        summary = _transcribe_and_summarize(
+    if episode.transcript_url:
+        summary = _summarize_from_transcript(episode, gemini_client, gemini_model, routes, max_input_tokens)
+        if summary is not None:
+            return summary
+
+    use_chunks = (
+        chunking is not None
+        and episode.duration_seconds > chunking.chunk_minutes * 60
+        and _has_ffmpeg()
+    )
+    audio_seconds = max_audio_minutes * 60
+    if episode.duration_seconds > 0:
+        audio_seconds = min(episode.duration_seconds, audio_seconds)
+    audio_tokens = audio_seconds * AUDIO_TOKENS_PER_SECOND
+    if max_input_tokens and audio_tokens > max_input_tokens and not use_chunks:
+        if (
+            chunking is not None
+            and chunking.chunk_minutes * 60 * AUDIO_TOKENS_PER_SECOND <= max_input_tokens
+            and _has_ffmpeg()
+        ):
+            logger.warning(f"  Audio ~{audio_tokens:,} tokens exceeds max_input_tokens — chunking it")
+            use_chunks = True
+        else:
+            raise TranscriptionError(
+                f"'{episode.title}' is ~{audio_tokens:,} audio tokens, over max_input_tokens "
+                f"({max_input_tokens:,}). Lower max_audio_minutes or enable chunk_long_episodes."
+            )
+    download_minutes = chunking.max_audio_minutes if use_chunks else max_audio_minutes
+
+    def summarize_audio(audio_path: str) -> str:
+        if use_chunks:
+            return _transcribe_in_chunks(
+                audio_path=audio_path,
+                episode=episode,
+                client=gemini_client,
+                model=gemini_model,
+                chunking=chunking,
+                upload_cache=upload_cache,
+            )
+        return _transcribe_and_summarize(
             audio_path=audio_path,
             episode=episode,
             client=gemini_client,
             model=gemini_model,
             max_audio_minutes=max_audio_minutes,
+            upload_cache=upload_cache,
+            routes=routes,
         )
-    return summary
+
+    if audio_cache_dir is None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            return summarize_audio(_download_audio(episode.audio_url, tmpdir, download_minutes))
+
+    return summarize_audio(_download_audio_cached(episode.audio_url, audio_cache_dir, download_minutes))
 
 
 # ---------------------------------------------------------------------------
@@ -379,6 +546,8 @@ def _parse_rss_item(item: ET.Element, show: PodcastShow) -> Optional[EpisodeInfo
     link_el = item.find("link")
     episode_url = link_el.text.strip() if link_el is not None and link_el.text else show.podcast_url
 
+    transcript_url, transcript_format = _pick_transcript(item)
+
     return EpisodeInfo(
         episode_id=episode_id,
         title=title,
@@ -390,9 +559,31 @@ def _parse_rss_item(item: ET.Element, show: PodcastShow) -> Optional[EpisodeInfo
         published_at=published_at,
         duration_seconds=duration_seconds,
         language=show.language,
+        transcript_url=transcript_url,
+        transcript_format=transcript_format,
     )
 
 
+def _pick_transcript(item: ET.Element) -> tuple[Optional[str], str]:
+    """Return (url, format) of the preferred parseable <podcast:transcript>, or (None, "")."""
+    preference = list(dict.fromkeys(_TRANSCRIPT_FORMATS.values()))
+    best = None
+    for el in item.findall("podcast:transcript", _NS):
+        url = (el.get("url") or "").strip()
+        if not url:
+            continue
+        mime = (el.get("type") or "").split(";")[0].strip().lower()
+        fmt = _TRANSCRIPT_FORMATS.get(mime)
+        if fmt is None:
+            ext = os.path.splitext(urllib.parse.urlparse(url).path)[1].lower()
+            fmt = _TRANSCRIPT_EXTENSIONS.get(ext)
+        if fmt is None:
+            continue
+        if best is None or preference.index(fmt) < preference.index(best[1]):
+            best = (url, fmt)
+    return best if best is not None else (None, "")
+
+
 def _parse_rss_date(date_str: Optional[str]) -> datetime:
     """Parse RFC 2822 pubDate. Falls back to epoch on failure."""
     if not date_str:
@@ -423,6 +614,97 @@ def _parse_itunes_duration(value: str) -> int:
         return 0
 
 
+# ---------------------------------------------------------------------------
+# Published transcripts (Podcasting 2.0)
+# ---------------------------------------------------------------------------
+
+def _summarize_from_transcript(
+    episode: EpisodeInfo,
+    client: genai.Client,
+    model: str,
+    routes: tuple[ModelRoute, ...] = (),
+    max_input_tokens: int = 0,
+) -> Optional[str]:
+    """Summarise an episode from its published transcript.
+
+    Returns None (caller falls back to audio) if the transcript cannot be
+    fetched or parsed.  Gemini errors propagate exactly as for audio.
+    """
+    try:
+        content = _fetch_rss_content(episode.transcript_url)
+        cues = _parse_transcript(content, episode.transcript_format)
+    except Exception as e:
+        logger.warning(f"  Published transcript unusable ({e}) — falling back to audio")
+        return None
+    raw_text = " ".join(cue.text for cue in cues)
+    cues = compact_snippets(cues, episode.language)
+    if not cues:
+        logger.warning("  Published transcript is empty — falling back to audio")
+        return None
+
+    transcript = " ".join(cue.text for cue in cues)
+    log_savings(episode.title, raw_text, transcript)
+    logger.info(
+        f"  Using published {episode.transcript_format.upper()} transcript "
+        f"({len(cues)} cues, {len(transcript)} chars) — skipping audio"
+    )
+    return summarize(
+        client=client,
+        model=model,
+        title=episode.title,
+        channel_name=episode.show_name,
+        transcript=transcript,
+        duration_seconds=episode.duration_seconds,
+        language=episode.language,
+        transcript_segments=sample_segments(cues, interval_seconds=anchor_interval(cues[-1].start)),
+        routes=routes,
+        max_input_tokens=max_input_tokens,
+    )
+
+
+def _parse_transcript(content: bytes, fmt: str) -> list[Snippet]:
+    """Parse a VTT, SRT or Podcasting 2.0 JSON transcript into timed cues."""
+    text = content.decode("utf-8-sig", errors="replace")
+    if fmt == "json":
+        return _parse_json_transcript(text)
+    if fmt in ("vtt", "srt"):
+        return _parse_cue_transcript(text)
+    raise ValueError(f"Unsupported transcript format: {fmt!r}")
+
+
+def _parse_cue_transcript(text: str) -> list[Snippet]:
+    """Parse WebVTT or SRT: blocks of a timing line followed by caption text."""
+    cues = []
+    for block in re.split(r"\n\s*\n", text.replace("\r\n", "\n")):
+        lines = block.strip().split("\n")
+        for i, line in enumerate(lines):
+            match = _CUE_TIME_RE.search(line)
+            if not match:
+                continue
+            hours, minutes, seconds, millis = match.groups()
+            start = (
+                int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+                + int(millis.ljust(3, "0")) / 1000
+            )
+            caption = " ".join(_CUE_TAG_RE.sub("", l).strip() for l in lines[i + 1:])
+            if caption.strip():
+                cues.append(Snippet(start=start, text=caption.strip()))
+            break
+    return cues
+
+
+def _parse_json_transcript(text: str) -> list[Snippet]:
+    """Parse the Podcasting 2.0 JSON format: {"segments": [{"startTime", "body"}, ...]}."""
+    data = json.loads(text)
+    segments = data.get("segments", []) if isinstance(data, dict) else []
+    cues = []
+    for seg in segments:
+        body = str(seg.get("body", "")).strip()
+        if body:
+            cues.append(Snippet(start=float(seg.get("startTime", 0)), text=body))
+    return cues
+
+
 # ---------------------------------------------------------------------------
 # Audio Download
 # ---------------------------------------------------------------------------
@@ -451,6 +733,38 @@ def _download_audio(audio_url: str, tmpdir: str, max_audio_minutes: int) -> str:
     return output_path
 
 
+def _download_audio_cached(audio_url: str, cache_dir: Path, max_audio_minutes: int) -> str:
+    """Return a path to clipped audio in the persistent cache, downloading if needed.
+
+    A complete cached file is returned as-is.  A leftover partial file from an
+    interrupted direct download is resumed via HTTP Range instead of trying
+    ffmpeg, which cannot resume.  ffmpeg output is written to a temp name and
+    renamed, so a crash mid-transcode never leaves a truncated "complete" entry.
+    """
+    cached = get_cached_audio(cache_dir, audio_url, max_audio_minutes)
+    if cached is not None:
+        logger.info(f"  Using cached audio ({cached.stat().st_size // 1024}KB)")
+        return str(cached)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    final_path, partial_path = audio_cache_paths(cache_dir, audio_url, max_audio_minutes)
+    max_seconds = max_audio_minutes * 60
+
+    if not partial_path.exists() and _has_ffmpeg():
+        ffmpeg_path = final_path.with_suffix(".ffmpeg.mp3")
+        if _download_with_ffmpeg(audio_url, str(ffmpeg_path), max_seconds):
+            os.replace(ffmpeg_path, final_path)
+            return str(final_path)
+        ffmpeg_path.unlink(missing_ok=True)
+
+    if partial_path.exists():
+        logger.info(f"  Resuming audio download from {partial_path.stat().st_size // 1024}KB")
+    max_bytes = max_audio_minutes * 1024 * 1024  # 1MB/min rough cap (see _download_audio)
+    _download_direct(audio_url, str(partial_path), max_bytes)
+    os.replace(partial_path, final_path)
+    return str(final_path)
+
+
 def _has_ffmpeg() -> bool:
     """Check if ffmpeg is available in PATH."""
     try:
@@ -497,23 +811,31 @@ def _download_with_ffmpeg(audio_url: str, output_path: str, max_seconds: int) ->
 
 
 def _download_direct(audio_url: str, output_path: str, max_bytes: int) -> None:
-    """Direct HTTP download with a byte cap.
+    """Direct HTTP download with a byte cap, resuming any partial file at output_path.
+
+    If output_path already holds bytes (an earlier attempt or run was
+    interrupted), only the remaining range is requested.  Servers that ignore
+    Range and answer 200 get the file rewritten from the start.
 
     Raises AudioDownloadError on unrecoverable failure.
     """
     last_error = None
     for attempt in range(MAX_RETRIES):
+        offset = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+        if offset >= max_bytes:
+            return
         try:
             req = urllib.request.Request(
                 audio_url,
                 headers={
                     "User-Agent": "MorningBrief/1.0",
-                    "Range": f"bytes=0-{max_bytes - 1}",
+                    "Range": f"bytes={offset}-{max_bytes - 1}",
                 },
             )
             with urllib.request.urlopen(req, timeout=120) as resp:
-                with open(output_path, "wb") as f:
-                    downloaded = 0
+                resumed = offset > 0 and getattr(resp, "status", None) == 206
+                downloaded = offset if resumed else 0
+                with open(output_path, "ab" if resumed else "wb") as f:
                     chunk_size = 65536  # 64KB
                     while True:
                         chunk = resp.read(chunk_size)
@@ -524,6 +846,8 @@ def _download_direct(audio_url: str, output_path: str, max_bytes: int) -> None:
             return
         except HTTPError as e:
             last_error = e
+            if e.code == 416 and offset > 0:
+                return  # Requested range starts past EOF: the partial file is already complete
             if e.code in (429, 503) and attempt < MAX_RETRIES - 1:
                 time.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
                 continue
@@ -536,7 +860,8 @@ def _download_direct(audio_url: str, output_path: str, max_bytes: int) -> None:
                 f"HTTP {e.code} downloading audio from {audio_url}. "
                 f"The episode URL may have expired or require authentication."
             ) from e
-        except URLError as e:
+        except (URLError, ConnectionError, TimeoutError, http.client.IncompleteRead) as e:
+            # Mid-stream drops land here too; the next attempt resumes from what was written
             last_error = e
             if attempt < MAX_RETRIES - 1:
                 time.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
@@ -553,7 +878,10 @@ def _download_direct(audio_url: str, output_path: str, max_bytes: int) -> None:
 # Gemini Transcription + Summarization
 # ---------------------------------------------------------------------------
 
-PODCAST_PROMPT = """You are a precise content summarizer. You will receive a podcast episode audio file.
+# Invariant rules + structure.  Sent inline (PODCAST_PROMPT etc.) by default, or
+# with prefix caching as part of the shared PODCAST_SYSTEM_INSTRUCTION, while
+# each request (PODCAST_REQUEST_TEMPLATE etc.) names its task and carries the item.
+_PODCAST_RULES = """You are a precise content summarizer. You will receive a podcast episode audio file.
 Listen carefully and create a summary.
 
 CRITICAL ACCURACY RULES:
@@ -581,12 +909,20 @@ A concluding thought on how this fits into the broader landscape or what the lis
 Additional requirements:
 - Write the ENTIRE summary in {language_name}. Section headers must remain in English, but all content must be in {language_name}.
 - Use plain language, avoid jargon unless essential.
-- Do NOT include any preamble like "Here is a summary".
+- Do NOT include any preamble like "Here is a summary"."""
 
-Episode title: {title}
+_PODCAST_ITEM = """Episode title: {title}
 Show: {show_name}
 """
 
+PODCAST_PROMPT = _PODCAST_RULES + "\n\n" + _PODCAST_ITEM
+
+PODCAST_REQUEST_TEMPLATE = """Task: EPISODE SUMMARY
+Episode duration: {duration_str}
+Summary language: {language_name}
+
+""" + _PODCAST_ITEM
+
 def _get_language_name(code: str) -> str:
     return LANGUAGE_NAMES.get(code, code)
 
@@ -607,90 +943,530 @@ def _transcribe_and_summarize(
     client: genai.Client,
     model: str,
     max_audio_minutes: int,
+    upload_cache: Optional[dict] = None,
+    routes: tuple[ModelRoute, ...] = (),
 ) -> str:
     """Upload audio to Gemini Files API and generate summary.
 
-    Cleans up the uploaded file after use.
+    The upload is made at most once per call and reused across retries, so a
+    transient generate_content failure does not cost a re-upload and another
+    ACTIVE wait.  With upload_cache (a live dict from state.gemini_file_cache)
+    the handle is also kept across runs, keyed by audio content hash; the
+    remote file is deleted only after a successful summary.  Without it the
+    file is deleted once the call finishes either way.
+
+    The first of routes matching the episode duration and the estimated audio
+    input size overrides model and adds its output / thinking limits.
+
     Raises TranscriptionError on unrecoverable failure.
     """
     # Effective duration for prompt: min of actual and our cap
     effective_seconds = min(episode.duration_seconds, max_audio_minutes * 60) if episode.duration_seconds > 0 else max_audio_minutes * 60
+    route = select_route(routes, episode.duration_seconds, effective_seconds * AUDIO_TOKENS_PER_SECOND)
+    if route is not None:
+        model = route.model or model
+        logger.info(f"  Model route '{route.name}' → {model}")
     duration_str = _format_duration(effective_seconds)
     language_name = _get_language_name(episode.language)
 
-    prompt = PODCAST_PROMPT.format(
+    system_instruction = PODCAST_SYSTEM_INSTRUCTION if prefix_caching_enabled() else None
+    template = PODCAST_PROMPT if system_instruction is None else PODCAST_REQUEST_TEMPLATE
+    prompt = template.format(
         title=episode.title,
         show_name=episode.show_name,
         duration_str=duration_str,
         language_name=language_name,
     )
+    started = time.monotonic()
+    summary = _generate_from_audio(
+        audio_path, prompt, episode, client, model, max_audio_minutes, upload_cache,
+        system_instruction=system_instruction, route=route,
+    )
+    if route is not None:
+        record_route_latency(route, time.monotonic() - started)
+    return summary
+
+
+def _generate_from_audio(
+    audio_path: str,
+    prompt: str,
+    episode: EpisodeInfo,
+    client: genai.Client,
+    model: str,
+    max_audio_minutes: int,
+    upload_cache: Optional[dict] = None,
+    system_instruction: Optional[str] = None,
+    route: Optional[ModelRoute] = None,
+) -> str:
+    """Upload (or reuse) an audio file and run one prompt against it, with retries.
+
+    Shared by whole-episode summaries and per-segment calls in chunked mode.
+    See _transcribe_and_summarize for the upload reuse/cleanup contract.
+    system_instruction is sent via prefix_request_config when set; route adds
+    its output-length / thinking limits.  Files over the Files API limit are
+    rejected before upload; the finished call is recorded in the usage ledger.
+    """
+    content_hash = _file_content_hash(audio_path)
+    if system_instruction is None:
+        cache_key = response_cache_key(model, prompt, content_hash, *route_cache_parts(route))
+    else:
+        cache_key = response_cache_key(model, system_instruction, prompt, content_hash, *route_cache_parts(route))
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        logger.info("  Served from response cache — skipping upload")
+        return cached
+
+    size = os.path.getsize(audio_path)
+    if size > _MAX_UPLOAD_BYTES:
+        raise TranscriptionError(
+            f"Audio for '{episode.title}' is {size // (1024 * 1024)}MB, over the Gemini upload limit. "
+            f"Reduce max_audio_minutes in config.yaml (currently {max_audio_minutes}min)."
+        )
 
     uploaded_file = None
     last_error = None
+    breaker = circuit_breaker()
+    attempts = 0
 
-    for attempt in range(MAX_RETRIES):
-        if attempt > 0:
-            wait = RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1))
-            logger.info(f"  Retry {attempt}/{MAX_RETRIES} after {wait}s...")
-            time.sleep(wait)
-        else:
-            time.sleep(5)  # throttle like summarizer
+    try:
+        for attempt in range(MAX_RETRIES):
+            # Fails fast (before any upload) while the run-wide breaker is open
+            breaker.before_request()
+            if attempt > 0:
+                wait = RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1))
+                logger.info(f"  Retry {attempt}/{MAX_RETRIES} after {wait}s...")
+                time.sleep(wait)
+            else:
+                throttle()  # shared with summarizer so concurrent calls stay under RPM
+            attempts = attempt + 1
+
+            try:
+                if uploaded_file is None:
+                    uploaded_file = _get_or_upload_audio(client, audio_path, content_hash, upload_cache)
+
+                # Generate summary
+                request = {"model": model, "contents": [uploaded_file, prompt]}
+                config = None
+                if system_instruction is not None:
+                    config = prefix_request_config(client, model, system_instruction)
+                config = route_request_config(route, config)
+                if config is not None:
+                    request["config"] = config
+                started = time.monotonic()
+                response = generate_with_timeout(client, request)
+                breaker.record_success()
+                record_call(
+                    served_model(response, model), getattr(response, "usage_metadata", None),
+                    time.monotonic() - started, attempts,
+                )
+                attempts = 0  # recorded
+                text = response.text or ""
+                store_response(cache_key, text)
+                _delete_uploaded_file(client, uploaded_file, content_hash, upload_cache)
+                uploaded_file = None
+                return text
+
+            except Exception as e:
+                last_error = e
+                error_str = str(e).lower()
+                breaker.record_failure(e)
+
+                # Auth errors — abort immediately
+                if "401" in str(e) or "403" in str(e) or "api_key_invalid" in error_str or "permission_denied" in error_str:
+                    raise TranscriptionError(
+                        f"Gemini authentication failed for '{episode.title}'. "
+                        f"Check GEMINI_API_KEY: {e}"
+                    ) from e
+
+                # Daily quota — propagate so main can handle gracefully
+                if "429" in str(e) or "resource_exhausted" in error_str:
+                    if "daily" in error_str or "per day" in error_str or "quota exceeded" in error_str:
+                        raise
+
+                # File too large
+                if "file too large" in error_str or "payload too large" in error_str:
+                    raise TranscriptionError(
+                        f"Audio file too large for Gemini API. "
+                        f"Reduce max_audio_minutes in config.yaml (currently {max_audio_minutes}min)."
+                    ) from e
+
+                # The cached prompt prefix expired — re-register it next attempt
+                if system_instruction is not None and "cached" in error_str:
+                    forget_prefix_cache(client, model, system_instruction)
+                # The remote file vanished (expired or deleted) — upload afresh next attempt
+                elif uploaded_file is not None and ("404" in str(e) or "not_found" in error_str):
+                    _forget_uploaded_file(content_hash, upload_cache)
+                    uploaded_file = None
+
+                logger.warning(f"  Transcription attempt {attempt + 1} failed: {e}")
+                continue
+    finally:
+        # Failed for good — still count the requests that were sent
+        if attempts:
+            record_call(model, None, 0.0, attempts, ok=False)
+        # No cache to hand the upload on to — clean it up now rather than
+        # leaving it in Gemini storage until the 48h expiry.
+        if uploaded_file is not None and upload_cache is None:
+            _delete_uploaded_file(client, uploaded_file, content_hash, upload_cache)
+
+    if breaker.is_open():
+        raise CircuitOpenError(f"Gemini circuit breaker is open: {last_error}") from last_error
+    raise TranscriptionError(
+        f"Gemini transcription failed after {MAX_RETRIES} attempts for '{episode.title}': {last_error}"
+    )
 
+
+def _file_content_hash(path: str) -> str:
+    """Return the sha256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _get_or_upload_audio(
+    client: genai.Client,
+    audio_path: str,
+    content_hash: str,
+    upload_cache: Optional[dict],
+):
+    """Return an ACTIVE Gemini file for the audio, reusing a cached upload if still valid."""
+    entry = upload_cache.get(content_hash) if upload_cache is not None else None
+    if entry:
         try:
-            # Upload audio to Gemini Files API
-            logger.info(f"  Uploading audio to Gemini ({os.path.getsize(audio_path) // 1024}KB)...")
-            uploaded_file = client.files.upload(
-                file=audio_path,
-                config={"mime_type": "audio/mpeg"},
-            )
+            file_info = client.files.get(name=entry["name"])
+            state_str = str(getattr(file_info, "state", "") or "").upper()
+            if "ACTIVE" in state_str:
+                logger.info(f"  Reusing uploaded audio {entry['name']} (uploaded {entry.get('uploaded_at', '?')})")
+                return file_info
+            logger.debug(f"  Cached upload {entry['name']} is {state_str or 'unknown'}, re-uploading")
+        except Exception as e:
+            logger.debug(f"  Cached upload {entry.get('name')} no longer available: {e}")
+        _forget_uploaded_file(content_hash, upload_cache)
+
+    logger.info(f"  Uploading audio to Gemini ({os.path.getsize(audio_path) // 1024}KB)...")
+    uploaded_file = client.files.upload(
+        file=audio_path,
+        config={"mime_type": "audio/mpeg"},
+    )
+    # Wait for file processing; a file that never becomes ACTIVE is deleted, not left behind
+    try:
+        _wait_for_file_active(client, uploaded_file)
+    except Exception:
+        _delete_uploaded_file(client, uploaded_file, content_hash, upload_cache)
+        raise
+    if upload_cache is not None:
+        upload_cache[content_hash] = {
+            "name": uploaded_file.name,
+            "uploaded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+    return uploaded_file
+
+
+def _forget_uploaded_file(content_hash: str, upload_cache: Optional[dict]) -> None:
+    if upload_cache is not None:
+        upload_cache.pop(content_hash, None)
 
-            # Wait for file processing
-            _wait_for_file_active(client, uploaded_file)
 
-            # Generate summary
-            response = client.models.generate_content(
+def _delete_uploaded_file(client: genai.Client, uploaded_file, content_hash: str, upload_cache: Optional[dict]) -> None:
+    """Delete an uploaded file from Gemini storage (best-effort) and drop its cache entry."""
+    _forget_uploaded_file(content_hash, upload_cache)
+    try:
+        client.files.delete(name=uploaded_file.name)
+    except Exception as e:
+        logger.debug(f"  Could not delete uploaded file {uploaded_file.name}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Chunked (map-reduce) transcription for long episodes
+# ---------------------------------------------------------------------------
+
+# silencedetect thresholds: anything quieter than this for this long is a pause
+_SILENCE_NOISE_DB = -35
+_SILENCE_MIN_SECONDS = 0.5
+# How far (as a fraction of chunk length) a split may move to land on a silence
+_SPLIT_SEARCH_FRACTION = 0.2
+# A trailing segment shorter than this is merged into the previous one
+_MIN_SEGMENT_SECONDS = 60
+
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?[\d.]+)")
+
+_SEGMENT_INTRO = """You are a precise note-taker. You will receive one segment of a longer podcast episode.
+This is part {part} of {total}, covering {start} to {end} of the episode.
+
+"""
+
+_SEGMENT_RULES = """CRITICAL ACCURACY RULES:
+- ONLY record facts, names, numbers, and claims that are EXPLICITLY said in this audio segment.
+- NEVER infer or fabricate information not present in the audio.
+- Attribute opinions to the speaker (e.g., "According to the host...").
+
+Write 5-10 dense bullet points (start each with "* ") covering the topics, data points, claims,
+notable quotes and advice in this segment, in the order they occur. No headers, no preamble.
+Write the notes in {language_name}."""
+
+_SEGMENT_ITEM = """Episode title: {title}
+Show: {show_name}
+"""
+
+PODCAST_SEGMENT_PROMPT = _SEGMENT_INTRO + _SEGMENT_RULES + "\n\n" + _SEGMENT_ITEM
+
+PODCAST_SEGMENT_REQUEST_TEMPLATE = """Task: SEGMENT NOTES
+Segment {part} of {total}, covering {start} to {end} of the episode.
+Notes language: {language_name}
+
+""" + _SEGMENT_ITEM
+
+_REDUCE_INTRO = """You are a precise content summarizer. Below are sequential notes taken from the {total} consecutive
+segments of one podcast episode. Combine them into a single summary of the whole episode.
+
+"""
+
+_REDUCE_RULES = """CRITICAL ACCURACY RULES:
+- ONLY use facts, names, numbers, and claims that appear in the notes.
+- NEVER infer or fabricate information not present in the notes.
+- Attribute opinions to the speaker (e.g., "According to the host...").
+
+Adapt the summary length based on the episode duration ({duration_str}):
+- Short episodes (under 30 min): 200-300 words.
+- Medium episodes (30-60 min): 400-600 words. Include key data points and specific claims.
+- Long episodes (60+ min): 600-800 words. Categorize themes, include notable quotes.
+
+Structure the summary using this architecture:
+
+## The Hook
+1-2 sentences explaining exactly why this episode matters now.
+
+## Key Findings
+3-5 bullet points containing the core substance of the WHOLE episode (not just the first segment): data, specific claims, insights, and actionable advice. Start each with "* ".
+
+## The So What?
+A concluding thought on how this fits into the broader landscape or what the listener should do with this information.
+
+Additional requirements:
+- Write the ENTIRE summary in {language_name}. Section headers must remain in English, but all content must be in {language_name}.
+- Use plain language, avoid jargon unless essential.
+- Do NOT include any preamble like "Here is a summary"."""
+
+_REDUCE_ITEM = """Episode title: {title}
+Show: {show_name}
+
+Segment notes:
+{notes}
+"""
+
+PODCAST_REDUCE_PROMPT = _REDUCE_INTRO + _REDUCE_RULES + "\n\n" + _REDUCE_ITEM
+
+PODCAST_REDUCE_REQUEST_TEMPLATE = """Task: EPISODE MERGE NOTES
+Segments: {total}
+Episode duration: {duration_str}
+Summary language: {language_name}
+
+""" + _REDUCE_ITEM
+
+# Every podcast task's rules in one system instruction, after the video tasks'
+# SUMMARY_SYSTEM_INSTRUCTION: the episode rules alone (~900 tokens) are below
+# the smallest prefix Gemini will cache, so whole-episode, segment and merge
+# calls would otherwise all send them uncached (see prefix_request_config).
+PODCAST_SYSTEM_INSTRUCTION = "\n\n".join([
+    SUMMARY_SYSTEM_INSTRUCTION,
+    "[TASK: EPISODE SUMMARY]\n" + _PODCAST_RULES.format(
+        duration_str="stated in the request",
+        language_name="the summary language stated in the request",
+    ),
+    "[TASK: SEGMENT NOTES]\n"
+    "You are a precise note-taker. You will receive one segment of a longer podcast episode; "
+    "the request states which segment it is and the time range it covers.\n\n"
+    + _SEGMENT_RULES.format(language_name="the notes language stated in the request"),
+    "[TASK: EPISODE MERGE NOTES]\n"
+    "You are a precise content summarizer. The request holds sequential notes taken from the consecutive\n"
+    "segments of one podcast episode. Combine them into a single summary of the whole episode.\n\n"
+    + _REDUCE_RULES.format(
+        duration_str="stated in the request",
+        language_name="the summary language stated in the request",
+    ),
+])
+
+
+def _transcribe_in_chunks(
+    audio_path: str,
+    episode: EpisodeInfo,
+    client: genai.Client,
+    model: str,
+    chunking: ChunkingOptions,
+    upload_cache: Optional[dict] = None,
+) -> str:
+    """Summarise a long episode by splitting it at silences (map) and merging the notes (reduce).
+
+    Segments are uploaded and summarised concurrently (up to chunking.max_parallel);
+    request starts are still spaced by the shared summarizer throttle.  The final
+    reduce call is text-only and produces the usual Hook / Key Findings / So What
+    structure.  With prefix caching every segment and the reduce call share
+    PODCAST_SYSTEM_INSTRUCTION.  Falls back to a single whole-file call if
+    splitting fails.
+    """
+    total_seconds = min(episode.duration_seconds, chunking.max_audio_minutes * 60)
+    target_seconds = chunking.chunk_minutes * 60
+    silences = _detect_silences(audio_path)
+    split_points = _choose_split_points(silences, total_seconds, target_seconds)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        segments = _split_audio(audio_path, split_points, total_seconds, tmpdir)
+        if not segments:
+            logger.warning("  Could not split audio into segments — summarising as a single file")
+            return _transcribe_and_summarize(
+                audio_path=audio_path,
+                episode=episode,
+                client=client,
                 model=model,
-                contents=[uploaded_file, prompt],
+                max_audio_minutes=chunking.max_audio_minutes,
+                upload_cache=upload_cache,
             )
-            return response.text or ""
 
-        except Exception as e:
-            last_error = e
-            error_str = str(e).lower()
+        logger.info(
+            f"  Chunked mode: {len(segments)} segment(s) of ~{chunking.chunk_minutes}m, "
+            f"{min(chunking.max_parallel, len(segments))} in parallel"
+        )
+        language_name = _get_language_name(episode.language)
+        system_instruction = PODCAST_SYSTEM_INSTRUCTION if prefix_caching_enabled() else None
+
+        def summarize_segment(index: int) -> str:
+            path, start, end = segments[index]
+            template = PODCAST_SEGMENT_PROMPT if system_instruction is None else PODCAST_SEGMENT_REQUEST_TEMPLATE
+            prompt = template.format(
+                part=index + 1,
+                total=len(segments),
+                start=_format_timestamp(start),
+                end=_format_timestamp(end),
+                language_name=language_name,
+                title=episode.title,
+                show_name=episode.show_name,
+            )
+            return _generate_from_audio(
+                path, prompt, episode, client, model, chunking.max_audio_minutes, upload_cache,
+                system_instruction=system_instruction,
+            )
 
-            # Auth errors — abort immediately
-            if "401" in str(e) or "403" in str(e) or "api_key_invalid" in error_str or "permission_denied" in error_str:
-                raise TranscriptionError(
-                    f"Gemini authentication failed for '{episode.title}'. "
-                    f"Check GEMINI_API_KEY: {e}"
-                ) from e
+        with ThreadPoolExecutor(max_workers=chunking.max_parallel) as pool:
+            # copy_context per segment keeps the usage-ledger item label on the workers
+            futures = [
+                pool.submit(contextvars.copy_context().run, summarize_segment, i)
+                for i in range(len(segments))
+            ]
+            notes = [future.result() for future in futures]
+
+    joined = "\n\n".join(
+        f"[Part {i + 1}: {_format_timestamp(start)}-{_format_timestamp(end)}]\n{text.strip()}"
+        for i, ((_, start, end), text) in enumerate(zip(segments, notes))
+    )
+    reduce_template = PODCAST_REDUCE_PROMPT if system_instruction is None else PODCAST_REDUCE_REQUEST_TEMPLATE
+    reduce_prompt = reduce_template.format(
+        total=len(segments),
+        duration_str=_format_duration(total_seconds),
+        language_name=language_name,
+        title=episode.title,
+        show_name=episode.show_name,
+        notes=joined,
+    )
+    return generate_text(client, model, reduce_prompt, system_instruction=system_instruction)
 
-            # Daily quota — propagate so main can handle gracefully
-            if "429" in str(e) or "resource_exhausted" in error_str:
-                if "daily" in error_str or "per day" in error_str or "quota exceeded" in error_str:
-                    raise
 
-            # File too large
-            if "file too large" in error_str or "payload too large" in error_str:
-                raise TranscriptionError(
-                    f"Audio file too large for Gemini API. "
-                    f"Reduce max_audio_minutes in config.yaml (currently {max_audio_minutes}min)."
-                ) from e
+def _detect_silences(audio_path: str) -> list[float]:
+    """Return the midpoints (seconds) of silent stretches found by ffmpeg silencedetect.
 
-            logger.warning(f"  Transcription attempt {attempt + 1} failed: {e}")
-            continue
+    Returns an empty list if ffmpeg fails — callers then split at fixed offsets.
+    """
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats",
+        "-i", audio_path,
+        "-af", f"silencedetect=noise={_SILENCE_NOISE_DB}dB:d={_SILENCE_MIN_SECONDS}",
+        "-f", "null", "-",
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"  Silence detection failed: {e}")
+        return []
 
-        finally:
-            # Always clean up uploaded file from Gemini storage
-            if uploaded_file:
-                try:
-                    client.files.delete(name=uploaded_file.name)
-                except Exception:
-                    pass  # Best-effort cleanup
+    midpoints = []
+    start = None
+    for kind, value in _SILENCE_RE.findall(result.stderr or ""):
+        if kind == "start":
+            start = max(float(value), 0.0)
+        elif start is not None:
+            midpoints.append((start + float(value)) / 2)
+            start = None
+    return midpoints
 
-    raise TranscriptionError(
-        f"Gemini transcription failed after {MAX_RETRIES} attempts for '{episode.title}': {last_error}"
-    )
+
+def _choose_split_points(silences: list[float], total_seconds: float, target_seconds: float) -> list[float]:
+    """Pick split offsets close to every multiple of target_seconds, preferring silences.
+
+    For each ideal boundary the nearest silence within ±_SPLIT_SEARCH_FRACTION of
+    target_seconds is used; if there is none the boundary is cut hard.  A final
+    segment shorter than _MIN_SEGMENT_SECONDS is folded into the previous one.
+    """
+    if total_seconds <= target_seconds:
+        return []
+    window = target_seconds * _SPLIT_SEARCH_FRACTION
+    points = []
+    ideal = target_seconds
+    while ideal < total_seconds - _MIN_SEGMENT_SECONDS:
+        previous = points[-1] if points else 0.0
+        candidates = [s for s in silences if abs(s - ideal) <= window and s > previous]
+        point = min(candidates, key=lambda s: abs(s - ideal)) if candidates else ideal
+        points.append(point)
+        ideal = point + target_seconds
+    if points and total_seconds - points[-1] < _MIN_SEGMENT_SECONDS:
+        points.pop()
+    return points
+
+
+def _split_audio(
+    audio_path: str,
+    split_points: list[float],
+    total_seconds: float,
+    out_dir: str,
+) -> list[tuple[str, float, float]]:
+    """Cut audio at split_points with ffmpeg stream copy.
+
+    Returns [(segment_path, start_seconds, end_seconds), ...], or an empty list
+    if any cut fails.
+    """
+    bounds = [0.0] + list(split_points) + [float(total_seconds)]
+    segments = []
+    for index, (start, end) in enumerate(zip(bounds, bounds[1:])):
+        path = os.path.join(out_dir, f"segment-{index:03d}.mp3")
+        cmd = [
+            "ffmpeg", "-y",
+            "-ss", f"{start:.2f}",
+            "-i", audio_path,
+            "-t", f"{end - start:.2f}",
+            "-acodec", "copy",
+            "-vn",
+            path,
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"  ffmpeg failed cutting segment {index + 1}: {e}")
+            return []
+        if result.returncode != 0 or not os.path.exists(path) or os.path.getsize(path) == 0:
+            logger.warning(f"  ffmpeg failed cutting segment {index + 1}: {result.stderr[-200:]}")
+            return []
+        segments.append((path, start, end))
+    return segments
+
+
+def _format_timestamp(seconds: float) -> str:
+    """Format seconds as H:MM:SS or M:SS for segment labels."""
+    seconds = int(seconds)
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
 
 
 def _wait_for_file_active(client: genai.Client, uploaded_file, max_wait_seconds: int = 300) -> None:
@@ -22,6 +22,7 @@ from youtube_transcript_api._errors import (
     IpBlocked,
 )
 
+from src.compaction import anchor_interval, compact_snippets, log_savings, sample_segments
 from src.config import YouTubeSource
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,14 @@ class IpBlockedError(Exception):
     """
 
 
+class ChannelFetchError(Exception):
+    """Raised when yt-dlp cannot list a channel (after retrying network errors).
+
+    Distinct from an empty listing so callers can count the failure against
+    the channel and stop fetching one that keeps failing.
+    """
+
+
 def _make_yta() -> YouTubeTranscriptApi:
     """Create a YouTubeTranscriptApi instance, loading cookies.txt if present.
 
@@ -68,7 +77,7 @@ class VideoInfo:
     duration_seconds: int
     transcript: Optional[str]
     language: str = "en"
-    # Sparse timestamp index: list of (start_seconds, text_snippet) sampled ~every 30s.
+    # Sparse timestamp index: list of (start_seconds, text_snippet) sampled every 30s or more (see anchor_interval).
     # Used to provide Gemini with time anchors for citation markers [t=NNs].
     transcript_segments: tuple = ()
 
@@ -78,12 +87,16 @@ def fetch_new_videos(
     processed_ids: set,
     lookback_hours: int,
     max_videos: int,
+    fetch_transcripts: bool = True,
 ) -> list:
     """Fetch new videos from a YouTube channel.
 
     Returns videos published within lookback_hours that haven't been processed yet.
     If no videos pass the filters, the latest video is included anyway so that
     every configured channel always produces at least one result.
+
+    With fetch_transcripts=False (dry runs) only metadata is fetched: the
+    videos are selected the same way but come back with transcript None.
     """
     logger.info(f"Fetching videos from {source.name} ({source.channel_url})")
 
@@ -108,9 +121,12 @@ def fetch_new_videos(
         if upload_date and not _is_within_lookback(upload_date, lookback_hours):
             continue
 
-        video = _build_video_info(entry, source, upload_date)
+        video = _build_video_info(entry, source, upload_date, fetch_transcripts)
         videos.append(video)
-        logger.info(f"  Found: {video.title} (transcript: {'yes' if video.transcript else 'no'})")
+        if fetch_transcripts:
+            logger.info(f"  Found: {video.title} (transcript: {'yes' if video.transcript else 'no'})")
+        else:
+            logger.info(f"  Found: {video.title}")
 
     # Guarantee at least one video per channel: if all were filtered out
     # (too old or already processed), force-include the latest entry.
@@ -122,7 +138,7 @@ def fetch_new_videos(
             real_date = _get_video_upload_date(video_id)
             if real_date:
                 upload_date = real_date
-            video = _build_video_info(latest, source, upload_date)
+            video = _build_video_info(latest, source, upload_date, fetch_transcripts)
             videos.append(video)
             logger.info(f"  Fallback: {video.title} (outside lookback, included as latest)")
 
@@ -130,14 +146,126 @@ def fetch_new_videos(
     return videos
 
 
+# Most recent uploads listed per channel by a backfill
+_BACKFILL_MAX_ENTRIES = 100
+
+
+def fetch_videos_published_between(
+    source: YouTubeSource,
+    processed_ids: set,
+    start: datetime,
+    end: datetime,
+    fetch_transcripts: bool = True,
+) -> list:
+    """Fetch every unprocessed video a channel published in [start, end) — for backfills.
+
+    Unlike fetch_new_videos there is no per-channel cap and no latest-video
+    fallback.  Entries come newest first, so listing stops at the first
+    video published before start.  Videos whose upload date cannot be
+    determined are skipped, since they cannot be placed on a day.
+    """
+    logger.info(f"Fetching videos from {source.name} published from {start:%Y-%m-%d %H:%M} until {end:%Y-%m-%d %H:%M} UTC")
+
+    videos = []
+    for entry in _get_channel_entries(source.channel_url, _BACKFILL_MAX_ENTRIES):
+        video_id = entry.get("id")
+        if not video_id:
+            continue
+        upload_date = _get_video_upload_date(video_id) or _parse_upload_date(entry.get("upload_date"))
+        if upload_date is None:
+            logger.info(f"  Skipping {video_id}: upload date unknown")
+            continue
+        if upload_date < start:
+            break
+        if upload_date >= end or video_id in processed_ids:
+            continue
+        video = _build_video_info(entry, source, upload_date, fetch_transcripts)
+        videos.append(video)
+        logger.info(f"  Found: {video.title} ({upload_date:%Y-%m-%d})")
+
+    logger.info(f"  {len(videos)} video(s) from {source.name} in range")
+    return videos
+
+
+def fetch_video(video_id: str, sources: list, fetch_transcript: bool = True) -> "VideoInfo":
+    """Fetch one video by ID, regardless of lookback window or processed state.
+
+    The video is attributed to the configured source it was uploaded by
+    (matched by channel name or URL); with a single source in sources it is
+    attributed to that one.  Raises ValueError when the video cannot be
+    looked up or matched to a source.
+    """
+    entry = _get_video_entry(video_id)
+    if entry is None:
+        raise ValueError(f"Could not look up video {video_id}")
+    source = _match_source(entry, sources)
+    if source is None:
+        raise ValueError(
+            f"Video {video_id} is from '{entry.get('channel') or 'an unknown channel'}', "
+            "which is not a configured source — name one with --source"
+        )
+    upload_date = _parse_upload_date(entry.get("upload_date"))
+    video = _build_video_info(entry, source, upload_date, fetch_transcript)
+    logger.info(f"Fetched video {video_id}: {video.title} ({source.name})")
+    return video
+
+
+def _match_source(entry: dict, sources: list) -> Optional[YouTubeSource]:
+    if len(sources) == 1:
+        return sources[0]
+    channel = (entry.get("channel") or entry.get("uploader") or "").casefold()
+    urls = {
+        (entry.get(key) or "").rstrip("/").casefold()
+        for key in ("channel_url", "uploader_url")
+    } - {""}
+    for source in sources:
+        if source.name.casefold() == channel or source.channel_url.rstrip("/").casefold() in urls:
+            return source
+    return None
+
+
+def _get_video_entry(video_id: str) -> Optional[dict]:
+    """Get one video's metadata (title, channel, duration, upload date) via yt-dlp."""
+    cmd = [
+        "yt-dlp",
+        "--no-download",
+        "--dump-json",
+        "--no-warnings",
+        f"https://www.youtube.com/watch?v={video_id}",
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+    except subprocess.TimeoutExpired:
+        logger.error(f"Timeout looking up video {video_id}")
+        return None
+    except FileNotFoundError:
+        logger.error("yt-dlp not found. Install it: pip install yt-dlp")
+        return None
+    if result.returncode != 0:
+        logger.error(f"yt-dlp error for video {video_id}: {result.stderr.strip()}")
+        return None
+    try:
+        return json.loads(result.stdout)
+    except json.JSONDecodeError:
+        logger.error(f"Failed to parse yt-dlp JSON for video {video_id}")
+        return None
+
+
 _TRANSCRIPT_API_PACE_SECONDS = 5  # pause between caption API calls to avoid YouTube 429s
 
 
-def _build_video_info(entry: dict, source: YouTubeSource, upload_date) -> "VideoInfo":
-    """Fetch transcript and build a VideoInfo from a yt-dlp entry dict."""
+def _build_video_info(
+    entry: dict,
+    source: YouTubeSource,
+    upload_date,
+    fetch_transcript: bool = True,
+) -> "VideoInfo":
+    """Fetch transcript (unless fetch_transcript is False) and build a VideoInfo from a yt-dlp entry dict."""
     video_id = entry["id"]
-    transcript, segments = _get_transcript(video_id, language=source.language)
-    time.sleep(_TRANSCRIPT_API_PACE_SECONDS)
+    transcript, segments = None, ()
+    if fetch_transcript:
+        transcript, segments = _get_transcript(video_id, language=source.language)
+        time.sleep(_TRANSCRIPT_API_PACE_SECONDS)
     return VideoInfo(
         video_id=video_id,
         title=entry.get("title", "Untitled"),
@@ -161,6 +289,7 @@ def _get_channel_entries(channel_url: str, max_videos: int) -> list:
 
     Retries up to _CHANNEL_FETCH_RETRIES times on network/DNS errors,
     which covers transient failures like brief DNS outages mid-run.
+    Raises ChannelFetchError when the channel cannot be listed.
     """
     videos_url = f"{channel_url.rstrip('/')}/videos"
     cmd = [
@@ -186,8 +315,7 @@ def _get_channel_entries(channel_url: str, max_videos: int) -> list:
                 logger.warning(f"  Timeout fetching channel (attempt {attempt + 1}), retrying in {wait}s...")
                 time.sleep(wait)
                 continue
-            logger.error(f"Timeout fetching channel after {_CHANNEL_FETCH_RETRIES} attempts: {channel_url}")
-            return []
+            raise ChannelFetchError(f"Timeout fetching channel after {_CHANNEL_FETCH_RETRIES} attempts: {channel_url}")
         except FileNotFoundError:
             logger.error("yt-dlp not found. Install it: pip install yt-dlp")
             return []
@@ -204,8 +332,7 @@ def _get_channel_entries(channel_url: str, max_videos: int) -> list:
                 logger.warning(f"  Network error fetching channel (attempt {attempt + 1}), retrying in {wait}s: {stderr[:120]}")
                 time.sleep(wait)
                 continue
-            logger.error(f"yt-dlp error for {channel_url}: {stderr}")
-            return []
+            raise ChannelFetchError(f"yt-dlp error for {channel_url}: {stderr}")
 
         # Parse successful output
         entries = []
@@ -253,9 +380,9 @@ def _get_transcript(video_id: str, language: str = "en") -> tuple:
 
         try:
             raw = yta.fetch(video_id, languages=languages)
-            text = " ".join(snippet.text for snippet in raw)
-            if text.strip():
-                return text, _sample_segments(raw)
+            text, segments = _build_transcript(raw, video_id, getattr(raw, "language_code", language))
+            if text:
+                return text, segments
         except IpBlocked:
             if attempt < _IP_BLOCK_RETRIES - 1:
                 wait = _IP_BLOCK_BACKOFF_SECONDS[attempt]
@@ -296,37 +423,29 @@ def _get_transcript(video_id: str, language: str = "en") -> tuple:
             first = available[0]
             logger.info(f"  Falling back to transcript language: {first.language_code} for {video_id}")
             raw = first.fetch()
-            text = " ".join(snippet.text for snippet in raw)
-            if text.strip():
-                return text, _sample_segments(raw)
+            text, segments = _build_transcript(raw, video_id, first.language_code)
+            if text:
+                return text, segments
     except Exception as e:
         logger.warning(f"  Transcript fallback failed for {video_id}: {e}")
 
     return None, ()
 
 
-def _sample_segments(raw: list, interval_seconds: int = 30) -> tuple:
-    """Return a sparse sample of transcript segments for timestamp citation.
-
-    Picks one segment per `interval_seconds` window to give Gemini ~30s-resolution
-    time anchors without bloating the prompt with every line.
+def _build_transcript(raw: list, video_id: str, language: str = "en") -> tuple:
+    """Compact fetched snippets and return (text, segments).
 
-    Returns a tuple of (start_seconds: int, text: str) pairs.
+    Rolling-caption repeats, non-speech markers and (in English captions)
+    filler words are removed (see src/compaction.py) and the timestamp index
+    is sampled at an interval that grows with transcript length.  text is ""
+    if nothing is left.
     """
-    if not raw:
-        return ()
-    samples = []
-    next_threshold = 0.0
-    for snippet in raw:
-        # v1.x returns dataclass objects (snippet.start, snippet.text)
-        start = float(snippet.start)
-        if start >= next_threshold:
-            text = snippet.text.strip() if snippet.text else ""
-            if text:
-                samples.append((int(start), text))
-                next_threshold = start + interval_seconds
-            # If text is empty, don't advance the threshold — keep looking
-    return tuple(samples)
+    snippets = compact_snippets(raw, language)
+    if not snippets:
+        return "", ()
+    text = " ".join(snippet.text for snippet in snippets)
+    log_savings(video_id, " ".join(snippet.text or "" for snippet in raw), text)
+    return text, sample_segments(snippets, interval_seconds=anchor_interval(snippets[-1].start))
 
 
 def _get_video_upload_date(video_id: str) -> Optional[datetime]:
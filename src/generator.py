@@ -33,21 +33,8 @@ def generate_summary_files(
 
     Returns a dict with path to the generated file.
     """
-    summaries_dir = output_dir / "summaries" / date_str
-    summaries_dir.mkdir(parents=True, exist_ok=True)
-
     slug = slugify(video.title)
-    summary_path = summaries_dir / f"{slug}.md"
-
-    duration_str = _format_duration(video.duration_seconds)
-
-    content = _build_summary_md(
-        video=video,
-        summary_text=summary,
-        duration_str=duration_str,
-    )
-
-    summary_path.write_text(content, encoding="utf-8")
+    summary_path = _write_summary_md(video, summary, output_dir, date_str, slug)
 
     logger.info(f"  Generated summary for: {video.title}")
 
@@ -57,6 +44,33 @@ def generate_summary_files(
     }
 
 
+def write_streaming_summary(
+    video: VideoInfo,
+    partial_summary: str,
+    output_dir: Path,
+    date_str: str,
+) -> Path:
+    """Rewrite a video's summary file with the text streamed so far.
+
+    Same path and layout as generate_summary_files, which writes the final
+    version once generation completes.  Silent — called once per chunk.
+    """
+    return _write_summary_md(video, partial_summary, output_dir, date_str, slugify(video.title))
+
+
+def _write_summary_md(video: VideoInfo, summary: str, output_dir: Path, date_str: str, slug: str) -> Path:
+    summaries_dir = output_dir / "summaries" / date_str
+    summaries_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = summaries_dir / f"{slug}.md"
+    content = _build_summary_md(
+        video=video,
+        summary_text=summary,
+        duration_str=_format_duration(video.duration_seconds),
+    )
+    summary_path.write_text(content, encoding="utf-8")
+    return summary_path
+
+
 def generate_podcast_summary_files(
     episode: EpisodeInfo,
     summary: str,
@@ -480,6 +494,8 @@ def generate_error_report(
     skipped_items: list,
     output_dir: Path,
     date_str: str,
+    usage: Optional[list] = None,
+    broken_sources: Optional[list] = None,
 ) -> Optional[Path]:
     """Generate an error report if there were any failures or skipped items.
 
@@ -488,11 +504,15 @@ def generate_error_report(
         skipped_items: List of dicts with keys: type, source, title, url, reason, action.
         output_dir: Base output directory.
         date_str: Date string.
+        usage: Optional markdown lines from the Gemini usage ledger, appended
+            as a "Gemini Usage" section.
+        broken_sources: Optional markdown lines for sources that are cooling
+            down after repeated failures (listed even when nothing else failed).
 
     Returns:
-        Path to error report, or None if no errors and no skipped items.
+        Path to error report, or None if no errors, skipped items or broken sources.
     """
-    if not errors and not skipped_items:
+    if not errors and not skipped_items and not broken_sources:
         return None
 
     errors_dir = output_dir / "errors"
@@ -527,6 +547,13 @@ def generate_error_report(
                 lines.append(f"  - **Action: {item['action']}**")
                 lines.append("")
 
+    # --- Sources skipped while they keep failing ---
+    if broken_sources:
+        lines.append(f"## Known-Broken Sources ({len(broken_sources)})")
+        lines.append("")
+        lines.extend(broken_sources)
+        lines.append("")
+
     # --- Raw errors section ---
     if errors:
         lines.append(f"## Raw Errors ({len(errors)})")
@@ -535,6 +562,13 @@ def generate_error_report(
             lines.append(f"- **{err['source']}**: {err['message']}")
         lines.append("")
 
+    # --- Gemini usage section (tokens, latency, retries) ---
+    if usage:
+        lines.append("## Gemini Usage")
+        lines.append("")
+        lines.extend(usage)
+        lines.append("")
+
     error_path.write_text("\n".join(lines), encoding="utf-8")
     logger.info(f"Generated error report: {error_path}")
     return error_path
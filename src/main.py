@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
 import logging
 import sys
-from datetime import datetime, timezone
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Optional
 
 # Load .env file if present (safe no-op if file doesn't exist)
 try:
@@ -15,11 +20,27 @@ try:
 except ImportError:
     pass
 
+from src.audio_cache import evict_audio, prune_audio_cache
+from src.cadence import CadenceModel, FetchPlan
+from src.circuit_breaker import CircuitOpenError, circuit_breaker, configure_circuit_breaker
 from src.cleanup import cleanup_old_content, cleanup_state
+from src.client_pool import create_client_pool
 from src.config import load_config, ConfigError
-from src.fetchers.youtube import fetch_new_videos, IpBlockedError, VideoInfo, _get_transcript
+from src.fetchers.youtube import (
+    ChannelFetchError,
+    fetch_new_videos,
+    fetch_video,
+    fetch_videos_published_between,
+    IpBlockedError,
+    VideoInfo,
+    _get_transcript,
+)
 from src.fetchers.podcast import (
+    ChunkingOptions,
+    EpisodeInfo,
+    fetch_episodes_published_between,
     fetch_new_episodes,
+    find_episode,
     download_and_transcribe,
     RSSLookupError,
     TranscriptionError,
@@ -30,6 +51,7 @@ from src.generator import (
     generate_daily_digest,
     generate_podcast_daily_digest,
     generate_error_report,
+    write_streaming_summary,
 )
 from src.state import (
     load_state,
@@ -44,51 +66,220 @@ from src.state import (
     promote_ip_blocked,
     expire_ip_blocked,
     update_rss_cache,
+    gemini_file_cache,
+    expire_gemini_files,
+    PENDING_PODCASTS,
+    PENDING_YOUTUBE,
+    get_pending,
+    mark_pending,
+    expire_pending,
+    is_pending_due,
+    pending_attempts,
+    get_breaker_tripped_at,
+    add_quota_usage,
+    get_quota_usage,
+    persist_quota_usage,
+    get_item_timings,
+    get_source_cadence,
+    set_item_timings,
+    set_source_cadence,
+    record_source_failure,
+    clear_source_failure,
+    get_source_failures,
+    is_source_cooling_down,
+    set_breaker_tripped_at,
+)
+from src.summarizer import (
+    PackedItem,
+    QuotaExhaustedError,
+    SHORT_VIDEO_SECONDS,
+    StreamOptions,
+    create_client,
+    disable_prefix_caching,
+    disable_request_hedging,
+    disable_shared_throttle,
+    enable_prefix_caching,
+    enable_request_hedging,
+    enable_shared_throttle,
+    reset_route_latencies,
+    route_latency_report,
+    set_request_timeout,
+    summarize,
+    summarize_packed,
 )
-from src.summarizer import create_client, summarize, QuotaExhaustedError
 from src.notifier import send_run_notification
+from src.response_cache import disable_response_cache, enable_response_cache, prune_response_cache
+from src.scheduler import (
+    PODCAST,
+    YOUTUBE,
+    DurationModel,
+    WorkItem,
+    episode_work_item,
+    plan_work,
+    run_deadline,
+    source_priority,
+    video_work_item,
+)
+from src.usage_ledger import CallRecord, ledger_item, reset_usage_ledger, usage_ledger
 from src.viewer import generate_viewer
 
 logger = logging.getLogger(__name__)
 
+# Appended to a streamed summary that was cut off at max_generation_seconds
+_TRUNCATED_NOTE = "\n\n*(Summary cut short — generation hit its time limit.)*"
+
+_BREAKER_OPEN_REASON = "Gemini unavailable — circuit breaker open after repeated server errors"
+
+# A video without captions is checked again after this, doubling per check
+# (YouTube usually generates auto-captions within 1-3 hours of upload) ...
+_CAPTIONS_RETRY_SECONDS = 60 * 60
+# ... and after this many checks it is taken to have captions disabled
+_MAX_CAPTION_CHECKS = 4
+# Items that failed transiently are retried after this, doubling per attempt
+_FAILED_RETRY_SECONDS = 30 * 60
+
+# Serialises per-call quota writes (calls finish on worker threads too)
+_quota_lock = threading.Lock()
+
+
+def _video_pending_info(video: VideoInfo) -> dict:
+    """What state["pending"] keeps to rebuild a deferred video (transcript is re-fetched)."""
+    return {
+        "title": video.title,
+        "url": video.url,
+        "channel": video.channel_name,
+        "category": video.category,
+        "upload_date": video.upload_date.isoformat(),
+        "duration_seconds": video.duration_seconds,
+        "language": video.language,
+    }
+
+
+def _episode_pending_info(episode: EpisodeInfo) -> dict:
+    """What state["pending"] keeps to rebuild a deferred podcast episode."""
+    info = dataclasses.asdict(episode)
+    del info["episode_id"], info["transcript"]
+    info["published_at"] = episode.published_at.isoformat()
+    return info
 
-def _print_dry_run_table(items: list[tuple[str, str, str, str]]) -> None:
-    """Print a formatted table of items that would be processed on a real run."""
+
+def _pending_entry(item) -> tuple[str, str, dict]:
+    """Return (section, item_id, info) for queueing a video or episode in state["pending"]."""
+    if isinstance(item, VideoInfo):
+        return PENDING_YOUTUBE, item.video_id, _video_pending_info(item)
+    return PENDING_PODCASTS, item.episode_id, _episode_pending_info(item)
+
+
+def _episode_from_pending(episode_id: str, info: dict) -> EpisodeInfo:
+    fields = {f.name for f in dataclasses.fields(EpisodeInfo)}
+    kwargs = {k: v for k, v in info.items() if k in fields}
+    kwargs["published_at"] = datetime.fromisoformat(info["published_at"])
+    return EpisodeInfo(episode_id=episode_id, **kwargs)
+
+
+def _dry_run_row(work: WorkItem) -> tuple[str, str, str, str, str, str]:
+    """(type, source, category, published, length, title) for one planned item."""
+    item = work.item
+    published = item.upload_date if work.kind == YOUTUBE else item.published_at
+    seconds = item.duration_seconds
+    return (
+        "YouTube" if work.kind == YOUTUBE else "Podcast",
+        work.source,
+        item.category,
+        published.strftime("%Y-%m-%d"),
+        f"{round(seconds / 60)} min" if seconds > 0 else "?",
+        item.title + (" (pending)" if work.pending else ""),
+    )
+
+
+def _print_dry_run_table(scheduled: list[WorkItem], deferred: list[WorkItem] = ()) -> None:
+    """Print a formatted table of items that would be processed on a real run, in run order."""
     BOLD  = "\033[1m"
     DIM   = "\033[2m"
     GREEN = "\033[32m"
     RESET = "\033[0m"
 
     print()  # blank line after log output
-    if not items:
+    if not scheduled and not deferred:
         print(f"{BOLD}Dry run complete — nothing to process.{RESET}")
         print(f"{DIM}All sources are up to date within the lookback window.{RESET}")
         return
 
-    print(f"{BOLD}Dry run complete — {len(items)} item(s) would be processed:{RESET}\n")
+    print(f"{BOLD}Dry run complete — {len(scheduled)} item(s) would be processed:{RESET}\n")
 
-    col_type   = max(len("Type"),   max(len(t[0]) for t in items))
-    col_source = max(len("Source"), max(len(t[1]) for t in items))
-    col_cat    = max(len("Category"), max(len(t[2]) for t in items))
-    # Title gets the rest; cap at 60 chars
-    col_title  = min(60, max(len("Title"), max(len(t[3]) for t in items)))
+    items = [_dry_run_row(w) for w in scheduled]
+    if items:
+        col_type   = max(len("Type"),   max(len(t[0]) for t in items))
+        col_source = max(len("Source"), max(len(t[1]) for t in items))
+        col_cat    = max(len("Category"), max(len(t[2]) for t in items))
+        col_date   = len("Published")
+        col_len    = max(len("Length"), max(len(t[4]) for t in items))
+        # Title gets the rest; cap at 60 chars
+        col_title  = min(60, max(len("Title"), max(len(t[5]) for t in items)))
 
-    header = (
-        f"  {'Type':<{col_type}}  {'Source':<{col_source}}  "
-        f"{'Category':<{col_cat}}  {'Title':<{col_title}}"
-    )
-    sep = "  " + "-" * (col_type + col_source + col_cat + col_title + 6)
-    print(f"{BOLD}{header}{RESET}")
-    print(sep)
-    for typ, source, category, title in items:
-        truncated = title if len(title) <= col_title else title[:col_title - 1] + "…"
-        print(f"  {GREEN}{typ:<{col_type}}{RESET}  {source:<{col_source}}  "
-              f"{DIM}{category:<{col_cat}}{RESET}  {truncated}")
+        header = (
+            f"  {'Type':<{col_type}}  {'Source':<{col_source}}  "
+            f"{'Category':<{col_cat}}  {'Published':<{col_date}}  "
+            f"{'Length':>{col_len}}  {'Title':<{col_title}}"
+        )
+        sep = "  " + "-" * (col_type + col_source + col_cat + col_date + col_len + col_title + 10)
+        print(f"{BOLD}{header}{RESET}")
+        print(sep)
+        for typ, source, category, published, length, title in items:
+            truncated = title if len(title) <= col_title else title[:col_title - 1] + "…"
+            print(f"  {GREEN}{typ:<{col_type}}{RESET}  {source:<{col_source}}  "
+                  f"{DIM}{category:<{col_cat}}{RESET}  {published:<{col_date}}  "
+                  f"{length:>{col_len}}  {truncated}")
+    if deferred:
+        print(f"\n{DIM}{len(deferred)} more item(s) over today's Gemini request budget would be deferred:{RESET}")
+        for work in deferred:
+            print(f"{DIM}  {work.source}: {work.item.title}{RESET}")
     print()
 
 
-def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = False) -> None:
-    """Run the full Morning Brief pipeline (YouTube + Podcasts)."""
+def run(
+    config_path: Path,
+    output_dir: Path,
+    state_path: Path,
+    dry_run: bool = False,
+    cache_dir: Optional[Path] = None,
+    no_cache: bool = False,
+    retry_pending: bool = False,
+    source_name: Optional[str] = None,
+    video_ids: tuple[str, ...] = (),
+    episode_ids: tuple[str, ...] = (),
+    backfill: Optional[tuple[date, date]] = None,
+    gemini_client=None,
+    incremental: bool = False,
+    day_report: Optional[dict] = None,
+) -> None:
+    """Run the full Morning Brief pipeline (YouTube + Podcasts).
+
+    cache_dir holds run-to-run caches (downloaded podcast audio, Gemini
+    responses); it defaults to a .cache directory next to the state file.
+    no_cache bypasses the Gemini response cache for this run.
+    retry_pending works only the pending queue (items that are due) and the
+    IP-blocked queue, without fetching any channel or feed.
+
+    Targeted runs: source_name limits the run to the channel or show of that name
+    (its new and pending items); video_ids / episode_ids process just those
+    items, even if already processed.  Results merge into today's digests and
+    only the targeted items are updated in state.
+
+    backfill=(first, last) lists every unprocessed item published on those
+    days (UTC, inclusive) instead of the lookback window, processes them
+    backfill_parallel_items at a time within the request budget, and files
+    each under the day it was published rather than today.  Pending and
+    IP-blocked queues are left for the regular runs; anything a backfill
+    does not finish is picked up by running it again.
+
+    gemini_client, incremental and day_report are for the daemon's polls: the
+    client (set up once by _setup_gemini) is reused, only the digests that
+    gained entries are regenerated, without a notification email, and the
+    run report is written from the errors and skipped items of every poll
+    that day (collected in day_report).  Errors in single items do not end
+    an incremental run with a non-zero exit; fatal ones still do.
+    """
     # Load config
     try:
         config = load_config(config_path)
@@ -96,6 +287,34 @@ def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = F
         logger.error(f"Configuration error: {e}")
         sys.exit(1)
 
+    youtube_sources, podcast_shows = config.youtube_sources, config.podcast_shows
+    if source_name:
+        youtube_sources = [s for s in youtube_sources if s.name.casefold() == source_name.casefold()]
+        podcast_shows = [s for s in podcast_shows if s.name.casefold() == source_name.casefold()]
+        if not youtube_sources and not podcast_shows:
+            logger.error(f"No YouTube source or podcast show named '{source_name}' in {config_path}")
+            sys.exit(1)
+    targeted = bool(source_name or video_ids or episode_ids or backfill)
+    backfill_window = None
+    if backfill:
+        first, last = backfill
+        if first > last:
+            logger.error(f"Backfill range is empty: {first} is after {last}")
+            sys.exit(1)
+        # Days at or past the retention cutoff would be cleaned up again right away
+        oldest = datetime.now().date() - timedelta(days=config.settings.max_age_days - 1)
+        if first < oldest:
+            logger.warning(f"Backfill starts before the {config.settings.max_age_days}-day retention window — starting at {oldest}")
+            first = oldest
+        if first > last:
+            logger.error(f"Backfill range is empty: {first} is after {last}")
+            sys.exit(1)
+        backfill_window = (
+            datetime(first.year, first.month, first.day, tzinfo=timezone.utc),
+            datetime(last.year, last.month, last.day, tzinfo=timezone.utc) + timedelta(days=1),
+        )
+        logger.info(f"Backfill: items published {first} to {last} (UTC)")
+
     date_str = datetime.now().strftime("%Y-%m-%d")  # local time — avoids UTC date drift for late-night runs
     logger.info(f"Morning Brief run: {date_str}")
 
@@ -110,6 +329,18 @@ def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = F
     if expired:
         logger.info(f"Expired {len(expired)} ip_blocked video(s) past TTL: {expired}")
     ip_blocked_videos = get_ip_blocked(state)
+    expire_gemini_files(state)
+    gemini_files = gemini_file_cache(state)
+    expired = expire_pending(state)
+    if expired:
+        logger.info(f"Expired {len(expired)} pending item(s) past TTL: {expired}")
+    pending_videos = get_pending(state, PENDING_YOUTUBE)
+    pending_episodes = get_pending(state, PENDING_PODCASTS)
+    if pending_videos or pending_episodes:
+        logger.info(
+            f"Pending queue: {len(pending_videos)} video(s), {len(pending_episodes)} episode(s) "
+            "deferred from an earlier run"
+        )
     if ip_blocked_videos:
         logger.info(
             f"IP-blocked queue: {len(ip_blocked_videos)} video(s) pending retry — "
@@ -121,14 +352,32 @@ def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = F
         f"{len(processed_episode_ids)} podcast episodes"
     )
 
-    # Create Gemini client (skip in dry-run mode)
-    gemini_client = None
+    cache_root = cache_dir or state_path.parent / ".cache"
+    audio_cache_dir = cache_root / "audio"
+    response_cache_dir = cache_root / "responses"
+    chunking = None
+    if config.settings.chunk_long_episodes:
+        chunking = ChunkingOptions(
+            chunk_minutes=config.settings.podcast_chunk_minutes,
+            max_audio_minutes=config.settings.max_chunked_audio_minutes,
+            max_parallel=config.settings.max_parallel_chunks,
+        )
+
+    transcript_chunk_tokens = (
+        config.settings.transcript_chunk_tokens if config.settings.chunk_long_transcripts else 0
+    )
+
+    # Create Gemini client (skip in dry-run mode); the daemon passes in its own
     if not dry_run:
-        try:
-            gemini_client = create_client()
-        except ValueError as e:
-            logger.error(str(e))
-            sys.exit(1)
+        reset_usage_ledger()
+        usage_ledger().on_record = lambda record: _record_quota_usage(state, state_path, record)
+        prune_audio_cache(audio_cache_dir, config.settings.audio_cache_max_mb * 1024 * 1024)
+        if not no_cache:
+            prune_response_cache(response_cache_dir, config.settings.response_cache_max_mb * 1024 * 1024)
+        if gemini_client is None:
+            gemini_client = _setup_gemini(config, state, response_cache_dir, no_cache)
+    else:
+        gemini_client = None
 
     digest_entries = []
     podcast_entries = []
@@ -137,92 +386,312 @@ def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = F
     # Each entry: {"type": "youtube"|"podcast", "source": str, "title": str,
     #              "url": str, "reason": str, "action": str}
     skipped_items = []
-    # Dry-run only: (type, source, category, title) tuples collected for summary table
-    dry_run_items: list[tuple[str, str, str, str]] = []
+    # Backfill workers (_process_concurrently) share these lists and state, so
+    # item processing makes every update to them under this lock
+    record_lock = threading.RLock()
 
     # -----------------------------------------------------------------------
     # YouTube pipeline
     # -----------------------------------------------------------------------
 
-    def _process_video(video) -> bool:
+    def _item_day(item) -> str:
+        """The day an item's output is filed under: today, or its publication day in a backfill."""
+        if backfill_window is None:
+            return date_str
+        published = item.upload_date if isinstance(item, VideoInfo) else item.published_at
+        return published.astimezone(timezone.utc).strftime("%Y-%m-%d")
+
+    def _queue_retry(item, reason: str, backoff_seconds: float = 0) -> None:
+        """Queue a video or episode in state["pending"] for a later run.
+
+        With backoff_seconds the retry waits backoff_seconds × 2^(earlier attempts).
+        Backfills queue nothing: items they do not finish stay unprocessed, so
+        running the backfill again picks them up (and files them on the right day).
+        """
+        if backfill_window is not None:
+            return
+        section, item_id, info = _pending_entry(item)
+        with record_lock:
+            retry_in = backoff_seconds * 2 ** pending_attempts(state, section, item_id) if backoff_seconds else 0
+            mark_pending(state, section, item_id, info, date_str, reason, retry_in)
+
+    def _defer(item, reason: str) -> None:
+        """Queue a video or episode for the next run and report it as deferred."""
+        logger.warning(f"  Deferred to next run ({reason}): {item.title}")
+        with record_lock:
+            _queue_retry(item, reason)
+            if isinstance(item, VideoInfo):
+                item_type, source, url = "youtube", item.channel_name, item.url
+            else:
+                item_type, source, url = "podcast", item.show_name, item.episode_url
+            skipped_items.append({
+                "type": item_type,
+                "source": source,
+                "title": item.title,
+                "url": url,
+                "reason": reason,
+                "action": (
+                    "Not processed — run the backfill again to pick it up." if backfill_window is not None
+                    else "Deferred — retried first on the next run."
+                ),
+            })
+
+    def _process_video(video, summary: Optional[str] = None) -> bool:
         """Summarize and generate output for a single video.
 
+        summary is passed in when the video was already summarised as part of
+        a packed request; otherwise summarize() is called here.
         Returns True on success, False if summarization failed (non-fatal).
         Raises QuotaExhaustedError / sys.exit on fatal errors.
         """
         nonlocal digest_entries, errors, skipped_items
+        day = _item_day(video)
 
         if not video.transcript:
-            msg = f"No transcript available for '{video.title}' — skipping"
+            checks = pending_attempts(state, PENDING_YOUTUBE, video.video_id) + 1
+            if checks < _MAX_CAPTION_CHECKS and backfill_window is None:
+                # Auto-captions are often not ready yet for a fresh upload
+                logger.warning(f"No transcript yet for '{video.title}' — queued to check again")
+                with record_lock:
+                    _queue_retry(video, "Awaiting captions", _CAPTIONS_RETRY_SECONDS)
+                    skipped_items.append({
+                        "type": "youtube",
+                        "source": video.channel_name,
+                        "title": video.title,
+                        "url": video.url,
+                        "reason": "Transcript not available yet (captions may still be generating)",
+                        "action": "Queued — captions are checked again by the next runs.",
+                    })
+                return False
+            msg = f"No transcript available for '{video.title}' after {checks} checks — skipping"
             logger.warning(msg)
-            skipped_items.append({
-                "type": "youtube",
-                "source": video.channel_name,
-                "title": video.title,
-                "url": video.url,
-                "reason": "Transcript unavailable (captions disabled or video unavailable)",
-                "action": "No action needed — captions are disabled for this video.",
-            })
-            # Mark as processed so this video is not retried on future runs.
-            # Captions disabled is a permanent condition for a given video.
-            mark_youtube_processed(state, video.video_id, date_str,
-                                   channel=video.channel_name, title=video.title)
+            with record_lock:
+                skipped_items.append({
+                    "type": "youtube",
+                    "source": video.channel_name,
+                    "title": video.title,
+                    "url": video.url,
+                    "reason": "Transcript unavailable (captions disabled or video unavailable)",
+                    "action": "No action needed — captions are disabled for this video.",
+                })
+                # Mark as processed so this video is not retried on future runs.
+                mark_youtube_processed(state, video.video_id, day,
+                                       channel=video.channel_name, title=video.title)
             return False
 
+        stream = None
+        if summary is None and config.settings.stream_summaries:
+            def _write_partial(text: str) -> None:
+                try:
+                    write_streaming_summary(video, text, output_dir, day)
+                except OSError as e:
+                    logger.debug(f"Could not write streamed summary for '{video.title}': {e}")
+
+            stream = StreamOptions(
+                on_text=_write_partial,
+                max_seconds=config.settings.max_generation_seconds,
+            )
+
+        if summary is None:
+            try:
+                with ledger_item(f"{video.channel_name}: {video.title}"):
+                    summary = summarize(
+                        client=gemini_client,
+                        model=config.settings.gemini_model,
+                        title=video.title,
+                        channel_name=video.channel_name,
+                        transcript=video.transcript,
+                        duration_seconds=video.duration_seconds,
+                        language=video.language,
+                        transcript_segments=video.transcript_segments,
+                        chunk_tokens=transcript_chunk_tokens,
+                        max_parallel=config.settings.max_parallel_chunks,
+                        stream=stream,
+                        routes=config.settings.model_routes,
+                        max_input_tokens=config.settings.max_input_tokens,
+                    )
+            except QuotaExhaustedError:
+                raise  # bubble up to caller for early-exit handling
+            except CircuitOpenError:
+                _defer(video, _BREAKER_OPEN_REASON)
+                return False
+            except Exception as e:
+                error_str = str(e).lower()
+                if "401" in str(e) or "403" in str(e) or "api_key_invalid" in error_str or "permission_denied" in error_str:
+                    logger.error(f"UNRECOVERABLE: Gemini auth failed — check GEMINI_API_KEY: {e}")
+                    with record_lock:
+                        errors.append({"source": "Gemini/AuthError", "message": str(e)})
+                        generate_error_report(*_day_report(errors, skipped_items, date_str, day_report), output_dir, date_str)
+                    sys.exit(1)
+                msg = f"Summarization failed for '{video.title}': {e}"
+                logger.error(msg)
+                with record_lock:
+                    errors.append({"source": f"Gemini/{video.channel_name}", "message": msg})
+                    _queue_retry(video, f"Gemini summarization error: {e}", _FAILED_RETRY_SECONDS)
+                    skipped_items.append({
+                        "type": "youtube",
+                        "source": video.channel_name,
+                        "title": video.title,
+                        "url": video.url,
+                        "reason": f"Gemini summarization error: {e}",
+                        "action": "Transient API error — queued for retry by the next run.",
+                    })
+                return False
+
+        if stream is not None and stream.stats.ttft_seconds is not None:
+            logger.info(
+                f"  Streamed: first token {stream.stats.ttft_seconds:.1f}s, "
+                f"total {stream.stats.total_seconds:.1f}s"
+            )
+            if stream.stats.truncated:
+                summary += _TRUNCATED_NOTE
+
         try:
-            summary = summarize(
-                client=gemini_client,
-                model=config.settings.gemini_model,
-                title=video.title,
-                channel_name=video.channel_name,
-                transcript=video.transcript,
-                duration_seconds=video.duration_seconds,
-                language=video.language,
-                transcript_segments=video.transcript_segments,
+            paths = generate_summary_files(
+                video=video,
+                summary=summary,
+                output_dir=output_dir,
+                date_str=day,
             )
+        except Exception as e:
+            msg = f"Failed to write summary files for '{video.title}': {e}"
+            logger.error(msg)
+            with record_lock:
+                errors.append({"source": f"FileWrite/{video.channel_name}", "message": msg})
+                _queue_retry(video, msg, _FAILED_RETRY_SECONDS)
+            return False
+
+        with record_lock:
+            digest_entries.append({"video": video, "paths": paths, "error": None, "date": day})
+            mark_youtube_processed(state, video.video_id, day,
+                                   channel=video.channel_name, title=video.title)
+        logger.info(f"  Processed: {video.title}")
+        return True
+
+    def _summarize_pack(pack: list) -> list[Optional[str]]:
+        """Summarise a pack of short videos in one request.
+
+        Returns one summary (or None → summarise singly) per video.  Any error
+        other than quota exhaustion falls back to per-video requests.
+        """
+        if len(pack) < 2:
+            return [None] * len(pack)
+        logger.info(f"Packing {len(pack)} short videos into one request")
+        try:
+            with ledger_item(f"Packed request ({len(pack)} short videos)"):
+                return summarize_packed(
+                    gemini_client,
+                    config.settings.gemini_model,
+                    [
+                        PackedItem(
+                            title=v.title,
+                            channel_name=v.channel_name,
+                            transcript=v.transcript,
+                            duration_seconds=v.duration_seconds,
+                            language=v.language,
+                            transcript_segments=v.transcript_segments,
+                        )
+                        for v in pack
+                    ],
+                )
+        except QuotaExhaustedError:
+            raise
+        except Exception as e:
+            logger.warning(f"  Packed request failed ({e}) — summarising videos one by one")
+            return [None] * len(pack)
+
+    def _process_episode(episode) -> bool:
+        """Transcribe, summarise and write output for a single podcast episode.
+
+        Returns True on success, False on a non-fatal failure (reported in
+        errors / skipped_items, or deferred while the Gemini breaker is open).
+        Raises QuotaExhaustedError / sys.exit on fatal errors.
+        """
+        day = _item_day(episode)
+        try:
+            with ledger_item(f"{episode.show_name}: {episode.title}"):
+                summary = download_and_transcribe(
+                    episode=episode,
+                    gemini_client=gemini_client,
+                    gemini_model=config.settings.gemini_model,
+                    max_audio_minutes=config.settings.max_audio_minutes,
+                    audio_cache_dir=audio_cache_dir,
+                    upload_cache=gemini_files,
+                    chunking=chunking,
+                    routes=config.settings.model_routes,
+                    max_input_tokens=config.settings.max_input_tokens,
+                )
         except QuotaExhaustedError:
             raise  # bubble up to caller for early-exit handling
+        except CircuitOpenError:
+            _defer(episode, _BREAKER_OPEN_REASON)
+            return False
+        except TranscriptionError as e:
+            msg = str(e)
+            logger.error(f"  Transcription failed for '{episode.title}': {msg}")
+            with record_lock:
+                errors.append({"source": f"Podcast/Transcription/{episode.show_name}", "message": msg})
+                _queue_retry(episode, f"Transcription failed: {msg}", _FAILED_RETRY_SECONDS)
+                skipped_items.append({
+                    "type": "podcast",
+                    "source": episode.show_name,
+                    "title": episode.title,
+                    "url": episode.episode_url,
+                    "reason": f"Transcription failed: {msg}",
+                    "action": (
+                        "Audio download or Gemini transcription failed. "
+                        "Check if the episode audio URL is accessible and re-run."
+                    ),
+                })
+            return False
         except Exception as e:
             error_str = str(e).lower()
-            if "401" in str(e) or "403" in str(e) or "api_key_invalid" in error_str or "permission_denied" in error_str:
+            if "401" in str(e) or "403" in str(e) or "api_key_invalid" in error_str:
                 logger.error(f"UNRECOVERABLE: Gemini auth failed — check GEMINI_API_KEY: {e}")
-                errors.append({"source": "Gemini/AuthError", "message": str(e)})
-                generate_error_report(errors, skipped_items, output_dir, date_str)
+                with record_lock:
+                    errors.append({"source": "Gemini/AuthError", "message": str(e)})
+                    generate_error_report(*_day_report(errors, skipped_items, date_str, day_report), output_dir, date_str)
                 sys.exit(1)
-            msg = f"Summarization failed for '{video.title}': {e}"
+            msg = f"Processing failed for '{episode.title}': {e}"
             logger.error(msg)
-            errors.append({"source": f"Gemini/{video.channel_name}", "message": msg})
-            skipped_items.append({
-                "type": "youtube",
-                "source": video.channel_name,
-                "title": video.title,
-                "url": video.url,
-                "reason": f"Gemini summarization error: {e}",
-                "action": "Transient API error — will retry on next run.",
-            })
+            with record_lock:
+                errors.append({"source": f"Podcast/{episode.show_name}", "message": msg})
+                _queue_retry(episode, str(e), _FAILED_RETRY_SECONDS)
+                skipped_items.append({
+                    "type": "podcast",
+                    "source": episode.show_name,
+                    "title": episode.title,
+                    "url": episode.episode_url,
+                    "reason": str(e),
+                    "action": "Transient error — queued for retry by the next run.",
+                })
             return False
 
         try:
-            paths = generate_summary_files(
-                video=video,
+            paths = generate_podcast_summary_files(
+                episode=episode,
                 summary=summary,
                 output_dir=output_dir,
-                date_str=date_str,
+                date_str=day,
             )
         except Exception as e:
-            msg = f"Failed to write summary files for '{video.title}': {e}"
+            msg = f"File generation failed for '{episode.title}': {e}"
             logger.error(msg)
-            errors.append({"source": f"FileWrite/{video.channel_name}", "message": msg})
+            with record_lock:
+                errors.append({"source": f"Generator/Podcast/{episode.show_name}", "message": msg})
+                _queue_retry(episode, msg, _FAILED_RETRY_SECONDS)
+                podcast_entries.append({"episode": episode, "paths": None, "error": str(e), "date": day})
             return False
 
-        digest_entries.append({"video": video, "paths": paths, "error": None})
-        mark_youtube_processed(state, video.video_id, date_str,
-                               channel=video.channel_name, title=video.title)
-        logger.info(f"  Processed: {video.title}")
+        with record_lock:
+            podcast_entries.append({"episode": episode, "paths": paths, "error": None, "date": day})
+            mark_podcast_processed(state, episode.episode_id, day)
+            processed_episode_ids.add(episode.episode_id)
+        evict_audio(audio_cache_dir, episode.audio_url)
         return True
 
     # Retry previously IP-blocked videos first (they bypass the lookback window)
-    if ip_blocked_videos and not dry_run:
+    if ip_blocked_videos and not dry_run and not targeted:
         logger.info(f"Retrying {len(ip_blocked_videos)} previously IP-blocked video(s)...")
         for video_id, info in list(ip_blocked_videos.items()):
             title = info.get("title", video_id)
@@ -274,17 +743,148 @@ def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = F
                 _save_and_generate(
                     state, state_path, rss_cache, digest_entries, podcast_entries,
                     errors, skipped_items, output_dir, date_str, config,
+                    incremental=incremental, day_report=day_report,
                 )
                 return
 
-    for source in config.youtube_sources:
+    # -----------------------------------------------------------------------
+    # Collect every candidate, plan against the Gemini budget, then process
+    # -----------------------------------------------------------------------
+    candidates: list[WorkItem] = []
+
+    # Items deferred by an earlier run; their IDs are kept out of this run's
+    # source fetches either way, but only those whose next attempt is due are
+    # scheduled.  Videos get their transcript when they run.  A dry run goes
+    # through the same selection and planning, but fetches metadata only.
+    processed_video_ids.update(pending_videos)
+    processed_episode_ids.update(pending_episodes)
+    pending_videos = {k: v for k, v in pending_videos.items() if is_pending_due(v)}
+    pending_episodes = {k: v for k, v in pending_episodes.items() if is_pending_due(v)}
+    scan_sources, scan_shows = youtube_sources, podcast_shows
+    if video_ids or episode_ids:
+        # Only the named items, fetched directly below
+        pending_videos, pending_episodes = {}, {}
+        scan_sources, scan_shows = [], []
+    elif backfill_window is not None:
+        # Pending items are filed under the day they run; leave them to regular runs
+        pending_videos, pending_episodes = {}, {}
+    elif source_name:
+        pending_videos = {k: v for k, v in pending_videos.items()
+                          if v.get("channel") in {s.name for s in youtube_sources}}
+        pending_episodes = {k: v for k, v in pending_episodes.items()
+                            if v.get("show_name") in {s.name for s in podcast_shows}}
+    if retry_pending:
+        logger.info(
+            f"Retry run: {len(pending_videos)} video(s), {len(pending_episodes)} episode(s) due — "
+            "not fetching sources"
+        )
+        scan_sources, scan_shows = [], []
+    for video_id, info in pending_videos.items():
+        video = VideoInfo(
+            video_id=video_id,
+            title=info.get("title", video_id),
+            url=info.get("url", f"https://www.youtube.com/watch?v={video_id}"),
+            channel_name=info.get("channel", ""),
+            category=info.get("category", ""),
+            upload_date=datetime.fromisoformat(info["upload_date"]) if info.get("upload_date") else datetime.now(timezone.utc),
+            duration_seconds=info.get("duration_seconds", 0),
+            transcript=None,
+            language=info.get("language", "en"),
+        )
+        priority = source_priority(config, YOUTUBE, video.channel_name, video.category)
+        candidates.append(video_work_item(video, priority, transcript_chunk_tokens, pending=True))
+
+    for episode_id, info in pending_episodes.items():
         try:
-            videos = fetch_new_videos(
-                source=source,
-                processed_ids=processed_video_ids,
-                lookback_hours=config.settings.lookback_hours,
-                max_videos=config.settings.max_videos_per_channel,
-            )
+            episode = _episode_from_pending(episode_id, info)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"  Pending episode {episode_id} is unreadable ({e}) — skipping it")
+            continue
+        priority = source_priority(config, PODCAST, episode.show_name, episode.category)
+        candidates.append(episode_work_item(
+            episode, priority, config.settings.max_audio_minutes, chunking, pending=True,
+        ))
+
+    for video_id in video_ids:
+        try:
+            video = fetch_video(video_id, youtube_sources, fetch_transcript=not dry_run)
+        except Exception as e:
+            logger.error(f"Cannot process video {video_id}: {e}")
+            errors.append({"source": f"YouTube/{video_id}", "message": str(e)})
+            continue
+        priority = source_priority(config, YOUTUBE, video.channel_name, video.category)
+        candidates.append(video_work_item(video, priority, transcript_chunk_tokens, metadata_only=dry_run))
+
+    for episode_id in episode_ids:
+        episode = None
+        for show in podcast_shows:
+            try:
+                episode = find_episode(show, episode_id, rss_cache)
+            except Exception as e:
+                logger.warning(f"  Could not search '{show.name}' for episode {episode_id}: {e}")
+                continue
+            if episode is not None:
+                break
+        if episode is None:
+            msg = f"Episode {episode_id} not found in any configured podcast feed"
+            logger.error(msg)
+            errors.append({"source": f"Podcast/{episode_id}", "message": msg})
+            continue
+        priority = source_priority(config, PODCAST, episode.show_name, episode.category)
+        candidates.append(episode_work_item(episode, priority, config.settings.max_audio_minutes, chunking))
+
+    # Regular and daemon runs skip sources unlikely to have posted since they
+    # were last fetched; manual --source, targeted and backfill runs always fetch
+    cadence = CadenceModel(get_source_cadence(state))
+    use_cadence = config.settings.learn_source_cadence and (incremental or not targeted)
+
+    def _cooling_down(label: str) -> bool:
+        """Skip a source that keeps failing until its cool-down ends (a manual --source run tries anyway)."""
+        if source_name and not incremental:
+            return False
+        if not is_source_cooling_down(state, label):
+            return False
+        logger.info(f"Skipping {label} — failing since {get_source_failures(state)[label]['since']}, cooling down")
+        return True
+
+    def _fetch_failed(label: str, error: Exception, cool_down_now: bool = False) -> str:
+        """Count a failed fetch; return the report's action text."""
+        retry_after = record_source_failure(state, label, str(error)[:300], date_str, cool_down_now)
+        if retry_after is None:
+            return "Transient network error — will retry on next run automatically."
+        return f"Failing repeatedly — not fetched again until {retry_after[:16].replace('T', ' ')} UTC."
+
+    def _fetch_plan(name: str, max_items: int) -> FetchPlan:
+        if not use_cadence:
+            return FetchPlan(True, max_items, config.settings.lookback_hours)
+        plan = cadence.plan(name, max_items, config.settings.lookback_hours, config.settings.cadence_max_skip_hours)
+        if not plan.fetch:
+            logger.info(f"Skipping {name} — {plan.reason}")
+        elif plan.max_items != max_items:
+            logger.info(f"Fetching up to {plan.max_items} item(s) from {name} (learned cadence)")
+        return plan
+
+    for source in scan_sources:
+        label = f"YouTube/{source.name}"
+        if _cooling_down(label):
+            continue
+        try:
+            if backfill_window is not None:
+                videos = fetch_videos_published_between(
+                    source, processed_video_ids, *backfill_window, fetch_transcripts=not dry_run,
+                )
+            else:
+                plan = _fetch_plan(source.name, config.settings.max_videos_per_channel)
+                if not plan.fetch:
+                    continue
+                videos = fetch_new_videos(
+                    source=source,
+                    processed_ids=processed_video_ids,
+                    lookback_hours=plan.lookback_hours,
+                    max_videos=plan.max_items,
+                    fetch_transcripts=not dry_run,
+                )
+                cadence.observe(source.name, [v.upload_date for v in videos])
         except IpBlockedError as e:
             video_id = str(e)
             msg = f"YouTube IP block for {source.name} — video {video_id} queued for retry"
@@ -301,62 +901,72 @@ def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = F
                             f"https://www.youtube.com/watch?v={video_id}", date_str,
                             channel=source.name)
             continue
+        except ChannelFetchError as e:
+            # Usually a transient timeout: an operational skip, and an error
+            # only once the channel has failed several runs in a row
+            action = _fetch_failed(label, e)
+            if get_source_failures(state)[label]["failures"] > 1:
+                logger.error(f"Failed to fetch {source.name} again: {e}")
+                errors.append({"source": label, "message": str(e)})
+            else:
+                logger.warning(f"Failed to fetch {source.name}, will retry next run: {e}")
+            skipped_items.append({
+                "type": "youtube",
+                "source": source.name,
+                "title": "(channel fetch failed)",
+                "url": source.channel_url,
+                "reason": str(e),
+                "action": action,
+            })
+            continue
         except Exception as e:
             msg = f"Failed to fetch {source.name}: {e}"
             logger.error(msg)
-            errors.append({"source": f"YouTube/{source.name}", "message": str(e)})
+            errors.append({"source": label, "message": str(e)})
             skipped_items.append({
                 "type": "youtube",
                 "source": source.name,
                 "title": "(channel fetch failed)",
                 "url": source.channel_url,
                 "reason": str(e),
-                "action": "Transient network error — will retry on next run automatically.",
+                "action": _fetch_failed(label, e),
             })
             continue
 
+        clear_source_failure(state, label)
+        priority = source_priority(config, YOUTUBE, source.name, source.category)
         for video in videos:
-            if dry_run:
-                dry_run_items.append(("YouTube", source.name, source.category, video.title))
-                continue
-
-            try:
-                _process_video(video)
-            except QuotaExhaustedError as e:
-                logger.error("Daily Gemini quota exhausted — saving progress and stopping early")
-                errors.append({"source": "Gemini/QuotaExhausted", "message": str(e)})
-                skipped_items.append({
-                    "type": "youtube",
-                    "source": video.channel_name,
-                    "title": video.title,
-                    "url": video.url,
-                    "reason": "Gemini daily quota exhausted",
-                    "action": "Quota resets at midnight Pacific. Re-run tomorrow or upgrade Gemini plan.",
-                })
-                _save_and_generate(
-                    state, state_path, rss_cache, digest_entries, podcast_entries,
-                    errors, skipped_items, output_dir, date_str, config,
-                )
-                return
-            # Always mark as seen — permanent skips (no transcript) should not be
-            # retried on subsequent runs; transient Gemini errors will be retried
-            # naturally when the channel is next fetched within the lookback window.
+            # Seen for the rest of this run; videos without captions and failed
+            # summaries are queued in state["pending"] by _process_video.
             processed_video_ids.add(video.video_id)
+            candidates.append(video_work_item(video, priority, transcript_chunk_tokens, metadata_only=dry_run))
 
-    # -----------------------------------------------------------------------
-    # Podcast pipeline
-    # -----------------------------------------------------------------------
-    for show in config.podcast_shows:
+    for show in scan_shows:
+        label = f"Podcast/{show.name}"
+        if _cooling_down(label):
+            continue
         try:
-            episodes = fetch_new_episodes(
-                show=show,
-                processed_ids=processed_episode_ids,
-                lookback_hours=config.settings.lookback_hours,
-                max_episodes=config.settings.max_episodes_per_show,
-                min_episodes=config.settings.min_episodes_per_show,
-                rss_cache=rss_cache,
-            )
+            if backfill_window is not None:
+                episodes = fetch_episodes_published_between(
+                    show, processed_episode_ids, *backfill_window, rss_cache,
+                )
+            else:
+                plan = _fetch_plan(show.name, config.settings.max_episodes_per_show)
+                if not plan.fetch:
+                    continue
+                episodes = fetch_new_episodes(
+                    show=show,
+                    processed_ids=processed_episode_ids,
+                    lookback_hours=plan.lookback_hours,
+                    max_episodes=plan.max_items,
+                    min_episodes=config.settings.min_episodes_per_show,
+                    rss_cache=rss_cache,
+                )
+                cadence.observe(show.name, [e.published_at for e in episodes])
         except RSSLookupError as e:
+            # Directory searches and feed probes fail the same way every run,
+            # so the failed lookup is cached (cool-down) from the first failure
+            _fetch_failed(label, e, cool_down_now=True)
             errors.append({"source": f"Podcast/RSS/{show.name}", "message": str(e)})
             skipped_items.append({
                 "type": "podcast",
@@ -374,106 +984,157 @@ def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = F
         except Exception as e:
             msg = f"Failed to fetch episodes for '{show.name}': {e}"
             logger.error(msg)
-            errors.append({"source": f"Podcast/{show.name}", "message": msg})
+            errors.append({"source": label, "message": msg})
             skipped_items.append({
                 "type": "podcast",
                 "source": show.name,
                 "title": "(episode fetch failed)",
                 "url": show.podcast_url,
                 "reason": str(e),
-                "action": "Transient network error — will retry on next run automatically.",
+                "action": _fetch_failed(label, e),
             })
             continue
 
+        clear_source_failure(state, label)
+        priority = source_priority(config, PODCAST, show.name, show.category)
         for episode in episodes:
-            if dry_run:
-                dry_run_items.append(("Podcast", show.name, show.category, episode.title))
-                continue
+            candidates.append(episode_work_item(
+                episode, priority, config.settings.max_audio_minutes, chunking,
+            ))
 
-            try:
-                summary = download_and_transcribe(
-                    episode=episode,
-                    gemini_client=gemini_client,
-                    gemini_model=config.settings.gemini_model,
-                    max_audio_minutes=config.settings.max_audio_minutes,
-                )
-            except QuotaExhaustedError as e:
-                logger.error("Daily Gemini quota exhausted — saving progress and stopping early")
-                errors.append({"source": "Gemini/QuotaExhausted", "message": str(e)})
-                skipped_items.append({
-                    "type": "podcast",
-                    "source": show.name,
-                    "title": episode.title,
-                    "url": episode.episode_url,
-                    "reason": "Gemini daily quota exhausted",
-                    "action": "Quota resets at midnight Pacific. Re-run tomorrow or upgrade Gemini plan.",
-                })
-                _save_and_generate(
-                    state, state_path, rss_cache, digest_entries, podcast_entries,
-                    errors, skipped_items, output_dir, date_str, config,
-                )
-                return
-            except TranscriptionError as e:
-                msg = str(e)
-                logger.error(f"  Transcription failed for '{episode.title}': {msg}")
-                errors.append({"source": f"Podcast/Transcription/{show.name}", "message": msg})
-                skipped_items.append({
-                    "type": "podcast",
-                    "source": show.name,
-                    "title": episode.title,
-                    "url": episode.episode_url,
-                    "reason": f"Transcription failed: {msg}",
-                    "action": (
-                        "Audio download or Gemini transcription failed. "
-                        "Check if the episode audio URL is accessible and re-run."
-                    ),
-                })
-                continue
-            except Exception as e:
-                error_str = str(e).lower()
-                if "401" in str(e) or "403" in str(e) or "api_key_invalid" in error_str:
-                    logger.error(f"UNRECOVERABLE: Gemini auth failed — check GEMINI_API_KEY: {e}")
-                    errors.append({"source": "Gemini/AuthError", "message": str(e)})
-                    generate_error_report(errors, skipped_items, output_dir, date_str)
-                    sys.exit(1)
-                msg = f"Processing failed for '{episode.title}': {e}"
-                logger.error(msg)
-                errors.append({"source": f"Podcast/{show.name}", "message": msg})
-                skipped_items.append({
-                    "type": "podcast",
-                    "source": show.name,
-                    "title": episode.title,
-                    "url": episode.episode_url,
-                    "reason": str(e),
-                    "action": "Transient error — will retry on next run.",
-                })
-                continue
+    # Requests already spent today — by earlier runs on the same quota day and
+    # by this run's IP-blocked retries (recorded as they happen) — come off the budget
+    used_today = sum(entry.get("requests", 0) for entry in get_quota_usage(state).values())
+    if used_today:
+        logger.info(f"Gemini requests already used today (Pacific): {used_today}")
+    budget = max(0, config.settings.daily_request_budget - used_today)
+    scheduled, deferred = plan_work(candidates, budget)
+    if dry_run:
+        _print_dry_run_table(scheduled, deferred)
+        return
+    for work in deferred:
+        _defer(work.item, f"Over today's Gemini request budget ({config.settings.daily_request_budget}) — lower priority")
 
+    # A backfill is a manual catch-up, not bound by the morning deadline
+    deadline = None if backfill_window is not None else run_deadline(
+        config.settings.run_deadline, config.settings.deadline_reserve_minutes,
+    )
+    durations = DurationModel(get_item_timings(state))
+
+    finished: set[str] = set()
+    # Short videos are held back and summarised several per request (RPM-bound
+    # days); each priority tier's shorts are flushed before the next tier starts.
+    # A video stays in short_videos until it is written, so whatever is left
+    # there when the quota runs out is exactly what still needs deferring.
+    short_videos: list[VideoInfo] = []
+
+    def _flush_short_videos() -> None:
+        pack_size = config.settings.max_videos_per_pack
+        while short_videos:
+            pack = short_videos[:pack_size]
+            summaries = _summarize_pack(pack)
+            # Write the packed summaries first: a single request that follows
+            # may hit the quota, and those summaries are already paid for
+            for video, summary in sorted(zip(pack, summaries), key=lambda vs: vs[1] is None):
+                _process_video(video, summary=summary)
+                finished.add(video.video_id)
+                short_videos.remove(video)
+
+    def _process_concurrently(items: list[WorkItem]) -> None:
+        """Backfill: process items backfill_parallel_items at a time.
+
+        A QuotaExhaustedError stops items that have not started; ones already
+        running are allowed to finish.
+        """
+        def _process_one(work: WorkItem) -> None:
+            if work.kind == PODCAST:
+                _process_episode(work.item)
+            else:
+                _process_video(work.item)
+            with record_lock:
+                finished.add(work.item_id)
+
+        with ThreadPoolExecutor(max_workers=config.settings.backfill_parallel_items) as pool:
+            futures = [pool.submit(_process_one, work) for work in items]
             try:
-                paths = generate_podcast_summary_files(
-                    episode=episode,
-                    summary=summary,
-                    output_dir=output_dir,
-                    date_str=date_str,
-                )
-            except Exception as e:
-                msg = f"File generation failed for '{episode.title}': {e}"
-                logger.error(msg)
-                errors.append({"source": f"Generator/Podcast/{show.name}", "message": msg})
-                podcast_entries.append({"episode": episode, "paths": None, "error": str(e)})
-                continue
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
-            podcast_entries.append({"episode": episode, "paths": paths, "error": None})
-            mark_podcast_processed(state, episode.episode_id, date_str)
-            processed_episode_ids.add(episode.episode_id)
+    tier = None
+    quota_error = None
+    try:
+        if backfill_window is not None:
+            _process_concurrently(scheduled)
+        else:
+            for work in scheduled:
+                if work.priority != tier:
+                    _flush_short_videos()
+                    tier = work.priority
+                if deadline is not None and not deadline.allows(durations.estimate(work)):
+                    _defer(work.item, f"Not enough time left before the {deadline.label} run deadline")
+                    finished.add(work.item_id)
+                    continue
+                started = time.monotonic()
+                if work.kind == PODCAST:
+                    if work.pending:
+                        logger.info(f"  Retrying deferred: {work.item.title}")
+                    if _process_episode(work.item):
+                        durations.observe(work, time.monotonic() - started)
+                    finished.add(work.item_id)
+                    continue
 
-    if dry_run:
-        _print_dry_run_table(dry_run_items)
+                video = work.item
+                if work.pending:
+                    logger.info(f"  Retrying deferred: {video.title}")
+                    try:
+                        transcript, segments = _get_transcript(video.video_id, video.language)
+                    except Exception as e:
+                        logger.warning(f"  Transcript fetch failed for deferred video {video.video_id} ({e}) — keeping it pending")
+                        finished.add(work.item_id)
+                        continue
+                    video = dataclasses.replace(video, transcript=transcript, transcript_segments=segments)
+                if (
+                    config.settings.pack_short_videos
+                    and video.transcript
+                    and 0 < video.duration_seconds <= SHORT_VIDEO_SECONDS
+                ):
+                    short_videos.append(video)
+                    continue
+                if _process_video(video):
+                    durations.observe(work, time.monotonic() - started)
+                finished.add(work.item_id)
+            _flush_short_videos()
+    except QuotaExhaustedError as e:
+        quota_error = e
+
+    set_item_timings(state, durations.history())
+    set_source_cadence(state, cadence.history())
+    if quota_error is not None:
+        logger.error("Daily Gemini quota exhausted — saving progress and stopping early")
+        errors.append({"source": "Gemini/QuotaExhausted", "message": str(quota_error)})
+        # Held for a pack that was never sent, or sent but not yet written
+        while short_videos:
+            video = short_videos.pop(0)
+            _defer(video, "Gemini daily quota exhausted")
+            finished.add(video.video_id)
+        for work in scheduled:
+            if work.item_id not in finished:
+                _defer(work.item, "Gemini daily quota exhausted")
+        _save_and_generate(
+            state, state_path, rss_cache, digest_entries, podcast_entries,
+            errors, skipped_items, output_dir, date_str, config,
+            incremental=incremental, day_report=day_report,
+        )
         return
 
     _save_and_generate(
         state, state_path, rss_cache, digest_entries, podcast_entries,
         errors, skipped_items, output_dir, date_str, config,
+        incremental=incremental, day_report=day_report,
     )
 
     logger.info(
@@ -484,10 +1145,178 @@ def run(config_path: Path, output_dir: Path, state_path: Path, dry_run: bool = F
     # Exit with non-zero code if there were processing errors — lets the GitHub
     # Action detect failures and trigger the "Report unrecoverable failure" step.
     # skipped_items alone (e.g. IP block, no transcript) don't warrant a failure
-    # exit since they are handled gracefully and queued for retry.
-    if errors:
+    # exit since they are handled gracefully and queued for retry.  A daemon
+    # poll carries on instead: its errors are in the day's run report.
+    if errors and not incremental:
+        sys.exit(1)
+
+
+def _setup_gemini(config, state: dict, response_cache_dir: Path, no_cache: bool = False):
+    """Configure the process-wide Gemini machinery and return a client (or client pool).
+
+    run() calls this once per run; the daemon once at startup, so the client's
+    connections, the breaker and the route latencies carry over between polls.
+    """
+    reset_route_latencies()
+    if no_cache:
+        logger.info("Response cache bypassed (--no-cache)")
+        disable_response_cache()
+    else:
+        enable_response_cache(response_cache_dir)
+    if config.settings.cache_prompt_prefix:
+        enable_prefix_caching()
+    else:
+        disable_prefix_caching()
+    set_request_timeout(config.settings.request_timeout_seconds)
+    tripped_at = get_breaker_tripped_at(state)
+    if tripped_at:
+        logger.info(f"Gemini circuit breaker was open at the end of the last run ({tripped_at}) — probing first")
+    configure_circuit_breaker(
+        config.settings.breaker_failure_threshold,
+        config.settings.breaker_cooldown_seconds,
+        half_open=bool(tripped_at),
+    )
+    if config.settings.hedge_requests:
+        enable_request_hedging()
+    else:
+        disable_request_hedging()
+    settings = config.settings
+    try:
+        if settings.gemini_api_key_envs or settings.fallback_models:
+            client = create_client_pool(
+                settings.gemini_api_key_envs or ("GEMINI_API_KEY",),
+                (settings.gemini_model,) + settings.fallback_models,
+            )
+            disable_shared_throttle()
+        else:
+            client = create_client()
+            enable_shared_throttle()
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    return client
+
+
+def run_daemon(
+    config_path: Path,
+    output_dir: Path,
+    state_path: Path,
+    cache_dir: Optional[Path] = None,
+    no_cache: bool = False,
+    max_cycles: Optional[int] = None,
+) -> None:
+    """Poll each source on its own schedule until interrupted (--daemon).
+
+    Every poll is a run() limited to one source (source_name), sharing one
+    Gemini client; the pending and IP-blocked queues get a retry_pending run
+    every daemon_poll_minutes.  Errors and skipped items are collected for
+    the day across polls, so each poll rewrites the run report with all of
+    them; the source is polled again on schedule.  A fatal error (e.g. an
+    invalid API key) stops the daemon with a non-zero exit.  max_cycles stops after that many
+    wake-ups (tests); otherwise Ctrl-C / SIGINT stops the daemon between polls.
+    """
+    try:
+        config = load_config(config_path)
+    except ConfigError as e:
+        logger.error(f"Configuration error: {e}")
         sys.exit(1)
 
+    default_minutes = config.settings.daemon_poll_minutes
+    intervals: dict[Optional[str], int] = {None: default_minutes}    # None: the retry queues
+    for source in [*config.youtube_sources, *config.podcast_shows]:
+        minutes = source.poll_minutes or default_minutes
+        intervals[source.name] = min(minutes, intervals.get(source.name, minutes))
+    logger.info(
+        f"Daemon: polling {len(intervals) - 1} source(s), every {min(intervals.values())}–"
+        f"{max(intervals.values())} min"
+    )
+
+    cache_root = cache_dir or state_path.parent / ".cache"
+    gemini_client = _setup_gemini(config, load_state(state_path), cache_root / "responses", no_cache)
+
+    next_poll = dict.fromkeys(intervals, 0.0)
+    day_report: dict = {}
+    cycles = 0
+    try:
+        while True:
+            for name, due_at in next_poll.items():
+                if due_at > time.monotonic():
+                    continue
+                label = name or "the pending and IP-blocked queues"
+                logger.info(f"Daemon: polling {label}")
+                try:
+                    run(
+                        config_path, output_dir, state_path, cache_dir=cache_dir, no_cache=no_cache,
+                        retry_pending=name is None, source_name=name,
+                        gemini_client=gemini_client, incremental=True, day_report=day_report,
+                    )
+                except SystemExit:
+                    logger.error(f"Daemon: poll of {label} failed fatally — stopping")
+                    raise
+                next_poll[name] = time.monotonic() + intervals[name] * 60
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                return
+            time.sleep(max(1.0, min(next_poll.values()) - time.monotonic()))
+    except KeyboardInterrupt:
+        logger.info("Daemon stopped")
+
+
+def _entries_by_day(entries: list, date_str: str) -> dict[str, list]:
+    """Group digest entries by their "date" (default date_str); date_str is always included."""
+    by_day: dict[str, list] = {date_str: []}
+    for entry in entries:
+        by_day.setdefault(entry.get("date", date_str), []).append(entry)
+    return by_day
+
+
+def _day_report(errors: list, skipped_items: list, date_str: str, day_report: Optional[dict]) -> tuple[list, list]:
+    """The errors and skipped items a run report lists.
+
+    Without day_report that is this run's.  With it (daemon polls) this run's
+    are added to the day's collected so far — a new date starts afresh — and
+    the whole day's are returned; an item skipped again keeps only its
+    latest entry.
+    """
+    if day_report is None:
+        return errors, skipped_items
+    if day_report.get("date") != date_str:
+        day_report.clear()
+        day_report.update(date=date_str, errors=[], skipped={})
+    day_report["errors"].extend(e for e in errors if e not in day_report["errors"])
+    for item in skipped_items:
+        day_report["skipped"].pop(item["url"], None)
+        day_report["skipped"][item["url"]] = item
+    return list(day_report["errors"]), list(day_report["skipped"].values())
+
+
+def _broken_source_lines(state: dict) -> list[str]:
+    """Report lines for the sources that are cooling down after repeated failures."""
+    lines = []
+    for source, entry in sorted(get_source_failures(state).items()):
+        if entry.get("retry_after"):
+            lines.append(
+                f"- **{source}**: failing since {entry.get('since', '?')} "
+                f"({entry.get('failures', 0)} failed fetch(es)), not fetched until "
+                f"{entry['retry_after'][:16].replace('T', ' ')} UTC — {entry.get('error', '')}"
+            )
+    return lines
+
+
+def _record_quota_usage(state: dict, state_path: Path, record: CallRecord) -> None:
+    """Add one finished Gemini call to today's quota, in state and in the state file.
+
+    Written per call, so a crash, a CI timeout or an early exit still leaves
+    the requests sent for the next run's daily_request_budget.
+    """
+    usage = {record.model: record}
+    with _quota_lock:
+        add_quota_usage(state, usage)
+        try:
+            persist_quota_usage(state_path, usage)
+        except OSError as e:
+            logger.warning(f"Could not record Gemini usage in {state_path}: {e}")
+
 
 def _save_and_generate(
     state: dict,
@@ -500,15 +1329,45 @@ def _save_and_generate(
     output_dir: Path,
     date_str: str,
     config,
+    incremental: bool = False,
+    day_report: Optional[dict] = None,
 ) -> None:
-    """Persist state and generate all output files."""
+    """Persist state and generate all output files.
+
+    incremental (daemon polls) regenerates only the digests that gained
+    entries, leaves the viewer alone when nothing did, and sends no email;
+    the run report covers the day's polls so far (see _day_report).
+    """
     update_rss_cache(state, rss_cache)
+    set_breaker_tripped_at(state, circuit_breaker().tripped_at)
     save_state(state_path, state)
 
-    generate_daily_digest(digest_entries, output_dir, date_str, config.categories)
-    generate_podcast_daily_digest(podcast_entries, output_dir, date_str, config.categories)
-    generate_error_report(errors, skipped_items, output_dir, date_str)
-    generate_viewer(config, output_dir)
+    # Entries carry the day they are filed under (a backfill spans several)
+    for day, entries in _entries_by_day(digest_entries, date_str).items():
+        if entries or not incremental:
+            generate_daily_digest(entries, output_dir, day, config.categories)
+    for day, entries in _entries_by_day(podcast_entries, date_str).items():
+        if entries or not incremental:
+            generate_podcast_daily_digest(entries, output_dir, day, config.categories)
+    report_errors, report_skipped = _day_report(errors, skipped_items, date_str, day_report)
+    generate_error_report(
+        report_errors, report_skipped, output_dir, date_str,
+        usage=usage_ledger().report_lines(), broken_sources=_broken_source_lines(state),
+    )
+    if digest_entries or podcast_entries or not incremental:
+        generate_viewer(config, output_dir)
+
+    for line in route_latency_report():
+        logger.info(f"Model route latency — {line}")
+    totals = usage_ledger().totals()
+    if totals.requests:
+        logger.info(
+            f"Gemini usage: {totals.requests} request(s), "
+            f"{totals.prompt_tokens:,} input / {totals.output_tokens:,} output tokens"
+        )
+    compacted, saved = usage_ledger().compaction_savings()
+    if compacted:
+        logger.info(f"Transcript compaction saved ~{saved:,} input tokens over {compacted} transcript(s)")
 
     removed = cleanup_old_content(output_dir, config.settings.max_age_days)
     cleanup_state(state_path, config.settings.max_age_days)
@@ -516,7 +1375,7 @@ def _save_and_generate(
         logger.info(f"Cleaned up {len(removed)} expired files")
 
     # Send email notification if configured
-    if config.settings.notify_email:
+    if config.settings.notify_email and not incremental:
         try:
             send_run_notification(
                 to_addr=config.settings.notify_email,
@@ -544,16 +1403,57 @@ def main():
         "--state", type=Path, default=Path("state.json"),
         help="State file path (default: state.json)",
     )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=Path(".cache"),
+        help="Directory for run-to-run caches such as podcast audio (default: .cache)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Bypass the Gemini response cache (always call the API)",
+    )
     parser.add_argument(
         "--dry-run", action="store_true",
         help="Fetch but don't summarize or generate files",
     )
+    parser.add_argument(
+        "--retry-pending", action="store_true",
+        help="Only retry queued items that are due (no channel or feed fetches)",
+    )
+    parser.add_argument(
+        "--source", metavar="NAME",
+        help="Only process the YouTube channel or podcast show with this name",
+    )
+    parser.add_argument(
+        "--backfill-from", type=date.fromisoformat, metavar="YYYY-MM-DD",
+        help="Catch up on every item published from this day (UTC), filed under its own day",
+    )
+    parser.add_argument(
+        "--backfill-to", type=date.fromisoformat, metavar="YYYY-MM-DD",
+        help="Last day of the backfill (default: today)",
+    )
+    parser.add_argument(
+        "--video-id", action="append", default=[], metavar="ID",
+        help="Only process this YouTube video, even if already processed (repeatable)",
+    )
+    parser.add_argument(
+        "--episode-id", action="append", default=[], metavar="ID",
+        help="Only process this podcast episode, even if already processed (repeatable)",
+    )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="Keep running and poll each source on its own schedule (see daemon_poll_minutes)",
+    )
     parser.add_argument(
         "--verbose", action="store_true",
         help="Enable verbose logging",
     )
 
     args = parser.parse_args()
+    if args.backfill_to and not args.backfill_from:
+        parser.error("--backfill-to requires --backfill-from")
+    if args.daemon and (args.dry_run or args.retry_pending or args.source or args.video_id
+                        or args.episode_id or args.backfill_from):
+        parser.error("--daemon cannot be combined with --dry-run, --retry-pending, targeted or backfill options")
 
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
@@ -561,11 +1461,22 @@ def main():
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    if args.daemon:
+        run_daemon(args.config, args.output, args.state, cache_dir=args.cache_dir, no_cache=args.no_cache)
+        return
+
     run(
         config_path=args.config,
         output_dir=args.output,
         state_path=args.state,
         dry_run=args.dry_run,
+        cache_dir=args.cache_dir,
+        no_cache=args.no_cache,
+        retry_pending=args.retry_pending,
+        source_name=args.source,
+        video_ids=tuple(args.video_id),
+        episode_ids=tuple(args.episode_id),
+        backfill=(args.backfill_from, args.backfill_to or date.today()) if args.backfill_from else None,
     )
 
 
@@ -0,0 +1,101 @@
+"""Content-addressed, on-disk cache of Gemini responses.
+
+A run that dies after a summary is generated but before it is written, or a
+transcript that comes round again, would otherwise pay for an identical
+generate_content call.  Responses are stored as plain text under a key that
+hashes the model, PROMPT_VERSION and the full input (rendered prompt, plus the
+audio content hash for podcast calls), so any change to a prompt template or
+input naturally misses.
+
+The cache is process-wide: main.run() enables it once per run (unless
+--no-cache is given) and _call_gemini / podcast audio calls consult it.
+
+Layout::
+
+    <cache_dir>/
+      <sha256>.txt   ← response text
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from src.audio_cache import prune_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached response (e.g. after changing post-processing)
+PROMPT_VERSION = 1
+
+# Cached responses untouched for longer than this are removed on the next prune
+RESPONSE_CACHE_TTL_DAYS = 14
+
+_cache_dir: Optional[Path] = None
+
+
+def enable_response_cache(cache_dir: Path) -> None:
+    """Serve and store Gemini responses under cache_dir for the rest of the process."""
+    global _cache_dir
+    _cache_dir = cache_dir
+
+
+def disable_response_cache() -> None:
+    """Turn the response cache off (the default)."""
+    global _cache_dir
+    _cache_dir = None
+
+
+def response_cache_key(model: str, *parts: str) -> str:
+    """Return the cache key for a model and its input parts."""
+    digest = hashlib.sha256(f"v{PROMPT_VERSION}\0{model}".encode())
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(part.encode())
+    return digest.hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    """Return the cached response for key, or None if disabled or missing.
+
+    Touches the file so that size-based pruning evicts least recently used first.
+    """
+    if _cache_dir is None:
+        return None
+    path = _cache_dir / f"{key}.txt"
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    path.touch()
+    return text
+
+
+def store_response(key: str, text: str) -> None:
+    """Write a response to the cache (no-op if disabled or text is empty).
+
+    Written to a temp file and renamed so parallel callers never see partial text.
+    """
+    if _cache_dir is None or not text:
+        return
+    try:
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=_cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, _cache_dir / f"{key}.txt")
+    except OSError as e:
+        logger.debug(f"Could not cache Gemini response {key[:12]}: {e}")
+
+
+def prune_response_cache(
+    cache_dir: Path,
+    max_bytes: int,
+    max_age_days: int = RESPONSE_CACHE_TTL_DAYS,
+) -> list[str]:
+    """Remove expired responses, then the least recently used until under max_bytes."""
+    return prune_cache_dir(cache_dir, max_bytes, max_age_days, label="Response cache")
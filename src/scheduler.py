@@ -0,0 +1,236 @@
+"""Quota-aware planning of a run's Gemini work.
+
+run() used to process sources in config order and stop wherever the daily
+quota ran out, so channels late in config.yaml and every podcast starved on
+busy days.  Instead, every candidate item is collected first and wrapped in a
+WorkItem carrying an estimate of its Gemini cost; plan_work() then orders the
+items by priority and recency and splits off whatever does not fit the
+request budget.  Deferred items go to state["pending"] for the next run.
+
+Priority is a source's ``priority`` plus its category's (both default 0,
+higher runs first).  Within a priority, items deferred by an earlier run go
+first (they expire after a week), then the newest.
+
+With a run_deadline set, each item is also checked against the time left
+before it starts: DurationModel estimates its duration from rates learned
+on earlier runs, and an item that would overrun the deadline is deferred.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union
+from zoneinfo import ZoneInfo
+
+from src.compaction import estimate_tokens
+from src.config import Config
+from src.fetchers.podcast import AUDIO_TOKENS_PER_SECOND, ChunkingOptions, EpisodeInfo
+from src.fetchers.youtube import VideoInfo
+
+logger = logging.getLogger(__name__)
+
+YOUTUBE = "youtube"
+PODCAST = "podcast"
+
+# Prompt rules / timestamp index and summary output that come with every request
+_PROMPT_OVERHEAD_TOKENS = 2_000
+_OUTPUT_TOKENS_PER_REQUEST = 1_500
+# Speech runs at ~150 words/min ≈ 3 tokens/s — used when no transcript is in hand yet
+_SPEECH_TOKENS_PER_SECOND = 3
+
+# run_deadline is Pacific wall-clock time (PST or PDT), the same zone as the quota day
+_DEADLINE_TZ = ZoneInfo("America/Los_Angeles")
+# Processing seconds per 1,000 estimated tokens until earlier runs have been timed
+_DEFAULT_SECONDS_PER_KTOKEN = {YOUTUBE: 2.0, PODCAST: 1.0}
+# Weight of the newest timing in the running average
+_TIMING_SMOOTHING = 0.3
+# No item is expected to take less than this (fetches, file writes)
+_MIN_ITEM_SECONDS = 5
+
+
+@dataclass(frozen=True)
+class WorkItem:
+    """One video or episode to summarise, with its estimated Gemini cost."""
+    kind: str                               # YOUTUBE | PODCAST
+    item: Union[VideoInfo, EpisodeInfo]
+    priority: int
+    requests: int
+    tokens: int
+    pending: bool = False                   # deferred by an earlier run
+
+    @property
+    def item_id(self) -> str:
+        return self.item.video_id if self.kind == YOUTUBE else self.item.episode_id
+
+    @property
+    def source(self) -> str:
+        return self.item.channel_name if self.kind == YOUTUBE else self.item.show_name
+
+    @property
+    def url(self) -> str:
+        return self.item.url if self.kind == YOUTUBE else self.item.episode_url
+
+    @property
+    def published_timestamp(self) -> float:
+        published = self.item.upload_date if self.kind == YOUTUBE else self.item.published_at
+        return published.timestamp()
+
+
+def source_priority(config: Config, kind: str, source_name: str, category: str) -> int:
+    """A source's priority plus its category's (sources no longer in config count 0)."""
+    sources = config.youtube_sources if kind == YOUTUBE else config.podcast_shows
+    own = next((s.priority for s in sources if s.name == source_name), 0)
+    category_priority = next((c.priority for c in config.categories if c.name == category), 0)
+    return own + category_priority
+
+
+def _with_overhead(requests: int, input_tokens: int) -> int:
+    return input_tokens + requests * (_PROMPT_OVERHEAD_TOKENS + _OUTPUT_TOKENS_PER_REQUEST)
+
+
+def video_work_item(
+    video: VideoInfo,
+    priority: int,
+    chunk_tokens: int = 0,
+    pending: bool = False,
+    metadata_only: bool = False,
+) -> WorkItem:
+    """Wrap a video; pending videos have no transcript yet, so their size comes from duration.
+
+    metadata_only marks a video listed without fetching its transcript (dry
+    runs); it is sized from duration too.  Otherwise a fetched video without a
+    transcript costs nothing (it is skipped).
+    """
+    if video.transcript:
+        tokens = estimate_tokens(video.transcript)
+    elif pending or metadata_only:
+        tokens = video.duration_seconds * _SPEECH_TOKENS_PER_SECOND
+    else:
+        return WorkItem(YOUTUBE, video, priority, requests=0, tokens=0, pending=pending)
+    requests = 1
+    if chunk_tokens and tokens > chunk_tokens:
+        requests = math.ceil(tokens / chunk_tokens) + 1    # map parts + reduce
+    return WorkItem(YOUTUBE, video, priority, requests, _with_overhead(requests, tokens), pending)
+
+
+def episode_work_item(
+    episode: EpisodeInfo,
+    priority: int,
+    max_audio_minutes: int,
+    chunking: Optional[ChunkingOptions] = None,
+    pending: bool = False,
+) -> WorkItem:
+    """Wrap an episode; audio is costed at the clip length download_and_transcribe will use."""
+    seconds = episode.duration_seconds if episode.duration_seconds > 0 else max_audio_minutes * 60
+    requests = 1
+    if episode.transcript_url:
+        tokens = seconds * _SPEECH_TOKENS_PER_SECOND
+    elif chunking is not None and seconds > chunking.chunk_minutes * 60:
+        seconds = min(seconds, chunking.max_audio_minutes * 60)
+        requests = math.ceil(seconds / (chunking.chunk_minutes * 60)) + 1
+        tokens = seconds * AUDIO_TOKENS_PER_SECOND
+    else:
+        tokens = min(seconds, max_audio_minutes * 60) * AUDIO_TOKENS_PER_SECOND
+    return WorkItem(PODCAST, episode, priority, requests, _with_overhead(requests, tokens), pending)
+
+
+def plan_work(items: list[WorkItem], request_budget: int) -> tuple[list[WorkItem], list[WorkItem]]:
+    """Return (scheduled, deferred).
+
+    Items are taken in priority order while their estimated requests fit the
+    budget; an item that does not fit is deferred, but cheaper items after it
+    may still be scheduled.
+    """
+    ordered = sorted(items, key=lambda w: (-w.priority, not w.pending, -w.published_timestamp))
+    scheduled, deferred = [], []
+    used = 0
+    for work in ordered:
+        if used + work.requests <= request_budget:
+            scheduled.append(work)
+            used += work.requests
+        else:
+            deferred.append(work)
+    logger.info(
+        f"Plan: {len(scheduled)} item(s), ~{used} Gemini request(s), "
+        f"~{sum(w.tokens for w in scheduled):,} tokens (budget {request_budget} requests)"
+        + (f"; deferring {len(deferred)} lower-priority item(s)" if deferred else "")
+    )
+    return scheduled, deferred
+
+
+class DurationModel:
+    """Per-kind processing rate (seconds per 1k estimated tokens) learned from earlier runs.
+
+    history is the dict returned by history() on a previous run (kept in state).
+    """
+
+    def __init__(self, history: Optional[dict] = None):
+        self._rates = dict(_DEFAULT_SECONDS_PER_KTOKEN)
+        self._samples = dict.fromkeys(self._rates, 0)
+        for kind, entry in (history or {}).items():
+            if kind in self._rates and isinstance(entry, dict):
+                rate = entry.get("seconds_per_ktoken")
+                if isinstance(rate, (int, float)) and rate > 0:
+                    self._rates[kind] = float(rate)
+                    self._samples[kind] = int(entry.get("samples", 1))
+
+    def estimate(self, work: WorkItem) -> float:
+        return max(_MIN_ITEM_SECONDS, work.tokens / 1000 * self._rates[work.kind])
+
+    def observe(self, work: WorkItem, seconds: float) -> None:
+        """Fold one finished item's wall time into its kind's rate."""
+        if work.tokens <= 0:
+            return
+        rate = seconds / (work.tokens / 1000)
+        if self._samples[work.kind]:
+            rate = (1 - _TIMING_SMOOTHING) * self._rates[work.kind] + _TIMING_SMOOTHING * rate
+        self._rates[work.kind] = rate
+        self._samples[work.kind] += 1
+
+    def history(self) -> dict:
+        """The learned rates, for state (kinds never timed are left out)."""
+        return {
+            kind: {"seconds_per_ktoken": round(rate, 3), "samples": self._samples[kind]}
+            for kind, rate in self._rates.items()
+            if self._samples[kind]
+        }
+
+
+class RunDeadline:
+    """Time left before the run must stop starting new items."""
+
+    def __init__(self, seconds: float, label: str):
+        self._ends_at = time.monotonic() + seconds
+        self.label = label
+
+    def seconds_left(self) -> float:
+        return self._ends_at - time.monotonic()
+
+    def allows(self, seconds: float) -> bool:
+        return seconds <= self.seconds_left()
+
+
+def run_deadline(hhmm: Optional[str], reserve_minutes: int, now: Optional[datetime] = None) -> Optional[RunDeadline]:
+    """Return the RunDeadline for the next hhmm Pacific time after now, less reserve_minutes.
+
+    None when no deadline is configured.  A run that starts after today's
+    deadline (e.g. the afternoon retry) is bound by tomorrow's, so in
+    practice it is not limited.
+    """
+    if not hhmm:
+        return None
+    now = (now or datetime.now(timezone.utc)).astimezone(_DEADLINE_TZ)
+    hour, minute = (int(part) for part in hhmm.split(":"))
+    deadline = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if deadline <= now:
+        deadline += timedelta(days=1)
+    # Through UTC: same-zone subtraction would ignore a DST change in between
+    seconds = (deadline.astimezone(timezone.utc) - now.astimezone(timezone.utc)).total_seconds()
+    seconds -= reserve_minutes * 60
+    label = f"{hhmm} {deadline.tzname()}"
+    logger.info(f"Run deadline {label}: {max(0, seconds) / 60:.0f} min for Gemini work after a {reserve_minutes} min reserve")
+    return RunDeadline(seconds, label)
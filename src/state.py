@@ -6,6 +6,8 @@ import json
 import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Optional
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +16,40 @@ _KEY_YOUTUBE = "youtube"
 _KEY_PODCASTS = "podcasts"
 _KEY_RSS_CACHE = "rss_cache"
 _KEY_IP_BLOCKED = "ip_blocked"
+_KEY_GEMINI_FILES = "gemini_files"
+_KEY_PENDING = "pending"
+_KEY_GEMINI_BREAKER = "gemini_breaker"
+_KEY_GEMINI_QUOTA = "gemini_quota"
+_KEY_ITEM_TIMINGS = "item_timings"
+_KEY_SOURCE_CADENCE = "source_cadence"
+_KEY_SOURCE_FAILURES = "source_failures"
+# Keys that are never video IDs in a legacy flat state file
+_RESERVED_KEYS = {
+    _KEY_YOUTUBE, _KEY_PODCASTS, _KEY_RSS_CACHE, _KEY_IP_BLOCKED, _KEY_GEMINI_FILES,
+    _KEY_PENDING, _KEY_GEMINI_BREAKER, _KEY_GEMINI_QUOTA, _KEY_ITEM_TIMINGS, _KEY_SOURCE_CADENCE,
+    _KEY_SOURCE_FAILURES,
+}
+
+# Sections of the pending queue
+PENDING_YOUTUBE = "youtube"
+PENDING_PODCASTS = "podcasts"
 
 # Videos stuck in ip_blocked longer than this are dropped (likely deleted / too old)
 _IP_BLOCKED_TTL_DAYS = 7
+# Deferred items not processed within this many days are dropped
+_PENDING_TTL_DAYS = 7
+
+# A failing source is left alone for this long after its 2nd consecutive
+# failure (1st for RSS lookups), doubling per further failure up to the cap
+_SOURCE_COOLDOWN_HOURS = 12
+_SOURCE_COOLDOWN_MAX_HOURS = 7 * 24
+
+# Gemini Files API deletes uploads after 48h; stop reusing them a little earlier
+_GEMINI_FILE_TTL_HOURS = 46
+
+# Gemini daily quotas reset at midnight Pacific time
+_QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+_QUOTA_FIELDS = ("requests", "prompt_tokens", "output_tokens")
 
 
 def load_state(state_path: Path) -> dict:
@@ -31,13 +64,18 @@ def load_state(state_path: Path) -> dict:
         return {}
 
 
+def _write_state(state_path: Path, state: dict) -> None:
+    """Write state to file atomically (write to .tmp, then rename)."""
+    tmp_path = state_path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    tmp_path.replace(state_path)
+
+
 def save_state(state_path: Path, state: dict) -> None:
     """Save state to file atomically (write to .tmp, then rename)."""
-    tmp_path = state_path.with_suffix(".tmp")
     try:
-        with open(tmp_path, "w") as f:
-            json.dump(state, f, indent=2, sort_keys=True)
-        tmp_path.replace(state_path)
+        _write_state(state_path, state)
     except OSError as e:
         logger.error(f"Failed to save state: {e}")
         raise
@@ -58,8 +96,7 @@ def get_processed_ids(state: dict) -> set:
         return set(youtube_state.keys())
     # Legacy: flat dict at root level (pre-podcast state files)
     # Filter out known non-video keys
-    reserved = {_KEY_YOUTUBE, _KEY_PODCASTS, _KEY_RSS_CACHE, _KEY_IP_BLOCKED}
-    return {k for k in state.keys() if k not in reserved}
+    return {k for k in state.keys() if k not in _RESERVED_KEYS}
 
 
 def get_youtube_entries(state: dict) -> dict:
@@ -104,12 +141,12 @@ def mark_youtube_processed(
     """
     if _KEY_YOUTUBE not in state:
         # Migrate legacy flat entries to nested format
-        reserved = {_KEY_YOUTUBE, _KEY_PODCASTS, _KEY_RSS_CACHE, _KEY_IP_BLOCKED}
-        legacy = {k: v for k, v in state.items() if k not in reserved}
+        legacy = {k: v for k, v in state.items() if k not in _RESERVED_KEYS}
         for k in legacy:
             del state[k]
         state[_KEY_YOUTUBE] = legacy
     state[_KEY_YOUTUBE][video_id] = {"date": date_str, "channel": channel, "title": title}
+    clear_pending(state, PENDING_YOUTUBE, video_id)
 
 
 def mark_podcast_processed(state: dict, episode_id: str, date_str: str) -> None:
@@ -117,6 +154,7 @@ def mark_podcast_processed(state: dict, episode_id: str, date_str: str) -> None:
     if _KEY_PODCASTS not in state:
         state[_KEY_PODCASTS] = {}
     state[_KEY_PODCASTS][episode_id] = date_str
+    clear_pending(state, PENDING_PODCASTS, episode_id)
 
 
 def update_rss_cache(state: dict, rss_cache: dict) -> None:
@@ -174,3 +212,257 @@ def expire_ip_blocked(state: dict) -> list[str]:
     for video_id in expired:
         blocked.pop(video_id, None)
     return expired
+
+
+# ---------------------------------------------------------------------------
+# Gemini Files API upload reuse
+# ---------------------------------------------------------------------------
+
+def gemini_file_cache(state: dict) -> dict:
+    """Return the live {content_sha256: {"name": str, "uploaded_at": iso}} upload map.
+
+    Unlike get_rss_cache this is the dict stored in state, not a copy — the
+    podcast fetcher adds and removes entries as it uploads and deletes files,
+    and those changes are persisted by the next save_state.
+    """
+    return state.setdefault(_KEY_GEMINI_FILES, {})
+
+
+def expire_gemini_files(state: dict) -> list[str]:
+    """Drop uploads older than _GEMINI_FILE_TTL_HOURS. Returns list of expired content hashes.
+
+    Gemini deletes the remote files itself at 48h, so only the handles are removed.
+    """
+    files = state.get(_KEY_GEMINI_FILES, {})
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=_GEMINI_FILE_TTL_HOURS)
+    expired = []
+    for content_hash, info in list(files.items()):
+        try:
+            uploaded = datetime.fromisoformat(info["uploaded_at"])
+        except (KeyError, TypeError, ValueError):
+            expired.append(content_hash)
+            continue
+        if uploaded.tzinfo is None:
+            uploaded = uploaded.replace(tzinfo=timezone.utc)
+        if uploaded < cutoff:
+            expired.append(content_hash)
+    for content_hash in expired:
+        files.pop(content_hash, None)
+    return expired
+
+
+# ---------------------------------------------------------------------------
+# Pending queue (items deferred or failed, retried by later runs)
+# ---------------------------------------------------------------------------
+
+def get_pending(state: dict, section: str) -> dict:
+    """Return {item_id: info} for one pending section (PENDING_YOUTUBE / PENDING_PODCASTS).
+
+    info is whatever the caller stored to rebuild the item, plus "date",
+    "reason", "attempts" and (for delayed retries) "next_attempt".
+    """
+    return dict(state.get(_KEY_PENDING, {}).get(section, {}))
+
+
+def mark_pending(
+    state: dict,
+    section: str,
+    item_id: str,
+    info: dict,
+    date_str: str,
+    reason: str,
+    retry_in_seconds: float = 0,
+) -> None:
+    """Queue an item for a later run.  The first deferral date is kept for expiry.
+
+    With retry_in_seconds the item is not retried before then (e.g. captions
+    that YouTube has not generated yet); otherwise the next run picks it up.
+    """
+    entries = state.setdefault(_KEY_PENDING, {}).setdefault(section, {})
+    previous = entries.get(item_id, {})
+    entry = {
+        **info,
+        "date": previous.get("date", date_str),
+        "reason": reason,
+        "attempts": previous.get("attempts", 0) + 1,
+    }
+    if retry_in_seconds > 0:
+        entry["next_attempt"] = (datetime.now(timezone.utc) + timedelta(seconds=retry_in_seconds)).isoformat()
+    entries[item_id] = entry
+
+
+def pending_attempts(state: dict, section: str, item_id: str) -> int:
+    """How many times an item has been queued so far (0 if it is not pending)."""
+    return state.get(_KEY_PENDING, {}).get(section, {}).get(item_id, {}).get("attempts", 0)
+
+
+def is_pending_due(info: dict, now: Optional[datetime] = None) -> bool:
+    """True once a pending entry's next_attempt has passed (entries without one are always due)."""
+    next_attempt = info.get("next_attempt")
+    if not next_attempt:
+        return True
+    try:
+        due_at = datetime.fromisoformat(next_attempt)
+    except (TypeError, ValueError):
+        return True
+    if due_at.tzinfo is None:
+        due_at = due_at.replace(tzinfo=timezone.utc)
+    return due_at <= (now or datetime.now(timezone.utc))
+
+
+def clear_pending(state: dict, section: str, item_id: str) -> None:
+    entries = state.get(_KEY_PENDING, {}).get(section)
+    if entries:
+        entries.pop(item_id, None)
+
+
+def expire_pending(state: dict) -> list[str]:
+    """Remove pending items deferred more than _PENDING_TTL_DAYS ago. Returns expired IDs."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=_PENDING_TTL_DAYS)
+    expired = []
+    for entries in state.get(_KEY_PENDING, {}).values():
+        for item_id, info in list(entries.items()):
+            try:
+                recorded = datetime.strptime(info["date"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            except (KeyError, TypeError, ValueError):
+                recorded = None
+            if recorded is None or recorded < cutoff:
+                entries.pop(item_id)
+                expired.append(item_id)
+    return expired
+
+
+# ---------------------------------------------------------------------------
+# Chronically failing sources (per-source failure count and cool-down)
+# ---------------------------------------------------------------------------
+
+def record_source_failure(
+    state: dict,
+    source: str,
+    error: str,
+    date_str: str,
+    cool_down_now: bool = False,
+    now: Optional[datetime] = None,
+) -> Optional[str]:
+    """Count a failed fetch of source (e.g. "YouTube/<name>"); return its retry_after, if cooling down.
+
+    A single failure is usually transient, so the cool-down starts with the
+    second in a row — or the first with cool_down_now (RSS lookups, which
+    fail the same way every run) — at 12h, doubling up to 7 days.
+    """
+    entries = state.setdefault(_KEY_SOURCE_FAILURES, {})
+    previous = entries.get(source, {})
+    failures = previous.get("failures", 0) + 1
+    entry = {"failures": failures, "since": previous.get("since", date_str), "error": error}
+    strikes = failures if cool_down_now else failures - 1
+    if strikes > 0:
+        hours = min(_SOURCE_COOLDOWN_HOURS * 2 ** (strikes - 1), _SOURCE_COOLDOWN_MAX_HOURS)
+        entry["retry_after"] = ((now or datetime.now(timezone.utc)) + timedelta(hours=hours)).isoformat()
+    entries[source] = entry
+    return entry.get("retry_after")
+
+
+def clear_source_failure(state: dict, source: str) -> None:
+    """Forget a source's failures after a successful fetch."""
+    entries = state.get(_KEY_SOURCE_FAILURES, {})
+    entries.pop(source, None)
+    if not entries:
+        state.pop(_KEY_SOURCE_FAILURES, None)
+
+
+def get_source_failures(state: dict) -> dict:
+    """Return {source: {"failures", "since", "error", "retry_after"?}} for every failing source."""
+    return dict(state.get(_KEY_SOURCE_FAILURES, {}))
+
+
+def is_source_cooling_down(state: dict, source: str, now: Optional[datetime] = None) -> bool:
+    """True while a failing source's retry_after is in the future."""
+    retry_after = state.get(_KEY_SOURCE_FAILURES, {}).get(source, {}).get("retry_after")
+    if not retry_after:
+        return False
+    try:
+        until = datetime.fromisoformat(retry_after)
+    except (TypeError, ValueError):
+        return False
+    return until > (now or datetime.now(timezone.utc))
+
+
+# ---------------------------------------------------------------------------
+# Gemini circuit breaker carry-over
+# ---------------------------------------------------------------------------
+
+def get_breaker_tripped_at(state: dict) -> Optional[str]:
+    """Return when the previous run left the Gemini breaker open (UTC ISO), or None."""
+    return state.get(_KEY_GEMINI_BREAKER, {}).get("tripped_at")
+
+
+def set_breaker_tripped_at(state: dict, tripped_at: Optional[str]) -> None:
+    """Record (or, with None, clear) that this run ended with the breaker open."""
+    if tripped_at:
+        state[_KEY_GEMINI_BREAKER] = {"tripped_at": tripped_at}
+    else:
+        state.pop(_KEY_GEMINI_BREAKER, None)
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """Return the Gemini quota day — the Pacific date — of now (default: the current time)."""
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(_QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+
+def get_quota_usage(state: dict, now: Optional[datetime] = None) -> dict:
+    """Return today's per-model usage: {model: {requests, prompt_tokens, output_tokens}}.
+
+    Usage recorded on an earlier quota day is ignored (the quota has reset).
+    """
+    ledger = state.get(_KEY_GEMINI_QUOTA, {})
+    if ledger.get("date") != quota_day(now):
+        return {}
+    return ledger.get("models", {})
+
+
+def add_quota_usage(state: dict, usage: dict, now: Optional[datetime] = None) -> None:
+    """Add a run's per-model usage (objects with requests / prompt_tokens / output_tokens).
+
+    Starts a fresh ledger when the Pacific date has moved on since the last run.
+    """
+    day = quota_day(now)
+    ledger = state.get(_KEY_GEMINI_QUOTA, {})
+    if ledger.get("date") != day:
+        ledger = {"date": day, "models": {}}
+    for model, totals in usage.items():
+        entry = ledger["models"].setdefault(model, dict.fromkeys(_QUOTA_FIELDS, 0))
+        for name in _QUOTA_FIELDS:
+            entry[name] = entry.get(name, 0) + getattr(totals, name)
+    state[_KEY_GEMINI_QUOTA] = ledger
+
+
+def persist_quota_usage(state_path: Path, usage: dict, now: Optional[datetime] = None) -> None:
+    """Add usage (as for add_quota_usage) to the state file on disk, leaving the rest of it as it is.
+
+    For recording Gemini calls as they happen: a run that dies before its
+    final save still leaves its usage for the next run's request budget.
+    """
+    state = load_state(state_path)
+    add_quota_usage(state, usage, now)
+    _write_state(state_path, state)
+
+
+def get_item_timings(state: dict) -> dict:
+    """Return the learned per-kind processing rates (see scheduler.DurationModel)."""
+    return state.get(_KEY_ITEM_TIMINGS, {})
+
+
+def set_item_timings(state: dict, timings: dict) -> None:
+    if timings:
+        state[_KEY_ITEM_TIMINGS] = timings
+
+
+def get_source_cadence(state: dict) -> dict:
+    """Return the per-source upload history (see cadence.CadenceModel)."""
+    return state.get(_KEY_SOURCE_CADENCE, {})
+
+
+def set_source_cadence(state: dict, history: dict) -> None:
+    if history:
+        state[_KEY_SOURCE_CADENCE] = history
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
+import contextvars
+import hashlib
 import logging
 import os
+import queue
+import re
+import threading
 import time
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 
 from google import genai
+from google.genai import types
+
+from src.circuit_breaker import CircuitOpenError, circuit_breaker
+from src.client_pool import served_model
+from src.compaction import CHARS_PER_TOKEN, estimate_tokens
+from src.config import ModelRoute
+from src.response_cache import get_cached_response, response_cache_key, store_response
+from src.usage_ledger import record_call
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +33,83 @@ class QuotaExhaustedError(Exception):
     pass
 
 
+class GenerationDeadlineError(Exception):
+    """Raised when a streamed generation reaches its deadline with no text.
+
+    Not a server error: retrying would only open another stream past the
+    same deadline, so it is neither retried nor counted by the breaker.
+    """
+    pass
+
+
 # Retry settings
 MAX_RETRIES = 4
 INITIAL_BACKOFF_SECONDS = 5
 # Throttle: pause between API calls to stay under 15 RPM free tier
 THROTTLE_SECONDS = 5
 
-SUMMARY_PROMPT = """You are a precise content summarizer. Create a summary of the following video transcript.
+# Serialises throttle pauses so concurrent callers start requests one
+# THROTTLE_SECONDS apart instead of all at once.
+_throttle_lock = threading.Lock()
+# Off when a client pool paces each key itself (see client_pool)
+_shared_throttle = True
+
+# Per-request timeout: the hard ceiling, and the timeout used until enough
+# latencies have been observed to derive one (see request_timeout)
+REQUEST_TIMEOUT_SECONDS = 600
+# Hedged requests: a duplicate is sent once a call passes this latency percentile
+HEDGE_PERCENTILE = 95
+_TIMEOUT_PERCENTILE = 99
+# Derived timeout = p99 × headroom, never below the floor
+_TIMEOUT_HEADROOM = 3
+_MIN_TIMEOUT_SECONDS = 30
+_MIN_LATENCY_SAMPLES = 10
+_LATENCY_WINDOW = 200
+
+# Latencies are kept per request class: audio, or text by prompt size
+# (upper bounds in estimated tokens), so a run of short summaries does not
+# set the timeout for an hour of audio or a long map-reduce prompt
+AUDIO = "audio"
+_TEXT_SIZE_BUCKETS = (8_000, 32_000, 128_000)
+
+_request_timeout = REQUEST_TIMEOUT_SECONDS
+_hedging = False
+# (model, request class) -> recent successful generate_content latencies (seconds)
+_request_latencies: dict[tuple[str, str], deque] = {}
+_request_latency_lock = threading.Lock()
+
+# A trailing chunk shorter than this fraction of chunk size is merged into the previous one
+_MIN_TAIL_FRACTION = 0.25
+# Explicit context caches for the invariant prompt prefix live this long
+PREFIX_CACHE_TTL_SECONDS = 2 * 3600
+# Smallest prefix (tokens) Gemini accepts as cached content: 1,024 on the
+# 2.5 Flash models, 4,096 on the others
+PREFIX_CACHE_MIN_TOKENS = 4096
+_PREFIX_CACHE_MIN_TOKENS_BY_MODEL = (("gemini-2.5-flash", 1024),)
+
+# Prompt prefix caching (off by default — see enable_prefix_caching).
+# (client id, model, instruction hash) -> cached content name, or None when
+# that prefix could not be cached and is sent as a plain system instruction.
+_prefix_caching = False
+_prefix_caches: dict[tuple[int, str, str], Optional[str]] = {}
+_prefix_cache_lock = threading.Lock()
+
+# "Short videos (under 5 min)" tier of SUMMARY_PROMPT — eligible for request packing
+SHORT_VIDEO_SECONDS = 5 * 60
+
+# Realised latency (seconds per item) per model_routes bucket, for the run log
+_route_latencies: dict[str, list[float]] = {}
+_route_latency_lock = threading.Lock()
+
+# Matches one item of a packed response: <<<SUMMARY n>>> ... <<<END n>>>
+_PACKED_ITEM_RE = re.compile(r"<<<SUMMARY (\d+)>>>\s*(.*?)\s*<<<END \1>>>", re.DOTALL)
+# Matches a [t=Xs] citation, including the space before it
+_CITATION_RE = re.compile(r"\s*\[t=(\d+)s\]")
+
+# Invariant rules + structure.  Sent inline (SUMMARY_PROMPT etc.) by default, or
+# with prefix caching as part of the shared SUMMARY_SYSTEM_INSTRUCTION, while
+# each request (SUMMARY_REQUEST_TEMPLATE etc.) names its task and carries the item.
+_SUMMARY_RULES = """You are a precise content summarizer. Create a summary of the following video transcript.
 
 CRITICAL ACCURACY RULES:
 - ONLY state facts, names, numbers, model versions, and claims that are EXPLICITLY mentioned in the transcript.
@@ -59,17 +145,224 @@ Additional requirements:
 - Use plain language, avoid jargon unless essential
 - Preserve important nuances and caveats
 - The summary should never take more than 10% of the video's length to read
-- Do NOT include any preamble like "Here is a summary"
+- Do NOT include any preamble like "Here is a summary\""""
+
+_SUMMARY_ITEM = """Video title: {title}
+Channel: {channel_name}
+
+Timestamp index (sparse anchors, spaced further apart for long videos):
+{timestamp_index}
+
+Transcript:
+{transcript}"""
+
+SUMMARY_PROMPT = _SUMMARY_RULES + "\n\n" + _SUMMARY_ITEM
+
+SUMMARY_REQUEST_TEMPLATE = """Task: SUMMARY
+Video duration: {duration_str}
+Summary language: {language_name}
+
+""" + _SUMMARY_ITEM
+
+_CHUNK_NOTES_INTRO = """You are a precise note-taker. You will receive one part of a longer video transcript.
+This is part {part} of {total}, covering {start} to {end} of the video.
+
+"""
+
+_CHUNK_NOTES_RULES = """CRITICAL ACCURACY RULES:
+- ONLY record facts, names, numbers, and claims that are EXPLICITLY stated in this part of the transcript.
+- NEVER infer or fabricate information that is not present.
+- Reproduce names and version numbers EXACTLY as spoken.
+- Attribute opinions to the speaker (e.g., "According to the presenter...").
+
+Write 5-10 dense bullet points (start each with "* ") covering the topics, data points, claims,
+notable quotes and advice in this part, in the order they occur. No headers, no preamble.
+End each bullet with the single most relevant timestamp citation [t=Xs] from the index below,
+copied exactly. Omit the citation if none fits.
+Write the notes in {language_name}."""
+
+_CHUNK_NOTES_ITEM = """Video title: {title}
+Channel: {channel_name}
+
+Timestamp index for this part:
+{timestamp_index}
+
+Transcript part:
+{transcript}"""
+
+CHUNK_NOTES_PROMPT = _CHUNK_NOTES_INTRO + _CHUNK_NOTES_RULES + "\n\n" + _CHUNK_NOTES_ITEM
+
+CHUNK_NOTES_REQUEST_TEMPLATE = """Task: PART NOTES
+Part {part} of {total}, covering {start} to {end} of the video.
+Notes language: {language_name}
+
+""" + _CHUNK_NOTES_ITEM
+
+_CHUNK_REDUCE_INTRO = """You are a precise content summarizer. Below are sequential notes taken from the {total} consecutive
+parts of one video transcript. Combine them into a single summary of the whole video.
+
+"""
+
+_CHUNK_REDUCE_RULES = """CRITICAL ACCURACY RULES:
+- ONLY use facts, names, numbers, and claims that appear in the notes.
+- NEVER infer or fabricate information not present in the notes.
+- Attribute opinions to the speaker (e.g., "According to the presenter...").
+
+Adapt the summary length based on the video duration ({duration_str}):
+- Medium videos (10-20 min): 300-500 words. Include key data points and specific claims.
+- Long videos/podcasts (60+ min): 600-800 words. Categorize themes, include notable quotes, and provide a timeline of topics.
+
+Structure the summary using this architecture:
+
+## The Hook
+1-2 sentences explaining exactly why this content matters now.
+
+## Key Findings
+3-5 bullet points containing the core substance of the WHOLE video (not just the first part): data, specific numbers, unexpected results, and actionable insights.
+
+TIMESTAMP CITATIONS: End each Key Findings bullet with the single [t=Xs] citation from the notes that supports it,
+copied exactly as it appears in the notes. Never invent, adjust or average timestamps. Omit the citation if none fits.
+
+## The So What?
+A concluding thought on how this fits into the broader landscape or what the viewer should do with this information.
+
+Additional requirements:
+- Write the ENTIRE summary in {language_name}. The section headers (The Hook, Key Findings, The So What?) must remain in English, but all content must be in {language_name}.
+- Use plain language, avoid jargon unless essential.
+- Do NOT include any preamble like "Here is a summary"."""
+
+_CHUNK_REDUCE_ITEM = """Video title: {title}
+Channel: {channel_name}
+
+Notes:
+{notes}"""
+
+CHUNK_REDUCE_PROMPT = _CHUNK_REDUCE_INTRO + _CHUNK_REDUCE_RULES + "\n\n" + _CHUNK_REDUCE_ITEM
+
+CHUNK_REDUCE_REQUEST_TEMPLATE = """Task: MERGE NOTES
+Parts: {total}
+Video duration: {duration_str}
+Summary language: {language_name}
 
+""" + _CHUNK_REDUCE_ITEM
+
+
+_PACKED_INTRO = """You are a precise content summarizer. Below are {total} separate SHORT video transcripts.
+Summarize EACH video independently — never mix facts between videos.
+
+"""
+
+_PACKED_RULES = """CRITICAL ACCURACY RULES:
+- ONLY state facts, names, numbers, model versions, and claims that are EXPLICITLY mentioned in that video's transcript.
+- NEVER infer, guess, or fill in version numbers, names, dates, or statistics that are not directly stated.
+- If the transcript mentions a name or version number, reproduce it EXACTLY as spoken.
+- Attribute claims to the speaker (e.g., "According to the presenter...") when they are opinions or interpretations.
+
+Each summary is 100-150 words, focused on the bottom line and immediate impact, with this structure:
+
+## The Hook
+1-2 sentences explaining exactly why this content matters now.
+
+## Key Findings
+3-5 bullet points with the core substance. End each bullet with the single most relevant [t=Xs]
+citation from THAT video's timestamp index, or omit it if none fits.
+
+## The So What?
+A concluding thought on what the viewer should do with this information.
+
+Additional requirements:
+- Write each summary in the language named for that video. Section headers stay in English.
+- Do NOT include any preamble like "Here is a summary".
+
+OUTPUT FORMAT — reply with exactly one block per video, in order, and nothing outside the blocks:
+<<<SUMMARY 1>>>
+(summary of video 1)
+<<<END 1>>>
+<<<SUMMARY 2>>>
+(summary of video 2)
+<<<END 2>>>"""
+
+PACKED_SUMMARY_PROMPT = _PACKED_INTRO + _PACKED_RULES + "\n\n{items}"
+
+PACKED_REQUEST_TEMPLATE = """Task: PACKED SUMMARIES
+Videos: {total}
+
+{items}"""
+
+PACKED_ITEM_TEMPLATE = """=== VIDEO {index} ===
 Video title: {title}
 Channel: {channel_name}
+Duration: {duration_str}
+Language: {language_name}
 
-Timestamp index (sparse, ~every 30s):
+Timestamp index:
 {timestamp_index}
 
 Transcript:
 {transcript}"""
 
+
+# Every text task's rules in one system instruction: single summaries, part
+# notes and merges of long transcripts, and packed short videos all share it,
+# so one cached prefix serves every text call of a run — and together the
+# rules clear the minimum size Gemini will cache (see prefix_request_config).
+SUMMARY_SYSTEM_INSTRUCTION = "\n\n".join([
+    "Each request names its task on its first line (\"Task: ...\"). "
+    "Follow only the instructions for that task below.",
+    "[TASK: SUMMARY]\n" + _SUMMARY_RULES.format(
+        duration_str="stated in the request",
+        language_name="the summary language stated in the request",
+    ),
+    "[TASK: PART NOTES]\n"
+    "You are a precise note-taker. You will receive one part of a longer video transcript; "
+    "the request states which part it is and the time range it covers.\n\n"
+    + _CHUNK_NOTES_RULES.format(language_name="the notes language stated in the request"),
+    "[TASK: MERGE NOTES]\n"
+    "You are a precise content summarizer. The request holds sequential notes taken from the consecutive\n"
+    "parts of one video transcript. Combine them into a single summary of the whole video.\n\n"
+    + _CHUNK_REDUCE_RULES.format(
+        duration_str="stated in the request",
+        language_name="the summary language stated in the request",
+    ),
+    "[TASK: PACKED SUMMARIES]\n"
+    "You are a precise content summarizer. The request holds several separate SHORT video transcripts.\n"
+    "Summarize EACH video independently — never mix facts between videos.\n\n"
+    + _PACKED_RULES,
+])
+
+
+@dataclass(frozen=True)
+class PackedItem:
+    """One short video's inputs for summarize_packed."""
+    title: str
+    channel_name: str
+    transcript: str
+    duration_seconds: int = 0
+    language: str = "en"
+    transcript_segments: tuple = ()
+
+
+@dataclass
+class StreamStats:
+    """Timings of one streamed generation, filled in by _call_gemini."""
+    ttft_seconds: Optional[float] = None   # time to first token
+    total_seconds: float = 0.0
+    truncated: bool = False                # cut off at the deadline
+
+
+@dataclass(frozen=True)
+class StreamOptions:
+    """Stream a generation instead of waiting for the full response.
+
+    on_text is called with the accumulated text after every chunk.  If
+    max_seconds pass after the streamed request is first sent, the stream is
+    abandoned and the text so far is returned as a partial result.
+    """
+    on_text: Callable[[str], None]
+    max_seconds: Optional[float] = None
+    stats: StreamStats = field(default_factory=StreamStats)
+
+
 def create_client(api_key: Optional[str] = None) -> genai.Client:
     """Create a Gemini API client."""
     key = api_key or os.environ.get("GEMINI_API_KEY")
@@ -80,6 +373,285 @@ def create_client(api_key: Optional[str] = None) -> genai.Client:
     return genai.Client(api_key=key)
 
 
+def throttle() -> None:
+    """Wait for this caller's turn under the shared request-rate limit.
+
+    Every Gemini request (summaries, podcast audio, chunked map calls) goes
+    through here before it is sent.  Sequential callers see the same fixed
+    THROTTLE_SECONDS pause as before; concurrent callers queue on the lock so
+    their requests are spaced out and the whole process stays under the RPM
+    limit, while the generation calls themselves still overlap.  A client
+    pool paces every key on its own, so the shared pause is switched off
+    while one is in use.
+    """
+    if not _shared_throttle:
+        return
+    with _throttle_lock:
+        time.sleep(THROTTLE_SECONDS)
+
+
+def enable_shared_throttle() -> None:
+    """Pace every request through the one process-wide throttle (single API key)."""
+    global _shared_throttle
+    _shared_throttle = True
+
+
+def disable_shared_throttle() -> None:
+    """Leave pacing to the client pool, which spaces requests per key and model."""
+    global _shared_throttle
+    _shared_throttle = False
+
+
+def set_request_timeout(seconds: int) -> None:
+    """Set the per-request timeout ceiling (settings.request_timeout_seconds)."""
+    global _request_timeout
+    _request_timeout = seconds
+
+
+def enable_request_hedging() -> None:
+    """Send a duplicate of any call that passes the p95 latency (see generate_with_timeout)."""
+    global _hedging
+    _hedging = True
+
+
+def disable_request_hedging() -> None:
+    global _hedging
+    _hedging = False
+
+
+def request_class(request: dict) -> str:
+    """AUDIO for requests carrying an uploaded file, else "text<N" by prompt size."""
+    contents = request["contents"]
+    parts = contents if isinstance(contents, list) else [contents]
+    if not all(isinstance(part, str) for part in parts):
+        return AUDIO
+    tokens = sum(estimate_tokens(part) for part in parts)
+    bound = next((b for b in _TEXT_SIZE_BUCKETS if tokens <= b), None)
+    return f"text<{bound // 1000}k" if bound else f"text>{_TEXT_SIZE_BUCKETS[-1] // 1000}k"
+
+
+_DEFAULT_CLASS = f"text<{_TEXT_SIZE_BUCKETS[0] // 1000}k"
+
+
+def record_request_latency(model: str, seconds: float, kind: str = _DEFAULT_CLASS) -> None:
+    with _request_latency_lock:
+        _request_latencies.setdefault((model, kind), deque(maxlen=_LATENCY_WINDOW)).append(seconds)
+
+
+def reset_request_latencies() -> None:
+    with _request_latency_lock:
+        _request_latencies.clear()
+
+
+def latency_percentile(model: str, percentile: int, kind: str = _DEFAULT_CLASS) -> Optional[float]:
+    """Nearest-rank percentile of recent latencies for model and request class, or None with too few samples."""
+    with _request_latency_lock:
+        samples = sorted(_request_latencies.get((model, kind), ()))
+    if len(samples) < _MIN_LATENCY_SAMPLES:
+        return None
+    rank = max(1, -(-len(samples) * percentile // 100))
+    return samples[rank - 1]
+
+
+def request_timeout(model: str, kind: str = _DEFAULT_CLASS) -> float:
+    """Timeout for one request: p99 × headroom once observed for its class, capped at the ceiling."""
+    p99 = latency_percentile(model, _TIMEOUT_PERCENTILE, kind)
+    if p99 is None:
+        return _request_timeout
+    return min(_request_timeout, max(_MIN_TIMEOUT_SECONDS, p99 * _TIMEOUT_HEADROOM))
+
+
+def generate_with_timeout(client: genai.Client, request: dict, on_hedge: Optional[Callable[[], None]] = None):
+    """client.models.generate_content(**request), bounded by request_timeout().
+
+    The call runs on a daemon thread so a hung request cannot hold the run.
+    Timeouts and hedging use the latencies of the same model and request
+    class (see request_class).  With hedging enabled, a text call still
+    running at its p95 latency gets one duplicate (sent after the shared
+    throttle, so it counts against the same rate budget); the first
+    successful response wins and the other is abandoned.  Audio calls are
+    never hedged — a duplicate would re-send the whole uploaded file.  The
+    abandoned request still uses quota, so on_hedge is called for every
+    duplicate sent.  Raises TimeoutError ("504 DEADLINE_EXCEEDED") when nothing
+    succeeds in time, which callers treat as a retryable server error.
+    """
+    model = request["model"]
+    kind = request_class(request)
+    timeout = request_timeout(model, kind)
+    hedge_after = latency_percentile(model, HEDGE_PERCENTILE, kind) if _hedging and kind != AUDIO else None
+    started = time.monotonic()
+    deadline = started + timeout
+    outcomes: queue.Queue = queue.Queue()
+
+    def attempt() -> None:
+        try:
+            outcomes.put((True, client.models.generate_content(**request)))
+        except Exception as e:
+            outcomes.put((False, e))
+
+    threading.Thread(target=attempt, daemon=True).start()
+    in_flight = 1
+    hedged = False
+    first_error: Optional[Exception] = None
+    while in_flight:
+        wait_until = deadline
+        if hedge_after is not None and not hedged:
+            wait_until = min(deadline, started + hedge_after)
+        try:
+            ok, result = outcomes.get(timeout=max(0.0, wait_until - time.monotonic()))
+        except queue.Empty:
+            if time.monotonic() >= deadline:
+                break
+            logger.info(f"  Request passed p{HEDGE_PERCENTILE} ({hedge_after:.1f}s) — sending a hedged duplicate")
+            throttle()
+            threading.Thread(target=attempt, daemon=True).start()
+            in_flight += 1
+            hedged = True
+            if on_hedge is not None:
+                on_hedge()
+            continue
+        in_flight -= 1
+        if ok:
+            record_request_latency(model, time.monotonic() - started, kind)
+            return result
+        first_error = first_error or result
+    if first_error is not None and in_flight == 0:
+        raise first_error
+    raise TimeoutError(f"504 DEADLINE_EXCEEDED: no Gemini response within {timeout:.0f}s")
+
+
+def enable_prefix_caching() -> None:
+    """Send invariant prompt rules as a (cached) system instruction for the rest of the process."""
+    global _prefix_caching
+    _prefix_caching = True
+
+
+def disable_prefix_caching() -> None:
+    """Return to single inline prompts (the default) and forget registered caches."""
+    global _prefix_caching
+    _prefix_caching = False
+    with _prefix_cache_lock:
+        _prefix_caches.clear()
+
+
+def prefix_caching_enabled() -> bool:
+    return _prefix_caching
+
+
+def prefix_cache_min_tokens(model: str) -> int:
+    """The smallest prompt prefix, in tokens, that model accepts as cached content."""
+    for prefix, tokens in _PREFIX_CACHE_MIN_TOKENS_BY_MODEL:
+        if model.startswith(prefix):
+            return tokens
+    return PREFIX_CACHE_MIN_TOKENS
+
+
+def prefix_request_config(
+    client: genai.Client,
+    model: str,
+    system_instruction: str,
+) -> types.GenerateContentConfig:
+    """Return the generate_content config that carries system_instruction.
+
+    The first call per (client, model, instruction) registers the instruction
+    as Gemini cached content; later calls reference it by name, so the prefix
+    is neither re-sent nor billed at the full input rate.  An instruction
+    below the model's minimum cacheable size (prefix_cache_min_tokens) is
+    never offered to caches.create; it, and one the API refuses, is sent as
+    a plain system instruction, which still keeps it out of the per-item prompt.
+    """
+    key = (id(client), model, hashlib.sha256(system_instruction.encode()).hexdigest())
+    with _prefix_cache_lock:
+        if key not in _prefix_caches and estimate_tokens(system_instruction) < prefix_cache_min_tokens(model):
+            logger.info(
+                f"Prompt prefix (~{estimate_tokens(system_instruction)} tokens) is below {model}'s "
+                f"minimum cacheable size — sending it as a system instruction"
+            )
+            _prefix_caches[key] = None
+        if key not in _prefix_caches:
+            try:
+                cached = client.caches.create(
+                    model=model,
+                    config=types.CreateCachedContentConfig(
+                        system_instruction=system_instruction,
+                        ttl=f"{PREFIX_CACHE_TTL_SECONDS}s",
+                        display_name="morning-brief-prompt-prefix",
+                    ),
+                )
+                _prefix_caches[key] = cached.name
+                logger.info(f"Registered prompt prefix as cached content {cached.name}")
+            except Exception as e:
+                logger.info(f"Prompt prefix not cacheable ({e}) — sending it as a system instruction")
+                _prefix_caches[key] = None
+        name = _prefix_caches[key]
+    if name:
+        return types.GenerateContentConfig(cached_content=name)
+    return types.GenerateContentConfig(system_instruction=system_instruction)
+
+
+def forget_prefix_cache(client: genai.Client, model: str, system_instruction: str) -> None:
+    """Drop a registered prefix cache (e.g. expired) so the next call re-registers it."""
+    key = (id(client), model, hashlib.sha256(system_instruction.encode()).hexdigest())
+    with _prefix_cache_lock:
+        _prefix_caches.pop(key, None)
+
+
+def select_route(
+    routes: tuple[ModelRoute, ...],
+    duration_seconds: int,
+    input_tokens: int,
+) -> Optional[ModelRoute]:
+    """Return the first route whose bucket the item falls in, or None for the defaults."""
+    for route in routes:
+        if route.matches(duration_seconds, input_tokens):
+            return route
+    return None
+
+
+def route_request_config(
+    route: Optional[ModelRoute],
+    config: Optional[types.GenerateContentConfig] = None,
+) -> Optional[types.GenerateContentConfig]:
+    """Add route's output-length and thinking limits to config (or a new config)."""
+    limits = {}
+    if route is not None and route.max_output_tokens is not None:
+        limits["max_output_tokens"] = route.max_output_tokens
+    if route is not None and route.thinking_budget is not None:
+        limits["thinking_config"] = types.ThinkingConfig(thinking_budget=route.thinking_budget)
+    if not limits:
+        return config
+    if config is None:
+        return types.GenerateContentConfig(**limits)
+    return config.model_copy(update=limits)
+
+
+def route_cache_parts(route: Optional[ModelRoute]) -> tuple[str, ...]:
+    """Extra response-cache key parts, so limited and unlimited outputs never mix."""
+    if route is None or (route.max_output_tokens is None and route.thinking_budget is None):
+        return ()
+    return (f"limits:{route.max_output_tokens}:{route.thinking_budget}",)
+
+
+def record_route_latency(route: ModelRoute, seconds: float) -> None:
+    with _route_latency_lock:
+        _route_latencies.setdefault(route.name, []).append(seconds)
+
+
+def route_latency_report() -> list[str]:
+    """One line per bucket used this run: item count, median and max latency."""
+    with _route_latency_lock:
+        snapshot = {name: sorted(times) for name, times in _route_latencies.items()}
+    return [
+        f"{name}: {len(times)} item(s), median {times[len(times) // 2]:.1f}s, max {times[-1]:.1f}s"
+        for name, times in sorted(snapshot.items())
+    ]
+
+
+def reset_route_latencies() -> None:
+    with _route_latency_lock:
+        _route_latencies.clear()
+
+
 def _format_duration_for_prompt(seconds: int) -> str:
     """Format duration for the prompt context."""
     if seconds <= 0:
@@ -138,6 +710,11 @@ def summarize(
     duration_seconds: int = 0,
     language: str = "en",
     transcript_segments: tuple = (),
+    chunk_tokens: int = 0,
+    max_parallel: int = 1,
+    stream: Optional[StreamOptions] = None,
+    routes: tuple[ModelRoute, ...] = (),
+    max_input_tokens: int = 0,
 ) -> str:
     """Generate an adaptive summary for a video transcript.
 
@@ -145,11 +722,68 @@ def summarize(
     skipping videos with no transcript before calling this.
     transcript_segments is a tuple of (start_seconds, text) pairs used to inject
     timestamp citations into Key Findings bullets.
+
+    If chunk_tokens is set and the transcript is estimated to be longer, it is
+    summarised map-reduce style instead (see _summarize_in_chunks), with up to
+    max_parallel chunk calls in flight.
+
+    stream streams the (final) generation call — see StreamOptions.
+
+    routes (settings.model_routes) picks the model, output-length and thinking
+    limits by duration and transcript size; the first matching route wins and
+    its realised latency is recorded for route_latency_report().
+
+    Pre-flight: a transcript estimated above max_input_tokens is never sent
+    whole — it is summarised in parts of at most half that size instead.
     """
+    tokens = estimate_tokens(transcript)
+    if max_input_tokens and tokens > max_input_tokens and not 0 < chunk_tokens <= max_input_tokens // 2:
+        logger.warning(
+            f"  Transcript ~{tokens:,} tokens exceeds max_input_tokens ({max_input_tokens:,}) — splitting it"
+        )
+        chunk_tokens = max_input_tokens // 2
+    route = select_route(routes, duration_seconds, tokens)
+    if route is None:
+        return _summarize_once(
+            client, model, title, channel_name, transcript, duration_seconds,
+            language, transcript_segments, chunk_tokens, max_parallel, stream,
+        )
+    model = route.model or model
+    logger.info(f"  Model route '{route.name}' → {model}")
+    started = time.monotonic()
+    summary = _summarize_once(
+        client, model, title, channel_name, transcript, duration_seconds,
+        language, transcript_segments, chunk_tokens, max_parallel, stream, route,
+    )
+    record_route_latency(route, time.monotonic() - started)
+    return summary
+
+
+def _summarize_once(
+    client: genai.Client,
+    model: str,
+    title: str,
+    channel_name: str,
+    transcript: str,
+    duration_seconds: int,
+    language: str,
+    transcript_segments: tuple,
+    chunk_tokens: int,
+    max_parallel: int,
+    stream: Optional[StreamOptions],
+    route: Optional[ModelRoute] = None,
+) -> str:
+    """summarize() for an already chosen model and route."""
     language_name = _get_language_name(language)
     duration_str = _format_duration_for_prompt(duration_seconds)
+    if chunk_tokens and estimate_tokens(transcript) > chunk_tokens:
+        return _summarize_in_chunks(
+            client, model, title, channel_name, transcript, duration_seconds,
+            language_name, transcript_segments, chunk_tokens, max_parallel, stream, route,
+        )
     timestamp_index = _format_timestamp_index(transcript_segments)
-    prompt = SUMMARY_PROMPT.format(
+    template = SUMMARY_REQUEST_TEMPLATE if _prefix_caching else SUMMARY_PROMPT
+    prompt = template.format(
         transcript=transcript,
         duration_str=duration_str,
         title=title,
@@ -157,7 +791,260 @@ def summarize(
         language_name=language_name,
         timestamp_index=timestamp_index,
     )
-    return _call_gemini(client, model, prompt)
+    system_instruction = SUMMARY_SYSTEM_INSTRUCTION if _prefix_caching else None
+    return _call_gemini(
+        client, model, prompt, stream=stream, system_instruction=system_instruction, route=route,
+    )
+
+
+def _summarize_in_chunks(
+    client: genai.Client,
+    model: str,
+    title: str,
+    channel_name: str,
+    transcript: str,
+    duration_seconds: int,
+    language_name: str,
+    transcript_segments: tuple,
+    chunk_tokens: int,
+    max_parallel: int,
+    stream: Optional[StreamOptions] = None,
+    route: Optional[ModelRoute] = None,
+) -> str:
+    """Map-reduce summary for transcripts too long for one comfortable request.
+
+    The transcript is cut at timestamp anchors into ~chunk_tokens parts.  Each
+    part is turned into cited notes in parallel (every call still goes through
+    throttle() via _call_gemini), then one reduce call merges the notes into the
+    usual Hook / Key Findings / So What structure.  Anchors keep their absolute
+    start times, and any citation in the final summary that is not a real
+    anchor is stripped, so [t=Xs] links stay correct.
+    """
+    chunks = _split_transcript(transcript, transcript_segments, chunk_tokens * CHARS_PER_TOKEN)
+    logger.info(
+        f"  Long transcript (~{estimate_tokens(transcript)} tokens) — "
+        f"summarising {len(chunks)} parts"
+    )
+
+    def part_bounds(index: int) -> tuple[int, int]:
+        start = chunks[index][1][0][0] if chunks[index][1] else 0
+        if index + 1 < len(chunks) and chunks[index + 1][1]:
+            return start, chunks[index + 1][1][0][0]
+        return start, duration_seconds
+
+    def summarize_part(index: int) -> str:
+        text, segments = chunks[index]
+        start, end = part_bounds(index)
+        template = CHUNK_NOTES_REQUEST_TEMPLATE if _prefix_caching else CHUNK_NOTES_PROMPT
+        prompt = template.format(
+            part=index + 1,
+            total=len(chunks),
+            start=_format_duration_for_prompt(start) if start else "the start",
+            end=_format_duration_for_prompt(end) if end else "the end",
+            language_name=language_name,
+            title=title,
+            channel_name=channel_name,
+            timestamp_index=_format_timestamp_index(segments),
+            transcript=text,
+        )
+        return _call_gemini(client, model, prompt, system_instruction=system_instruction, route=route)
+
+    system_instruction = SUMMARY_SYSTEM_INSTRUCTION if _prefix_caching else None
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        # copy_context per part keeps the usage-ledger item label on the workers
+        futures = [pool.submit(contextvars.copy_context().run, summarize_part, i) for i in range(len(chunks))]
+        notes = [future.result() for future in futures]
+
+    joined = "\n\n".join(
+        f"[Part {i + 1}]\n{text.strip()}" for i, text in enumerate(notes)
+    )
+    reduce_template = CHUNK_REDUCE_REQUEST_TEMPLATE if _prefix_caching else CHUNK_REDUCE_PROMPT
+    reduce_prompt = reduce_template.format(
+        total=len(chunks),
+        duration_str=_format_duration_for_prompt(duration_seconds),
+        language_name=language_name,
+        title=title,
+        channel_name=channel_name,
+        notes=joined,
+    )
+    summary = _call_gemini(
+        client, model, reduce_prompt, stream=stream, system_instruction=system_instruction, route=route,
+    )
+    return _strip_unknown_citations(summary, {start for start, _ in transcript_segments})
+
+
+def _split_transcript(transcript: str, segments: tuple, chunk_chars: int) -> list[tuple[str, tuple]]:
+    """Split a transcript into ~chunk_chars parts, cutting only at timestamp anchors.
+
+    Each segment's text is located in the transcript (in order) so a part always
+    starts exactly where an anchor starts, and carries the anchors that fall
+    inside it.  Without locatable anchors, cuts fall on word boundaries.
+    Returns a list of (text, segments) pairs.
+    """
+    anchors = []
+    pos = 0
+    for segment in segments:
+        offset = transcript.find(segment[1].strip(), pos)
+        if offset >= 0:
+            anchors.append((offset, segment))
+            pos = offset
+
+    cuts = [0]
+    if anchors:
+        for offset, _ in anchors:
+            if offset - cuts[-1] >= chunk_chars:
+                cuts.append(offset)
+    else:
+        while len(transcript) - cuts[-1] > chunk_chars:
+            cut = transcript.rfind(" ", cuts[-1] + 1, cuts[-1] + chunk_chars)
+            cuts.append(cut if cut > cuts[-1] else cuts[-1] + chunk_chars)
+    if len(cuts) > 1 and len(transcript) - cuts[-1] < chunk_chars * _MIN_TAIL_FRACTION:
+        cuts.pop()
+
+    bounds = cuts + [len(transcript)]
+    return [
+        (
+            transcript[start:end].strip(),
+            tuple(seg for offset, seg in anchors if start <= offset < end),
+        )
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def _strip_unknown_citations(summary: str, valid_starts: set[int]) -> str:
+    """Remove [t=Xs] citations whose X is not a real transcript anchor."""
+    def keep_or_drop(match: re.Match) -> str:
+        if int(match.group(1)) in valid_starts:
+            return match.group(0)
+        logger.debug(f"  Dropped unknown citation [t={match.group(1)}s] from merged summary")
+        return ""
+
+    return _CITATION_RE.sub(keep_or_drop, summary)
+
+
+def summarize_packed(
+    client: genai.Client,
+    model: str,
+    items: list[PackedItem],
+) -> list[Optional[str]]:
+    """Summarise several short videos in one request.
+
+    The response is split on <<<SUMMARY n>>> / <<<END n>>> markers back into one
+    summary per item, each with the same sections summarize() produces and with
+    citations checked against that item's own anchors.  Items missing from
+    the response come back as None so the caller can summarise them singly.
+    """
+    blocks = "\n\n".join(
+        PACKED_ITEM_TEMPLATE.format(
+            index=i + 1,
+            title=item.title,
+            channel_name=item.channel_name,
+            duration_str=_format_duration_for_prompt(item.duration_seconds),
+            language_name=_get_language_name(item.language),
+            timestamp_index=_format_timestamp_index(item.transcript_segments),
+            transcript=item.transcript,
+        )
+        for i, item in enumerate(items)
+    )
+    if _prefix_caching:
+        prompt = PACKED_REQUEST_TEMPLATE.format(total=len(items), items=blocks)
+        response = _call_gemini(client, model, prompt, system_instruction=SUMMARY_SYSTEM_INSTRUCTION)
+    else:
+        prompt = PACKED_SUMMARY_PROMPT.format(total=len(items), items=blocks)
+        response = _call_gemini(client, model, prompt)
+
+    found = {int(m.group(1)): m.group(2) for m in _PACKED_ITEM_RE.finditer(response)}
+    summaries = []
+    for i, item in enumerate(items):
+        text = found.get(i + 1, "").strip()
+        if not text:
+            logger.warning(f"  Packed response is missing '{item.title}' — will summarise it alone")
+            summaries.append(None)
+            continue
+        valid = {start for start, _ in item.transcript_segments}
+        summaries.append(_strip_unknown_citations(text, valid))
+    return summaries
+
+
+def _generate_streaming(
+    client: genai.Client,
+    request: dict,
+    stream: StreamOptions,
+    deadline: Optional[float] = None,
+) -> tuple[str, object, str]:
+    """Run one streamed generation, reporting progress and timings via stream.
+
+    The stream is read on a daemon thread, so a stalled stream is cut off
+    on the wall clock too: at deadline (a time.monotonic() value) the text
+    so far is kept as a partial result, or GenerationDeadlineError is raised
+    if there is none; a stream still unfinished after request_timeout()
+    raises TimeoutError ("504 DEADLINE_EXCEEDED") like generate_with_timeout.
+
+    Returns (text, usage_metadata of the last chunk that carried one, the
+    model that served the stream — see served_model).
+    """
+    stats = stream.stats
+    stats.ttft_seconds, stats.truncated = None, False
+    model = request["model"]
+    kind = request_class(request)
+    timeout = request_timeout(model, kind)
+    started = time.monotonic()
+    cutoff = started + timeout
+    if deadline is not None:
+        cutoff = min(cutoff, deadline)
+    chunks: queue.Queue = queue.Queue()
+    abandoned = threading.Event()
+    done = object()
+
+    def read() -> None:
+        try:
+            for chunk in client.models.generate_content_stream(**request):
+                if abandoned.is_set():
+                    return
+                chunks.put((True, chunk))
+            chunks.put((True, done))
+        except Exception as e:
+            chunks.put((False, e))
+
+    threading.Thread(target=read, daemon=True).start()
+    text = ""
+    usage = None
+    served = model
+    try:
+        while True:
+            try:
+                ok, chunk = chunks.get(timeout=max(0.0, cutoff - time.monotonic()))
+            except queue.Empty:
+                elapsed = time.monotonic() - started
+                if deadline is None or time.monotonic() < deadline:
+                    raise TimeoutError(f"504 DEADLINE_EXCEEDED: stream unfinished after {elapsed:.0f}s")
+                if not text:
+                    raise GenerationDeadlineError(f"Generation deadline reached after {elapsed:.0f}s with no output")
+                stats.truncated = True
+                logger.warning(f"  Generation deadline reached — keeping partial result ({len(text)} chars)")
+                break
+            if not ok:
+                raise chunk
+            if chunk is done:
+                record_request_latency(model, time.monotonic() - started, kind)
+                break
+            now = time.monotonic()
+            usage = getattr(chunk, "usage_metadata", None) or usage
+            served = served_model(chunk, model)
+            if chunk.text:
+                if stats.ttft_seconds is None:
+                    stats.ttft_seconds = now - started
+                text += chunk.text
+                stream.on_text(text)
+            if deadline is not None and now >= deadline:
+                stats.truncated = True
+                logger.warning(f"  Generation deadline reached — keeping partial result ({len(text)} chars)")
+                break
+    finally:
+        abandoned.set()
+    stats.total_seconds = time.monotonic() - started
+    return text, usage, served
 
 
 def _format_timestamp_index(segments: tuple) -> str:
@@ -179,51 +1066,155 @@ def _format_timestamp_index(segments: tuple) -> str:
     return "\n".join(lines)
 
 
-def _call_gemini(client: genai.Client, model: str, prompt: str) -> str:
-    """Make a single Gemini API call with retry and throttle."""
+def generate_text(
+    client: genai.Client,
+    model: str,
+    prompt: str,
+    system_instruction: Optional[str] = None,
+    route: Optional[ModelRoute] = None,
+) -> str:
+    """Send one text prompt the way every summary call is sent (see _call_gemini).
+
+    For other modules' text calls (e.g. the podcast notes merge): throttle,
+    retries, response cache, circuit breaker and usage ledger all apply.
+    """
+    return _call_gemini(client, model, prompt, system_instruction=system_instruction, route=route)
+
+
+def _call_gemini(
+    client: genai.Client,
+    model: str,
+    prompt: str,
+    stream: Optional[StreamOptions] = None,
+    system_instruction: Optional[str] = None,
+    route: Optional[ModelRoute] = None,
+) -> str:
+    """Make a single Gemini API call with retry and throttle.
+
+    Identical (model, prompt) calls are served from the response cache when
+    it is enabled, without throttling.  With stream set, the streaming API is
+    used (see StreamOptions); a partial result cut off at the deadline is
+    returned but never cached.  The deadline starts when the first stream is
+    sent, and no retry is sent once it has passed (GenerationDeadlineError).  system_instruction is sent through
+    prefix_request_config (cached content when possible).  route adds its
+    output-length / thinking limits to the request.  Non-streamed calls are
+    bounded (and optionally hedged) by generate_with_timeout, streamed ones
+    by the same request timeout (see _generate_streaming).
+
+    Every attempt goes through the run-wide circuit breaker: while it is open
+    CircuitOpenError is raised at once instead of retrying.  The finished call
+    (tokens, latency, attempts) is recorded in the usage ledger.
+    """
+    if system_instruction is None:
+        cache_key = response_cache_key(model, prompt, *route_cache_parts(route))
+    else:
+        cache_key = response_cache_key(model, system_instruction, prompt, *route_cache_parts(route))
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        logger.info("  Served from response cache")
+        return cached
+
     last_error = None
+    breaker = circuit_breaker()
+    attempts = 0
+    hedges = 0      # duplicates sent by generate_with_timeout, billed like any request
+    stream_deadline = None
 
-    for attempt in range(MAX_RETRIES + 1):
-        if attempt > 0:
-            backoff = INITIAL_BACKOFF_SECONDS * (2 ** (attempt - 1))
-            logger.info(f"  Retry {attempt}/{MAX_RETRIES} after {backoff}s backoff...")
-            time.sleep(backoff)
-        else:
-            # Throttle between calls to stay under 15 RPM
-            time.sleep(THROTTLE_SECONDS)
+    def count_hedge() -> None:
+        nonlocal hedges
+        hedges += 1
 
-        try:
-            response = client.models.generate_content(
-                model=model,
-                contents=prompt,
-            )
-            return response.text or ""
-        except Exception as e:
-            last_error = e
-            error_str = str(e).lower()
+    try:
+        for attempt in range(MAX_RETRIES + 1):
+            breaker.before_request()
+            if attempt > 0:
+                backoff = INITIAL_BACKOFF_SECONDS * (2 ** (attempt - 1))
+                logger.info(f"  Retry {attempt}/{MAX_RETRIES} after {backoff}s backoff...")
+                time.sleep(backoff)
+            else:
+                # Throttle between calls to stay under 15 RPM
+                throttle()
+            if stream_deadline is not None and time.monotonic() >= stream_deadline:
+                # A new stream would be cut off before its first token
+                error = GenerationDeadlineError(
+                    f"Generation deadline reached after {stream.max_seconds:.0f}s — not retrying"
+                )
+                breaker.record_failure(error)
+                raise error
+            attempts = attempt + 1
+            attempt_started = time.monotonic()
+
+            try:
+                request = {"model": model, "contents": prompt}
+                config = None
+                if system_instruction is not None:
+                    config = prefix_request_config(client, model, system_instruction)
+                config = route_request_config(route, config)
+                if config is not None:
+                    request["config"] = config
+                if stream is None:
+                    response = generate_with_timeout(client, request, on_hedge=count_hedge)
+                    text = response.text or ""
+                    usage = getattr(response, "usage_metadata", None)
+                    served = served_model(response, model)
+                else:
+                    if stream.max_seconds is not None and stream_deadline is None:
+                        stream_deadline = time.monotonic() + stream.max_seconds
+                    text, usage, served = _generate_streaming(client, request, stream, stream_deadline)
+                breaker.record_success()
+                record_call(served, usage, time.monotonic() - attempt_started, attempts + hedges)
+                attempts = hedges = 0  # recorded
+                if stream is not None and stream.stats.truncated:
+                    return text
+                store_response(cache_key, text)
+                return text
+            except Exception as e:
+                last_error = e
+                error_str = str(e).lower()
+                breaker.record_failure(e)
+
+                # --- Streamed generation out of time — a retry would start past the deadline ---
+                if isinstance(e, GenerationDeadlineError):
+                    logger.warning(f"  {e}")
+                    raise
+
+                # --- Authentication / bad key (401/403) — abort immediately, no point retrying ---
+                if "401" in str(e) or "403" in str(e) or "api_key_invalid" in error_str or "permission_denied" in error_str:
+                    logger.error(f"Gemini authentication error — check your API key: {e}")
+                    raise
+
+                # --- Daily quota exhausted (RPD) — abort run, save partial progress ---
+                if "429" in str(e) or "resource_exhausted" in error_str:
+                    if "daily" in error_str or "per day" in error_str or "quota exceeded" in error_str:
+                        logger.error("Gemini daily quota exhausted — aborting run to avoid wasted retries")
+                        raise QuotaExhaustedError("Gemini daily quota exhausted") from e
+                    # Per-minute rate limit (RPM) — retryable
+                    logger.warning(f"  Rate limited (attempt {attempt + 1}/{MAX_RETRIES + 1})")
+                    continue
+
+                # --- Registered prefix cache expired or deleted — re-register and retry ---
+                if system_instruction is not None and "cached" in error_str and (
+                    "not found" in error_str or "404" in str(e) or "expired" in error_str
+                ):
+                    logger.warning("  Cached prompt prefix is gone — re-registering")
+                    forget_prefix_cache(client, model, system_instruction)
+                    continue
+
+                # --- Server errors (5xx) and timeouts — retryable ---
+                if "500" in str(e) or "502" in str(e) or "503" in str(e) or "504" in str(e) or "unavailable" in error_str:
+                    logger.warning(f"  Gemini server error, retrying (attempt {attempt + 1}/{MAX_RETRIES + 1}): {e}")
+                    continue
 
-            # --- Authentication / bad key (401/403) — abort immediately, no point retrying ---
-            if "401" in str(e) or "403" in str(e) or "api_key_invalid" in error_str or "permission_denied" in error_str:
-                logger.error(f"Gemini authentication error — check your API key: {e}")
+                # --- Any other error — not retryable ---
+                logger.error(f"Gemini API error: {e}")
                 raise
 
-            # --- Daily quota exhausted (RPD) — abort run, save partial progress ---
-            if "429" in str(e) or "resource_exhausted" in error_str:
-                if "daily" in error_str or "per day" in error_str or "quota exceeded" in error_str:
-                    logger.error("Gemini daily quota exhausted — aborting run to avoid wasted retries")
-                    raise QuotaExhaustedError("Gemini daily quota exhausted") from e
-                # Per-minute rate limit (RPM) — retryable
-                logger.warning(f"  Rate limited (attempt {attempt + 1}/{MAX_RETRIES + 1})")
-                continue
-
-            # --- Server errors (5xx) — retryable ---
-            if "500" in str(e) or "502" in str(e) or "503" in str(e) or "unavailable" in error_str:
-                logger.warning(f"  Gemini server error, retrying (attempt {attempt + 1}/{MAX_RETRIES + 1}): {e}")
-                continue
-
-            # --- Any other error — not retryable ---
-            logger.error(f"Gemini API error: {e}")
-            raise
-
-    logger.error(f"Gemini API error after {MAX_RETRIES + 1} attempts: {last_error}")
-    raise last_error
+        logger.error(f"Gemini API error after {MAX_RETRIES + 1} attempts: {last_error}")
+        if breaker.is_open():
+            raise CircuitOpenError(f"Gemini circuit breaker is open: {last_error}") from last_error
+        raise last_error
+    except BaseException:
+        # Failed for good — still count the requests that were sent
+        if attempts:
+            record_call(model, None, 0.0, attempts + hedges, ok=False)
+        raise
@@ -0,0 +1,171 @@
+"""Per-run ledger of Gemini calls: tokens, latency and retries per item.
+
+Every Gemini generation (summaries, chunk notes, podcast audio) is recorded
+here once it finishes, with the usage_metadata token counts the API returns.
+main.py labels the item being processed (see ledger_item), so the ledger can
+report per-item cost as well as per-model totals; those totals are logged at
+the end of the run, written to the run report and used for quota planning.
+A ledger's on_record callback sees every call as it is recorded (main uses
+it to keep the daily quota in state current).
+Tokens saved by transcript compaction (src/compaction.py) are tallied here
+too, so the run report shows what compaction kept out of the prompts.
+
+Calls made on worker threads (parallel chunks) must be submitted with
+contextvars.copy_context().run so they keep the item label.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Items listed individually in the run report
+_REPORT_SLOWEST_ITEMS = 10
+
+_current_item: contextvars.ContextVar[str] = contextvars.ContextVar("ledger_item", default="")
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    """One finished Gemini call (including its retries)."""
+    item: str
+    model: str
+    prompt_tokens: int
+    output_tokens: int
+    latency_seconds: float
+    requests: int          # attempts sent, i.e. 1 + retries
+    ok: bool = True
+
+
+@dataclass(frozen=True)
+class UsageTotals:
+    requests: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+
+class UsageLedger:
+    """Thread-safe list of CallRecords with simple aggregations."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records: list[CallRecord] = []
+        self._compacted: list[int] = []    # tokens saved per compacted transcript
+        self.on_record: Optional[Callable[[CallRecord], None]] = None
+
+    def record(self, record: CallRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+        if self.on_record is not None:
+            self.on_record(record)
+
+    def record_compaction(self, saved_tokens: int) -> None:
+        with self._lock:
+            self._compacted.append(saved_tokens)
+
+    def compaction_savings(self) -> tuple[int, int]:
+        """(transcripts compacted, estimated tokens saved) so far this run."""
+        with self._lock:
+            return len(self._compacted), sum(self._compacted)
+
+    @property
+    def records(self) -> list[CallRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def totals(self) -> UsageTotals:
+        records = self.records
+        return UsageTotals(
+            requests=sum(r.requests for r in records),
+            prompt_tokens=sum(r.prompt_tokens for r in records),
+            output_tokens=sum(r.output_tokens for r in records),
+        )
+
+    def by_model(self) -> dict[str, UsageTotals]:
+        totals: dict[str, UsageTotals] = {}
+        for r in self.records:
+            t = totals.get(r.model, UsageTotals())
+            totals[r.model] = UsageTotals(
+                t.requests + r.requests, t.prompt_tokens + r.prompt_tokens, t.output_tokens + r.output_tokens,
+            )
+        return totals
+
+    def report_lines(self) -> list[str]:
+        """Markdown bullet lines: per-model totals, compaction savings, then the slowest items."""
+        records = self.records
+        transcripts, saved = self.compaction_savings()
+        if not records and not transcripts:
+            return []
+        lines = []
+        for model, t in sorted(self.by_model().items()):
+            lines.append(
+                f"- **{model}**: {t.requests} request(s), "
+                f"{t.prompt_tokens:,} input / {t.output_tokens:,} output tokens"
+            )
+        if transcripts:
+            lines.append(f"- Transcript compaction: ~{saved:,} input tokens saved over {transcripts} transcript(s)")
+        per_item: dict[str, list[CallRecord]] = {}
+        for r in records:
+            per_item.setdefault(r.item or "(unlabelled)", []).append(r)
+        slowest = sorted(
+            per_item.items(), key=lambda kv: sum(r.latency_seconds for r in kv[1]), reverse=True,
+        )[:_REPORT_SLOWEST_ITEMS]
+        for item, calls in slowest:
+            retries = sum(r.requests - 1 for r in calls)
+            lines.append(
+                f"- {item}: {len(calls)} call(s), {sum(r.latency_seconds for r in calls):.1f}s, "
+                f"{sum(r.prompt_tokens for r in calls):,} in / {sum(r.output_tokens for r in calls):,} out"
+                + (f", {retries} retr{'y' if retries == 1 else 'ies'}" if retries else "")
+            )
+        return lines
+
+
+# The ledger for the current run
+_ledger = UsageLedger()
+
+
+def usage_ledger() -> UsageLedger:
+    return _ledger
+
+
+def reset_usage_ledger() -> None:
+    """Start a fresh ledger (once per run)."""
+    global _ledger
+    _ledger = UsageLedger()
+
+
+@contextmanager
+def ledger_item(label: str) -> Iterator[None]:
+    """Attribute Gemini calls made inside the block to the item label."""
+    token = _current_item.set(label)
+    try:
+        yield
+    finally:
+        _current_item.reset(token)
+
+
+def _token_count(usage, name: str) -> int:
+    value = getattr(usage, name, None) if usage is not None else None
+    return value if isinstance(value, int) else 0
+
+
+def record_call(model: str, usage, latency_seconds: float, requests: int, ok: bool = True) -> None:
+    """Record one finished call.  usage is the response's usage_metadata (may be None).
+
+    Thinking tokens are billed as output, so they are counted there.
+    """
+    _ledger.record(CallRecord(
+        item=_current_item.get(),
+        model=model,
+        prompt_tokens=_token_count(usage, "prompt_token_count"),
+        output_tokens=_token_count(usage, "candidates_token_count") + _token_count(usage, "thoughts_token_count"),
+        latency_seconds=latency_seconds,
+        requests=requests,
+        ok=ok,
+    ))
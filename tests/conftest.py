@@ -1,5 +1,20 @@
 """Pytest configuration and shared fixtures."""
 
+import pytest
+
+from src.circuit_breaker import configure_circuit_breaker
+from src.response_cache import disable_response_cache
+from src.summarizer import (
+    REQUEST_TIMEOUT_SECONDS,
+    disable_prefix_caching,
+    disable_request_hedging,
+    enable_shared_throttle,
+    reset_request_latencies,
+    reset_route_latencies,
+    set_request_timeout,
+)
+from src.usage_ledger import reset_usage_ledger
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -25,3 +40,20 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "integration" in item.keywords:
                 item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_caches():
+    """run() enables process-wide caches; never leak them between tests."""
+    disable_response_cache()
+    disable_prefix_caching()
+    yield
+    disable_response_cache()
+    disable_prefix_caching()
+    enable_shared_throttle()
+    reset_route_latencies()
+    disable_request_hedging()
+    set_request_timeout(REQUEST_TIMEOUT_SECONDS)
+    reset_request_latencies()
+    configure_circuit_breaker()
+    reset_usage_ledger()
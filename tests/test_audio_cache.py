@@ -0,0 +1,103 @@
+"""Tests for the cross-run podcast audio cache."""
+
+from __future__ import annotations
+
+import os
+import time
+
+from src.audio_cache import (
+    AUDIO_CACHE_TTL_DAYS,
+    audio_cache_key,
+    audio_cache_paths,
+    evict_audio,
+    get_cached_audio,
+    prune_audio_cache,
+)
+
+URL = "https://cdn.example.com/ep1.mp3"
+
+
+class TestAudioCacheKey:
+    def test_stable_for_same_url(self):
+        assert audio_cache_key(URL) == audio_cache_key(URL)
+
+    def test_differs_between_urls(self):
+        assert audio_cache_key(URL) != audio_cache_key("https://cdn.example.com/ep2.mp3")
+
+    def test_paths_include_clip_length(self, tmp_path):
+        final_60, partial_60 = audio_cache_paths(tmp_path, URL, 60)
+        final_30, _ = audio_cache_paths(tmp_path, URL, 30)
+        assert final_60 != final_30
+        assert final_60.name.endswith(".60m.mp3")
+        assert partial_60.name.endswith(".60m.part")
+
+
+class TestGetCachedAudio:
+    def test_returns_none_when_missing(self, tmp_path):
+        assert get_cached_audio(tmp_path, URL, 60) is None
+
+    def test_returns_none_for_partial_only(self, tmp_path):
+        _, partial = audio_cache_paths(tmp_path, URL, 60)
+        partial.write_bytes(b"half")
+        assert get_cached_audio(tmp_path, URL, 60) is None
+
+    def test_returns_none_for_empty_file(self, tmp_path):
+        final, _ = audio_cache_paths(tmp_path, URL, 60)
+        final.write_bytes(b"")
+        assert get_cached_audio(tmp_path, URL, 60) is None
+
+    def test_returns_complete_file_and_touches_it(self, tmp_path):
+        final, _ = audio_cache_paths(tmp_path, URL, 60)
+        final.write_bytes(b"audio")
+        old = time.time() - 3600
+        os.utime(final, (old, old))
+
+        assert get_cached_audio(tmp_path, URL, 60) == final
+        assert final.stat().st_mtime > old
+
+
+class TestEvictAudio:
+    def test_removes_complete_and_partial(self, tmp_path):
+        final, partial = audio_cache_paths(tmp_path, URL, 60)
+        final.write_bytes(b"audio")
+        partial.write_bytes(b"aud")
+        other, _ = audio_cache_paths(tmp_path, "https://cdn.example.com/other.mp3", 60)
+        other.write_bytes(b"keep")
+
+        assert evict_audio(tmp_path, URL) == 2
+        assert not final.exists()
+        assert not partial.exists()
+        assert other.exists()
+
+    def test_missing_dir_is_noop(self, tmp_path):
+        assert evict_audio(tmp_path / "nope", URL) == 0
+
+
+class TestPruneAudioCache:
+    def test_missing_dir_returns_empty(self, tmp_path):
+        assert prune_audio_cache(tmp_path / "nope", max_bytes=1024) == []
+
+    def test_removes_expired_files(self, tmp_path):
+        stale = tmp_path / "stale.60m.mp3"
+        stale.write_bytes(b"x")
+        old = time.time() - (AUDIO_CACHE_TTL_DAYS + 1) * 86400
+        os.utime(stale, (old, old))
+        fresh = tmp_path / "fresh.60m.mp3"
+        fresh.write_bytes(b"x")
+
+        removed = prune_audio_cache(tmp_path, max_bytes=1024)
+
+        assert removed == ["stale.60m.mp3"]
+        assert fresh.exists()
+
+    def test_evicts_least_recently_used_when_over_size(self, tmp_path):
+        now = time.time()
+        for i, name in enumerate(["a.60m.mp3", "b.60m.mp3", "c.60m.mp3"]):
+            path = tmp_path / name
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (now - 300 + i * 100, now - 300 + i * 100))
+
+        removed = prune_audio_cache(tmp_path, max_bytes=150)
+
+        assert removed == ["a.60m.mp3", "b.60m.mp3"]
+        assert (tmp_path / "c.60m.mp3").exists()
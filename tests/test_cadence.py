@@ -0,0 +1,98 @@
+"""Tests for learned per-source posting cadence."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.cadence import CadenceModel, FetchPlan
+
+NOW = datetime(2026, 2, 20, 14, 0, tzinfo=timezone.utc)
+
+
+def _model(uploads, checked_hours_ago=24):
+    model = CadenceModel()
+    model.observe("Channel", uploads, now=NOW - timedelta(hours=checked_hours_ago))
+    return model
+
+
+def _weekly(last_days_ago, count=6):
+    """Date-only uploads (like YouTube's) a week apart."""
+    last = (NOW - timedelta(days=last_days_ago)).replace(hour=0)
+    return [last - timedelta(days=7 * i) for i in range(count)]
+
+
+class TestPlan:
+    def test_no_history_fetches_as_configured(self):
+        assert CadenceModel().plan("Channel", 3, 26, 72, now=NOW) == FetchPlan(True, 3, 26)
+
+    def test_too_little_history_fetches(self):
+        plan = _model(_weekly(1, count=4)).plan("Channel", 3, 26, 72, now=NOW)
+        assert plan.fetch
+
+    def test_weekly_source_skipped_soon_after_upload(self):
+        plan = _model(_weekly(2)).plan("Channel", 3, 26, 72, now=NOW)
+        assert not plan.fetch
+        assert "posts every ~7.0 days" in plan.reason
+
+    def test_weekly_source_fetched_once_an_upload_is_due(self):
+        assert _model(_weekly(5)).plan("Channel", 3, 26, 72, now=NOW).fetch
+
+    def test_never_skipped_longer_than_max_skip(self):
+        plan = _model(_weekly(2), checked_hours_ago=80).plan("Channel", 3, 26, 72, now=NOW)
+        assert plan.fetch
+        assert plan.lookback_hours == 81    # covers everything since the last fetch
+
+    def test_fetch_after_skip_widens_lookback(self):
+        plan = _model(_weekly(5), checked_hours_ago=48).plan("Channel", 3, 26, 72, now=NOW)
+        assert plan.lookback_hours == 49
+
+    def test_daily_feed_skipped_until_its_usual_hour_comes_round(self):
+        # Posts around 18:00 UTC daily, last yesterday; fetched this morning at 08:00
+        uploads = [NOW.replace(hour=18) - timedelta(days=i) for i in range(1, 7)]
+        model = CadenceModel()
+        model.observe("Show", uploads, now=NOW.replace(hour=8))
+
+        plan = model.plan("Show", 3, 26, 72, now=NOW.replace(hour=10))
+        assert not plan.fetch
+        assert plan.reason == "usually posts around 18:00 UTC"
+        assert model.plan("Show", 3, 26, 72, now=NOW.replace(hour=17)).fetch
+
+    def test_date_only_uploads_have_no_time_of_day(self):
+        daily = [NOW.replace(hour=0) - timedelta(days=i) for i in range(6)]
+        model = CadenceModel()
+        model.observe("Channel", daily, now=NOW - timedelta(hours=1))
+        assert model.plan("Channel", 3, 26, 72, now=NOW).fetch
+
+    def test_bursty_source_fetches_more(self):
+        burst = [NOW - timedelta(days=1, minutes=10 * i) for i in range(8)]
+        plan = _model(burst + _weekly(9)).plan("Channel", 3, 26, 72, now=NOW)
+        assert plan.max_items == 9
+
+    @pytest.mark.parametrize("max_items, expected", [(3, 9), (1, 3)])
+    def test_burst_fetch_capped(self, max_items, expected):
+        burst = [NOW - timedelta(days=1, minutes=i) for i in range(20)]
+        assert _model(burst).plan("Channel", max_items, 26, 72, now=NOW).max_items == expected
+
+    def test_quiet_source_fetches_less(self):
+        plan = _model(_weekly(5)).plan("Channel", 5, 26, 72, now=NOW)
+        assert plan.max_items == 2
+
+
+class TestHistory:
+    def test_round_trip(self):
+        model = _model(_weekly(2))
+        restored = CadenceModel(model.history())
+        assert restored.history() == model.history()
+        assert restored.plan("Channel", 3, 26, 72, now=NOW) == model.plan("Channel", 3, 26, 72, now=NOW)
+
+    def test_keeps_newest_uploads(self):
+        model = _model(_weekly(1, count=40))
+        uploads = model.history()["Channel"]["uploads"]
+        assert len(uploads) == 30
+        assert uploads[-1] == _weekly(1, count=1)[0].isoformat()
+
+    def test_unreadable_history_ignored(self):
+        model = CadenceModel({"Channel": {"uploads": ["yesterday"]}, "Other": "x"})
+        assert model.history() == {}
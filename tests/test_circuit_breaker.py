@@ -0,0 +1,108 @@
+"""Tests for the run-wide Gemini circuit breaker."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from src.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    circuit_breaker,
+    configure_circuit_breaker,
+    is_server_error,
+)
+
+SERVER_ERROR = Exception("503 UNAVAILABLE: the model is overloaded")
+
+
+class TestIsServerError:
+    @pytest.mark.parametrize("message", [
+        "500 Internal", "502 Bad Gateway", "503 Service Unavailable",
+        "504 DEADLINE_EXCEEDED: no Gemini response within 60s", "UNAVAILABLE",
+    ])
+    def test_server_errors(self, message):
+        assert is_server_error(Exception(message))
+
+    @pytest.mark.parametrize("message", ["400 INVALID_ARGUMENT", "429 RESOURCE_EXHAUSTED", "401"])
+    def test_other_errors(self, message):
+        assert not is_server_error(Exception(message))
+
+
+class TestCircuitBreaker:
+    def test_trips_after_consecutive_server_errors(self):
+        breaker = CircuitBreaker(failure_threshold=3, cooldown_seconds=60)
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_failure(SERVER_ERROR)
+        assert breaker.state == "closed"
+        breaker.before_request()
+        breaker.record_failure(SERVER_ERROR)
+
+        assert breaker.is_open()
+        assert breaker.tripped_at is not None
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_success_resets_the_count(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure(SERVER_ERROR)
+        breaker.record_success()
+        breaker.record_failure(SERVER_ERROR)
+        assert breaker.state == "closed"
+
+    def test_other_errors_leave_the_count_alone(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure(SERVER_ERROR)
+        breaker.record_failure(Exception("429 per minute"))
+        breaker.record_failure(Exception("400 INVALID_ARGUMENT"))
+        assert breaker.state == "closed"
+        breaker.record_failure(SERVER_ERROR)
+        assert breaker.is_open()
+
+    def test_other_error_on_probe_frees_it_without_closing(self):
+        breaker = CircuitBreaker(failure_threshold=5, cooldown_seconds=60, half_open=True)
+        breaker.before_request()
+        breaker.record_failure(Exception("429 per minute"))
+
+        assert breaker.state == "half-open"
+        assert breaker.tripped_at is not None
+        breaker.before_request()    # the next request is the new probe
+        with pytest.raises(CircuitOpenError, match="probe already in flight"):
+            breaker.before_request()
+
+    def test_half_open_probe_after_cooldown_closes_on_success(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+        with patch("src.circuit_breaker.time.monotonic", return_value=1000.0):
+            breaker.record_failure(SERVER_ERROR)
+        with patch("src.circuit_breaker.time.monotonic", return_value=1061.0):
+            breaker.before_request()
+            assert breaker.state == "half-open"
+            # Only one probe at a time
+            with pytest.raises(CircuitOpenError, match="probe already in flight"):
+                breaker.before_request()
+        breaker.record_success()
+
+        assert breaker.state == "closed"
+        assert breaker.tripped_at is None
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=5, cooldown_seconds=60, half_open=True)
+        breaker.before_request()
+        breaker.record_failure(SERVER_ERROR)
+
+        assert breaker.is_open()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_starts_half_open_after_tripped_run(self):
+        breaker = CircuitBreaker(half_open=True)
+        assert breaker.state == "half-open"
+        assert breaker.tripped_at is not None
+
+    def test_configure_replaces_process_breaker(self):
+        configure_circuit_breaker(failure_threshold=2, cooldown_seconds=30, half_open=True)
+        assert circuit_breaker().failure_threshold == 2
+        assert circuit_breaker().state == "half-open"
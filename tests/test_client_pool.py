@@ -0,0 +1,253 @@
+"""Tests for the multi-key / multi-model Gemini client pool."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.genai import types
+
+from src.client_pool import (
+    POOL_RPM_PER_LANE,
+    ClientPool,
+    create_client_pool,
+    is_daily_quota_error,
+    is_rate_limit_error,
+    served_model,
+)
+from src.summarizer import StreamOptions, _call_gemini
+from src.usage_ledger import usage_ledger
+
+
+def make_client(name):
+    client = MagicMock(name=name)
+    client.models.generate_content.return_value = MagicMock(text=f"from {name}")
+    uploaded, cached = MagicMock(), MagicMock()
+    uploaded.name, cached.name = f"files/{name}", f"cachedContents/{name}"
+    client.files.upload.return_value = uploaded
+    client.caches.create.return_value = cached
+    return client
+
+
+@pytest.fixture(autouse=True)
+def pacing_sleep():
+    with patch("src.client_pool.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+class TestErrorClassification:
+    def test_rate_limit(self):
+        assert is_rate_limit_error(Exception("429 Too Many Requests"))
+        assert is_rate_limit_error(Exception("RESOURCE_EXHAUSTED"))
+        assert not is_rate_limit_error(Exception("503 unavailable"))
+
+    def test_daily(self):
+        assert is_daily_quota_error(Exception("429 quota exceeded per day"))
+        assert not is_daily_quota_error(Exception("429 per minute"))
+
+
+class TestRouting:
+    def test_spreads_requests_by_remaining_budget(self):
+        a, b = make_client("a"), make_client("b")
+        pool = ClientPool([a, b], ("m1",))
+
+        for _ in range(4):
+            pool.models.generate_content(model="m1", contents="p")
+
+        assert a.models.generate_content.call_count == 2
+        assert b.models.generate_content.call_count == 2
+
+    def test_fails_over_to_next_key_on_rate_limit(self):
+        a, b = make_client("a"), make_client("b")
+        a.models.generate_content.side_effect = Exception("429 RESOURCE_EXHAUSTED per minute")
+        pool = ClientPool([a, b], ("m1",))
+
+        result = pool.models.generate_content(model="m1", contents="p")
+        assert result.text == "from b"
+
+        # a is cooling down: the next request goes straight to b
+        pool.models.generate_content(model="m1", contents="p")
+        assert a.models.generate_content.call_count == 1
+        assert b.models.generate_content.call_count == 2
+
+    def test_fails_over_to_fallback_model_when_keys_exhausted(self):
+        a = make_client("a")
+        a.models.generate_content.side_effect = [
+            Exception("429 daily quota exceeded"), MagicMock(text="lite"),
+        ]
+        pool = ClientPool([a], ("m1", "m-lite"))
+
+        assert pool.models.generate_content(model="m1", contents="p").text == "lite"
+        models = [c.kwargs["model"] for c in a.models.generate_content.call_args_list]
+        assert models == ["m1", "m-lite"]
+
+    def test_served_model_reported_after_failover(self):
+        a = make_client("a")
+        a.models.generate_content.side_effect = [Exception("429 daily quota exceeded"), MagicMock(text="lite")]
+        pool = ClientPool([a], ("m1", "m-lite"))
+
+        assert served_model(pool.models.generate_content(model="m1", contents="p"), "m1") == "m-lite"
+        assert served_model(make_client("b").models.generate_content(model="m1", contents="p"), "m1") == "m1"
+
+    @patch("src.summarizer.time.sleep")
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_usage_recorded_under_the_model_that_answered(self, mock_sleep, streamed):
+        a = make_client("a")
+        a.models.generate_content.side_effect = [Exception("429 daily quota exceeded"), MagicMock(text="lite")]
+        a.models.generate_content_stream.side_effect = [
+            Exception("429 daily quota exceeded"), iter([MagicMock(text="lite")]),
+        ]
+        pool = ClientPool([a], ("m1", "m-lite"))
+        stream = StreamOptions(on_text=lambda text: None) if streamed else None
+
+        assert _call_gemini(pool, "m1", "prompt", stream=stream) == "lite"
+
+        [record] = usage_ledger().records
+        assert record.model == "m-lite"
+
+    def test_last_error_raised_when_every_lane_benched(self):
+        a = make_client("a")
+        a.models.generate_content.side_effect = Exception("429 quota exceeded per day")
+        pool = ClientPool([a], ("m1",))
+
+        with pytest.raises(Exception, match="per day"):
+            pool.models.generate_content(model="m1", contents="p")
+        # Later requests fail fast with a daily-quota error the callers recognise
+        with pytest.raises(RuntimeError) as exc:
+            pool.models.generate_content(model="m1", contents="p")
+        assert is_rate_limit_error(exc.value) and is_daily_quota_error(exc.value)
+
+    def test_other_errors_not_failed_over(self):
+        a, b = make_client("a"), make_client("b")
+        a.models.generate_content.side_effect = Exception("500 internal")
+        pool = ClientPool([a, b], ("m1",))
+
+        with pytest.raises(Exception, match="500"):
+            pool.models.generate_content(model="m1", contents="p")
+        b.models.generate_content.assert_not_called()
+
+    def test_uploads_spread_over_keys(self):
+        a, b = make_client("a"), make_client("b")
+        pool = ClientPool([a, b], ("m1",))
+        pool.models.generate_content(model="m1", contents="p")   # a is busiest now
+
+        assert pool.files.upload(file="x.mp3").name == "files/b"
+        b.files.upload.assert_called_once_with(file="x.mp3", config=None)
+        a.files.upload.assert_not_called()
+
+    def test_uploaded_files_pinned_to_owning_key(self):
+        a, b = make_client("a"), make_client("b")
+        pool = ClientPool([a, b], ("m1", "m2"))
+        pool.models.generate_content(model="m1", contents="p")
+        uploaded = pool.files.upload(file="x.mp3")
+        b.models.generate_content.side_effect = Exception("429 per minute")
+
+        with pytest.raises(Exception, match="429"):
+            for _ in range(3):
+                pool.models.generate_content(model="m1", contents=[uploaded, "prompt"])
+        assert a.models.generate_content.call_count == 1   # only the unpinned request
+
+    def test_cached_content_pinned_to_owning_key_and_model(self):
+        a, b = make_client("a"), make_client("b")
+        pool = ClientPool([a, b], ("m1", "m2"))
+        pool.models.generate_content(model="m1", contents="p")
+        cached = pool.caches.create(model="m1", config=None)
+        config = types.GenerateContentConfig(cached_content=cached.name)
+
+        for _ in range(3):
+            pool.models.generate_content(model="m1", contents="p", config=config)
+
+        assert b.caches.create.called and not a.caches.create.called
+        assert b.models.generate_content.call_count == 3
+        assert all(c.kwargs["model"] == "m1" for c in b.models.generate_content.call_args_list)
+        assert all(c.kwargs["config"] is config for c in b.models.generate_content.call_args_list)
+
+    def test_file_from_earlier_run_found_on_its_key(self):
+        a, b = make_client("a"), make_client("b")
+        a.files.get.side_effect = Exception("403 PERMISSION_DENIED")
+        pool = ClientPool([a, b], ("m1",))
+
+        assert pool.files.get(name="files/old") is b.files.get.return_value
+        pool.files.delete(name="files/old")
+
+        a.files.delete.assert_not_called()
+        b.files.delete.assert_called_once_with(name="files/old")
+        assert pool._pinned_key([MagicMock(name="f"), "p"], None) is None
+
+    def test_unlisted_model_gets_its_own_lanes(self):
+        a, b = make_client("a"), make_client("b")
+        pool = ClientPool([a, b], ("m1",))
+
+        pool.models.generate_content(model="routed", contents="p")
+
+        called = a.models.generate_content.call_args or b.models.generate_content.call_args
+        assert called.kwargs["model"] == "routed"
+
+    def test_budget_window_counts_recent_requests(self):
+        a, b = make_client("a"), make_client("b")
+        pool = ClientPool([a, b], ("m1",))
+        with patch("src.client_pool.time.monotonic", return_value=1000.0):
+            for _ in range(POOL_RPM_PER_LANE):
+                pool.models.generate_content(model="m1", contents="p")
+        assert sum(lane.remaining(1000.0) for lane in pool._lanes) == POOL_RPM_PER_LANE
+        # A minute after the last paced request both lanes have their full budget again
+        assert all(lane.remaining(1100.0) == POOL_RPM_PER_LANE for lane in pool._lanes)
+
+
+class TestPacing:
+    def test_requests_on_one_lane_spaced_out(self, pacing_sleep):
+        a = make_client("a")
+        pool = ClientPool([a], ("m1",))
+        with patch("src.client_pool.time.monotonic", return_value=1000.0):
+            for _ in range(3):
+                pool.models.generate_content(model="m1", contents="p")
+
+        waits = [c.args[0] for c in pacing_sleep.call_args_list]
+        assert waits == [60 / POOL_RPM_PER_LANE, 2 * 60 / POOL_RPM_PER_LANE]
+
+    def test_keys_paced_independently(self, pacing_sleep):
+        a, b = make_client("a"), make_client("b")
+        pool = ClientPool([a, b], ("m1",))
+        with patch("src.client_pool.time.monotonic", return_value=1000.0):
+            pool.models.generate_content(model="m1", contents="p")
+            pool.models.generate_content(model="m1", contents="p")
+
+        pacing_sleep.assert_not_called()
+        assert a.models.generate_content.call_count == b.models.generate_content.call_count == 1
+
+
+class TestStreaming:
+    def test_stream_rate_limit_on_first_chunk_fails_over(self):
+        a, b = make_client("a"), make_client("b")
+
+        def failing_stream():
+            raise Exception("429 per minute")
+            yield  # pragma: no cover
+
+        a.models.generate_content_stream.return_value = failing_stream()
+        b.models.generate_content_stream.return_value = iter([MagicMock(text="x"), MagicMock(text="y")])
+        pool = ClientPool([a, b], ("m1",))
+
+        chunks = [c.text for c in pool.models.generate_content_stream(model="m1", contents="p")]
+        assert chunks == ["x", "y"]
+
+    def test_empty_stream(self):
+        a = make_client("a")
+        a.models.generate_content_stream.return_value = iter([])
+        pool = ClientPool([a], ("m1",))
+        assert list(pool.models.generate_content_stream(model="m1", contents="p")) == []
+
+
+class TestCreateClientPool:
+    def test_reads_named_env_vars_and_skips_missing(self, monkeypatch):
+        monkeypatch.setenv("KEY_A", "a")
+        monkeypatch.delenv("KEY_B", raising=False)
+        with patch("src.client_pool.genai.Client") as mock_cls:
+            pool = create_client_pool(("KEY_A", "KEY_B"), ("m1",))
+        mock_cls.assert_called_once_with(api_key="a")
+        assert pool.key_count == 1
+
+    def test_raises_when_no_keys_set(self, monkeypatch):
+        monkeypatch.delenv("KEY_A", raising=False)
+        with pytest.raises(ValueError, match="KEY_A"):
+            create_client_pool(("KEY_A",), ("m1",))
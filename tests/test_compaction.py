@@ -0,0 +1,151 @@
+"""Tests for deterministic transcript compaction."""
+
+from __future__ import annotations
+
+import logging
+
+from src.compaction import (
+    Snippet,
+    anchor_interval,
+    compact_snippets,
+    estimate_tokens,
+    log_savings,
+    sample_segments,
+)
+from src.usage_ledger import usage_ledger
+
+
+def snippets(*items):
+    return [Snippet(start=start, text=text) for text, start in items]
+
+
+def texts(result):
+    return [s.text for s in result]
+
+
+class TestCompactSnippets:
+    def test_clean_captions_unchanged(self):
+        raw = snippets(("Hello world", 0.0), ("this is a test", 2.0))
+        assert compact_snippets(raw) == raw
+
+    def test_strips_non_speech_markers(self):
+        raw = snippets(("[Music]", 0.0), ("♪ la la ♪ welcome back", 1.0), (">> HOST: [Applause] thanks", 2.0))
+        assert texts(compact_snippets(raw)) == ["la la welcome back", "HOST: thanks"]
+
+    def test_only_known_parentheticals_removed(self):
+        raw = snippets(("(laughter) it works (mostly)", 0.0))
+        assert texts(compact_snippets(raw)) == ["it works (mostly)"]
+
+    def test_strips_filler_words(self):
+        raw = snippets(("Um, so uh the model, erm, scored 90%", 0.0))
+        assert texts(compact_snippets(raw)) == ["so the model, scored 90%"]
+
+    def test_fillers_kept_outside_english(self):
+        # "um" is Portuguese for "one"
+        raw = snippets(("um modelo novo", 0.0))
+        assert texts(compact_snippets(raw, "pt-BR")) == ["um modelo novo"]
+        assert texts(compact_snippets(raw, "en-US")) == ["modelo novo"]
+
+    def test_filler_inside_words_kept(self):
+        raw = snippets(("the umbrella hummed", 0.0))
+        assert texts(compact_snippets(raw)) == ["the umbrella hummed"]
+
+    def test_rolling_caption_overlap_removed(self):
+        raw = snippets(
+            ("we trained the model", 0.0),
+            ("trained the model on new data", 2.0),
+            ("on new data.", 4.0),
+            ("Results were strong", 6.0),
+        )
+        result = compact_snippets(raw)
+        assert texts(result) == ["we trained the model", "on new data", "Results were strong"]
+        assert [s.start for s in result] == [0.0, 2.0, 6.0]
+
+    def test_single_repeated_word_kept(self):
+        raw = snippets(("it was very", 0.0), ("very good", 2.0), ("I think that", 4.0), ("that works", 6.0))
+        assert texts(compact_snippets(raw)) == ["it was very", "very good", "I think that", "that works"]
+
+    def test_empty_and_none_text_skipped(self):
+        raw = snippets(("", 0.0), ("[Music]", 1.0), ("Real", 2.0))
+        raw.insert(0, Snippet(start=0.0, text=None))
+        assert texts(compact_snippets(raw)) == ["Real"]
+
+
+class TestSampleSegments:
+    """Tests for sample_segments() — the timestamp index builder."""
+
+    def test_empty_returns_empty_tuple(self):
+        assert sample_segments([]) == ()
+
+    def test_single_snippet(self):
+        raw = snippets(("Hello world", 0.0))
+        result = sample_segments(raw)
+        assert result == ((0, "Hello world"),)
+
+    def test_samples_every_30s_by_default(self):
+        # 3 snippets: 0s, 15s, 30s — only 0s and 30s should be sampled
+        raw = snippets(("First", 0.0), ("Middle", 15.0), ("Third", 30.0))
+        result = sample_segments(raw)
+        starts = [s for s, _ in result]
+        assert 0 in starts
+        assert 30 in starts
+        assert 15 not in starts
+
+    def test_custom_interval(self):
+        raw = snippets(("A", 0.0), ("B", 10.0), ("C", 20.0))
+        result = sample_segments(raw, interval_seconds=10)
+        starts = [s for s, _ in result]
+        assert 0 in starts
+        assert 10 in starts
+        assert 20 in starts
+
+    def test_returns_tuple_of_tuples(self):
+        raw = snippets(("Hi", 5.0))
+        result = sample_segments(raw)
+        assert isinstance(result, tuple)
+        assert isinstance(result[0], tuple)
+        assert result[0] == (5, "Hi")
+
+    def test_skips_empty_text(self):
+        raw = snippets(("", 0.0), ("   ", 1.0), ("Real text", 2.0))
+        result = sample_segments(raw)
+        # Only "Real text" has non-empty text and falls in the first window
+        assert len(result) == 1
+        assert result[0][1] == "Real text"
+
+    def test_start_seconds_are_integers(self):
+        raw = snippets(("Test", 12.7))
+        result = sample_segments(raw)
+        assert isinstance(result[0][0], int)
+        assert result[0][0] == 12
+
+
+class TestAnchorInterval:
+    def test_short_transcripts_use_30s(self):
+        assert anchor_interval(0) == 30
+        assert anchor_interval(3600) == 30
+
+    def test_long_transcripts_spread_out(self):
+        # 3h / 120 anchors = 90s
+        assert anchor_interval(3 * 3600) == 90
+
+    def test_rounded_up_to_multiple_of_30(self):
+        assert anchor_interval(3601) == 60
+
+
+class TestTokenAccounting:
+    def test_estimate_tokens(self):
+        assert estimate_tokens("a" * 400) == 100
+
+    def test_log_savings_reports_and_returns_saved(self, caplog):
+        with caplog.at_level(logging.INFO, logger="src.compaction"):
+            saved = log_savings("vid123", "x" * 400, "x" * 300)
+        assert saved == 25
+        assert "vid123" in caplog.text
+        assert "25%" in caplog.text
+        assert usage_ledger().compaction_savings() == (1, 25)
+
+    def test_log_savings_empty_original(self, caplog):
+        with caplog.at_level(logging.INFO, logger="src.compaction"):
+            assert log_savings("vid", "", "") == 0
+        assert caplog.text == ""
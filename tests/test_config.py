@@ -5,7 +5,7 @@ import yaml
 from pathlib import Path
 
 from src.config import (
-    Config, Category, YouTubeSource, PodcastShow, Settings,
+    Config, Category, YouTubeSource, PodcastShow, Settings, ModelRoute,
     ConfigError, load_config, _parse_config,
     _parse_podcast_shows,
 )
@@ -248,6 +248,61 @@ class TestParsePodcastShows:
         config = _parse_config(raw)
         assert config.podcast_shows[0].language == "es"
 
+    def test_priorities(self):
+        raw = {
+            "categories": [{"name": "AI", "priority": 10}, {"name": "News"}],
+            "sources": {
+                "youtube": [{"channel_url": "https://yt/a", "name": "A", "category": "AI", "priority": -2}],
+                "podcasts": [{"podcast_url": "https://pod/b", "name": "B", "category": "News", "priority": 3}],
+            },
+        }
+        config = _parse_config(raw)
+        assert [c.priority for c in config.categories] == [10, 0]
+        assert config.youtube_sources[0].priority == -2
+        assert config.podcast_shows[0].priority == 3
+
+    def test_priority_must_be_int(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": [{"channel_url": "https://yt/a", "name": "A", "category": "AI", "priority": "high"}]},
+        }
+        with pytest.raises(ConfigError, match="'priority' must be an int"):
+            _parse_config(raw)
+
+    def test_poll_minutes(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {
+                "youtube": [{"channel_url": "https://yt/a", "name": "A", "category": "AI", "poll_minutes": 240}],
+                "podcasts": [{"podcast_url": "https://pod/b", "name": "B", "category": "AI"}],
+            },
+            "settings": {"daemon_poll_minutes": 15},
+        }
+        config = _parse_config(raw)
+        assert config.youtube_sources[0].poll_minutes == 240
+        assert config.podcast_shows[0].poll_minutes is None
+        assert config.settings.daemon_poll_minutes == 15
+        assert Settings().daemon_poll_minutes == 30
+
+    def test_source_cadence_settings(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"learn_source_cadence": False, "cadence_max_skip_hours": 24},
+        }
+        settings = _parse_config(raw).settings
+        assert (settings.learn_source_cadence, settings.cadence_max_skip_hours) == (False, 24)
+        assert Settings().learn_source_cadence is True
+
+    @pytest.mark.parametrize("value", [0, "hourly", True])
+    def test_invalid_poll_minutes(self, value):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"podcasts": [{"podcast_url": "https://pod/b", "name": "B", "category": "AI", "poll_minutes": value}]},
+        }
+        with pytest.raises(ConfigError, match="'poll_minutes' must be a positive int"):
+            _parse_config(raw)
+
     def test_missing_podcast_url(self):
         raw = {
             "categories": [{"name": "AI"}],
@@ -337,6 +392,9 @@ class TestPodcastSettings:
         assert config.settings.max_episodes_per_show == 3
         assert config.settings.min_episodes_per_show == 1
         assert config.settings.max_audio_minutes == 60
+        assert config.settings.audio_cache_max_mb == 1024
+        assert config.settings.chunk_long_episodes is False
+        assert config.settings.podcast_chunk_minutes == 20
 
     def test_custom_podcast_settings(self):
         raw = {
@@ -346,9 +404,11 @@ class TestPodcastSettings:
                 "max_episodes_per_show": 5,
                 "min_episodes_per_show": 2,
                 "max_audio_minutes": 30,
+                "audio_cache_max_mb": 200,
             },
         }
         config = _parse_config(raw)
+        assert config.settings.audio_cache_max_mb == 200
         assert config.settings.max_episodes_per_show == 5
         assert config.settings.min_episodes_per_show == 2
         assert config.settings.max_audio_minutes == 30
@@ -372,6 +432,251 @@ class TestPodcastSettings:
             _parse_config(raw)
 
 
+class TestChunkingSettings:
+    def test_chunking_settings_parsed(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {
+                "chunk_long_episodes": True,
+                "podcast_chunk_minutes": 15,
+                "max_chunked_audio_minutes": 180,
+                "max_parallel_chunks": 4,
+            },
+        }
+        settings = _parse_config(raw).settings
+        assert settings.chunk_long_episodes is True
+        assert settings.podcast_chunk_minutes == 15
+        assert settings.max_chunked_audio_minutes == 180
+        assert settings.max_parallel_chunks == 4
+
+    def test_chunk_flag_must_be_bool(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"chunk_long_episodes": "yes"},
+        }
+        with pytest.raises(ConfigError, match="must be bool"):
+            _parse_config(raw)
+
+    def test_transcript_chunking_settings(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"chunk_long_transcripts": True, "transcript_chunk_tokens": 20000},
+        }
+        settings = _parse_config(raw).settings
+        assert settings.chunk_long_transcripts is True
+        assert settings.transcript_chunk_tokens == 20000
+
+    def test_transcript_chunking_defaults(self):
+        raw = {"categories": [{"name": "AI"}], "sources": {"youtube": []}}
+        settings = _parse_config(raw).settings
+        assert settings.chunk_long_transcripts is False
+        assert settings.transcript_chunk_tokens == 30000
+
+
+class TestPackingSettings:
+    def test_packing_settings(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"pack_short_videos": True, "max_videos_per_pack": 8},
+        }
+        settings = _parse_config(raw).settings
+        assert settings.pack_short_videos is True
+        assert settings.max_videos_per_pack == 8
+
+    def test_packing_defaults_off(self):
+        settings = _parse_config({"categories": [{"name": "AI"}], "sources": {"youtube": []}}).settings
+        assert settings.pack_short_videos is False
+        assert settings.max_videos_per_pack == 5
+
+
+class TestStreamingSettings:
+    def test_streaming_settings(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"stream_summaries": True, "max_generation_seconds": 120},
+        }
+        settings = _parse_config(raw).settings
+        assert settings.stream_summaries is True
+        assert settings.max_generation_seconds == 120
+
+    def test_streaming_defaults_off(self):
+        settings = _parse_config({"categories": [{"name": "AI"}], "sources": {"youtube": []}}).settings
+        assert settings.stream_summaries is False
+        assert settings.max_generation_seconds == 300
+
+    def test_cache_prompt_prefix(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"cache_prompt_prefix": True},
+        }
+        assert _parse_config(raw).settings.cache_prompt_prefix is True
+
+    def test_request_timeout_and_hedging(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"request_timeout_seconds": 120, "hedge_requests": True},
+        }
+        settings = _parse_config(raw).settings
+        assert settings.request_timeout_seconds == 120
+        assert settings.hedge_requests is True
+
+    def test_request_timeout_defaults(self):
+        settings = _parse_config({"categories": [{"name": "AI"}], "sources": {"youtube": []}}).settings
+        assert settings.request_timeout_seconds == 600
+        assert settings.hedge_requests is False
+
+    def test_circuit_breaker_settings(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"breaker_failure_threshold": 3, "breaker_cooldown_seconds": 60},
+        }
+        settings = _parse_config(raw).settings
+        assert settings.breaker_failure_threshold == 3
+        assert settings.breaker_cooldown_seconds == 60
+
+    def test_circuit_breaker_threshold_must_be_positive(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"breaker_failure_threshold": 0},
+        }
+        with pytest.raises(ConfigError, match="breaker_failure_threshold"):
+            _parse_config(raw)
+
+    def test_max_input_tokens(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"max_input_tokens": 200000},
+        }
+        assert _parse_config(raw).settings.max_input_tokens == 200000
+        assert Settings().max_input_tokens == 1_000_000
+
+    def test_daily_request_budget(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"daily_request_budget": 40},
+        }
+        assert _parse_config(raw).settings.daily_request_budget == 40
+        assert Settings().daily_request_budget == 250
+
+    def test_run_deadline(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"run_deadline": "07:00", "deadline_reserve_minutes": 15},
+        }
+        settings = _parse_config(raw).settings
+        assert settings.run_deadline == "07:00"
+        assert settings.deadline_reserve_minutes == 15
+        assert Settings().run_deadline is None
+
+    def test_backfill_parallel_items(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"backfill_parallel_items": 5},
+        }
+        assert _parse_config(raw).settings.backfill_parallel_items == 5
+        assert Settings().backfill_parallel_items == 3
+
+    @pytest.mark.parametrize("value", ["7am", "25:00", "07:60", 700])
+    def test_invalid_run_deadline(self, value):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"run_deadline": value},
+        }
+        with pytest.raises(ConfigError, match="run_deadline"):
+            _parse_config(raw)
+
+
+class TestClientPoolSettings:
+    def test_pool_settings_parsed_as_tuples(self):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {
+                "gemini_api_key_envs": ["GEMINI_API_KEY", "GEMINI_API_KEY_2"],
+                "fallback_models": ["gemini-2.5-flash-lite"],
+            },
+        }
+        settings = _parse_config(raw).settings
+        assert settings.gemini_api_key_envs == ("GEMINI_API_KEY", "GEMINI_API_KEY_2")
+        assert settings.fallback_models == ("gemini-2.5-flash-lite",)
+
+    def test_pool_defaults_empty(self):
+        settings = _parse_config({"categories": [{"name": "AI"}], "sources": {"youtube": []}}).settings
+        assert settings.gemini_api_key_envs == ()
+        assert settings.fallback_models == ()
+
+    @pytest.mark.parametrize("value", ["GEMINI_API_KEY", [""], [1]])
+    def test_invalid_key_env_list(self, value):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"gemini_api_key_envs": value},
+        }
+        with pytest.raises(ConfigError, match="list of non-empty strings"):
+            _parse_config(raw)
+
+
+class TestModelRouteSettings:
+    def _settings(self, routes):
+        raw = {
+            "categories": [{"name": "AI"}],
+            "sources": {"youtube": []},
+            "settings": {"model_routes": routes},
+        }
+        return _parse_config(raw).settings
+
+    def test_routes_parsed_in_order(self):
+        settings = self._settings([
+            {"name": "short", "max_minutes": 15, "model": "gemini-2.5-flash-lite",
+             "max_output_tokens": 1024, "thinking_budget": 0},
+            {"max_output_tokens": 4096},
+        ])
+        assert settings.model_routes == (
+            ModelRoute(name="short", max_minutes=15, model="gemini-2.5-flash-lite",
+                       max_output_tokens=1024, thinking_budget=0),
+            ModelRoute(name="route-2", max_output_tokens=4096),
+        )
+
+    def test_routes_default_empty(self):
+        settings = _parse_config({"categories": [{"name": "AI"}], "sources": {"youtube": []}}).settings
+        assert settings.model_routes == ()
+
+    @pytest.mark.parametrize("routes, message", [
+        ("short", "must be a list"),
+        (["short"], "must be a mapping"),
+        ([{"max_minutes": 0}], "'max_minutes' must be a positive int"),
+        ([{"max_output_tokens": "lots"}], "'max_output_tokens' must be a positive int"),
+        ([{"thinking_budget": -2}], "'thinking_budget' must be an int >= -1"),
+        ([{"model": ""}], "'model' must be a non-empty string"),
+    ])
+    def test_invalid_routes(self, routes, message):
+        with pytest.raises(ConfigError, match=message):
+            self._settings(routes)
+
+    def test_route_matches_bounds(self):
+        route = ModelRoute(name="short", max_minutes=15, max_input_tokens=5000)
+        assert route.matches(600, 4000)
+        assert not route.matches(1200, 4000)
+        assert not route.matches(600, 6000)
+        # Unknown duration never lands in a duration-bounded bucket
+        assert not route.matches(0, 100)
+        assert ModelRoute(name="any").matches(0, 10 ** 6)
+
+
 class TestConfigProperties:
     def test_category_names(self, valid_raw_config):
         config = _parse_config(valid_raw_config)
@@ -17,6 +17,7 @@ from src.generator import (
     generate_daily_digest,
     generate_podcast_daily_digest,
     generate_error_report,
+    write_streaming_summary,
     _format_duration,
     _relative_path,
 )
@@ -145,6 +146,17 @@ class TestGenerateSummaryFiles:
 
         assert (tmp_path / "summaries" / "2026-02-16").is_dir()
 
+    def test_streaming_writes_same_file_final_overwrites(self, tmp_path, sample_video, sample_summary):
+        partial_path = write_streaming_summary(sample_video, "## The Hook\nPart", tmp_path, "2026-02-16")
+        assert "## The Hook\nPart" in partial_path.read_text()
+        assert "Understanding Neural Networks" in partial_path.read_text()
+
+        result = generate_summary_files(
+            video=sample_video, summary=sample_summary, output_dir=tmp_path, date_str="2026-02-16",
+        )
+        assert result["summary_path"] == partial_path
+        assert "Key Findings" in partial_path.read_text()
+
 
 class TestGenerateDailyDigest:
     def test_empty_entries(self, tmp_path, categories):
@@ -308,6 +320,28 @@ class TestGenerateErrorReport:
         assert "No captions available" in content
         assert "Rate limit exceeded" in content
 
+    def test_usage_section(self, tmp_path):
+        errors = [{"source": "Gemini API", "message": "Rate limit exceeded"}]
+        usage = ["- **gemini-2.5-flash**: 3 request(s), 12,000 input / 900 output tokens"]
+
+        path = generate_error_report(errors, [], tmp_path, "2026-02-16", usage=usage)
+
+        content = path.read_text()
+        assert "## Gemini Usage" in content
+        assert usage[0] in content
+
+    def test_usage_alone_writes_no_report(self, tmp_path):
+        assert generate_error_report([], [], tmp_path, "2026-02-16", usage=["- x"]) is None
+
+    def test_broken_sources_reported_on_their_own(self, tmp_path):
+        broken = ["- **Podcast/Gone Show**: failing since 2026-02-10 (3 failed fetch(es))"]
+
+        path = generate_error_report([], [], tmp_path, "2026-02-16", broken_sources=broken)
+
+        content = path.read_text()
+        assert "## Known-Broken Sources (1)" in content
+        assert broken[0] in content
+
     def test_with_skipped_items(self, tmp_path):
         skipped = [{
             "type": "youtube",
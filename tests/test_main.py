@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
-from src.config import Config, Category, YouTubeSource, PodcastShow, Settings
-from src.fetchers.youtube import VideoInfo, IpBlockedError
+from src.config import Config, Category, YouTubeSource, PodcastShow, Settings, ModelRoute
+from src.fetchers.youtube import ChannelFetchError, VideoInfo, IpBlockedError
 from src.fetchers.podcast import EpisodeInfo, RSSLookupError, TranscriptionError
-from src.main import run, _save_and_generate
+from src.circuit_breaker import CircuitOpenError, circuit_breaker, configure_circuit_breaker
+from src.main import run, run_daemon, _save_and_generate, _episode_from_pending, _episode_pending_info, _record_quota_usage
+from src.scheduler import RunDeadline
+from src.state import get_quota_usage, mark_youtube_processed, quota_day
 from src.summarizer import QuotaExhaustedError
+from src.usage_ledger import record_call, usage_ledger
 
 
 # ---------------------------------------------------------------------------
@@ -77,12 +84,13 @@ def _mock_config_file(tmp_path: Path, config_dict: dict) -> Path:
 # ---------------------------------------------------------------------------
 
 class TestDryRun:
-    def test_dry_run_no_files_generated(self, tmp_path, config):
+    def test_dry_run_no_files_generated(self, tmp_path, config, sample_video, sample_episode):
         state_path = tmp_path / "state.json"
+        listed = dataclasses.replace(sample_video, transcript=None)
 
         with patch("src.main.load_config", return_value=config):
-            with patch("src.main.fetch_new_videos", return_value=[MagicMock(title="v1")]):
-                with patch("src.main.fetch_new_episodes", return_value=[MagicMock(title="e1")]):
+            with patch("src.main.fetch_new_videos", return_value=[listed]):
+                with patch("src.main.fetch_new_episodes", return_value=[sample_episode]):
                     run(
                         config_path=tmp_path / "config.yaml",
                         output_dir=tmp_path / "output",
@@ -94,6 +102,49 @@ class TestDryRun:
         assert not (tmp_path / "output").exists()
         assert not state_path.exists()
 
+    def test_dry_run_lists_metadata_only_in_run_order(self, tmp_path, config, sample_video, sample_episode, capsys):
+        config = dataclasses.replace(config, podcast_shows=[
+            dataclasses.replace(config.podcast_shows[0], priority=5),
+        ])
+        listed = dataclasses.replace(sample_video, transcript=None)
+
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.fetch_new_videos", return_value=[listed]) as mock_fetch:
+                with patch("src.main.fetch_new_episodes", return_value=[sample_episode]):
+                    with patch("src.main._get_transcript") as mock_transcript:
+                        with patch("src.main.download_and_transcribe") as mock_download:
+                            run(
+                                config_path=tmp_path / "config.yaml",
+                                output_dir=tmp_path / "output",
+                                state_path=tmp_path / "state.json",
+                                dry_run=True,
+                            )
+
+        assert mock_fetch.call_args.kwargs["fetch_transcripts"] is False
+        mock_transcript.assert_not_called()
+        mock_download.assert_not_called()
+        out = capsys.readouterr().out
+        assert "2 item(s) would be processed" in out
+        assert out.index("Test Episode") < out.index("Test Video")
+        assert "10 min" in out and "60 min" in out
+
+    def test_dry_run_shows_items_over_budget(self, tmp_path, config, sample_video, sample_episode, capsys):
+        config = dataclasses.replace(config, settings=dataclasses.replace(config.settings, daily_request_budget=1))
+
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.fetch_new_videos", return_value=[dataclasses.replace(sample_video, transcript=None)]):
+                with patch("src.main.fetch_new_episodes", return_value=[sample_episode]):
+                    run(
+                        config_path=tmp_path / "config.yaml",
+                        output_dir=tmp_path / "output",
+                        state_path=tmp_path / "state.json",
+                        dry_run=True,
+                    )
+
+        out = capsys.readouterr().out
+        assert "1 item(s) would be processed" in out
+        assert "1 more item(s) over today's Gemini request budget" in out
+
 
 # ---------------------------------------------------------------------------
 # Tests: YouTube pipeline
@@ -160,8 +211,8 @@ class TestYouTubePipeline:
 
         mock_summarize.assert_not_called()
 
-    def test_no_transcript_video_marked_in_state(self, tmp_path, config):
-        """Videos with no transcript must be written to state so they are not retried on future runs."""
+    def test_no_transcript_video_queued_for_captions(self, tmp_path, config):
+        """A fresh video without captions is queued to be checked again, not marked processed."""
         state_path = tmp_path / "state.json"
         no_transcript_video = VideoInfo(
             video_id="no-captions-vid", title="Captions Disabled",
@@ -188,13 +239,12 @@ class TestYouTubePipeline:
                                                         state_path=state_path,
                                                     )
 
-        # State file must contain the video ID so the next run skips it.
         from src.state import load_state, get_processed_ids
         state = load_state(state_path)
-        processed = get_processed_ids(state)
-        assert "no-captions-vid" in processed, (
-            "Video with no transcript must be marked in state to prevent re-processing on future runs"
-        )
+        assert "no-captions-vid" not in get_processed_ids(state)
+        entry = state["pending"]["youtube"]["no-captions-vid"]
+        assert entry["reason"] == "Awaiting captions"
+        assert entry["next_attempt"] > datetime.now(timezone.utc).isoformat()
 
     def test_youtube_fetch_error_logged_and_continues(self, tmp_path, config):
         with patch("src.main.load_config", return_value=config):
@@ -306,6 +356,991 @@ class TestYouTubePipeline:
 # Tests: Podcast pipeline
 # ---------------------------------------------------------------------------
 
+class TestClientPoolSelection:
+    def _run(self, tmp_path, config):
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client") as mock_create:
+                with patch("src.main.create_client_pool", return_value=MagicMock(key_count=2)) as mock_pool:
+                    with patch("src.main.fetch_new_videos", return_value=[]):
+                        with patch("src.main.fetch_new_episodes", return_value=[]):
+                            with patch("src.main._save_and_generate"):
+                                run(
+                                    config_path=tmp_path / "config.yaml",
+                                    output_dir=tmp_path / "output",
+                                    state_path=tmp_path / "state.json",
+                                )
+        return mock_create, mock_pool
+
+    def test_single_client_by_default(self, tmp_path, config):
+        mock_create, mock_pool = self._run(tmp_path, config)
+        mock_create.assert_called_once()
+        mock_pool.assert_not_called()
+
+    def test_pool_built_from_settings(self, tmp_path, config):
+        pooled = dataclasses.replace(
+            config,
+            settings=dataclasses.replace(
+                config.settings,
+                gemini_api_key_envs=("K1", "K2"),
+                fallback_models=("gemini-2.5-flash-lite",),
+            ),
+        )
+        mock_create, mock_pool = self._run(tmp_path, pooled)
+        mock_create.assert_not_called()
+        mock_pool.assert_called_once_with(("K1", "K2"), ("gemini-2.5-flash", "gemini-2.5-flash-lite"))
+
+
+class TestShortVideoPacking:
+    @pytest.fixture
+    def packing_config(self, config):
+        return dataclasses.replace(
+            config, settings=dataclasses.replace(config.settings, pack_short_videos=True),
+        )
+
+    def _shorts(self, count):
+        # Same upload time: the plan keeps equally recent items in fetch order
+        uploaded = datetime.now(timezone.utc)
+        return [
+            VideoInfo(
+                video_id=f"short{i}", title=f"Short {i}",
+                url=f"https://youtube.com/watch?v=short{i}",
+                channel_name="Test Channel", category="AI",
+                upload_date=uploaded, duration_seconds=120,
+                transcript=f"short transcript {i}",
+            )
+            for i in range(count)
+        ]
+
+    def _run(self, tmp_path, config, videos, packed, single=None):
+        mock_paths = {"summary_path": tmp_path / "output/summaries/x/test.md", "slug": "test"}
+        single = single or {"return_value": "## Single"}
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=videos):
+                    with patch("src.main.fetch_new_episodes", return_value=[]):
+                        with patch("src.main.summarize_packed", **packed) as mock_packed:
+                            with patch("src.main.summarize", **single) as mock_sum:
+                                with patch("src.main.generate_summary_files", return_value=mock_paths) as mock_gen:
+                                    with patch("src.main._save_and_generate") as mock_save:
+                                        run(
+                                            config_path=tmp_path / "config.yaml",
+                                            output_dir=tmp_path / "output",
+                                            state_path=tmp_path / "state.json",
+                                        )
+        self.saved = mock_save
+        return mock_packed, mock_sum, mock_gen
+
+    def test_short_videos_share_one_request(self, tmp_path, packing_config, sample_video):
+        shorts = self._shorts(2)
+        mock_packed, mock_sum, mock_gen = self._run(
+            tmp_path, packing_config, shorts + [sample_video],
+            {"return_value": ["## Packed 0", None]},
+        )
+
+        mock_packed.assert_called_once()
+        items = mock_packed.call_args[0][2]
+        assert [item.title for item in items] == ["Short 0", "Short 1"]
+        # Long video and the item missing from the packed response go singly
+        assert [c.kwargs["title"] for c in mock_sum.call_args_list] == ["Test Video", "Short 1"]
+        written = {c.kwargs["video"].video_id: c.kwargs["summary"] for c in mock_gen.call_args_list}
+        assert written == {"vid1": "## Single", "short0": "## Packed 0", "short1": "## Single"}
+
+    def test_packed_failure_falls_back_to_single_requests(self, tmp_path, packing_config):
+        mock_packed, mock_sum, mock_gen = self._run(
+            tmp_path, packing_config, self._shorts(2), {"side_effect": Exception("bad response")},
+        )
+        assert mock_sum.call_count == 2
+        assert mock_gen.call_count == 2
+
+    def test_quota_mid_pack_writes_packed_summaries_and_defers_the_rest(self, tmp_path, packing_config):
+        _, _, mock_gen = self._run(
+            tmp_path, packing_config, self._shorts(3),
+            {"return_value": [None, "## Packed 1", "## Packed 2"]},
+            {"side_effect": QuotaExhaustedError("daily quota")},
+        )
+
+        assert sorted(c.kwargs["video"].video_id for c in mock_gen.call_args_list) == ["short1", "short2"]
+        skipped = self.saved.call_args[0][6]
+        assert [(s["title"], s["reason"]) for s in skipped] == [("Short 0", "Gemini daily quota exhausted")]
+
+    def test_quota_on_pack_request_defers_each_short_once(self, tmp_path, packing_config):
+        _, _, mock_gen = self._run(
+            tmp_path, packing_config, self._shorts(2), {"side_effect": QuotaExhaustedError("daily quota")},
+        )
+
+        mock_gen.assert_not_called()
+        skipped = self.saved.call_args[0][6]
+        assert [s["title"] for s in skipped] == ["Short 0", "Short 1"]
+
+    def test_single_short_video_not_packed(self, tmp_path, packing_config):
+        mock_packed, mock_sum, _ = self._run(
+            tmp_path, packing_config, self._shorts(1), {"return_value": []},
+        )
+        mock_packed.assert_not_called()
+        mock_sum.assert_called_once()
+
+    def test_packing_disabled_by_default(self, tmp_path, config):
+        mock_packed, mock_sum, _ = self._run(
+            tmp_path, config, self._shorts(2), {"return_value": []},
+        )
+        mock_packed.assert_not_called()
+        assert mock_sum.call_count == 2
+
+
+class TestStreamingSummaries:
+    def _run(self, tmp_path, config, video, summarize_side_effect):
+        mock_paths = {"summary_path": tmp_path / "output/summaries/x/test.md", "slug": "test"}
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=[video]):
+                    with patch("src.main.fetch_new_episodes", return_value=[]):
+                        with patch("src.main.summarize", side_effect=summarize_side_effect):
+                            with patch("src.main.write_streaming_summary") as mock_partial:
+                                with patch("src.main.generate_summary_files", return_value=mock_paths) as mock_gen:
+                                    with patch("src.main._save_and_generate"):
+                                        run(
+                                            config_path=tmp_path / "config.yaml",
+                                            output_dir=tmp_path / "output",
+                                            state_path=tmp_path / "state.json",
+                                        )
+        return mock_partial, mock_gen
+
+    @pytest.fixture
+    def streaming_config(self, config):
+        return dataclasses.replace(
+            config, settings=dataclasses.replace(config.settings, stream_summaries=True),
+        )
+
+    def test_partial_text_written_while_streaming(self, tmp_path, streaming_config, sample_video):
+        def fake_summarize(**kwargs):
+            stream = kwargs["stream"]
+            stream.on_text("## The Hook")
+            stream.stats.ttft_seconds, stream.stats.total_seconds = 0.5, 2.0
+            return "## The Hook\nDone"
+
+        mock_partial, mock_gen = self._run(tmp_path, streaming_config, sample_video, fake_summarize)
+
+        mock_partial.assert_called_once()
+        assert mock_partial.call_args[0][:3] == (sample_video, "## The Hook", tmp_path / "output")
+        assert mock_gen.call_args.kwargs["summary"] == "## The Hook\nDone"
+
+    def test_truncated_summary_kept_with_note(self, tmp_path, streaming_config, sample_video):
+        def fake_summarize(**kwargs):
+            stats = kwargs["stream"].stats
+            stats.ttft_seconds, stats.truncated = 0.5, True
+            return "## The Hook\nPartial"
+
+        _, mock_gen = self._run(tmp_path, streaming_config, sample_video, fake_summarize)
+
+        summary = mock_gen.call_args.kwargs["summary"]
+        assert summary.startswith("## The Hook\nPartial")
+        assert "time limit" in summary
+
+    def test_streaming_off_by_default(self, tmp_path, config, sample_video):
+        def fake_summarize(**kwargs):
+            assert kwargs["stream"] is None
+            return "## Summary"
+
+        mock_partial, mock_gen = self._run(tmp_path, config, sample_video, fake_summarize)
+        mock_partial.assert_not_called()
+        mock_gen.assert_called_once()
+
+
+class TestModelRoutes:
+    def test_routes_passed_to_summarize_and_download(self, tmp_path, config, sample_video, sample_episode):
+        routes = (ModelRoute(name="short", max_minutes=15, max_output_tokens=1024),)
+        routed_config = dataclasses.replace(
+            config, settings=dataclasses.replace(config.settings, model_routes=routes),
+        )
+        mock_paths = {"summary_path": tmp_path / "output/summaries/x/test.md", "slug": "test"}
+        with patch("src.main.load_config", return_value=routed_config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=[sample_video]):
+                    with patch("src.main.fetch_new_episodes", return_value=[sample_episode]):
+                        with patch("src.main.summarize", return_value="## Summary") as mock_summarize:
+                            with patch("src.main.download_and_transcribe", return_value="## Summary") as mock_dl:
+                                with patch("src.main.generate_summary_files", return_value=mock_paths):
+                                    with patch("src.main.generate_podcast_summary_files", return_value=mock_paths):
+                                        with patch("src.main._save_and_generate"):
+                                            run(
+                                                config_path=tmp_path / "config.yaml",
+                                                output_dir=tmp_path / "output",
+                                                state_path=tmp_path / "state.json",
+                                            )
+
+        assert mock_summarize.call_args.kwargs["routes"] == routes
+        assert mock_dl.call_args.kwargs["routes"] == routes
+
+
+class TestCircuitBreakerDeferral:
+    def _run(self, tmp_path, config, videos=(), episodes=(), summarize=None, transcribe=None, **patches):
+        mock_paths = {"summary_path": tmp_path / "output/summaries/x/test.md", "slug": "test"}
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=list(videos)):
+                    with patch("src.main.fetch_new_episodes", return_value=list(episodes)):
+                        with patch("src.main.summarize", side_effect=summarize, return_value="## Summary"):
+                            with patch("src.main.download_and_transcribe", side_effect=transcribe, return_value="## Summary"):
+                                with patch("src.main.generate_summary_files", return_value=mock_paths):
+                                    with patch("src.main.generate_podcast_summary_files", return_value=mock_paths):
+                                        with patch("src.main._get_transcript", return_value=("recovered transcript", ())) as mock_transcript:
+                                            with patch("src.main._save_and_generate") as mock_save:
+                                                run(
+                                                    config_path=tmp_path / "config.yaml",
+                                                    output_dir=tmp_path / "output",
+                                                    state_path=tmp_path / "state.json",
+                                                )
+        return mock_save.call_args[0][0], mock_save.call_args[0][6], mock_transcript
+
+    def test_video_deferred_to_pending_when_breaker_open(self, tmp_path, config, sample_video):
+        state, skipped, _ = self._run(
+            tmp_path, config, videos=[sample_video],
+            summarize=CircuitOpenError("Gemini circuit breaker is open"),
+        )
+
+        pending = state["pending"]["youtube"]["vid1"]
+        assert pending["title"] == "Test Video"
+        assert pending["channel"] == "Test Channel"
+        assert "vid1" not in state.get("youtube", {})
+        assert skipped[0]["action"] == "Deferred — retried first on the next run."
+
+    def test_episode_deferred_to_pending_when_breaker_open(self, tmp_path, config, sample_episode):
+        state, _, _ = self._run(
+            tmp_path, config, episodes=[sample_episode],
+            transcribe=CircuitOpenError("Gemini circuit breaker is open"),
+        )
+
+        info = state["pending"]["podcasts"]["ep_abc"]
+        assert _episode_from_pending("ep_abc", info) == sample_episode
+
+    def test_pending_items_retried_first(self, tmp_path, config, sample_video, sample_episode):
+        state = {"pending": {
+            "youtube": {"vid1": {"date": datetime.now().strftime("%Y-%m-%d"), "reason": "503",
+                                 "title": "Test Video", "channel": "Test Channel", "category": "AI",
+                                 "url": "https://youtube.com/watch?v=vid1", "duration_seconds": 600,
+                                 "upload_date": "2026-02-19T08:00:00+00:00", "language": "en"}},
+            "podcasts": {"ep_abc": {**_episode_pending_info(sample_episode),
+                                    "date": datetime.now().strftime("%Y-%m-%d"), "reason": "503"}},
+        }}
+        (tmp_path / "state.json").write_text(json.dumps(state))
+
+        state, _, mock_transcript = self._run(tmp_path, config)
+
+        mock_transcript.assert_called_once_with("vid1", "en")
+        assert "vid1" in state["youtube"]
+        assert "ep_abc" in state["podcasts"]
+        assert state["pending"] == {"youtube": {}, "podcasts": {}}
+
+    def test_tripped_breaker_carried_into_next_run(self, tmp_path, config):
+        (tmp_path / "state.json").write_text(json.dumps({"gemini_breaker": {"tripped_at": "2026-02-19T08:00:00+00:00"}}))
+        with patch("src.main.configure_circuit_breaker") as mock_configure:
+            self._run(tmp_path, config)
+
+        mock_configure.assert_called_once_with(5, 120, half_open=True)
+
+    def test_open_breaker_recorded_in_saved_state(self, tmp_path, config):
+        configure_circuit_breaker(failure_threshold=1)
+        circuit_breaker().record_failure(Exception("503 UNAVAILABLE"))
+        state = {}
+        with patch("src.main.save_state") as mock_save_state:
+            with patch("src.main.generate_daily_digest"):
+                with patch("src.main.generate_podcast_daily_digest"):
+                    with patch("src.main.generate_error_report"):
+                        with patch("src.main.generate_viewer"):
+                            with patch("src.main.cleanup_old_content", return_value=[]):
+                                with patch("src.main.cleanup_state"):
+                                    _save_and_generate(
+                                        state, tmp_path / "state.json", {}, [], [], [], [],
+                                        tmp_path / "output", "2026-02-20", config,
+                                    )
+
+        mock_save_state.assert_called_once()
+        assert state["gemini_breaker"]["tripped_at"] == circuit_breaker().tripped_at
+
+
+class TestPendingQueue:
+    def _run(self, tmp_path, config, videos=(), summarize=None, transcript=("recovered transcript", ()), retry_pending=False):
+        mock_paths = {"summary_path": tmp_path / "output/summaries/x/test.md", "slug": "test"}
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=list(videos)) as mock_fetch:
+                    with patch("src.main.fetch_new_episodes", return_value=[]) as mock_episodes:
+                        with patch("src.main.summarize", side_effect=summarize, return_value="## Summary"):
+                            with patch("src.main.generate_summary_files", return_value=mock_paths):
+                                with patch("src.main._get_transcript", return_value=transcript) as mock_transcript:
+                                    with patch("src.main._save_and_generate") as mock_save:
+                                        run(
+                                            config_path=tmp_path / "config.yaml",
+                                            output_dir=tmp_path / "output",
+                                            state_path=tmp_path / "state.json",
+                                            retry_pending=retry_pending,
+                                        )
+        assert mock_fetch.called == mock_episodes.called
+        return mock_save.call_args[0][0], mock_fetch, mock_transcript
+
+    def _write_pending(self, tmp_path, **entry):
+        info = {"date": datetime.now().strftime("%Y-%m-%d"), "reason": "Awaiting captions",
+                "title": "Test Video", "channel": "Test Channel", "category": "AI",
+                "url": "https://youtube.com/watch?v=vid1", "duration_seconds": 600,
+                "upload_date": "2026-02-19T08:00:00+00:00", "language": "en", "attempts": 1, **entry}
+        (tmp_path / "state.json").write_text(json.dumps({"pending": {"youtube": {"vid1": info}}}))
+
+    def test_retry_run_works_only_the_queue(self, tmp_path, config, sample_video):
+        self._write_pending(tmp_path)
+
+        state, mock_fetch, mock_transcript = self._run(tmp_path, config, videos=[sample_video], retry_pending=True)
+
+        mock_fetch.assert_not_called()
+        mock_transcript.assert_called_once_with("vid1", "en")
+        assert "vid1" in state["youtube"]
+        assert state["pending"]["youtube"] == {}
+
+    def test_item_not_due_is_left_queued(self, tmp_path, config):
+        later = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        self._write_pending(tmp_path, next_attempt=later)
+
+        state, _, mock_transcript = self._run(tmp_path, config, retry_pending=True)
+
+        mock_transcript.assert_not_called()
+        assert state["pending"]["youtube"]["vid1"]["next_attempt"] == later
+
+    def test_full_run_does_not_refetch_queued_video(self, tmp_path, config):
+        later = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        self._write_pending(tmp_path, next_attempt=later)
+
+        _, mock_fetch, _ = self._run(tmp_path, config)
+
+        assert "vid1" in mock_fetch.call_args.kwargs["processed_ids"]
+
+    def test_captions_still_missing_backs_off(self, tmp_path, config):
+        self._write_pending(tmp_path)
+
+        state, _, _ = self._run(tmp_path, config, transcript=(None, ()), retry_pending=True)
+
+        entry = state["pending"]["youtube"]["vid1"]
+        assert entry["attempts"] == 2
+        due_in = datetime.fromisoformat(entry["next_attempt"]) - datetime.now(timezone.utc)
+        assert timedelta(minutes=110) < due_in <= timedelta(hours=2)
+
+    def test_captions_given_up_after_max_checks(self, tmp_path, config):
+        self._write_pending(tmp_path, attempts=3)
+
+        state, _, _ = self._run(tmp_path, config, transcript=(None, ()), retry_pending=True)
+
+        assert "vid1" in state["youtube"]
+        assert state["pending"]["youtube"] == {}
+
+    def test_failed_summary_queued_with_backoff(self, tmp_path, config, sample_video):
+        with patch("src.main.sys.exit"):
+            state, _, _ = self._run(tmp_path, config, videos=[sample_video], summarize=Exception("500 internal"))
+
+        entry = state["pending"]["youtube"]["vid1"]
+        assert entry["reason"] == "Gemini summarization error: 500 internal"
+        assert "vid1" not in state.get("youtube", {})
+        due_in = datetime.fromisoformat(entry["next_attempt"]) - datetime.now(timezone.utc)
+        assert timedelta(minutes=25) < due_in <= timedelta(minutes=30)
+
+
+class TestTargetedRuns:
+    def _run(self, tmp_path, config, videos=(), episodes=(), **kwargs):
+        mock_paths = {"summary_path": tmp_path / "output/summaries/x/test.md", "slug": "test"}
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=list(videos)) as mock_fetch:
+                    with patch("src.main.fetch_new_episodes", return_value=list(episodes)) as mock_episodes:
+                        with patch("src.main.summarize", return_value="## Summary"):
+                            with patch("src.main.download_and_transcribe", return_value="## Summary"):
+                                with patch("src.main.generate_summary_files", return_value=mock_paths):
+                                    with patch("src.main.generate_podcast_summary_files", return_value=mock_paths):
+                                        with patch("src.main._save_and_generate") as mock_save:
+                                            run(
+                                                config_path=tmp_path / "config.yaml",
+                                                output_dir=tmp_path / "output",
+                                                state_path=tmp_path / "state.json",
+                                                **kwargs,
+                                            )
+        return mock_save.call_args[0][0], mock_fetch, mock_episodes
+
+    def test_source_filter_fetches_only_that_source(self, tmp_path, config, sample_video):
+        config = dataclasses.replace(config, youtube_sources=config.youtube_sources + [
+            YouTubeSource(channel_url="https://youtube.com/@other", name="Other", category="AI"),
+        ])
+
+        state, mock_fetch, mock_episodes = self._run(tmp_path, config, videos=[sample_video], source_name="test channel")
+
+        assert [c.kwargs["source"].name for c in mock_fetch.call_args_list] == ["Test Channel"]
+        mock_episodes.assert_not_called()
+        assert "vid1" in state["youtube"]
+
+    def test_source_filter_keeps_only_its_pending_items(self, tmp_path, config):
+        today = datetime.now().strftime("%Y-%m-%d")
+        (tmp_path / "state.json").write_text(json.dumps({"pending": {"youtube": {
+            "mine": {"date": today, "reason": "503", "title": "Mine", "channel": "Test Channel"},
+            "theirs": {"date": today, "reason": "503", "title": "Theirs", "channel": "Other"},
+        }}}))
+
+        with patch("src.main._get_transcript", return_value=("text", ())) as mock_transcript:
+            state, _, _ = self._run(tmp_path, config, source_name="Test Channel")
+
+        mock_transcript.assert_called_once_with("mine", "en")
+        assert list(state["pending"]["youtube"]) == ["theirs"]
+
+    def test_unknown_source_exits(self, tmp_path, config):
+        with pytest.raises(SystemExit):
+            self._run(tmp_path, config, source_name="Nope")
+
+    def test_video_id_reprocessed_without_scanning(self, tmp_path, config, sample_video):
+        (tmp_path / "state.json").write_text(json.dumps({"youtube": {"vid1": "2026-02-01"}}))
+
+        with patch("src.main.fetch_video", return_value=sample_video) as mock_fetch_video:
+            state, mock_fetch, mock_episodes = self._run(tmp_path, config, video_ids=("vid1",))
+
+        mock_fetch_video.assert_called_once_with("vid1", config.youtube_sources, fetch_transcript=True)
+        mock_fetch.assert_not_called()
+        mock_episodes.assert_not_called()
+        assert state["youtube"]["vid1"]["date"] == datetime.now().strftime("%Y-%m-%d")
+
+    def test_episode_id_found_in_feed(self, tmp_path, config, sample_episode):
+        with patch("src.main.find_episode", return_value=sample_episode) as mock_find:
+            state, mock_fetch, _ = self._run(tmp_path, config, episode_ids=("ep_abc",))
+
+        assert mock_find.call_args[0][:2] == (config.podcast_shows[0], "ep_abc")
+        mock_fetch.assert_not_called()
+        assert "ep_abc" in state["podcasts"]
+
+    def test_unknown_episode_reported_as_error(self, tmp_path, config):
+        with patch("src.main.find_episode", return_value=None):
+            with patch("src.main.sys.exit") as mock_exit:
+                self._run(tmp_path, config, episode_ids=("missing",))
+
+        mock_exit.assert_called_once_with(1)
+
+
+class TestSourceCadence:
+    def _run(self, tmp_path, config, cadence, videos=(), **kwargs):
+        (tmp_path / "state.json").write_text(json.dumps({"source_cadence": cadence}))
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=list(videos)) as mock_fetch:
+                    with patch("src.main.fetch_new_episodes", return_value=[]):
+                        with patch("src.main.summarize", return_value="## Summary"):
+                            with patch("src.main.generate_summary_files", return_value={"summary_path": tmp_path / "s.md", "slug": "s"}):
+                                with patch("src.main._save_and_generate") as mock_save:
+                                    run(
+                                        config_path=tmp_path / "config.yaml",
+                                        output_dir=tmp_path / "output",
+                                        state_path=tmp_path / "state.json",
+                                        **kwargs,
+                                    )
+        return mock_save.call_args[0][0], mock_fetch
+
+    @staticmethod
+    def _weekly_channel(checked_hours_ago=12):
+        """History of a channel that posts weekly and posted yesterday."""
+        now = datetime.now(timezone.utc)
+        uploads = [(now - timedelta(days=1 + 7 * i)).isoformat() for i in range(6)]
+        return {"Test Channel": {"uploads": uploads, "checked": (now - timedelta(hours=checked_hours_ago)).isoformat()}}
+
+    def test_source_unlikely_to_have_posted_is_not_fetched(self, tmp_path, config):
+        _, mock_fetch = self._run(tmp_path, config, self._weekly_channel())
+        mock_fetch.assert_not_called()
+
+    def test_fetch_after_a_skip_covers_the_whole_gap(self, tmp_path, config):
+        _, mock_fetch = self._run(tmp_path, config, self._weekly_channel(checked_hours_ago=100))
+        assert mock_fetch.call_args.kwargs["lookback_hours"] > 100
+
+    def test_manual_source_run_always_fetches(self, tmp_path, config):
+        _, mock_fetch = self._run(tmp_path, config, self._weekly_channel(), source_name="Test Channel")
+        mock_fetch.assert_called_once()
+
+    def test_disabled_by_setting(self, tmp_path, config):
+        config = dataclasses.replace(config, settings=dataclasses.replace(config.settings, learn_source_cadence=False))
+        _, mock_fetch = self._run(tmp_path, config, self._weekly_channel())
+        mock_fetch.assert_called_once()
+
+    def test_fetch_records_uploads_and_check_time(self, tmp_path, config, sample_video):
+        state, _ = self._run(tmp_path, config, {}, videos=[sample_video])
+
+        entry = state["source_cadence"]["Test Channel"]
+        assert entry["uploads"] == [sample_video.upload_date.isoformat()]
+        assert datetime.fromisoformat(entry["checked"]) > datetime.now(timezone.utc) - timedelta(minutes=1)
+
+
+class TestSourceFailures:
+    def _run(self, tmp_path, config, state=None, fetch=None, episodes=None, **kwargs):
+        if state is not None:
+            (tmp_path / "state.json").write_text(json.dumps(state))
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", side_effect=fetch, return_value=[]) as mock_fetch:
+                    with patch("src.main.fetch_new_episodes", side_effect=episodes, return_value=[]) as mock_episodes:
+                        with patch("src.main.sys.exit"):
+                            with patch("src.main._save_and_generate") as mock_save:
+                                run(
+                                    config_path=tmp_path / "config.yaml",
+                                    output_dir=tmp_path / "output",
+                                    state_path=tmp_path / "state.json",
+                                    **kwargs,
+                                )
+        state, skipped = mock_save.call_args[0][0], mock_save.call_args[0][6]
+        self.errors = mock_save.call_args[0][5]
+        return state, skipped, mock_fetch, mock_episodes
+
+    def test_one_channel_timeout_is_an_operational_skip(self, tmp_path, config):
+        _, skipped, _, _ = self._run(tmp_path, config, fetch=ChannelFetchError("Timeout fetching channel"))
+
+        assert self.errors == []
+        assert skipped[0]["action"] == "Transient network error — will retry on next run automatically."
+
+    def test_repeated_channel_failure_is_an_error(self, tmp_path, config):
+        state, _, _, _ = self._run(tmp_path, config, fetch=ChannelFetchError("Timeout fetching channel"))
+        self._run(tmp_path, config, state=state, fetch=ChannelFetchError("Timeout fetching channel"))
+
+        assert [e["source"] for e in self.errors] == ["YouTube/Test Channel"]
+
+    @staticmethod
+    def _cooling(label):
+        retry_after = (datetime.now(timezone.utc) + timedelta(hours=6)).isoformat()
+        return {"source_failures": {label: {"failures": 2, "since": "2026-02-18", "error": "gone", "retry_after": retry_after}}}
+
+    def test_second_failure_in_a_row_starts_cool_down(self, tmp_path, config):
+        state, _, _, _ = self._run(tmp_path, config, fetch=ChannelFetchError("channel does not exist"))
+        assert "retry_after" not in state["source_failures"]["YouTube/Test Channel"]
+
+        state, skipped, _, _ = self._run(tmp_path, config, state=state, fetch=ChannelFetchError("channel does not exist"))
+
+        assert state["source_failures"]["YouTube/Test Channel"]["failures"] == 2
+        assert skipped[0]["action"].startswith("Failing repeatedly — not fetched again until")
+
+    def test_cooling_down_source_not_fetched(self, tmp_path, config):
+        state, skipped, mock_fetch, mock_episodes = self._run(tmp_path, config, state=self._cooling("YouTube/Test Channel"))
+
+        mock_fetch.assert_not_called()
+        mock_episodes.assert_called_once()
+        assert skipped == []
+        assert state["source_failures"]["YouTube/Test Channel"]["failures"] == 2
+
+    def test_manual_source_run_fetches_anyway_and_success_clears(self, tmp_path, config):
+        state, _, mock_fetch, _ = self._run(
+            tmp_path, config, state=self._cooling("YouTube/Test Channel"), source_name="Test Channel",
+        )
+
+        mock_fetch.assert_called_once()
+        assert "source_failures" not in state
+
+    def test_rss_lookup_failure_cools_down_at_once(self, tmp_path, config):
+        state, _, _, _ = self._run(tmp_path, config, episodes=RSSLookupError("no feed found"))
+
+        entry = state["source_failures"]["Podcast/Test Podcast"]
+        assert (entry["failures"], entry["error"]) == (1, "no feed found")
+        assert "retry_after" in entry
+
+    def test_broken_sources_listed_in_report(self, tmp_path, config):
+        with patch("src.main.generate_error_report") as mock_report, \
+             patch("src.main.save_state"), \
+             patch("src.main.generate_daily_digest"), \
+             patch("src.main.generate_podcast_daily_digest"), \
+             patch("src.main.generate_viewer"), \
+             patch("src.main.cleanup_old_content", return_value=[]), \
+             patch("src.main.cleanup_state"):
+            _save_and_generate(self._cooling("Podcast/Gone"), tmp_path / "state.json", {}, [], [], [], [],
+                               tmp_path, "2026-02-20", config)
+
+        [line] = mock_report.call_args.kwargs["broken_sources"]
+        assert line.startswith("- **Podcast/Gone**: failing since 2026-02-18 (2 failed fetch(es)), not fetched until")
+        assert line.endswith("UTC — gone")
+
+
+class TestDaemon:
+    class _Clock:
+        """Stands in for time.monotonic / time.sleep."""
+        def __init__(self):
+            self.now = 0.0
+            self.sleeps = []
+
+        def monotonic(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+    def _run(self, tmp_path, config, max_cycles=1, run_side_effect=None):
+        clock = self._Clock()
+        client = MagicMock()
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main._setup_gemini", return_value=client) as mock_setup:
+                with patch("src.main.run", side_effect=run_side_effect) as mock_run:
+                    with patch("src.main.time.monotonic", clock.monotonic):
+                        with patch("src.main.time.sleep", clock.sleep):
+                            run_daemon(tmp_path / "config.yaml", tmp_path / "output", tmp_path / "state.json",
+                                       max_cycles=max_cycles)
+        mock_setup.assert_called_once()
+        return mock_run, client, clock
+
+    @staticmethod
+    def _polled(mock_run):
+        return [c.kwargs["source_name"] for c in mock_run.call_args_list]
+
+    def test_first_cycle_polls_queues_and_every_source_with_one_client(self, tmp_path, config):
+        mock_run, client, _ = self._run(tmp_path, config)
+
+        assert self._polled(mock_run) == [None, "Test Channel", "Test Podcast"]
+        assert [c.kwargs["retry_pending"] for c in mock_run.call_args_list] == [True, False, False]
+        assert all(c.kwargs["gemini_client"] is client for c in mock_run.call_args_list)
+        assert all(c.kwargs["incremental"] for c in mock_run.call_args_list)
+
+    def test_sources_polled_on_their_own_interval(self, tmp_path, config):
+        config = dataclasses.replace(
+            config,
+            youtube_sources=[dataclasses.replace(config.youtube_sources[0], poll_minutes=10)],
+            settings=dataclasses.replace(config.settings, daemon_poll_minutes=30),
+        )
+
+        mock_run, _, clock = self._run(tmp_path, config, max_cycles=4)
+
+        # t=0 everything, t=10 and t=20 the channel, t=30 everything again
+        assert self._polled(mock_run) == [
+            None, "Test Channel", "Test Podcast", "Test Channel", "Test Channel",
+            None, "Test Channel", "Test Podcast",
+        ]
+        assert clock.sleeps == [600, 600, 600]
+
+    def test_polls_share_one_day_report(self, tmp_path, config):
+        mock_run, _, _ = self._run(tmp_path, config)
+
+        reports = [c.kwargs["day_report"] for c in mock_run.call_args_list]
+        assert all(r is reports[0] for r in reports)
+
+    def test_fatal_poll_stops_the_daemon(self, tmp_path, config):
+        with pytest.raises(SystemExit):
+            self._run(tmp_path, config, run_side_effect=SystemExit(1))
+
+    def test_report_collects_every_poll_of_the_day(self, tmp_path, config):
+        day_report: dict = {}
+        skipped = {"type": "youtube", "source": "C", "title": "T", "url": "u1", "reason": "r", "action": "a"}
+        with patch("src.main.save_state"), \
+             patch("src.main.generate_error_report") as mock_report, \
+             patch("src.main.cleanup_old_content", return_value=[]), \
+             patch("src.main.cleanup_state"):
+            for errors, skips in [
+                ([{"source": "A", "message": "x"}], [skipped]),
+                ([], []),                                            # a clean poll
+                ([{"source": "B", "message": "y"}], [dict(skipped, reason="again")]),
+            ]:
+                _save_and_generate({}, tmp_path / "state.json", {}, [], [], errors, skips, tmp_path,
+                                   "2026-02-20", config, incremental=True, day_report=day_report)
+            _save_and_generate({}, tmp_path / "state.json", {}, [], [], [], [], tmp_path,
+                               "2026-02-21", config, incremental=True, day_report=day_report)
+
+        reports = [c.args[:2] for c in mock_report.call_args_list]
+        assert reports[1] == ([{"source": "A", "message": "x"}], [skipped])
+        assert reports[2] == (
+            [{"source": "A", "message": "x"}, {"source": "B", "message": "y"}],
+            [dict(skipped, reason="again")],
+        )
+        assert reports[3] == ([], [])     # a new day starts afresh
+
+    def test_incremental_save_skips_untouched_digests_viewer_and_email(self, tmp_path, config):
+        config = dataclasses.replace(config, settings=dataclasses.replace(config.settings, notify_email="a@b.c"))
+        with patch("src.main.save_state"), \
+             patch("src.main.generate_daily_digest") as mock_digest, \
+             patch("src.main.generate_podcast_daily_digest") as mock_podcast_digest, \
+             patch("src.main.generate_error_report"), \
+             patch("src.main.generate_viewer") as mock_viewer, \
+             patch("src.main.cleanup_old_content", return_value=[]), \
+             patch("src.main.cleanup_state"), \
+             patch("src.main.send_run_notification") as mock_notify:
+            _save_and_generate({}, tmp_path / "state.json", {}, [], [], [], [], tmp_path, "2026-02-20",
+                               config, incremental=True)
+            mock_viewer.assert_not_called()
+
+            _save_and_generate({}, tmp_path / "state.json", {}, [], [{"episode": MagicMock()}], [], [],
+                               tmp_path, "2026-02-20", config, incremental=True)
+
+        mock_digest.assert_not_called()
+        mock_podcast_digest.assert_called_once()
+        mock_viewer.assert_called_once()
+        mock_notify.assert_not_called()
+
+
+class TestBackfill:
+    def _days_ago(self, days):
+        return (datetime.now(timezone.utc) - timedelta(days=days)).replace(hour=12, minute=0)
+
+    def _run(self, tmp_path, config, videos=(), episodes=(), backfill=None, summarize=None):
+        today = datetime.now().date()
+        backfill = backfill or (today - timedelta(days=2), today)
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos") as mock_new:
+                    with patch("src.main.fetch_videos_published_between", return_value=list(videos)) as mock_range:
+                        with patch("src.main.fetch_episodes_published_between", return_value=list(episodes)):
+                            with patch("src.main.summarize", side_effect=summarize, return_value="## Summary"):
+                                with patch("src.main.download_and_transcribe", return_value="## Summary"):
+                                    with patch("src.main.generate_summary_files", return_value={"slug": "s"}) as mock_files:
+                                        with patch("src.main.generate_podcast_summary_files", return_value={"slug": "s"}):
+                                            with patch("src.main._save_and_generate") as mock_save:
+                                                run(
+                                                    config_path=tmp_path / "config.yaml",
+                                                    output_dir=tmp_path / "output",
+                                                    state_path=tmp_path / "state.json",
+                                                    backfill=backfill,
+                                                )
+        mock_new.assert_not_called()
+        return mock_save.call_args[0], mock_range, mock_files
+
+    def test_items_filed_under_their_publication_day(self, tmp_path, config, sample_video, sample_episode):
+        video = dataclasses.replace(sample_video, upload_date=self._days_ago(2))
+        episode = dataclasses.replace(sample_episode, published_at=self._days_ago(1))
+
+        args, mock_range, mock_files = self._run(tmp_path, config, videos=[video], episodes=[episode])
+        state, digest_entries, podcast_entries = args[0], args[3], args[4]
+
+        video_day, episode_day = self._days_ago(2).strftime("%Y-%m-%d"), self._days_ago(1).strftime("%Y-%m-%d")
+        start, end = mock_range.call_args[0][2:4]
+        assert end - start == timedelta(days=3)
+        assert mock_files.call_args.kwargs["date_str"] == video_day
+        assert state["youtube"]["vid1"]["date"] == video_day
+        assert state["podcasts"]["ep_abc"] == episode_day
+        assert digest_entries[0]["date"] == video_day
+        assert podcast_entries[0]["date"] == episode_day
+
+    def test_items_processed_concurrently_within_budget(self, tmp_path, config, sample_video):
+        config = dataclasses.replace(config, settings=dataclasses.replace(
+            config.settings, daily_request_budget=3, backfill_parallel_items=3,
+        ))
+        videos = [
+            dataclasses.replace(sample_video, video_id=f"v{i}", title=f"Video {i}", upload_date=self._days_ago(1))
+            for i in range(4)
+        ]
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def _summarize(**kwargs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return "## Summary"
+
+        args, _, _ = self._run(tmp_path, config, videos=videos, summarize=_summarize)
+        state, skipped = args[0], args[6]
+
+        assert peak[0] > 1
+        assert len(state["youtube"]) == 3
+        assert "pending" not in state or not state["pending"].get("youtube")
+        assert skipped[0]["action"] == "Not processed — run the backfill again to pick it up."
+
+    def test_state_updates_from_workers_do_not_overlap(self, tmp_path, config, sample_video):
+        config = dataclasses.replace(config, settings=dataclasses.replace(config.settings, backfill_parallel_items=4))
+        videos = [
+            dataclasses.replace(sample_video, video_id=f"v{i}", title=f"Video {i}", upload_date=self._days_ago(1))
+            for i in range(8)
+        ]
+        running, peak = [0], [0]
+        real_mark = mark_youtube_processed
+
+        def _mark(*args, **kwargs):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            real_mark(*args, **kwargs)
+            running[0] -= 1
+
+        with patch("src.main.mark_youtube_processed", side_effect=_mark):
+            args, _, _ = self._run(tmp_path, config, videos=videos)
+
+        assert peak[0] == 1
+        assert len(args[0]["youtube"]) == 8
+        assert len(args[3]) == 8
+
+    def test_start_clamped_to_retention_window(self, tmp_path, config):
+        today = datetime.now().date()
+        _, mock_range, _ = self._run(tmp_path, config, backfill=(today - timedelta(days=30), today))
+
+        start = mock_range.call_args[0][2]
+        assert start.date() == today - timedelta(days=config.settings.max_age_days - 1)
+
+    def test_empty_range_exits(self, tmp_path, config):
+        today = datetime.now().date()
+        with pytest.raises(SystemExit):
+            self._run(tmp_path, config, backfill=(today, today - timedelta(days=1)))
+
+    def test_digests_generated_per_day(self, tmp_path, config, sample_video):
+        entries = [
+            {"video": sample_video, "paths": {}, "error": None, "date": "2026-02-18"},
+            {"video": sample_video, "paths": {}, "error": None, "date": "2026-02-19"},
+        ]
+        with patch("src.main.save_state"):
+            with patch("src.main.generate_daily_digest") as mock_digest:
+                with patch("src.main.generate_podcast_daily_digest") as mock_podcast_digest:
+                    with patch("src.main.generate_error_report"):
+                        with patch("src.main.generate_viewer"):
+                            with patch("src.main.cleanup_old_content", return_value=[]):
+                                with patch("src.main.cleanup_state"):
+                                    _save_and_generate(
+                                        {}, tmp_path / "state.json", {}, entries, [], [], [],
+                                        tmp_path / "output", "2026-02-20", config,
+                                    )
+
+        assert [c.args[2] for c in mock_digest.call_args_list] == ["2026-02-20", "2026-02-18", "2026-02-19"]
+        assert [c.args[0] for c in mock_digest.call_args_list][1:] == [[entries[0]], [entries[1]]]
+        mock_podcast_digest.assert_called_once()
+
+
+class TestPriorityScheduling:
+    def _run(self, tmp_path, config, videos=(), episodes=(), summarize=None, transcribe=None):
+        calls = []
+
+        def _summarize(**kwargs):
+            calls.append(kwargs["title"])
+            if summarize:
+                summarize(**kwargs)
+            return "## Summary"
+
+        def _transcribe(episode, **kwargs):
+            calls.append(episode.title)
+            if transcribe:
+                transcribe(episode)
+            return "## Summary"
+
+        mock_paths = {"summary_path": tmp_path / "output/summaries/x/test.md", "slug": "test"}
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=list(videos)):
+                    with patch("src.main.fetch_new_episodes", return_value=list(episodes)):
+                        with patch("src.main.summarize", side_effect=_summarize):
+                            with patch("src.main.download_and_transcribe", side_effect=_transcribe):
+                                with patch("src.main.generate_summary_files", return_value=mock_paths):
+                                    with patch("src.main.generate_podcast_summary_files", return_value=mock_paths):
+                                        with patch("src.main._save_and_generate") as mock_save:
+                                            run(
+                                                config_path=tmp_path / "config.yaml",
+                                                output_dir=tmp_path / "output",
+                                                state_path=tmp_path / "state.json",
+                                            )
+        return calls, mock_save.call_args[0][0], mock_save.call_args[0][6]
+
+    def _prioritised(self, config, show_priority=0, **settings):
+        return dataclasses.replace(
+            config,
+            podcast_shows=[dataclasses.replace(config.podcast_shows[0], priority=show_priority)],
+            settings=dataclasses.replace(config.settings, **settings),
+        )
+
+    def test_higher_priority_source_runs_first(self, tmp_path, config, sample_video, sample_episode):
+        calls, _, _ = self._run(
+            tmp_path, self._prioritised(config, show_priority=1),
+            videos=[sample_video], episodes=[sample_episode],
+        )
+        assert calls == ["Test Episode", "Test Video"]
+
+    def test_over_budget_items_deferred_to_pending(self, tmp_path, config, sample_video, sample_episode):
+        calls, state, skipped = self._run(
+            tmp_path, self._prioritised(config, show_priority=1, daily_request_budget=1),
+            videos=[sample_video], episodes=[sample_episode],
+        )
+        assert calls == ["Test Episode"]
+        assert "vid1" in state["pending"]["youtube"]
+        assert "request budget" in skipped[0]["reason"]
+
+    def test_budget_reduced_by_todays_earlier_usage(self, tmp_path, config, sample_video, sample_episode):
+        (tmp_path / "state.json").write_text(json.dumps({
+            "gemini_quota": {"date": quota_day(), "models": {"gemini-2.5-flash": {"requests": 9}}},
+        }))
+        calls, _, _ = self._run(
+            tmp_path, self._prioritised(config, show_priority=1, daily_request_budget=10),
+            videos=[sample_video], episodes=[sample_episode],
+        )
+        assert calls == ["Test Episode"]
+
+    def test_items_that_would_overrun_deadline_deferred(self, tmp_path, config, sample_video, sample_episode):
+        # ~117k audio tokens at 1s per 1k tokens will not fit in 60s; the video will
+        with patch("src.main.run_deadline", return_value=RunDeadline(60, "07:00 PST")):
+            calls, state, skipped = self._run(
+                tmp_path, self._prioritised(config, show_priority=1),
+                videos=[sample_video], episodes=[sample_episode],
+            )
+        assert calls == ["Test Video"]
+        assert "ep_abc" in state["pending"]["podcasts"]
+        assert "07:00 PST run deadline" in skipped[0]["reason"]
+
+    def test_item_timings_saved_for_next_run(self, tmp_path, config, sample_video):
+        _, state, _ = self._run(tmp_path, config, videos=[sample_video])
+        assert state["item_timings"]["youtube"]["samples"] == 1
+
+    def test_quota_exhaustion_defers_remaining_items(self, tmp_path, config, sample_video, sample_episode):
+        def quota(episode):
+            raise QuotaExhaustedError("daily quota")
+
+        calls, state, _ = self._run(
+            tmp_path, self._prioritised(config, show_priority=1),
+            videos=[sample_video], episodes=[sample_episode], transcribe=quota,
+        )
+        assert calls == ["Test Episode"]
+        assert set(state["pending"]["youtube"]) == {"vid1"}
+        assert set(state["pending"]["podcasts"]) == {"ep_abc"}
+
+
+class TestUsageLedger:
+    def test_calls_labelled_with_item(self, tmp_path, config, sample_video):
+        def summarize(**kwargs):
+            record_call(kwargs["model"], None, 1.5, 1)
+            return "## Summary"
+
+        mock_paths = {"summary_path": tmp_path / "output/summaries/x/test.md", "slug": "test"}
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=[sample_video]):
+                    with patch("src.main.fetch_new_episodes", return_value=[]):
+                        with patch("src.main.summarize", side_effect=summarize):
+                            with patch("src.main.generate_summary_files", return_value=mock_paths):
+                                with patch("src.main._save_and_generate"):
+                                    run(
+                                        config_path=tmp_path / "config.yaml",
+                                        output_dir=tmp_path / "output",
+                                        state_path=tmp_path / "state.json",
+                                    )
+
+        [record] = usage_ledger().records
+        assert record.item == "Test Channel: Test Video"
+
+    def test_usage_passed_to_run_report(self, tmp_path, config):
+        record_call("gemini-2.5-flash", None, 2.0, 1)
+        with patch("src.main.save_state"):
+            with patch("src.main.generate_daily_digest"):
+                with patch("src.main.generate_podcast_daily_digest"):
+                    with patch("src.main.generate_error_report") as mock_report:
+                        with patch("src.main.generate_viewer"):
+                            with patch("src.main.cleanup_old_content", return_value=[]):
+                                with patch("src.main.cleanup_state"):
+                                    _save_and_generate(
+                                        {}, tmp_path / "state.json", {}, [], [], [], [],
+                                        tmp_path / "output", "2026-02-20", config,
+                                    )
+
+        usage = mock_report.call_args.kwargs["usage"]
+        assert usage[0].startswith("- **gemini-2.5-flash**: 1 request(s)")
+
+    def test_usage_added_to_daily_quota_as_calls_finish(self, tmp_path, config):
+        state_path = tmp_path / "state.json"
+        state_path.write_text(json.dumps({"youtube": {"abc": "2026-02-19"}}))
+        state = {"youtube": {"abc": "2026-02-19", "def": "2026-02-20"}}
+        usage_ledger().on_record = lambda record: _record_quota_usage(state, state_path, record)
+
+        record_call("gemini-2.5-flash", None, 2.0, 3)
+        record_call("gemini-2.5-flash", None, 1.0, 1)
+
+        assert get_quota_usage(state)["gemini-2.5-flash"]["requests"] == 4
+        # On disk before the end-of-run save, with the rest of the file unchanged
+        on_disk = json.loads(state_path.read_text())
+        assert get_quota_usage(on_disk)["gemini-2.5-flash"]["requests"] == 4
+        assert on_disk["youtube"] == {"abc": "2026-02-19"}
+
+
 class TestPodcastPipeline:
     def test_processes_episode_successfully(self, tmp_path, config, sample_episode):
         output_dir = tmp_path / "output"
@@ -422,6 +1457,87 @@ class TestPodcastPipeline:
 
         mock_save.assert_called_once()
 
+    def test_cached_audio_evicted_only_after_success(self, tmp_path, config, sample_episode):
+        output_dir = tmp_path / "output"
+        mock_paths = {"summary_path": output_dir / "podcast-summaries/x/test.md", "slug": "test"}
+        failing = EpisodeInfo(
+            episode_id="ep_fail", title="Failing Episode", show_name="Test Podcast",
+            show_url="https://open.spotify.com/show/abc",
+            episode_url="https://podcast.example.com/ep2",
+            audio_url="https://cdn.example.com/ep2.mp3",
+            category="AI",
+            published_at=datetime.now(timezone.utc), duration_seconds=3600,
+        )
+
+        def transcribe(episode, **kwargs):
+            if episode is failing:
+                raise TranscriptionError("Gemini down")
+            return "## Summary"
+
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=[]):
+                    with patch("src.main.fetch_new_episodes", return_value=[sample_episode, failing]):
+                        with patch("src.main.download_and_transcribe", side_effect=transcribe) as mock_dt:
+                            with patch("src.main.generate_podcast_summary_files", return_value=mock_paths):
+                                with patch("src.main.evict_audio") as mock_evict:
+                                    with patch("src.main._save_and_generate"):
+                                        with pytest.raises(SystemExit):
+                                            run(
+                                                config_path=tmp_path / "config.yaml",
+                                                output_dir=output_dir,
+                                                state_path=tmp_path / "state.json",
+                                            )
+
+        cache_dir = tmp_path / ".cache" / "audio"
+        assert mock_dt.call_args[1]["audio_cache_dir"] == cache_dir
+        mock_evict.assert_called_once_with(cache_dir, sample_episode.audio_url)
+
+    @pytest.mark.parametrize("no_cache", [False, True])
+    def test_response_cache_enabled_unless_bypassed(self, tmp_path, config, no_cache):
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=[]):
+                    with patch("src.main.fetch_new_episodes", return_value=[]):
+                        with patch("src.main.enable_response_cache") as mock_enable:
+                            with patch("src.main.prune_response_cache") as mock_prune:
+                                with patch("src.main._save_and_generate"):
+                                    run(
+                                        config_path=tmp_path / "config.yaml",
+                                        output_dir=tmp_path / "output",
+                                        state_path=tmp_path / "state.json",
+                                        no_cache=no_cache,
+                                    )
+
+        if no_cache:
+            mock_enable.assert_not_called()
+            mock_prune.assert_not_called()
+        else:
+            mock_enable.assert_called_once_with(tmp_path / ".cache" / "responses")
+            mock_prune.assert_called_once()
+
+    @pytest.mark.parametrize("hedge", [False, True])
+    def test_request_timeout_and_hedging_configured(self, tmp_path, config, hedge):
+        config = dataclasses.replace(
+            config,
+            settings=dataclasses.replace(config.settings, request_timeout_seconds=90, hedge_requests=hedge),
+        )
+        with patch("src.main.load_config", return_value=config):
+            with patch("src.main.create_client", return_value=MagicMock()):
+                with patch("src.main.fetch_new_videos", return_value=[]):
+                    with patch("src.main.fetch_new_episodes", return_value=[]):
+                        with patch("src.main.set_request_timeout") as mock_timeout:
+                            with patch("src.main.enable_request_hedging") as mock_hedge:
+                                with patch("src.main._save_and_generate"):
+                                    run(
+                                        config_path=tmp_path / "config.yaml",
+                                        output_dir=tmp_path / "output",
+                                        state_path=tmp_path / "state.json",
+                                    )
+
+        mock_timeout.assert_called_once_with(90)
+        assert mock_hedge.called is hedge
+
 
 # ---------------------------------------------------------------------------
 # Tests: Config errors
@@ -852,6 +1968,10 @@ class TestMainEntrypoint:
         assert kwargs["output_dir"] == Path("output")
         assert kwargs["state_path"] == Path("state.json")
         assert kwargs["dry_run"] is False
+        assert kwargs["cache_dir"] == Path(".cache")
+        assert kwargs["no_cache"] is False
+        assert kwargs["retry_pending"] is False
+        assert kwargs["backfill"] is None
 
     def test_main_dry_run_flag(self, tmp_path, monkeypatch):
         import sys
@@ -862,3 +1982,75 @@ class TestMainEntrypoint:
             main()
 
         assert mock_run.call_args[1]["dry_run"] is True
+
+    def test_main_retry_pending_flag(self, tmp_path, monkeypatch):
+        import sys
+        monkeypatch.setattr(sys, "argv", ["src.main", "--retry-pending"])
+
+        with patch("src.main.run") as mock_run:
+            from src.main import main
+            main()
+
+        assert mock_run.call_args[1]["retry_pending"] is True
+
+    def test_main_targeting_flags(self, tmp_path, monkeypatch):
+        import sys
+        monkeypatch.setattr(sys, "argv", [
+            "src.main", "--source", "Hard Fork", "--video-id", "a", "--video-id", "b", "--episode-id", "e",
+        ])
+
+        with patch("src.main.run") as mock_run:
+            from src.main import main
+            main()
+
+        kwargs = mock_run.call_args[1]
+        assert kwargs["source_name"] == "Hard Fork"
+        assert kwargs["video_ids"] == ("a", "b")
+        assert kwargs["episode_ids"] == ("e",)
+
+    def test_main_backfill_flags(self, tmp_path, monkeypatch):
+        import sys
+        from datetime import date
+        monkeypatch.setattr(sys, "argv", ["src.main", "--backfill-from", "2026-02-18", "--backfill-to", "2026-02-19"])
+
+        with patch("src.main.run") as mock_run:
+            from src.main import main
+            main()
+
+        assert mock_run.call_args[1]["backfill"] == (date(2026, 2, 18), date(2026, 2, 19))
+
+    def test_main_daemon_flag(self, tmp_path, monkeypatch):
+        import sys
+        monkeypatch.setattr(sys, "argv", ["src.main", "--daemon", "--no-cache"])
+
+        with patch("src.main.run") as mock_run:
+            with patch("src.main.run_daemon") as mock_daemon:
+                from src.main import main
+                main()
+
+        mock_run.assert_not_called()
+        mock_daemon.assert_called_once_with(
+            Path("config.yaml"), Path("output"), Path("state.json"), cache_dir=Path(".cache"), no_cache=True,
+        )
+
+    def test_main_daemon_rejects_one_off_options(self, tmp_path, monkeypatch):
+        import sys
+        monkeypatch.setattr(sys, "argv", ["src.main", "--daemon", "--source", "Hard Fork"])
+
+        with patch("src.main.run_daemon") as mock_daemon:
+            from src.main import main
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_daemon.assert_not_called()
+
+    def test_main_backfill_to_requires_from(self, tmp_path, monkeypatch):
+        import sys
+        monkeypatch.setattr(sys, "argv", ["src.main", "--backfill-to", "2026-02-19"])
+
+        with patch("src.main.run") as mock_run:
+            from src.main import main
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_run.assert_not_called()
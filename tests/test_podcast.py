@@ -7,23 +7,35 @@ and are skipped unless --integration is passed.
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import json
 import os
 import tempfile
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch, mock_open, call
 from io import BytesIO
+from urllib.error import URLError
 
 import pytest
 
-from src.config import PodcastShow
+from src.config import ModelRoute, PodcastShow
+from src.circuit_breaker import CircuitOpenError, circuit_breaker, configure_circuit_breaker
+from src.response_cache import enable_response_cache
+from src.compaction import estimate_tokens
+from src.summarizer import enable_prefix_caching, prefix_cache_min_tokens
+from src.usage_ledger import usage_ledger
 from src.fetchers.podcast import (
+    ChunkingOptions,
     EpisodeInfo,
+    PODCAST_SYSTEM_INSTRUCTION,
     RSSLookupError,
     AudioDownloadError,
     TranscriptionError,
+    fetch_episodes_published_between,
     fetch_new_episodes,
+    find_episode,
     resolve_rss_feed,
     download_and_transcribe,
     _lookup_itunes,
@@ -34,11 +46,20 @@ from src.fetchers.podcast import (
     _parse_rss_date,
     _parse_itunes_duration,
     _parse_rss_item,
+    _parse_transcript,
+    _pick_transcript,
+    _summarize_from_transcript,
     _has_ffmpeg,
     _download_with_ffmpeg,
     _download_direct,
+    _download_audio_cached,
     _wait_for_file_active,
     _transcribe_and_summarize,
+    _transcribe_in_chunks,
+    _choose_split_points,
+    _detect_silences,
+    _split_audio,
+    _format_timestamp,
     _format_duration,
     _get_language_name,
 )
@@ -297,6 +318,145 @@ class TestExtractEpisodes:
         episodes = _extract_episodes(xml, sample_show_es)
         assert episodes[0].language == "es"
 
+    def test_published_transcript_picked_up(self, sample_show):
+        xml = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:podcast="https://podcastindex.org/namespace/1.0"><channel>
+  <item>
+    <title>With Transcript</title>
+    <guid>ep-t</guid>
+    <enclosure url="https://cdn.example.com/ep.mp3" type="audio/mpeg" length="100"/>
+    <podcast:transcript url="https://cdn.example.com/ep.html" type="text/html"/>
+    <podcast:transcript url="https://cdn.example.com/ep.json" type="application/json"/>
+    <podcast:transcript url="https://cdn.example.com/ep.vtt" type="text/vtt"/>
+  </item>
+</channel></rss>"""
+        episodes = _extract_episodes(xml, sample_show)
+        assert episodes[0].transcript_url == "https://cdn.example.com/ep.vtt"
+        assert episodes[0].transcript_format == "vtt"
+
+    def test_no_transcript_tag_leaves_url_none(self, rss_xml_bytes, sample_show):
+        episodes = _extract_episodes(rss_xml_bytes, sample_show)
+        assert episodes[0].transcript_url is None
+        assert episodes[0].transcript_format == ""
+
+
+# ---------------------------------------------------------------------------
+# Tests: Published transcripts
+# ---------------------------------------------------------------------------
+
+def _transcript_item(*tags: str):
+    body = "".join(tags)
+    return ET.fromstring(
+        f'<item xmlns:podcast="https://podcastindex.org/namespace/1.0">{body}</item>'
+    )
+
+
+class TestPickTranscript:
+    def test_none_when_absent(self):
+        assert _pick_transcript(_transcript_item()) == (None, "")
+
+    def test_unparseable_types_ignored(self):
+        item = _transcript_item('<podcast:transcript url="https://x/t.html" type="text/html"/>')
+        assert _pick_transcript(item) == (None, "")
+
+    def test_srt_preferred_over_json(self):
+        item = _transcript_item(
+            '<podcast:transcript url="https://x/t.json" type="application/json"/>',
+            '<podcast:transcript url="https://x/t.srt" type="application/x-subrip"/>',
+        )
+        assert _pick_transcript(item) == ("https://x/t.srt", "srt")
+
+    def test_format_inferred_from_extension_when_type_missing(self):
+        item = _transcript_item('<podcast:transcript url="https://x/t.vtt?sig=1"/>')
+        assert _pick_transcript(item) == ("https://x/t.vtt?sig=1", "vtt")
+
+    def test_empty_url_ignored(self):
+        item = _transcript_item('<podcast:transcript url="" type="text/vtt"/>')
+        assert _pick_transcript(item) == (None, "")
+
+
+class TestParseTranscript:
+    def test_vtt(self):
+        content = b"""WEBVTT
+
+1
+00:00:01.500 --> 00:00:04.000
+<v Host>Welcome to the show.
+
+00:01:05.000 --> 00:01:08.000
+Second line
+continues here.
+"""
+        cues = _parse_transcript(content, "vtt")
+        assert [(c.start, c.text) for c in cues] == [
+            (1.5, "Welcome to the show."),
+            (65.0, "Second line continues here."),
+        ]
+
+    def test_srt_with_hours_and_crlf(self):
+        content = b"1\r\n01:00:02,250 --> 01:00:05,000\r\nLate in the episode.\r\n\r\n"
+        cues = _parse_transcript(content, "srt")
+        assert cues[0].start == 3602.25
+        assert cues[0].text == "Late in the episode."
+
+    def test_cue_without_text_skipped(self):
+        content = b"WEBVTT\n\n00:00:01.000 --> 00:00:02.000\n\n"
+        assert _parse_transcript(content, "vtt") == []
+
+    def test_json(self):
+        content = json.dumps({"version": "1.0.0", "segments": [
+            {"speaker": "A", "startTime": 0.5, "endTime": 2, "body": "Hello"},
+            {"startTime": 2, "body": "  "},
+            {"startTime": 3.25, "body": "World"},
+        ]}).encode()
+        cues = _parse_transcript(content, "json")
+        assert [(c.start, c.text) for c in cues] == [(0.5, "Hello"), (3.25, "World")]
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError, match="Unsupported"):
+            _parse_transcript(b"x", "html")
+
+
+class TestSummarizeFromTranscript:
+    def _episode(self, sample_episode):
+        return dataclasses.replace(
+            sample_episode,
+            transcript_url="https://cdn.example.com/ep.vtt",
+            transcript_format="vtt",
+        )
+
+    def test_summarizes_text_with_timestamp_segments(self, sample_episode):
+        episode = self._episode(sample_episode)
+        vtt = b"WEBVTT\n\n00:00:00.000 --> 00:00:02.000\nHello\n\n00:00:40.000 --> 00:00:42.000\nWorld\n"
+        with patch("src.fetchers.podcast._fetch_rss_content", return_value=vtt):
+            with patch("src.fetchers.podcast.summarize", return_value="Summary") as mock_sum:
+                result = _summarize_from_transcript(episode, MagicMock(), "gemini-2.5-flash")
+
+        assert result == "Summary"
+        kwargs = mock_sum.call_args.kwargs
+        assert kwargs["transcript"] == "Hello World"
+        assert kwargs["channel_name"] == "Hard Fork"
+        assert kwargs["duration_seconds"] == 3600
+        assert kwargs["transcript_segments"] == ((0, "Hello"), (40, "World"))
+
+    def test_fetch_failure_returns_none(self, sample_episode):
+        with patch("src.fetchers.podcast._fetch_rss_content", side_effect=URLError("down")):
+            with patch("src.fetchers.podcast.summarize") as mock_sum:
+                result = _summarize_from_transcript(
+                    self._episode(sample_episode), MagicMock(), "m"
+                )
+        assert result is None
+        mock_sum.assert_not_called()
+
+    def test_empty_transcript_returns_none(self, sample_episode):
+        with patch("src.fetchers.podcast._fetch_rss_content", return_value=b"WEBVTT\n"):
+            with patch("src.fetchers.podcast.summarize") as mock_sum:
+                result = _summarize_from_transcript(
+                    self._episode(sample_episode), MagicMock(), "m"
+                )
+        assert result is None
+        mock_sum.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # Tests: RSS fetch
@@ -758,6 +918,40 @@ class TestFetchNewEpisodes:
 # Tests: Audio download
 # ---------------------------------------------------------------------------
 
+class TestFetchEpisodesPublishedBetween:
+    def test_filters_by_range_and_processed(self, sample_show, sample_episode):
+        def _ep(episode_id, day):
+            return dataclasses.replace(sample_episode, episode_id=episode_id,
+                                       published_at=datetime(2026, 2, day, 12, tzinfo=timezone.utc))
+        feed = [_ep("after", 21), _ep("in", 20), _ep("done", 19), _ep("first", 18), _ep("before", 17)]
+        rss_cache = {sample_show.podcast_url: "https://rss.example.com"}
+        with patch("src.fetchers.podcast._parse_rss_feed", return_value=feed):
+            result = fetch_episodes_published_between(
+                sample_show, {"done"},
+                datetime(2026, 2, 18, tzinfo=timezone.utc), datetime(2026, 2, 21, tzinfo=timezone.utc),
+                rss_cache,
+            )
+
+        assert [ep.episode_id for ep in result] == ["in", "first"]
+
+
+class TestFindEpisode:
+    def test_finds_old_episode_by_id(self, sample_show, sample_episode):
+        old = dataclasses.replace(sample_episode, episode_id="old", published_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        rss_cache = {}
+        with patch("src.fetchers.podcast.resolve_rss_feed", return_value="https://rss.example.com"):
+            with patch("src.fetchers.podcast._parse_rss_feed", return_value=[sample_episode, old]) as mock_parse:
+                assert find_episode(sample_show, "old", rss_cache) == old
+
+        mock_parse.assert_called_once_with("https://rss.example.com", sample_show)
+        assert rss_cache == {sample_show.podcast_url: "https://rss.example.com"}
+
+    def test_missing_episode_returns_none(self, sample_show, sample_episode):
+        rss_cache = {sample_show.podcast_url: "https://rss.example.com"}
+        with patch("src.fetchers.podcast._parse_rss_feed", return_value=[sample_episode]):
+            assert find_episode(sample_show, "nope", rss_cache) is None
+
+
 class TestHasFfmpeg:
     def test_returns_true_when_available(self):
         mock_result = MagicMock(returncode=0)
@@ -885,6 +1079,142 @@ class TestDownloadDirect:
                     _download_direct("https://cdn.example.com/ep.mp3", output_path, max_bytes=1_000_000)
 
 
+class TestDownloadDirectResume:
+    def _resp(self, data, status):
+        mock_resp = MagicMock()
+        mock_resp.status = status
+        mock_resp.read.side_effect = [data, b""]
+        mock_resp.__enter__ = lambda s: s
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        return mock_resp
+
+    def test_resumes_partial_file_with_range(self, tmp_path):
+        output_path = tmp_path / "episode.part"
+        output_path.write_bytes(b"first-half|")
+        requests_seen = []
+
+        def fake_urlopen(req, timeout):
+            requests_seen.append(req)
+            return self._resp(b"second-half", 206)
+
+        with patch("urllib.request.urlopen", side_effect=fake_urlopen):
+            _download_direct("https://cdn.example.com/ep.mp3", str(output_path), max_bytes=1_000_000)
+
+        assert requests_seen[0].get_header("Range") == "bytes=11-999999"
+        assert output_path.read_bytes() == b"first-half|second-half"
+
+    def test_restarts_when_server_ignores_range(self, tmp_path):
+        output_path = tmp_path / "episode.part"
+        output_path.write_bytes(b"stale")
+
+        with patch("urllib.request.urlopen", return_value=self._resp(b"whole file", 200)):
+            _download_direct("https://cdn.example.com/ep.mp3", str(output_path), max_bytes=1_000_000)
+
+        assert output_path.read_bytes() == b"whole file"
+
+    def test_416_with_partial_treated_as_complete(self, tmp_path):
+        from urllib.error import HTTPError
+        output_path = tmp_path / "episode.part"
+        output_path.write_bytes(b"everything")
+
+        with patch("urllib.request.urlopen",
+                   side_effect=HTTPError(url="x", code=416, msg="Range", hdrs={}, fp=None)):
+            _download_direct("https://cdn.example.com/ep.mp3", str(output_path), max_bytes=1_000_000)
+
+        assert output_path.read_bytes() == b"everything"
+
+    def test_already_at_cap_skips_request(self, tmp_path):
+        output_path = tmp_path / "episode.part"
+        output_path.write_bytes(b"x" * 10)
+
+        with patch("urllib.request.urlopen") as mock_open_url:
+            _download_direct("https://cdn.example.com/ep.mp3", str(output_path), max_bytes=10)
+
+        mock_open_url.assert_not_called()
+
+    def test_mid_stream_drop_resumes_on_next_attempt(self, tmp_path):
+        output_path = tmp_path / "episode.part"
+        dropping = MagicMock()
+        dropping.status = 206
+        dropping.read.side_effect = [b"part-one|", ConnectionResetError("reset")]
+        dropping.__enter__ = lambda s: s
+        dropping.__exit__ = MagicMock(return_value=False)
+        ranges = []
+
+        def fake_urlopen(req, timeout):
+            ranges.append(req.get_header("Range"))
+            return dropping if len(ranges) == 1 else self._resp(b"part-two", 206)
+
+        with patch("urllib.request.urlopen", side_effect=fake_urlopen):
+            with patch("time.sleep"):
+                _download_direct("https://cdn.example.com/ep.mp3", str(output_path), max_bytes=1_000_000)
+
+        assert ranges == ["bytes=0-999999", "bytes=9-999999"]
+        assert output_path.read_bytes() == b"part-one|part-two"
+
+
+class TestDownloadAudioCached:
+    def test_returns_cached_file_without_download(self, tmp_path):
+        from src.audio_cache import audio_cache_paths
+        final, _ = audio_cache_paths(tmp_path, "https://cdn.example.com/ep.mp3", 60)
+        final.write_bytes(b"cached audio")
+
+        with patch("src.fetchers.podcast._has_ffmpeg") as mock_has:
+            with patch("src.fetchers.podcast._download_direct") as mock_direct:
+                path = _download_audio_cached("https://cdn.example.com/ep.mp3", tmp_path, 60)
+
+        assert path == str(final)
+        mock_has.assert_not_called()
+        mock_direct.assert_not_called()
+
+    def test_ffmpeg_output_promoted_to_cache(self, tmp_path):
+        def fake_ffmpeg(url, output_path, max_seconds):
+            with open(output_path, "wb") as f:
+                f.write(b"clipped")
+            return True
+
+        with patch("src.fetchers.podcast._has_ffmpeg", return_value=True):
+            with patch("src.fetchers.podcast._download_with_ffmpeg", side_effect=fake_ffmpeg):
+                path = _download_audio_cached("https://cdn.example.com/ep.mp3", tmp_path, 60)
+
+        assert path.endswith(".60m.mp3")
+        assert open(path, "rb").read() == b"clipped"
+        assert not list(tmp_path.glob("*.ffmpeg.mp3"))
+
+    def test_partial_download_resumed_instead_of_ffmpeg(self, tmp_path):
+        from src.audio_cache import audio_cache_paths
+        final, partial = audio_cache_paths(tmp_path, "https://cdn.example.com/ep.mp3", 60)
+        partial.write_bytes(b"half")
+
+        with patch("src.fetchers.podcast._has_ffmpeg", return_value=True) as mock_has:
+            with patch("src.fetchers.podcast._download_direct") as mock_direct:
+                path = _download_audio_cached("https://cdn.example.com/ep.mp3", tmp_path, 60)
+
+        mock_has.assert_not_called()
+        mock_direct.assert_called_once_with(
+            "https://cdn.example.com/ep.mp3", str(partial), 60 * 1024 * 1024,
+        )
+        assert path == str(final)
+        assert final.exists() and not partial.exists()
+
+    def test_failed_direct_download_keeps_partial(self, tmp_path):
+        from src.audio_cache import audio_cache_paths
+        final, partial = audio_cache_paths(tmp_path, "https://cdn.example.com/ep.mp3", 60)
+
+        def failing_direct(url, output_path, max_bytes):
+            with open(output_path, "wb") as f:
+                f.write(b"some bytes")
+            raise AudioDownloadError("Network error")
+
+        with patch("src.fetchers.podcast._has_ffmpeg", return_value=False):
+            with patch("src.fetchers.podcast._download_direct", side_effect=failing_direct):
+                with pytest.raises(AudioDownloadError):
+                    _download_audio_cached("https://cdn.example.com/ep.mp3", tmp_path, 60)
+
+        assert partial.read_bytes() == b"some bytes"
+        assert not final.exists()
+
+
 # ---------------------------------------------------------------------------
 # Tests: Gemini transcription
 # ---------------------------------------------------------------------------
@@ -975,6 +1305,107 @@ class TestTranscribeAndSummarize:
         # File should be deleted after use
         mock_client.files.delete.assert_called_once_with(name="files/abc")
 
+    @pytest.mark.parametrize("duration, expected_model, expected_tokens", [
+        (1200, "gemini-2.5-flash-lite", 1024),
+        (3600, "gemini-2.0-flash", 4096),
+    ])
+    def test_model_route_by_duration(self, sample_episode, tmp_path, duration, expected_model, expected_tokens):
+        audio_path = str(tmp_path / "episode.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(b"fake audio data")
+        episode = dataclasses.replace(sample_episode, duration_seconds=duration)
+        routes = (
+            ModelRoute(name="short", max_minutes=30, model="gemini-2.5-flash-lite", max_output_tokens=1024),
+            ModelRoute(name="long", max_output_tokens=4096),
+        )
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        with patch("src.fetchers.podcast._wait_for_file_active"):
+            with patch("time.sleep"):
+                _transcribe_and_summarize(
+                    audio_path=audio_path,
+                    episode=episode,
+                    client=mock_client,
+                    model="gemini-2.0-flash",
+                    max_audio_minutes=60,
+                    routes=routes,
+                )
+
+        request = mock_client.models.generate_content.call_args.kwargs
+        assert request["model"] == expected_model
+        assert request["config"].max_output_tokens == expected_tokens
+
+    def test_open_breaker_skips_upload(self, sample_episode, tmp_path):
+        audio_path = str(tmp_path / "episode.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(b"fake audio data")
+        configure_circuit_breaker(failure_threshold=1, cooldown_seconds=60)
+        circuit_breaker().record_failure(Exception("503 UNAVAILABLE"))
+        mock_client = MagicMock()
+
+        with pytest.raises(CircuitOpenError):
+            _transcribe_and_summarize(
+                audio_path=audio_path, episode=sample_episode, client=mock_client,
+                model="gemini-2.0-flash", max_audio_minutes=60,
+            )
+
+        mock_client.files.upload.assert_not_called()
+
+    def test_oversized_file_rejected_before_upload(self, sample_episode, tmp_path):
+        audio_path = str(tmp_path / "episode.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(b"fake audio data")
+        mock_client = MagicMock()
+
+        with patch("src.fetchers.podcast._MAX_UPLOAD_BYTES", 4):
+            with pytest.raises(TranscriptionError, match="upload limit"):
+                _transcribe_and_summarize(
+                    audio_path=audio_path, episode=sample_episode, client=mock_client,
+                    model="gemini-2.0-flash", max_audio_minutes=60,
+                )
+
+        mock_client.files.upload.assert_not_called()
+
+    def test_call_recorded_in_usage_ledger(self, sample_episode, tmp_path):
+        audio_path = str(tmp_path / "episode.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(b"fake audio data")
+        response = MagicMock(text="Summary")
+        response.usage_metadata.prompt_token_count = 115_000
+        response.usage_metadata.candidates_token_count = 900
+        response.usage_metadata.thoughts_token_count = 100
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = response
+
+        with patch("src.fetchers.podcast._wait_for_file_active"):
+            with patch("time.sleep"):
+                _transcribe_and_summarize(
+                    audio_path=audio_path, episode=sample_episode, client=mock_client,
+                    model="gemini-2.0-flash", max_audio_minutes=60,
+                )
+
+        [record] = usage_ledger().records
+        assert (record.model, record.prompt_tokens, record.output_tokens) == ("gemini-2.0-flash", 115_000, 1000)
+
+    def test_server_error_storm_raises_circuit_open(self, sample_episode, tmp_path):
+        audio_path = str(tmp_path / "episode.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(b"fake audio data")
+        configure_circuit_breaker(failure_threshold=2, cooldown_seconds=60)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = Exception("503 UNAVAILABLE")
+
+        with patch("src.fetchers.podcast._wait_for_file_active"):
+            with patch("time.sleep"):
+                with pytest.raises(CircuitOpenError):
+                    _transcribe_and_summarize(
+                        audio_path=audio_path, episode=sample_episode, client=mock_client,
+                        model="gemini-2.0-flash", max_audio_minutes=60,
+                    )
+
+        assert mock_client.models.generate_content.call_count == 2
+
     def test_raises_transcription_error_on_auth_failure(self, sample_episode, tmp_path):
         audio_path = str(tmp_path / "episode.mp3")
         with open(audio_path, "wb") as f:
@@ -1105,11 +1536,343 @@ class TestTranscribeAndSummarize:
         assert "15m" in prompt
 
 
+class TestUploadReuse:
+    @pytest.fixture
+    def audio_path(self, tmp_path):
+        path = tmp_path / "episode.mp3"
+        path.write_bytes(b"fake audio")
+        return str(path)
+
+    def _client(self):
+        mock_client = MagicMock()
+        uploaded = MagicMock()
+        uploaded.name = "files/new"
+        mock_client.files.upload.return_value = uploaded
+        return mock_client
+
+    def _run(self, audio_path, episode, client, upload_cache=None):
+        with patch("src.fetchers.podcast._wait_for_file_active"):
+            with patch("time.sleep"):
+                return _transcribe_and_summarize(
+                    audio_path=audio_path,
+                    episode=episode,
+                    client=client,
+                    model="gemini-2.0-flash",
+                    max_audio_minutes=60,
+                    upload_cache=upload_cache,
+                )
+
+    def test_response_cache_hit_skips_upload(self, sample_episode, audio_path, tmp_path):
+        enable_response_cache(tmp_path / "responses")
+        client = self._client()
+        client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        first = self._run(audio_path, sample_episode, client)
+        second = self._run(audio_path, sample_episode, client)
+
+        assert first == second == "Summary"
+        client.files.upload.assert_called_once()
+        assert client.models.generate_content.call_count == 1
+
+    def test_prefix_caching_sends_rules_as_system_instruction(self, sample_episode, audio_path):
+        enable_prefix_caching()
+        client = self._client()
+        client.caches.create.side_effect = Exception("too small to cache")
+        client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        assert self._run(audio_path, sample_episode, client) == "Summary"
+
+        kwargs = client.models.generate_content.call_args.kwargs
+        assert kwargs["config"].system_instruction == PODCAST_SYSTEM_INSTRUCTION
+        prompt = kwargs["contents"][1]
+        assert "CRITICAL ACCURACY RULES" not in prompt
+        assert "Episode title: Test Episode" in prompt
+        assert "Summary language: English" in prompt
+
+    def test_upload_reused_across_retries(self, sample_episode, audio_path):
+        client = self._client()
+        client.models.generate_content.side_effect = [
+            Exception("503 Service Unavailable"), MagicMock(text="Summary"),
+        ]
+
+        result = self._run(audio_path, sample_episode, client)
+
+        assert result == "Summary"
+        client.files.upload.assert_called_once()
+        client.files.delete.assert_called_once_with(name="files/new")
+
+    def test_upload_that_never_becomes_active_is_deleted(self, sample_episode, audio_path):
+        client = self._client()
+        upload_cache = {}
+
+        with patch("src.fetchers.podcast._wait_for_file_active",
+                   side_effect=TranscriptionError("Gemini file processing timed out")):
+            with patch("time.sleep"):
+                with pytest.raises(TranscriptionError, match="timed out"):
+                    _transcribe_and_summarize(
+                        audio_path=audio_path, episode=sample_episode, client=client,
+                        model="gemini-2.0-flash", max_audio_minutes=60, upload_cache=upload_cache,
+                    )
+
+        # Every attempt's upload is deleted once it fails to become ACTIVE
+        assert client.files.delete.call_count == client.files.upload.call_count
+        assert client.files.delete.call_args.kwargs == {"name": "files/new"}
+        assert upload_cache == {}
+
+    def test_failure_with_cache_keeps_upload_for_next_run(self, sample_episode, audio_path):
+        client = self._client()
+        client.models.generate_content.side_effect = Exception("503 Service Unavailable")
+        upload_cache = {}
+
+        with pytest.raises(TranscriptionError):
+            self._run(audio_path, sample_episode, client, upload_cache)
+
+        client.files.upload.assert_called_once()
+        client.files.delete.assert_not_called()
+        (entry,) = upload_cache.values()
+        assert entry["name"] == "files/new"
+        assert "uploaded_at" in entry
+
+    def test_cached_upload_reused_and_removed_on_success(self, sample_episode, audio_path):
+        from src.fetchers.podcast import _file_content_hash
+        content_hash = _file_content_hash(audio_path)
+        upload_cache = {content_hash: {"name": "files/old", "uploaded_at": "2026-01-01T00:00:00+00:00"}}
+        client = self._client()
+        cached = MagicMock(state="ACTIVE")
+        cached.name = "files/old"
+        client.files.get.return_value = cached
+        client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        result = self._run(audio_path, sample_episode, client, upload_cache)
+
+        assert result == "Summary"
+        client.files.upload.assert_not_called()
+        assert client.models.generate_content.call_args[1]["contents"][0] is cached
+        client.files.delete.assert_called_once_with(name="files/old")
+        assert upload_cache == {}
+
+    def test_unavailable_cached_upload_replaced(self, sample_episode, audio_path):
+        from src.fetchers.podcast import _file_content_hash
+        content_hash = _file_content_hash(audio_path)
+        upload_cache = {content_hash: {"name": "files/gone"}}
+        client = self._client()
+        client.files.get.side_effect = Exception("404 NOT_FOUND")
+        client.models.generate_content.side_effect = Exception("503 Service Unavailable")
+
+        with pytest.raises(TranscriptionError):
+            self._run(audio_path, sample_episode, client, upload_cache)
+
+        client.files.upload.assert_called_once()
+        assert upload_cache[content_hash]["name"] == "files/new"
+
+    def test_remote_file_not_found_triggers_reupload(self, sample_episode, audio_path):
+        client = self._client()
+        client.models.generate_content.side_effect = [
+            Exception("404 NOT_FOUND: file expired"), MagicMock(text="Summary"),
+        ]
+
+        result = self._run(audio_path, sample_episode, client, upload_cache={})
+
+        assert result == "Summary"
+        assert client.files.upload.call_count == 2
+
+
+class TestChooseSplitPoints:
+    def test_short_audio_not_split(self):
+        assert _choose_split_points([100.0], total_seconds=1200, target_seconds=1200) == []
+
+    def test_snaps_to_nearest_silence_in_window(self):
+        points = _choose_split_points([1150.0, 1230.0, 2500.0], total_seconds=3600, target_seconds=1200)
+        # 1230 is 30s from the 1200 ideal; next ideal is 1230+1200=2430 → 2500 within ±240
+        assert points == [1230.0, 2500.0]
+
+    def test_hard_cut_when_no_silence_nearby(self):
+        points = _choose_split_points([], total_seconds=3000, target_seconds=1200)
+        assert points == [1200, 2400]
+
+    def test_tiny_trailing_segment_merged(self):
+        points = _choose_split_points([], total_seconds=2430, target_seconds=1200)
+        assert points == [1200]
+
+
+class TestDetectSilences:
+    def test_parses_midpoints_from_stderr(self):
+        stderr = (
+            "[silencedetect @ 0x1] silence_start: 10.5\n"
+            "[silencedetect @ 0x1] silence_end: 11.5 | silence_duration: 1\n"
+            "[silencedetect @ 0x1] silence_start: -0.01\n"
+            "[silencedetect @ 0x1] silence_end: 2 | silence_duration: 2\n"
+        )
+        with patch("subprocess.run", return_value=MagicMock(returncode=0, stderr=stderr)):
+            assert _detect_silences("a.mp3") == [11.0, 1.0]
+
+    def test_ffmpeg_missing_returns_empty(self):
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            assert _detect_silences("a.mp3") == []
+
+
+class TestSplitAudio:
+    def test_cuts_each_segment(self, tmp_path):
+        def fake_run(cmd, **kwargs):
+            with open(cmd[-1], "wb") as f:
+                f.write(b"seg")
+            return MagicMock(returncode=0, stderr="")
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            segments = _split_audio("a.mp3", [600.0], 1500, str(tmp_path))
+
+        assert [(start, end) for _, start, end in segments] == [(0.0, 600.0), (600.0, 1500.0)]
+        assert mock_run.call_count == 2
+        second_cmd = mock_run.call_args_list[1][0][0]
+        assert second_cmd[second_cmd.index("-ss") + 1] == "600.00"
+        assert second_cmd[second_cmd.index("-t") + 1] == "900.00"
+
+    def test_failed_cut_returns_empty(self, tmp_path):
+        with patch("subprocess.run", return_value=MagicMock(returncode=1, stderr="boom")):
+            assert _split_audio("a.mp3", [600.0], 1500, str(tmp_path)) == []
+
+
+class TestFormatTimestamp:
+    def test_minutes(self):
+        assert _format_timestamp(125) == "2:05"
+
+    def test_hours(self):
+        assert _format_timestamp(3725.4) == "1:02:05"
+
+
+class TestTranscribeInChunks:
+    @pytest.fixture
+    def long_episode(self):
+        return EpisodeInfo(
+            episode_id="long", title="Long Interview", show_name="Hard Fork",
+            show_url="https://spotify", episode_url="https://ep",
+            audio_url="https://cdn/long.mp3", category="AI",
+            published_at=datetime.now(timezone.utc), duration_seconds=3 * 3600,
+            language="es",
+        )
+
+    def test_map_then_reduce(self, long_episode):
+        chunking = ChunkingOptions(chunk_minutes=60, max_audio_minutes=240, max_parallel=3)
+        segments = [("s0.mp3", 0.0, 3600.0), ("s1.mp3", 3600.0, 7200.0), ("s2.mp3", 7200.0, 10800.0)]
+        prompts = {}
+
+        def fake_generate(path, prompt, *args, **kwargs):
+            prompts[path] = prompt
+            return f"* notes for {path}"
+
+        with patch("src.fetchers.podcast._detect_silences", return_value=[3590.0]):
+            with patch("src.fetchers.podcast._split_audio", return_value=segments) as mock_split:
+                with patch("src.fetchers.podcast._generate_from_audio", side_effect=fake_generate):
+                    with patch("src.fetchers.podcast.generate_text", return_value="## The Hook\nFinal") as mock_reduce:
+                        result = _transcribe_in_chunks(
+                            "full.mp3", long_episode, MagicMock(), "gemini-2.5-flash", chunking,
+                        )
+
+        assert result == "## The Hook\nFinal"
+        assert mock_split.call_args[0][1] == [3590.0, 7190.0]
+        assert "part 2 of 3" in prompts["s1.mp3"]
+        assert "1:00:00 to 2:00:00" in prompts["s1.mp3"]
+        reduce_prompt = mock_reduce.call_args[0][2]
+        assert reduce_prompt.index("notes for s0.mp3") < reduce_prompt.index("notes for s2.mp3")
+        assert "## The Hook" in reduce_prompt and "## The So What?" in reduce_prompt
+        assert "Spanish" in reduce_prompt
+        assert "3h 0m" in reduce_prompt
+
+    def test_prefix_caching_shares_rules_across_segments_and_reduce(self, long_episode):
+        enable_prefix_caching()
+        chunking = ChunkingOptions(chunk_minutes=60, max_audio_minutes=240, max_parallel=2)
+        segments = [("s0.mp3", 0.0, 3600.0), ("s1.mp3", 3600.0, 7200.0)]
+        calls = {}
+
+        def fake_generate(path, prompt, *args, system_instruction=None):
+            calls[path] = (prompt, system_instruction)
+            return f"* notes for {path}"
+
+        with patch("src.fetchers.podcast._detect_silences", return_value=[]):
+            with patch("src.fetchers.podcast._split_audio", return_value=segments):
+                with patch("src.fetchers.podcast._generate_from_audio", side_effect=fake_generate):
+                    with patch("src.fetchers.podcast.generate_text", return_value="Final") as mock_reduce:
+                        _transcribe_in_chunks("full.mp3", long_episode, MagicMock(), "gemini-2.5-flash", chunking)
+
+        prompt, system_instruction = calls["s1.mp3"]
+        assert system_instruction == PODCAST_SYSTEM_INSTRUCTION
+        assert prompt.startswith("Task: SEGMENT NOTES\nSegment 2 of 2")
+        assert "CRITICAL ACCURACY RULES" not in prompt
+        reduce_prompt = mock_reduce.call_args[0][2]
+        assert mock_reduce.call_args.kwargs["system_instruction"] == PODCAST_SYSTEM_INSTRUCTION
+        assert reduce_prompt.startswith("Task: EPISODE MERGE NOTES")
+        assert "CRITICAL ACCURACY RULES" not in reduce_prompt
+        assert "* notes for s0.mp3" in reduce_prompt
+
+    def test_shared_prefix_is_cacheable(self):
+        assert estimate_tokens(PODCAST_SYSTEM_INSTRUCTION) >= prefix_cache_min_tokens("gemini-2.5-flash")
+        for task in ("EPISODE SUMMARY", "SEGMENT NOTES", "EPISODE MERGE NOTES"):
+            assert f"[TASK: {task}]" in PODCAST_SYSTEM_INSTRUCTION
+
+    def test_falls_back_to_single_call_when_split_fails(self, long_episode):
+        chunking = ChunkingOptions(chunk_minutes=60, max_audio_minutes=240, max_parallel=3)
+        with patch("src.fetchers.podcast._detect_silences", return_value=[]):
+            with patch("src.fetchers.podcast._split_audio", return_value=[]):
+                with patch("src.fetchers.podcast._transcribe_and_summarize", return_value="Whole") as mock_ts:
+                    result = _transcribe_in_chunks(
+                        "full.mp3", long_episode, MagicMock(), "gemini-2.5-flash", chunking,
+                    )
+
+        assert result == "Whole"
+        assert mock_ts.call_args[1]["max_audio_minutes"] == 240
+
+    def test_segment_failure_propagates(self, long_episode):
+        chunking = ChunkingOptions(chunk_minutes=60, max_audio_minutes=240, max_parallel=2)
+        segments = [("s0.mp3", 0.0, 3600.0), ("s1.mp3", 3600.0, 7200.0)]
+        with patch("src.fetchers.podcast._detect_silences", return_value=[]):
+            with patch("src.fetchers.podcast._split_audio", return_value=segments):
+                with patch("src.fetchers.podcast._generate_from_audio",
+                           side_effect=TranscriptionError("segment failed")):
+                    with patch("src.fetchers.podcast.generate_text") as mock_reduce:
+                        with pytest.raises(TranscriptionError):
+                            _transcribe_in_chunks(
+                                "full.mp3", long_episode, MagicMock(), "gemini-2.5-flash", chunking,
+                            )
+        mock_reduce.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Tests: download_and_transcribe (integration of download + transcription)
 # ---------------------------------------------------------------------------
 
 class TestDownloadAndTranscribe:
+    def test_published_transcript_skips_audio(self, sample_episode):
+        episode = dataclasses.replace(
+            sample_episode, transcript_url="https://x/t.vtt", transcript_format="vtt"
+        )
+        with patch("src.fetchers.podcast._summarize_from_transcript", return_value="From text"):
+            with patch("src.fetchers.podcast._has_ffmpeg") as mock_has:
+                result = download_and_transcribe(
+                    episode=episode,
+                    gemini_client=MagicMock(),
+                    gemini_model="gemini-2.0-flash",
+                    max_audio_minutes=60,
+                )
+        assert result == "From text"
+        mock_has.assert_not_called()
+
+    def test_unusable_transcript_falls_back_to_audio(self, sample_episode):
+        episode = dataclasses.replace(
+            sample_episode, transcript_url="https://x/t.vtt", transcript_format="vtt"
+        )
+        with patch("src.fetchers.podcast._summarize_from_transcript", return_value=None):
+            with patch("src.fetchers.podcast._has_ffmpeg", return_value=False):
+                with patch("src.fetchers.podcast._download_direct") as mock_direct:
+                    with patch("src.fetchers.podcast._transcribe_and_summarize", return_value="Audio"):
+                        result = download_and_transcribe(
+                            episode=episode,
+                            gemini_client=MagicMock(),
+                            gemini_model="gemini-2.0-flash",
+                            max_audio_minutes=60,
+                        )
+        assert result == "Audio"
+        mock_direct.assert_called_once()
+
     def test_uses_ffmpeg_when_available(self, sample_episode):
         with patch("src.fetchers.podcast._has_ffmpeg", return_value=True):
             with patch("src.fetchers.podcast._download_with_ffmpeg", return_value=True) as mock_ffmpeg:
@@ -1186,6 +1949,117 @@ class TestDownloadAndTranscribe:
         assert not os.path.exists(created_tmpdir)
 
 
+    def test_cache_dir_used_instead_of_temp_dir(self, sample_episode, tmp_path):
+        with patch("src.fetchers.podcast._download_audio_cached",
+                   return_value=str(tmp_path / "a.mp3")) as mock_cached:
+            with patch("src.fetchers.podcast._download_audio") as mock_tmp:
+                with patch("src.fetchers.podcast._transcribe_and_summarize",
+                           return_value="Summary") as mock_ts:
+                    result = download_and_transcribe(
+                        episode=sample_episode,
+                        gemini_client=MagicMock(),
+                        gemini_model="gemini-2.0-flash",
+                        max_audio_minutes=60,
+                        audio_cache_dir=tmp_path,
+                    )
+
+        assert result == "Summary"
+        mock_cached.assert_called_once_with(sample_episode.audio_url, tmp_path, 60)
+        mock_tmp.assert_not_called()
+        assert mock_ts.call_args[1]["audio_path"] == str(tmp_path / "a.mp3")
+
+
+    def test_upload_cache_passed_through(self, sample_episode, tmp_path):
+        upload_cache = {}
+        with patch("src.fetchers.podcast._download_audio_cached", return_value="a.mp3"):
+            with patch("src.fetchers.podcast._transcribe_and_summarize",
+                       return_value="Summary") as mock_ts:
+                download_and_transcribe(
+                    episode=sample_episode,
+                    gemini_client=MagicMock(),
+                    gemini_model="gemini-2.0-flash",
+                    max_audio_minutes=60,
+                    audio_cache_dir=tmp_path,
+                    upload_cache=upload_cache,
+                )
+
+        assert mock_ts.call_args[1]["upload_cache"] is upload_cache
+
+
+    def test_long_episode_uses_chunked_mode_and_cap(self, sample_episode, tmp_path):
+        long_episode = dataclasses.replace(sample_episode, duration_seconds=3 * 3600)
+        chunking = ChunkingOptions(chunk_minutes=20, max_audio_minutes=240, max_parallel=3)
+        with patch("src.fetchers.podcast._has_ffmpeg", return_value=True):
+            with patch("src.fetchers.podcast._download_audio_cached", return_value="a.mp3") as mock_dl:
+                with patch("src.fetchers.podcast._transcribe_in_chunks", return_value="Merged") as mock_chunks:
+                    result = download_and_transcribe(
+                        episode=long_episode,
+                        gemini_client=MagicMock(),
+                        gemini_model="gemini-2.0-flash",
+                        max_audio_minutes=60,
+                        audio_cache_dir=tmp_path,
+                        chunking=chunking,
+                    )
+
+        assert result == "Merged"
+        assert mock_dl.call_args[0][2] == 240
+        assert mock_chunks.call_args[1]["chunking"] is chunking
+
+    def test_short_episode_ignores_chunking(self, sample_episode, tmp_path):
+        chunking = ChunkingOptions(chunk_minutes=90, max_audio_minutes=240, max_parallel=3)
+        with patch("src.fetchers.podcast._has_ffmpeg", return_value=True):
+            with patch("src.fetchers.podcast._download_audio_cached", return_value="a.mp3") as mock_dl:
+                with patch("src.fetchers.podcast._transcribe_in_chunks") as mock_chunks:
+                    with patch("src.fetchers.podcast._transcribe_and_summarize", return_value="Single"):
+                        result = download_and_transcribe(
+                            episode=sample_episode,
+                            gemini_client=MagicMock(),
+                            gemini_model="gemini-2.0-flash",
+                            max_audio_minutes=60,
+                            audio_cache_dir=tmp_path,
+                            chunking=chunking,
+                        )
+
+        assert result == "Single"
+        assert mock_dl.call_args[0][2] == 60
+        mock_chunks.assert_not_called()
+
+    def test_preflight_rejects_oversized_audio_before_download(self, sample_episode, tmp_path):
+        # 60 min at ~32 tokens/s is ~115k tokens
+        with patch("src.fetchers.podcast._download_audio_cached") as mock_dl:
+            with pytest.raises(TranscriptionError, match="max_input_tokens"):
+                download_and_transcribe(
+                    episode=sample_episode,
+                    gemini_client=MagicMock(),
+                    gemini_model="gemini-2.0-flash",
+                    max_audio_minutes=60,
+                    audio_cache_dir=tmp_path,
+                    max_input_tokens=100_000,
+                )
+
+        mock_dl.assert_not_called()
+
+    def test_preflight_chunks_audio_of_unknown_length(self, sample_episode, tmp_path):
+        # No duration in the feed: the whole max_audio_minutes clip is assumed
+        episode = dataclasses.replace(sample_episode, duration_seconds=0)
+        chunking = ChunkingOptions(chunk_minutes=30, max_audio_minutes=240, max_parallel=3)
+        with patch("src.fetchers.podcast._has_ffmpeg", return_value=True):
+            with patch("src.fetchers.podcast._download_audio_cached", return_value="a.mp3"):
+                with patch("src.fetchers.podcast._transcribe_in_chunks", return_value="Merged") as mock_chunks:
+                    result = download_and_transcribe(
+                        episode=episode,
+                        gemini_client=MagicMock(),
+                        gemini_model="gemini-2.0-flash",
+                        max_audio_minutes=60,
+                        audio_cache_dir=tmp_path,
+                        chunking=chunking,
+                        max_input_tokens=100_000,
+                    )
+
+        assert result == "Merged"
+        mock_chunks.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Tests: uncovered error paths in podcast.py
 # ---------------------------------------------------------------------------
@@ -0,0 +1,91 @@
+"""Tests for the content-addressed Gemini response cache."""
+
+from __future__ import annotations
+
+import os
+import time
+
+from src.response_cache import (
+    RESPONSE_CACHE_TTL_DAYS,
+    disable_response_cache,
+    enable_response_cache,
+    get_cached_response,
+    prune_response_cache,
+    response_cache_key,
+    store_response,
+)
+
+
+class TestResponseCacheKey:
+    def test_stable_for_same_input(self):
+        assert response_cache_key("m", "prompt") == response_cache_key("m", "prompt")
+
+    def test_model_is_part_of_key(self):
+        assert response_cache_key("a", "prompt") != response_cache_key("b", "prompt")
+
+    def test_parts_are_delimited(self):
+        assert response_cache_key("m", "ab", "c") != response_cache_key("m", "a", "bc")
+
+    def test_prompt_version_is_part_of_key(self, monkeypatch):
+        before = response_cache_key("m", "prompt")
+        monkeypatch.setattr("src.response_cache.PROMPT_VERSION", 99)
+        assert response_cache_key("m", "prompt") != before
+
+
+class TestGetAndStore:
+    def test_disabled_by_default(self, tmp_path):
+        store_response("k", "text")
+        assert get_cached_response("k") is None
+        assert not any(tmp_path.iterdir())
+
+    def test_round_trip(self, tmp_path):
+        enable_response_cache(tmp_path / "responses")
+        store_response("k", "## Summary ✓")
+        assert get_cached_response("k") == "## Summary ✓"
+        assert [p.name for p in (tmp_path / "responses").iterdir()] == ["k.txt"]
+
+    def test_miss_returns_none(self, tmp_path):
+        enable_response_cache(tmp_path)
+        assert get_cached_response("missing") is None
+
+    def test_empty_text_not_stored(self, tmp_path):
+        enable_response_cache(tmp_path)
+        store_response("k", "")
+        assert get_cached_response("k") is None
+
+    def test_hit_touches_file(self, tmp_path):
+        enable_response_cache(tmp_path)
+        store_response("k", "text")
+        old = time.time() - 3600
+        os.utime(tmp_path / "k.txt", (old, old))
+        get_cached_response("k")
+        assert (tmp_path / "k.txt").stat().st_mtime > old
+
+    def test_disable_stops_serving(self, tmp_path):
+        enable_response_cache(tmp_path)
+        store_response("k", "text")
+        disable_response_cache()
+        assert get_cached_response("k") is None
+
+    def test_write_failure_is_not_fatal(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        enable_response_cache(blocker / "responses")
+        store_response("k", "text")  # mkdir fails under a regular file
+        assert get_cached_response("k") is None
+
+
+class TestPruneResponseCache:
+    def test_removes_expired(self, tmp_path):
+        (tmp_path / "old.txt").write_text("x")
+        (tmp_path / "new.txt").write_text("x")
+        expired = time.time() - (RESPONSE_CACHE_TTL_DAYS + 1) * 86400
+        os.utime(tmp_path / "old.txt", (expired, expired))
+
+        removed = prune_response_cache(tmp_path, max_bytes=10_000)
+
+        assert removed == ["old.txt"]
+        assert (tmp_path / "new.txt").exists()
+
+    def test_missing_dir(self, tmp_path):
+        assert prune_response_cache(tmp_path / "nope", max_bytes=1) == []
@@ -0,0 +1,199 @@
+"""Tests for quota-aware work planning."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config import Category, Config, PodcastShow, Settings, YouTubeSource
+from src.fetchers.podcast import ChunkingOptions, EpisodeInfo
+from src.fetchers.youtube import VideoInfo
+from src.scheduler import (
+    PODCAST,
+    YOUTUBE,
+    DurationModel,
+    RunDeadline,
+    episode_work_item,
+    plan_work,
+    run_deadline,
+    source_priority,
+    video_work_item,
+)
+
+NOW = datetime(2026, 2, 20, 14, 0, tzinfo=timezone.utc)
+
+
+def _video(video_id="v1", hours_ago=1, transcript="word " * 400, duration=600):
+    return VideoInfo(
+        video_id=video_id, title=f"Video {video_id}", url=f"https://youtube.com/watch?v={video_id}",
+        channel_name="Channel", category="AI", upload_date=NOW - timedelta(hours=hours_ago),
+        duration_seconds=duration, transcript=transcript,
+    )
+
+
+def _episode(episode_id="e1", hours_ago=1, duration=3600, transcript_url=None):
+    return EpisodeInfo(
+        episode_id=episode_id, title=f"Episode {episode_id}", show_name="Show",
+        show_url="https://open.spotify.com/show/x", episode_url=f"https://x/{episode_id}",
+        audio_url=f"https://x/{episode_id}.mp3", category="AI",
+        published_at=NOW - timedelta(hours=hours_ago), duration_seconds=duration,
+        transcript_url=transcript_url,
+    )
+
+
+class TestSourcePriority:
+    def test_source_and_category_priorities_add_up(self):
+        config = Config(
+            categories=[Category("AI", "#fff", priority=10), Category("News", "#000")],
+            youtube_sources=[YouTubeSource("https://yt/a", "Channel", "AI", priority=5)],
+            podcast_shows=[PodcastShow("https://pod/a", "Channel", "News", priority=-1)],
+            settings=Settings(),
+        )
+        assert source_priority(config, YOUTUBE, "Channel", "AI") == 15
+        assert source_priority(config, PODCAST, "Channel", "News") == -1
+        assert source_priority(config, YOUTUBE, "Removed channel", "Gone") == 0
+
+
+class TestCostEstimates:
+    def test_video_single_request(self):
+        work = video_work_item(_video(), priority=0)
+        assert work.requests == 1
+        assert work.tokens > 100
+
+    def test_chunked_video_counts_parts_and_reduce(self):
+        work = video_work_item(_video(transcript="word " * 4000), priority=0, chunk_tokens=2000)
+        assert work.requests == 4    # 5000 tokens → 3 parts + 1 reduce
+
+    def test_video_without_transcript_is_free(self):
+        work = video_work_item(_video(transcript=None), priority=0)
+        assert (work.requests, work.tokens) == (0, 0)
+
+    def test_pending_video_sized_from_duration(self):
+        work = video_work_item(_video(transcript=None, duration=600), priority=0, pending=True)
+        assert work.requests == 1
+        assert work.tokens >= 600 * 3
+
+    def test_metadata_only_video_sized_from_duration(self):
+        work = video_work_item(_video(transcript=None, duration=600), priority=0, metadata_only=True)
+        assert (work.requests, work.pending) == (1, False)
+        assert work.tokens >= 600 * 3
+
+    def test_audio_clipped_to_max_minutes(self):
+        long_work = episode_work_item(_episode(duration=4 * 3600), priority=0, max_audio_minutes=60)
+        hour_work = episode_work_item(_episode(duration=3600), priority=0, max_audio_minutes=60)
+        assert long_work.tokens == hour_work.tokens
+
+    def test_chunked_episode(self):
+        chunking = ChunkingOptions(chunk_minutes=20, max_audio_minutes=240, max_parallel=3)
+        work = episode_work_item(_episode(duration=3600), priority=0, max_audio_minutes=60, chunking=chunking)
+        assert work.requests == 4    # 3 segments + 1 reduce
+
+    def test_published_transcript_cheaper_than_audio(self):
+        text = episode_work_item(_episode(transcript_url="https://x/t.vtt"), priority=0, max_audio_minutes=60)
+        audio = episode_work_item(_episode(), priority=0, max_audio_minutes=60)
+        assert text.tokens < audio.tokens
+
+
+class TestPlanWork:
+    def test_orders_by_priority_then_recency(self):
+        items = [
+            video_work_item(_video("old", hours_ago=20), priority=0),
+            video_work_item(_video("new", hours_ago=1), priority=0),
+            episode_work_item(_episode("important", hours_ago=30), priority=5, max_audio_minutes=60),
+        ]
+        scheduled, deferred = plan_work(items, request_budget=10)
+        assert [w.item_id for w in scheduled] == ["important", "new", "old"]
+        assert deferred == []
+
+    def test_pending_items_first_within_priority(self):
+        items = [
+            video_work_item(_video("new", hours_ago=1), priority=0),
+            video_work_item(_video("pending", hours_ago=40), priority=0, pending=True),
+        ]
+        scheduled, _ = plan_work(items, request_budget=10)
+        assert [w.item_id for w in scheduled] == ["pending", "new"]
+
+    def test_low_priority_overflow_deferred(self):
+        items = [video_work_item(_video(f"v{i}", hours_ago=i), priority=i) for i in range(4)]
+        scheduled, deferred = plan_work(items, request_budget=2)
+        assert [w.item_id for w in scheduled] == ["v3", "v2"]
+        assert [w.item_id for w in deferred] == ["v1", "v0"]
+
+    def test_cheaper_item_fills_remaining_budget(self):
+        chunking = ChunkingOptions(chunk_minutes=20, max_audio_minutes=240, max_parallel=3)
+        big = episode_work_item(_episode(duration=3600), priority=5, max_audio_minutes=60, chunking=chunking)
+        small = video_work_item(_video(), priority=0)
+        scheduled, deferred = plan_work([big, small], request_budget=2)
+        assert scheduled == [small]
+        assert deferred == [big]
+
+    @pytest.mark.parametrize("budget", [0, 1])
+    def test_free_items_always_scheduled(self, budget):
+        free = video_work_item(_video(transcript=None), priority=0)
+        scheduled, _ = plan_work([free], request_budget=budget)
+        assert scheduled == [free]
+
+
+class TestDurationModel:
+    def test_default_rates_before_any_history(self):
+        model = DurationModel()
+        work = video_work_item(_video(transcript="word " * 8000), priority=0)    # 10k + overhead tokens
+        assert model.estimate(work) == pytest.approx(work.tokens / 1000 * 2.0)
+
+    def test_small_items_have_a_floor(self):
+        assert DurationModel().estimate(video_work_item(_video(transcript=None), priority=0)) == 5
+
+    def test_first_timing_replaces_default_then_averages(self):
+        model = DurationModel()
+        work = episode_work_item(_episode(), priority=0, max_audio_minutes=60)
+        model.observe(work, work.tokens / 1000 * 3.0)
+        assert model.estimate(work) == pytest.approx(work.tokens / 1000 * 3.0)
+        model.observe(work, work.tokens / 1000 * 1.0)
+        assert model.estimate(work) == pytest.approx(work.tokens / 1000 * 2.4)
+
+    def test_history_round_trip(self):
+        model = DurationModel()
+        work = episode_work_item(_episode(), priority=0, max_audio_minutes=60)
+        model.observe(work, 120)
+        history = model.history()
+
+        assert set(history) == {PODCAST}
+        assert DurationModel(history).estimate(work) == pytest.approx(model.estimate(work), rel=1e-3)
+
+    def test_unreadable_history_ignored(self):
+        model = DurationModel({PODCAST: {"seconds_per_ktoken": "fast"}, "other": {}})
+        assert model.history() == {}
+
+
+class TestRunDeadline:
+    def test_no_deadline_configured(self):
+        assert run_deadline(None, 10) is None
+
+    def test_time_left_before_todays_deadline(self):
+        # 14:00 UTC is 06:00 PST: one hour to 07:00, less a 10 minute reserve
+        deadline = run_deadline("07:00", 10, now=datetime(2026, 2, 20, 14, 0, tzinfo=timezone.utc))
+        assert deadline.seconds_left() == pytest.approx(50 * 60, abs=5)
+        assert deadline.label == "07:00 PST"
+
+    def test_deadline_follows_pacific_daylight_time(self):
+        # 13:00 UTC in July is 06:00 PDT (UTC−7): one hour to 07:00
+        deadline = run_deadline("07:00", 10, now=datetime(2026, 7, 20, 13, 0, tzinfo=timezone.utc))
+        assert deadline.seconds_left() == pytest.approx(50 * 60, abs=5)
+        assert deadline.label == "07:00 PDT"
+
+    def test_deadline_across_dst_change(self):
+        # 09:00 PST the day before clocks spring forward: 22 wall-clock hours to 07:00 PDT, 21 real
+        deadline = run_deadline("07:00", 0, now=datetime(2026, 3, 7, 17, 0, tzinfo=timezone.utc))
+        assert deadline.seconds_left() == pytest.approx(21 * 3600, abs=5)
+
+    def test_run_after_deadline_is_bound_by_tomorrows(self):
+        # 17:00 UTC is 09:00 PST — the next 07:00 is 22 hours away
+        deadline = run_deadline("07:00", 10, now=datetime(2026, 2, 20, 17, 0, tzinfo=timezone.utc))
+        assert deadline.seconds_left() == pytest.approx(22 * 3600 - 600, abs=5)
+
+    def test_allows(self):
+        deadline = RunDeadline(60, "07:00 PST")
+        assert deadline.allows(30)
+        assert not deadline.allows(120)
+
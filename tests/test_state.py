@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from src.usage_ledger import UsageTotals
 from src.state import (
     load_state,
     save_state,
@@ -19,7 +21,33 @@ from src.state import (
     promote_ip_blocked,
     expire_ip_blocked,
     update_rss_cache,
+    gemini_file_cache,
+    expire_gemini_files,
+    PENDING_PODCASTS,
+    PENDING_YOUTUBE,
+    get_pending,
+    mark_pending,
+    clear_pending,
+    expire_pending,
+    is_pending_due,
+    pending_attempts,
+    get_breaker_tripped_at,
+    set_breaker_tripped_at,
+    add_quota_usage,
+    get_quota_usage,
+    persist_quota_usage,
+    quota_day,
+    get_item_timings,
+    get_source_cadence,
+    set_item_timings,
+    set_source_cadence,
+    record_source_failure,
+    clear_source_failure,
+    get_source_failures,
+    is_source_cooling_down,
     _IP_BLOCKED_TTL_DAYS,
+    _PENDING_TTL_DAYS,
+    _GEMINI_FILE_TTL_HOURS,
 )
 
 
@@ -294,3 +322,214 @@ class TestGetYoutubeEntriesLegacy:
         from src.state import get_youtube_entries
         assert get_youtube_entries({}) == {}
         assert get_youtube_entries({"youtube": {}}) == {}
+
+
+# ---------------------------------------------------------------------------
+# Tests: Gemini Files API upload cache
+# ---------------------------------------------------------------------------
+
+class TestGeminiFileCache:
+    def test_returns_live_dict(self):
+        state = {}
+        cache = gemini_file_cache(state)
+        cache["abc"] = {"name": "files/1", "uploaded_at": "2026-01-01T00:00:00+00:00"}
+        assert state["gemini_files"]["abc"]["name"] == "files/1"
+
+    def test_existing_entries_returned(self):
+        state = {"gemini_files": {"abc": {"name": "files/1"}}}
+        assert gemini_file_cache(state) is state["gemini_files"]
+
+    def test_not_treated_as_legacy_video_ids(self):
+        state = {"gemini_files": {"abc": {"name": "files/1"}}}
+        assert get_processed_ids(state) == set()
+
+    def test_expire_drops_old_and_malformed_entries(self):
+        now = datetime.now(timezone.utc)
+        state = {"gemini_files": {
+            "fresh": {"name": "files/1", "uploaded_at": (now - timedelta(hours=1)).isoformat()},
+            "stale": {"name": "files/2", "uploaded_at": (now - timedelta(hours=_GEMINI_FILE_TTL_HOURS + 1)).isoformat()},
+            "broken": {"name": "files/3"},
+        }}
+        expired = expire_gemini_files(state)
+        assert sorted(expired) == ["broken", "stale"]
+        assert list(state["gemini_files"]) == ["fresh"]
+
+    def test_expire_empty_state(self):
+        assert expire_gemini_files({}) == []
+
+
+class TestPending:
+    def test_mark_and_get(self):
+        state = {}
+        mark_pending(state, PENDING_YOUTUBE, "vid1", {"title": "T"}, "2026-02-20", reason="503")
+        assert get_pending(state, PENDING_YOUTUBE) == {
+            "vid1": {"title": "T", "date": "2026-02-20", "reason": "503", "attempts": 1},
+        }
+        assert get_pending(state, PENDING_PODCASTS) == {}
+
+    def test_redeferral_keeps_first_date(self):
+        state = {}
+        mark_pending(state, PENDING_PODCASTS, "ep1", {}, "2026-02-20", reason="503")
+        mark_pending(state, PENDING_PODCASTS, "ep1", {}, "2026-02-21", reason="502")
+        entry = get_pending(state, PENDING_PODCASTS)["ep1"]
+        assert entry["date"] == "2026-02-20"
+        assert entry["reason"] == "502"
+        assert pending_attempts(state, PENDING_PODCASTS, "ep1") == 2
+        assert pending_attempts(state, PENDING_PODCASTS, "other") == 0
+
+    def test_delayed_retry_not_due_until_next_attempt(self):
+        state = {}
+        mark_pending(state, PENDING_YOUTUBE, "vid1", {}, "2026-02-20", reason="No captions yet", retry_in_seconds=3600)
+        entry = get_pending(state, PENDING_YOUTUBE)["vid1"]
+
+        assert not is_pending_due(entry)
+        assert is_pending_due(entry, now=datetime.now(timezone.utc) + timedelta(hours=2))
+
+    def test_undelayed_and_unreadable_entries_are_due(self):
+        assert is_pending_due({"date": "2026-02-20"})
+        assert is_pending_due({"next_attempt": "soon"})
+
+    def test_marking_processed_clears_pending(self):
+        state = {}
+        mark_pending(state, PENDING_YOUTUBE, "vid1", {}, "2026-02-20", reason="503")
+        mark_pending(state, PENDING_PODCASTS, "ep1", {}, "2026-02-20", reason="503")
+        mark_youtube_processed(state, "vid1", "2026-02-21")
+        mark_podcast_processed(state, "ep1", "2026-02-21")
+        assert get_pending(state, PENDING_YOUTUBE) == {}
+        assert get_pending(state, PENDING_PODCASTS) == {}
+
+    def test_clear_missing_is_noop(self):
+        clear_pending({}, PENDING_YOUTUBE, "nope")
+
+    def test_expire(self):
+        today = datetime.now(timezone.utc)
+        old = (today - timedelta(days=_PENDING_TTL_DAYS + 1)).strftime("%Y-%m-%d")
+        state = {}
+        mark_pending(state, PENDING_YOUTUBE, "old", {}, old, reason="503")
+        mark_pending(state, PENDING_YOUTUBE, "new", {}, today.strftime("%Y-%m-%d"), reason="503")
+        state["pending"]["podcasts"] = {"broken": {"reason": "503"}}
+
+        assert sorted(expire_pending(state)) == ["broken", "old"]
+        assert list(get_pending(state, PENDING_YOUTUBE)) == ["new"]
+
+    def test_pending_key_not_treated_as_legacy_video(self):
+        state = {"vid1": "2026-02-20"}
+        mark_pending(state, PENDING_YOUTUBE, "vid2", {}, "2026-02-20", reason="503")
+        assert get_processed_ids(state) == {"vid1"}
+
+
+class TestBreakerCarryOver:
+    def test_set_and_clear(self):
+        state = {}
+        assert get_breaker_tripped_at(state) is None
+        set_breaker_tripped_at(state, "2026-02-20T10:00:00+00:00")
+        assert get_breaker_tripped_at(state) == "2026-02-20T10:00:00+00:00"
+        set_breaker_tripped_at(state, None)
+        assert "gemini_breaker" not in state
+
+
+class TestQuotaLedger:
+    # 07:30 UTC on 20 Feb is 23:30 on 19 Feb in Pacific time
+    BEFORE_RESET = datetime(2026, 2, 20, 7, 30, tzinfo=timezone.utc)
+    AFTER_RESET = datetime(2026, 2, 20, 8, 30, tzinfo=timezone.utc)
+
+    @staticmethod
+    def _usage(requests, prompt_tokens=0, output_tokens=0):
+        return UsageTotals(requests, prompt_tokens, output_tokens)
+
+    def test_quota_day_is_pacific_date(self):
+        assert quota_day(self.BEFORE_RESET) == "2026-02-19"
+        assert quota_day(self.AFTER_RESET) == "2026-02-20"
+
+    def test_runs_on_same_day_accumulate(self):
+        state = {}
+        add_quota_usage(state, {"flash": self._usage(3, 1000, 100)}, self.AFTER_RESET)
+        add_quota_usage(state, {"flash": self._usage(2, 500, 50), "pro": self._usage(1)}, self.AFTER_RESET)
+
+        assert get_quota_usage(state, self.AFTER_RESET) == {
+            "flash": {"requests": 5, "prompt_tokens": 1500, "output_tokens": 150},
+            "pro": {"requests": 1, "prompt_tokens": 0, "output_tokens": 0},
+        }
+
+    def test_resets_at_pacific_midnight(self):
+        state = {}
+        add_quota_usage(state, {"flash": self._usage(3)}, self.BEFORE_RESET)
+        assert get_quota_usage(state, self.AFTER_RESET) == {}
+
+        add_quota_usage(state, {"flash": self._usage(1)}, self.AFTER_RESET)
+        assert state["gemini_quota"]["date"] == "2026-02-20"
+        assert get_quota_usage(state, self.AFTER_RESET)["flash"]["requests"] == 1
+
+    def test_persist_adds_to_file_on_disk(self, tmp_path):
+        state_path = tmp_path / "state.json"
+        save_state(state_path, {"youtube": {"abc": "2026-02-20"}})
+
+        persist_quota_usage(state_path, {"flash": self._usage(2)}, self.AFTER_RESET)
+        persist_quota_usage(state_path, {"flash": self._usage(1)}, self.AFTER_RESET)
+
+        state = load_state(state_path)
+        assert get_quota_usage(state, self.AFTER_RESET)["flash"]["requests"] == 3
+        assert state["youtube"] == {"abc": "2026-02-20"}
+
+    def test_quota_key_is_not_a_video_id(self):
+        state = {"gemini_quota": {"date": "2026-02-20", "models": {}}, "abc123": "2026-02-20"}
+        assert get_processed_ids(state) == {"abc123"}
+
+
+class TestItemTimings:
+    def test_set_and_get(self):
+        state = {}
+        assert get_item_timings(state) == {}
+        set_item_timings(state, {"podcast": {"seconds_per_ktoken": 0.8, "samples": 3}})
+        assert get_item_timings(state)["podcast"]["samples"] == 3
+
+    def test_empty_timings_not_written(self):
+        state = {}
+        set_item_timings(state, {})
+        assert state == {}
+
+
+class TestSourceCadence:
+    def test_set_and_get(self):
+        state = {}
+        assert get_source_cadence(state) == {}
+        set_source_cadence(state, {"Show": {"uploads": [], "checked": "2026-02-20T14:00:00+00:00"}})
+        assert get_source_cadence(state)["Show"]["checked"] == "2026-02-20T14:00:00+00:00"
+
+    def test_cadence_key_is_not_a_video_id(self):
+        state = {"source_cadence": {}, "abc123": "2026-02-20"}
+        assert get_processed_ids(state) == {"abc123"}
+
+
+class TestSourceFailures:
+    NOW = datetime(2026, 2, 20, 14, 0, tzinfo=timezone.utc)
+
+    def test_first_failure_does_not_cool_down(self):
+        state = {}
+        assert record_source_failure(state, "YouTube/A", "boom", "2026-02-20", now=self.NOW) is None
+        assert not is_source_cooling_down(state, "YouTube/A", now=self.NOW)
+        assert get_source_failures(state)["YouTube/A"] == {"failures": 1, "since": "2026-02-20", "error": "boom"}
+
+    def test_cool_down_doubles_and_is_capped(self):
+        state = {}
+        hours = []
+        for day in range(8):
+            retry_after = record_source_failure(state, "YouTube/A", "boom", f"2026-02-{10 + day}", now=self.NOW)
+            if retry_after:
+                hours.append((datetime.fromisoformat(retry_after) - self.NOW).total_seconds() / 3600)
+        assert hours == [12, 24, 48, 96, 168, 168, 168]
+        assert get_source_failures(state)["YouTube/A"]["since"] == "2026-02-10"
+
+    def test_cool_down_now_starts_with_first_failure(self):
+        state = {}
+        record_source_failure(state, "Podcast/B", "no feed", "2026-02-20", cool_down_now=True, now=self.NOW)
+        assert is_source_cooling_down(state, "Podcast/B", now=self.NOW + timedelta(hours=11))
+        assert not is_source_cooling_down(state, "Podcast/B", now=self.NOW + timedelta(hours=12))
+
+    def test_clear_removes_entry(self):
+        state = {}
+        record_source_failure(state, "YouTube/A", "boom", "2026-02-20")
+        clear_source_failure(state, "YouTube/A")
+        clear_source_failure(state, "YouTube/never-failed")
+        assert state == {}
+
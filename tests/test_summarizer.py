@@ -2,20 +2,50 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
+from src.circuit_breaker import CircuitOpenError, circuit_breaker, configure_circuit_breaker
+from src.config import ModelRoute
+from src.compaction import estimate_tokens
+from src.response_cache import enable_response_cache
 from src.summarizer import (
     create_client,
     summarize,
     _call_gemini,
+    _generate_streaming,
     _format_duration_for_prompt,
     _format_timestamp_index,
     _get_language_name,
+    _split_transcript,
+    GenerationDeadlineError,
+    PackedItem,
+    StreamOptions,
+    SUMMARY_SYSTEM_INSTRUCTION,
+    disable_shared_throttle,
+    enable_prefix_caching,
+    prefix_cache_min_tokens,
+    enable_request_hedging,
+    AUDIO,
+    generate_with_timeout,
+    latency_percentile,
+    request_class,
+    record_request_latency,
+    request_timeout,
+    route_latency_report,
+    select_route,
+    set_request_timeout,
+    summarize_packed,
+    _strip_unknown_citations,
     QuotaExhaustedError,
     SUMMARY_PROMPT,
+    THROTTLE_SECONDS,
+    throttle,
 )
+from src.usage_ledger import ledger_item, usage_ledger
 
 
 class TestCreateClient:
@@ -36,6 +66,39 @@ class TestCreateClient:
                 create_client()
 
 
+class TestThrottle:
+    @patch("src.summarizer.time.sleep")
+    def test_sleeps_throttle_interval(self, mock_sleep):
+        throttle()
+        mock_sleep.assert_called_once_with(THROTTLE_SECONDS)
+
+    def test_concurrent_callers_are_serialised(self):
+        active = []
+        overlaps = []
+
+        def fake_sleep(seconds):
+            active.append(1)
+            if len(active) > 1:
+                overlaps.append(True)
+            threading.Event().wait(0.01)
+            active.pop()
+
+        with patch("src.summarizer.time.sleep", side_effect=fake_sleep):
+            threads = [threading.Thread(target=throttle) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert overlaps == []
+
+    @patch("src.summarizer.time.sleep")
+    def test_no_pause_while_pool_paces_keys(self, mock_sleep):
+        disable_shared_throttle()
+        throttle()
+        mock_sleep.assert_not_called()
+
+
 class TestCallGemini:
     @patch("src.summarizer.time.sleep")
     def test_successful_call(self, mock_sleep):
@@ -211,6 +274,44 @@ class TestCallGemini:
         assert mock_client.models.generate_content.call_count == 2
 
 
+class TestCallGeminiResponseCache:
+    @patch("src.summarizer.time.sleep")
+    def test_second_identical_call_served_from_cache(self, mock_sleep, tmp_path):
+        enable_response_cache(tmp_path)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        first = _call_gemini(mock_client, "gemini-2.5-flash", "prompt")
+        mock_sleep.reset_mock()
+        second = _call_gemini(mock_client, "gemini-2.5-flash", "prompt")
+
+        assert first == second == "Summary"
+        assert mock_client.models.generate_content.call_count == 1
+        mock_sleep.assert_not_called()  # cache hits skip the throttle
+
+    @patch("src.summarizer.time.sleep")
+    def test_different_model_misses(self, mock_sleep, tmp_path):
+        enable_response_cache(tmp_path)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        _call_gemini(mock_client, "model-a", "prompt")
+        _call_gemini(mock_client, "model-b", "prompt")
+
+        assert mock_client.models.generate_content.call_count == 2
+
+    @patch("src.summarizer.time.sleep")
+    def test_empty_response_not_cached(self, mock_sleep, tmp_path):
+        enable_response_cache(tmp_path)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text=None)
+
+        _call_gemini(mock_client, "m", "prompt")
+        _call_gemini(mock_client, "m", "prompt")
+
+        assert mock_client.models.generate_content.call_count == 2
+
+
 class TestFormatDurationForPrompt:
     def test_short_video(self):
         assert _format_duration_for_prompt(180) == "3m"
@@ -404,3 +505,703 @@ class TestSummarizeWithTimestamps:
         prompt = mock_client.models.generate_content.call_args.kwargs["contents"]
         assert "(none available)" in prompt
 
+
+
+class TestSplitTranscript:
+    def test_cuts_only_at_anchor_offsets(self):
+        segments = ((0, "alpha one"), (30, "bravo two"), (60, "charlie three"), (90, "delta four"))
+        transcript = "alpha one more words bravo two more words charlie three more words delta four more words"
+        chunks = _split_transcript(transcript, segments, chunk_chars=40)
+
+        assert [c[0].split()[0] for c in chunks] == ["alpha", "charlie"]
+        assert chunks[0][1] == ((0, "alpha one"), (30, "bravo two"))
+        assert chunks[1][1] == ((60, "charlie three"), (90, "delta four"))
+        assert " ".join(c[0] for c in chunks) == transcript
+
+    def test_short_tail_merged_into_previous_part(self):
+        segments = ((0, "start"), (30, "tail"))
+        transcript = "start " + "x " * 30 + "tail end"
+        chunks = _split_transcript(transcript, segments, chunk_chars=40)
+        assert len(chunks) == 1
+        assert chunks[0][1] == segments
+
+    def test_falls_back_to_word_boundaries_without_anchors(self):
+        transcript = " ".join(f"w{i}" for i in range(100))
+        chunks = _split_transcript(transcript, (), chunk_chars=50)
+        assert len(chunks) > 1
+        assert all(len(text) <= 50 for text, _ in chunks[:-1])
+        assert " ".join(text for text, _ in chunks) == transcript
+
+
+class TestStripUnknownCitations:
+    def test_keeps_real_anchors_and_drops_invented(self):
+        summary = "* Real claim. [t=30s]\n* Made-up time. [t=45s]"
+        result = _strip_unknown_citations(summary, {0, 30})
+        assert result == "* Real claim. [t=30s]\n* Made-up time."
+
+
+class TestSummarizeInChunks:
+    @patch("src.summarizer.time.sleep")
+    def test_short_transcript_stays_single_call(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        summarize(
+            client=mock_client, model="m", title="T", channel_name="C",
+            transcript="word " * 100, chunk_tokens=1000,
+        )
+
+        assert mock_client.models.generate_content.call_count == 1
+
+    @patch("src.summarizer.time.sleep")
+    def test_long_transcript_map_reduce(self, mock_sleep):
+        segments = ((0, "part one begins"), (600, "part two begins"), (1200, "part three begins"))
+        transcript = " ".join(f"{text} " + "filler " * 60 for _, text in segments)
+
+        def respond(model, contents):
+            if "Notes:" in contents:
+                return MagicMock(text="## Key Findings\n* A. [t=600s]\n* B. [t=601s]")
+            return MagicMock(text="* note [t=0s]")
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = respond
+
+        result = summarize(
+            client=mock_client, model="m", title="Long Video", channel_name="C",
+            transcript=transcript, duration_seconds=1800,
+            transcript_segments=segments, chunk_tokens=100, max_parallel=2,
+        )
+
+        prompts = [c.kwargs["contents"] for c in mock_client.models.generate_content.call_args_list]
+        map_prompts = [p for p in prompts if "Transcript part:" in p]
+        assert len(map_prompts) == 3
+        assert any("[t=600s]" in p and "part two begins" in p for p in map_prompts)
+        assert sum("Notes:" in p for p in prompts) == 1
+        assert prompts[-1].count("[Part ") == 3
+        assert result == "## Key Findings\n* A. [t=600s]\n* B."
+
+
+class TestSummarizePacked:
+    ITEMS = [
+        PackedItem(title="First", channel_name="A", transcript="first words", duration_seconds=60,
+                   transcript_segments=((0, "first words"),)),
+        PackedItem(title="Second", channel_name="B", transcript="second words", duration_seconds=90,
+                   language="es", transcript_segments=((30, "second words"),)),
+    ]
+
+    @patch("src.summarizer.time.sleep")
+    def test_one_request_split_back_per_item(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text=(
+            "<<<SUMMARY 1>>>\n## The Hook\nOne.\n## Key Findings\n* A. [t=0s]\n<<<END 1>>>\n"
+            "<<<SUMMARY 2>>>\n## The Hook\nDos.\n## Key Findings\n* B. [t=0s] [t=30s]\n<<<END 2>>>"
+        ))
+
+        result = summarize_packed(mock_client, "m", self.ITEMS)
+
+        assert mock_client.models.generate_content.call_count == 1
+        prompt = mock_client.models.generate_content.call_args.kwargs["contents"]
+        assert "=== VIDEO 1 ===" in prompt and "=== VIDEO 2 ===" in prompt
+        assert "Spanish" in prompt
+        assert result[0] == "## The Hook\nOne.\n## Key Findings\n* A. [t=0s]"
+        # [t=0s] is not an anchor of the second video
+        assert result[1] == "## The Hook\nDos.\n## Key Findings\n* B. [t=30s]"
+
+    @patch("src.summarizer.time.sleep")
+    def test_missing_item_returns_none(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(
+            text="<<<SUMMARY 2>>>\nOnly two\n<<<END 2>>>"
+        )
+        assert summarize_packed(mock_client, "m", self.ITEMS) == [None, "Only two"]
+
+
+class TestStreaming:
+    @staticmethod
+    def _client(*chunks):
+        mock_client = MagicMock()
+        mock_client.models.generate_content_stream.return_value = iter(
+            [MagicMock(text=c) for c in chunks]
+        )
+        return mock_client
+
+    @patch("src.summarizer.time.sleep")
+    def test_streams_chunks_and_records_timings(self, mock_sleep):
+        seen = []
+        stream = StreamOptions(on_text=seen.append)
+        mock_client = self._client("## The Hook", None, "\nBody")
+
+        result = _call_gemini(mock_client, "m", "prompt", stream=stream)
+
+        assert result == "## The Hook\nBody"
+        assert seen == ["## The Hook", "## The Hook\nBody"]
+        mock_client.models.generate_content.assert_not_called()
+        mock_client.models.generate_content_stream.assert_called_once_with(model="m", contents="prompt")
+        assert stream.stats.ttft_seconds is not None
+        assert stream.stats.total_seconds >= stream.stats.ttft_seconds
+        assert stream.stats.truncated is False
+
+    @staticmethod
+    def _stalled_client(*chunks):
+        """A stream that sends chunks, then hangs until the test ends."""
+        release = threading.Event()
+
+        def stalled():
+            for c in chunks:
+                yield MagicMock(text=c)
+            release.wait(5)
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content_stream.return_value = stalled()
+        return mock_client, release
+
+    @patch("src.summarizer.time.sleep")
+    def test_deadline_cuts_off_stalled_stream_keeping_partial(self, mock_sleep, tmp_path):
+        enable_response_cache(tmp_path)
+        stream = StreamOptions(on_text=lambda text: None, max_seconds=0.2)
+        mock_client, release = self._stalled_client("partial")
+
+        result = _call_gemini(mock_client, "m", "prompt", stream=stream)
+        release.set()
+
+        assert result == "partial"
+        assert stream.stats.truncated is True
+        assert not any(tmp_path.iterdir())
+
+    @patch("src.summarizer.time.sleep")
+    def test_deadline_clock_starts_at_the_streamed_call(self, mock_sleep):
+        # Time spent before the call (e.g. a chunked map phase) does not count
+        stream = StreamOptions(on_text=lambda text: None, max_seconds=0.5)
+        time.sleep(0.01)
+        mock_client = self._client("## Full")
+
+        assert _call_gemini(mock_client, "m", "prompt", stream=stream) == "## Full"
+        assert stream.stats.truncated is False
+
+    @patch("src.summarizer.time.sleep")
+    def test_deadline_with_no_text_is_not_retried_or_counted_by_breaker(self, mock_sleep):
+        configure_circuit_breaker(failure_threshold=1)
+        stream = StreamOptions(on_text=lambda text: None, max_seconds=0.2)
+        mock_client, release = self._stalled_client()
+
+        with pytest.raises(GenerationDeadlineError, match="no output"):
+            _call_gemini(mock_client, "m", "prompt", stream=stream)
+        release.set()
+
+        assert mock_client.models.generate_content_stream.call_count == 1
+        assert circuit_breaker().state == "closed"
+
+    def test_no_retry_stream_sent_past_the_deadline(self):
+        stream = StreamOptions(on_text=lambda text: None, max_seconds=0.1)
+        mock_client = MagicMock()
+        mock_client.models.generate_content_stream.side_effect = Exception("503 UNAVAILABLE")
+        real_sleep = time.sleep
+
+        # The retry backoff outlasts the deadline
+        with patch("src.summarizer.time.sleep", side_effect=lambda s: real_sleep(0.15)):
+            with pytest.raises(GenerationDeadlineError, match="not retrying"):
+                _call_gemini(mock_client, "m", "prompt", stream=stream)
+
+        assert mock_client.models.generate_content_stream.call_count == 1
+
+    def test_request_timeout_bounds_stream_without_chunks(self):
+        set_request_timeout(0.2)
+        stream = StreamOptions(on_text=lambda text: None)
+        mock_client, release = self._stalled_client()
+
+        with pytest.raises(TimeoutError, match="504"):
+            _generate_streaming(mock_client, {"model": "m", "contents": "p"}, stream)
+        release.set()
+
+    @patch("src.summarizer.time.sleep")
+    def test_summarize_passes_stream_through(self, mock_sleep):
+        stream = StreamOptions(on_text=lambda text: None)
+        mock_client = self._client("Summary")
+
+        result = summarize(
+            client=mock_client, model="m", title="T", channel_name="C",
+            transcript="words", stream=stream,
+        )
+
+        assert result == "Summary"
+        prompt = mock_client.models.generate_content_stream.call_args.kwargs["contents"]
+        assert "Video title: T" in prompt
+
+
+class TestPrefixCaching:
+    @staticmethod
+    def _client():
+        mock_client = MagicMock()
+        mock_client.caches.create.return_value = MagicMock()
+        mock_client.caches.create.return_value.name = "cachedContents/abc"
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+        return mock_client
+
+    def _summarize(self, mock_client, **kwargs):
+        return summarize(
+            client=mock_client, model="gemini-2.5-flash", title="Test Video",
+            channel_name="Test Channel", transcript="the transcript", duration_seconds=600,
+            language="es", **kwargs,
+        )
+
+    @patch("src.summarizer.time.sleep")
+    def test_default_sends_single_inline_prompt(self, mock_sleep):
+        mock_client = self._client()
+        self._summarize(mock_client)
+
+        mock_client.caches.create.assert_not_called()
+        assert "config" not in mock_client.models.generate_content.call_args.kwargs
+
+    @patch("src.summarizer.time.sleep")
+    def test_rules_registered_once_and_referenced(self, mock_sleep):
+        enable_prefix_caching()
+        mock_client = self._client()
+
+        self._summarize(mock_client)
+        self._summarize(mock_client, transcript_segments=((0, "other"),))
+
+        mock_client.caches.create.assert_called_once()
+        created = mock_client.caches.create.call_args.kwargs["config"]
+        assert created.system_instruction == SUMMARY_SYSTEM_INSTRUCTION
+        for c in mock_client.models.generate_content.call_args_list:
+            assert c.kwargs["config"].cached_content == "cachedContents/abc"
+            prompt = c.kwargs["contents"]
+            assert "CRITICAL ACCURACY RULES" not in prompt
+            assert "Video duration: 10m" in prompt
+            assert "Summary language: Spanish" in prompt
+            assert "the transcript" in prompt
+
+    @patch("src.summarizer.time.sleep")
+    def test_uncacheable_prefix_sent_as_system_instruction(self, mock_sleep):
+        enable_prefix_caching()
+        mock_client = self._client()
+        mock_client.caches.create.side_effect = Exception("400 too few tokens for caching")
+
+        self._summarize(mock_client)
+        self._summarize(mock_client)
+
+        mock_client.caches.create.assert_called_once()
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.cached_content is None
+        assert config.system_instruction == SUMMARY_SYSTEM_INSTRUCTION
+
+    @patch("src.summarizer.time.sleep")
+    def test_expired_cache_reregistered(self, mock_sleep):
+        enable_prefix_caching()
+        mock_client = self._client()
+        mock_client.models.generate_content.side_effect = [
+            Exception("404 NOT_FOUND: CachedContent not found"), MagicMock(text="Summary"),
+        ]
+
+        assert self._summarize(mock_client) == "Summary"
+        assert mock_client.caches.create.call_count == 2
+
+    def test_inline_prompt_unchanged_by_split(self):
+        rules = SUMMARY_SYSTEM_INSTRUCTION.split("[TASK: SUMMARY]\n")[1]
+        assert SUMMARY_PROMPT.startswith(rules.split("(stated")[0])
+        assert SUMMARY_PROMPT.rstrip().endswith("Transcript:\n{transcript}")
+
+    def test_shared_prefix_meets_flash_minimum_only(self):
+        # The real threshold: the combined rules clear 2.5 Flash's minimum, not Pro's
+        assert estimate_tokens(SUMMARY_SYSTEM_INSTRUCTION) >= prefix_cache_min_tokens("gemini-2.5-flash")
+        assert estimate_tokens(SUMMARY_SYSTEM_INSTRUCTION) < prefix_cache_min_tokens("gemini-2.5-pro")
+
+    @patch("src.summarizer.time.sleep")
+    def test_prefix_below_model_minimum_never_offered_to_cache(self, mock_sleep):
+        enable_prefix_caching()
+        mock_client = self._client()
+
+        summarize(
+            client=mock_client, model="gemini-2.5-pro", title="T", channel_name="C",
+            transcript="the transcript",
+        )
+
+        mock_client.caches.create.assert_not_called()
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.system_instruction == SUMMARY_SYSTEM_INSTRUCTION
+
+    @patch("src.summarizer.time.sleep")
+    def test_map_reduce_and_packed_calls_share_the_prefix(self, mock_sleep):
+        enable_prefix_caching()
+        mock_client = self._client()
+        segments = ((0, "part one begins"), (600, "part two begins"))
+        transcript = " ".join(f"{text} " + "filler " * 60 for _, text in segments)
+
+        summarize(
+            client=mock_client, model="gemini-2.5-flash", title="T", channel_name="C",
+            transcript=transcript, duration_seconds=1200, transcript_segments=segments, chunk_tokens=100,
+        )
+        summarize_packed(mock_client, "gemini-2.5-flash", TestSummarizePacked.ITEMS)
+
+        mock_client.caches.create.assert_called_once()
+        calls = mock_client.models.generate_content.call_args_list
+        assert [c.kwargs["contents"].split("\n")[0] for c in calls] == [
+            "Task: PART NOTES", "Task: PART NOTES", "Task: MERGE NOTES", "Task: PACKED SUMMARIES",
+        ]
+        assert all(c.kwargs["config"].cached_content == "cachedContents/abc" for c in calls)
+        assert all("CRITICAL ACCURACY RULES" not in c.kwargs["contents"] for c in calls)
+
+
+class TestModelRoutes:
+    ROUTES = (
+        ModelRoute(name="short", max_minutes=15, model="gemini-2.5-flash-lite",
+                   max_output_tokens=1024, thinking_budget=0),
+        ModelRoute(name="long", max_output_tokens=4096),
+    )
+
+    def _summarize(self, mock_client, duration_seconds, **kwargs):
+        return summarize(
+            client=mock_client, model="gemini-2.5-flash", title="Test Video",
+            channel_name="Test Channel", transcript="the transcript",
+            duration_seconds=duration_seconds, routes=self.ROUTES, **kwargs,
+        )
+
+    def test_select_route_first_match_wins(self):
+        assert select_route(self.ROUTES, 600, 100).name == "short"
+        assert select_route(self.ROUTES, 3600, 100).name == "long"
+        assert select_route((), 600, 100) is None
+
+    @patch("src.summarizer.time.sleep")
+    def test_no_routes_sends_no_config(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+        summarize(mock_client, "gemini-2.5-flash", "T", "C", "the transcript", duration_seconds=600)
+
+        request = mock_client.models.generate_content.call_args.kwargs
+        assert request["model"] == "gemini-2.5-flash"
+        assert "config" not in request
+        assert route_latency_report() == []
+
+    @patch("src.summarizer.time.sleep")
+    def test_short_item_routed_with_limits(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        assert self._summarize(mock_client, 600) == "Summary"
+
+        request = mock_client.models.generate_content.call_args.kwargs
+        assert request["model"] == "gemini-2.5-flash-lite"
+        assert request["config"].max_output_tokens == 1024
+        assert request["config"].thinking_config.thinking_budget == 0
+        report = route_latency_report()
+        assert len(report) == 1 and report[0].startswith("short: 1 item(s)")
+
+    @patch("src.summarizer.time.sleep")
+    def test_catch_all_keeps_default_model(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        self._summarize(mock_client, 3600)
+
+        request = mock_client.models.generate_content.call_args.kwargs
+        assert request["model"] == "gemini-2.5-flash"
+        assert request["config"].max_output_tokens == 4096
+        assert request["config"].thinking_config is None
+
+    @patch("src.summarizer.time.sleep")
+    def test_limits_merged_with_prefix_config(self, mock_sleep):
+        enable_prefix_caching()
+        mock_client = MagicMock()
+        mock_client.caches.create.return_value = MagicMock()
+        mock_client.caches.create.return_value.name = "cachedContents/abc"
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        self._summarize(mock_client, 600)
+
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.cached_content == "cachedContents/abc"
+        assert config.max_output_tokens == 1024
+
+    @patch("src.summarizer.time.sleep")
+    def test_limits_part_of_response_cache_key(self, mock_sleep, tmp_path):
+        enable_response_cache(tmp_path)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        _call_gemini(mock_client, "gemini-2.5-flash", "same prompt")
+        _call_gemini(mock_client, "gemini-2.5-flash", "same prompt", route=self.ROUTES[1])
+        _call_gemini(mock_client, "gemini-2.5-flash", "same prompt", route=self.ROUTES[1])
+
+        assert mock_client.models.generate_content.call_count == 2
+
+
+class TestRequestTimeouts:
+    @staticmethod
+    def _observe(model, seconds, count=10):
+        for _ in range(count):
+            record_request_latency(model, seconds)
+
+    def test_ceiling_used_until_enough_samples(self):
+        set_request_timeout(120)
+        self._observe("m", 5.0, count=9)
+        assert latency_percentile("m", 95) is None
+        assert request_timeout("m") == 120
+
+    def test_timeout_derived_from_p99(self):
+        set_request_timeout(600)
+        self._observe("m", 20.0)
+        assert request_timeout("m") == 60.0
+        # Fast models are floored, slow ones capped
+        self._observe("fast", 1.0)
+        assert request_timeout("fast") == 30
+        self._observe("slow", 400.0)
+        assert request_timeout("slow") == 600
+
+    def test_percentile_nearest_rank(self):
+        for seconds in range(1, 21):
+            record_request_latency("m", float(seconds))
+        assert latency_percentile("m", 95) == 19.0
+        assert latency_percentile("m", 50) == 10.0
+
+    def test_hung_call_times_out(self):
+        set_request_timeout(0.05)
+        release = threading.Event()
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = lambda **kw: release.wait(5)
+
+        with pytest.raises(TimeoutError, match="504 DEADLINE_EXCEEDED"):
+            generate_with_timeout(mock_client, {"model": "m", "contents": "p"})
+        release.set()
+
+    def test_success_records_latency(self):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="ok")
+        for _ in range(10):
+            assert generate_with_timeout(mock_client, {"model": "m", "contents": "p"}).text == "ok"
+        assert latency_percentile("m", 50) is not None
+
+    def test_samples_kept_per_request_class(self):
+        set_request_timeout(600)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="ok")
+        for _ in range(10):
+            generate_with_timeout(mock_client, {"model": "m", "contents": "short prompt"})
+
+        assert request_timeout("m", request_class({"model": "m", "contents": "short prompt"})) == 30
+        # Fast text summaries do not shorten the timeout of audio or long prompts
+        audio = {"model": "m", "contents": [MagicMock(), "prompt"]}
+        long_prompt = {"model": "m", "contents": "word " * 100_000}
+        assert request_class(audio) == AUDIO
+        assert request_class(long_prompt) == "text<128k"
+        assert request_timeout("m", AUDIO) == 600
+        assert request_timeout("m", request_class(long_prompt)) == 600
+
+    @patch("src.summarizer.time.sleep")
+    def test_timeout_retried_by_call_gemini(self, mock_sleep):
+        mock_client = MagicMock()
+        with patch("src.summarizer.generate_with_timeout", side_effect=[
+            TimeoutError("504 DEADLINE_EXCEEDED: no Gemini response within 60s"),
+            MagicMock(text="Summary"),
+        ]):
+            assert _call_gemini(mock_client, "m", "prompt") == "Summary"
+
+
+class TestRequestHedging:
+    @patch("src.summarizer.time.sleep")
+    def test_slow_call_hedged_and_fast_duplicate_wins(self, mock_sleep):
+        enable_request_hedging()
+        for _ in range(10):
+            record_request_latency("m", 0.01)
+        release = threading.Event()
+        calls = []
+
+        def generate(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                release.wait(5)
+                return MagicMock(text="slow")
+            return MagicMock(text="fast")
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = generate
+
+        assert generate_with_timeout(mock_client, {"model": "m", "contents": "p"}).text == "fast"
+        assert len(calls) == 2
+        # The duplicate waits its turn under the shared rate limiter
+        mock_sleep.assert_called_once_with(THROTTLE_SECONDS)
+        release.set()
+
+    @patch("src.summarizer.time.sleep")
+    def test_hedged_call_recorded_as_two_requests(self, mock_sleep):
+        enable_request_hedging()
+        for _ in range(10):
+            record_request_latency("m", 0.01)
+        release = threading.Event()
+        calls = []
+
+        def generate(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                release.wait(5)
+            return MagicMock(text="Summary")
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = generate
+
+        assert _call_gemini(mock_client, "m", "prompt") == "Summary"
+        release.set()
+
+        [record] = usage_ledger().records
+        assert record.requests == 2
+
+    def test_audio_requests_never_hedged(self):
+        enable_request_hedging()
+        for _ in range(10):
+            record_request_latency("m", 0.01, AUDIO)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = lambda **kw: threading.Event().wait(0.1) or MagicMock(text="ok")
+
+        assert generate_with_timeout(mock_client, {"model": "m", "contents": [MagicMock(), "p"]}).text == "ok"
+        mock_client.models.generate_content.assert_called_once()
+
+    def test_no_hedge_without_latency_history(self):
+        enable_request_hedging()
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="ok")
+
+        generate_with_timeout(mock_client, {"model": "m", "contents": "p"})
+
+        mock_client.models.generate_content.assert_called_once()
+
+    @patch("src.summarizer.time.sleep")
+    def test_error_from_one_attempt_waits_for_the_other(self, mock_sleep):
+        enable_request_hedging()
+        for _ in range(10):
+            record_request_latency("m", 0.01)
+        calls = []
+
+        def generate(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                threading.Event().wait(0.2)
+                return MagicMock(text="primary")
+            raise Exception("503 unavailable")
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = generate
+
+        assert generate_with_timeout(mock_client, {"model": "m", "contents": "p"}).text == "primary"
+
+
+class TestCircuitBreakerIntegration:
+    @patch("src.summarizer.time.sleep")
+    def test_storm_trips_breaker_and_raises_circuit_open(self, mock_sleep):
+        configure_circuit_breaker(failure_threshold=3, cooldown_seconds=60)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = Exception("503 UNAVAILABLE")
+
+        with pytest.raises(CircuitOpenError):
+            _call_gemini(mock_client, "m", "prompt")
+
+        # Stopped at the threshold instead of spending all MAX_RETRIES + 1 attempts
+        assert mock_client.models.generate_content.call_count == 3
+
+    @patch("src.summarizer.time.sleep")
+    def test_open_breaker_fails_fast(self, mock_sleep):
+        configure_circuit_breaker(failure_threshold=1, cooldown_seconds=60)
+        circuit_breaker().record_failure(Exception("503 UNAVAILABLE"))
+        mock_client = MagicMock()
+
+        with pytest.raises(CircuitOpenError):
+            _call_gemini(mock_client, "m", "prompt")
+
+        mock_client.models.generate_content.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    @patch("src.summarizer.time.sleep")
+    def test_successful_probe_closes_breaker(self, mock_sleep):
+        configure_circuit_breaker(half_open=True)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        assert _call_gemini(mock_client, "m", "prompt") == "Summary"
+        assert circuit_breaker().state == "closed"
+
+
+class TestUsageLedger:
+    @staticmethod
+    def _response(text, prompt_tokens, output_tokens):
+        response = MagicMock(text=text)
+        response.usage_metadata.prompt_token_count = prompt_tokens
+        response.usage_metadata.candidates_token_count = output_tokens
+        response.usage_metadata.thoughts_token_count = None
+        return response
+
+    @patch("src.summarizer.time.sleep")
+    def test_records_tokens_and_retries(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = [
+            Exception("503 UNAVAILABLE"),
+            self._response("Summary", 1200, 300),
+        ]
+
+        with ledger_item("Channel: Video"):
+            _call_gemini(mock_client, "m", "prompt")
+
+        [record] = usage_ledger().records
+        assert (record.item, record.model, record.requests) == ("Channel: Video", "m", 2)
+        assert (record.prompt_tokens, record.output_tokens, record.ok) == (1200, 300, True)
+
+    @patch("src.summarizer.time.sleep")
+    def test_records_failed_call(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = Exception("400 INVALID_ARGUMENT")
+
+        with pytest.raises(Exception):
+            _call_gemini(mock_client, "m", "prompt")
+
+        [record] = usage_ledger().records
+        assert record.ok is False
+        assert record.requests == mock_client.models.generate_content.call_count
+
+    @patch("src.summarizer.time.sleep")
+    def test_streamed_usage_from_final_chunk(self, mock_sleep):
+        mock_client = MagicMock()
+        first = MagicMock(text="Sum", usage_metadata=None)
+        mock_client.models.generate_content_stream.return_value = iter(
+            [first, self._response("mary", 800, 40)]
+        )
+
+        _call_gemini(mock_client, "m", "prompt", stream=StreamOptions(on_text=lambda text: None))
+
+        [record] = usage_ledger().records
+        assert (record.prompt_tokens, record.output_tokens) == (800, 40)
+
+    @patch("src.summarizer.time.sleep")
+    def test_cache_hit_is_not_recorded(self, mock_sleep, tmp_path):
+        enable_response_cache(tmp_path)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        _call_gemini(mock_client, "m", "prompt")
+        _call_gemini(mock_client, "m", "prompt")
+
+        assert len(usage_ledger().records) == 1
+
+
+class TestPreflightSize:
+    @patch("src.summarizer.time.sleep")
+    def test_oversized_transcript_is_split(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="* note")
+
+        summarize(
+            client=mock_client, model="m", title="T", channel_name="C",
+            transcript="word " * 400, max_input_tokens=200,
+        )
+
+        prompts = [c.kwargs["contents"] for c in mock_client.models.generate_content.call_args_list]
+        assert sum("Transcript part:" in p for p in prompts) >= 2
+        assert sum("Notes:" in p for p in prompts) == 1
+
+    @patch("src.summarizer.time.sleep")
+    def test_transcript_within_limit_is_sent_whole(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = MagicMock(text="Summary")
+
+        summarize(
+            client=mock_client, model="m", title="T", channel_name="C",
+            transcript="word " * 400, max_input_tokens=10_000,
+        )
+
+        assert mock_client.models.generate_content.call_count == 1
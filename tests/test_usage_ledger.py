@@ -0,0 +1,102 @@
+"""Tests for the per-run Gemini usage ledger."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from types import SimpleNamespace
+
+from src.usage_ledger import (
+    CallRecord,
+    UsageLedger,
+    UsageTotals,
+    ledger_item,
+    record_call,
+    reset_usage_ledger,
+    usage_ledger,
+)
+
+
+def _usage(prompt=0, candidates=0, thoughts=None):
+    return SimpleNamespace(
+        prompt_token_count=prompt,
+        candidates_token_count=candidates,
+        thoughts_token_count=thoughts,
+    )
+
+
+class TestRecordCall:
+    def test_records_tokens_latency_and_requests(self):
+        record_call("gemini-2.5-flash", _usage(1000, 200, 50), 3.5, 2)
+
+        [record] = usage_ledger().records
+        assert record == CallRecord(
+            item="", model="gemini-2.5-flash", prompt_tokens=1000, output_tokens=250,
+            latency_seconds=3.5, requests=2,
+        )
+
+    def test_missing_usage_counts_zero_tokens(self):
+        record_call("m", None, 0.0, 5, ok=False)
+
+        [record] = usage_ledger().records
+        assert (record.prompt_tokens, record.output_tokens, record.requests, record.ok) == (0, 0, 5, False)
+
+    def test_ledger_item_labels_calls(self):
+        with ledger_item("Show: Episode 1"):
+            record_call("m", _usage(10, 1), 1.0, 1)
+        record_call("m", _usage(10, 1), 1.0, 1)
+
+        assert [r.item for r in usage_ledger().records] == ["Show: Episode 1", ""]
+
+    def test_label_carried_to_worker_thread_with_copied_context(self):
+        with ledger_item("Channel: Long video"):
+            context = contextvars.copy_context()
+        thread = threading.Thread(target=context.run, args=(record_call, "m", _usage(1, 1), 0.1, 1))
+        thread.start()
+        thread.join()
+
+        assert usage_ledger().records[0].item == "Channel: Long video"
+
+    def test_reset_starts_fresh_ledger(self):
+        record_call("m", _usage(1, 1), 0.1, 1)
+        reset_usage_ledger()
+        assert usage_ledger().records == []
+
+
+class TestUsageLedger:
+    def _ledger(self):
+        ledger = UsageLedger()
+        ledger.record(CallRecord("A", "flash", 1000, 100, 2.0, 1))
+        ledger.record(CallRecord("A", "flash", 500, 50, 1.0, 3))
+        ledger.record(CallRecord("B", "pro", 2000, 300, 10.0, 1))
+        return ledger
+
+    def test_totals(self):
+        assert self._ledger().totals() == UsageTotals(requests=5, prompt_tokens=3500, output_tokens=450)
+
+    def test_by_model(self):
+        assert self._ledger().by_model() == {
+            "flash": UsageTotals(4, 1500, 150),
+            "pro": UsageTotals(1, 2000, 300),
+        }
+
+    def test_report_lines_models_then_slowest_items(self):
+        lines = self._ledger().report_lines()
+
+        assert lines[0] == "- **flash**: 4 request(s), 1,500 input / 150 output tokens"
+        assert lines[1] == "- **pro**: 1 request(s), 2,000 input / 300 output tokens"
+        assert lines[2].startswith("- B: 1 call(s), 10.0s")
+        assert lines[3] == "- A: 2 call(s), 3.0s, 1,500 in / 150 out, 2 retries"
+
+    def test_report_lines_include_compaction_savings(self):
+        ledger = self._ledger()
+        ledger.record_compaction(1200)
+        ledger.record_compaction(300)
+
+        lines = ledger.report_lines()
+
+        assert lines[2] == "- Transcript compaction: ~1,500 input tokens saved over 2 transcript(s)"
+        assert lines[3].startswith("- B: ")
+
+    def test_empty_ledger_has_no_report(self):
+        assert UsageLedger().report_lines() == []
@@ -12,14 +12,16 @@ import pytest
 from src.config import YouTubeSource
 from src.fetchers.youtube import (
     VideoInfo,
+    ChannelFetchError,
     IpBlockedError,
     fetch_new_videos,
+    fetch_video,
+    fetch_videos_published_between,
     _get_channel_entries,
     _get_transcript,
     _get_video_upload_date,
     _parse_upload_date,
     _is_within_lookback,
-    _sample_segments,
 )
 
 
@@ -100,55 +102,6 @@ class TestIsWithinLookback:
         assert _is_within_lookback(just_outside, 26) is False
 
 
-class TestSampleSegments:
-    """Tests for _sample_segments() — the timestamp index builder."""
-
-    def test_empty_returns_empty_tuple(self):
-        assert _sample_segments([]) == ()
-
-    def test_single_snippet(self):
-        raw = make_snippets(("Hello world", 0.0))
-        result = _sample_segments(raw)
-        assert result == ((0, "Hello world"),)
-
-    def test_samples_every_30s_by_default(self):
-        # 3 snippets: 0s, 15s, 30s — only 0s and 30s should be sampled
-        raw = make_snippets(("First", 0.0), ("Middle", 15.0), ("Third", 30.0))
-        result = _sample_segments(raw)
-        starts = [s for s, _ in result]
-        assert 0 in starts
-        assert 30 in starts
-        assert 15 not in starts
-
-    def test_custom_interval(self):
-        raw = make_snippets(("A", 0.0), ("B", 10.0), ("C", 20.0))
-        result = _sample_segments(raw, interval_seconds=10)
-        starts = [s for s, _ in result]
-        assert 0 in starts
-        assert 10 in starts
-        assert 20 in starts
-
-    def test_returns_tuple_of_tuples(self):
-        raw = make_snippets(("Hi", 5.0))
-        result = _sample_segments(raw)
-        assert isinstance(result, tuple)
-        assert isinstance(result[0], tuple)
-        assert result[0] == (5, "Hi")
-
-    def test_skips_empty_text(self):
-        raw = make_snippets(("", 0.0), ("   ", 1.0), ("Real text", 2.0))
-        result = _sample_segments(raw)
-        # Only "Real text" has non-empty text and falls in the first window
-        assert len(result) == 1
-        assert result[0][1] == "Real text"
-
-    def test_start_seconds_are_integers(self):
-        raw = make_snippets(("Test", 12.7))
-        result = _sample_segments(raw)
-        assert isinstance(result[0][0], int)
-        assert result[0][0] == 12
-
-
 class TestGetTranscript:
     """Tests for _get_transcript().
 
@@ -181,6 +134,16 @@ class TestGetTranscript:
         assert text == "Hello world"
         mock_yta.fetch.assert_called_with("abc123", languages=["en", "en-US", "en-GB"])
 
+    def test_fetched_captions_are_compacted(self):
+        snippets = make_snippets(("[Music]", 0.0), ("um we trained the", 1.0), ("trained the model", 2.0))
+        mock_yta = self._mock_yta(fetch_return=snippets)
+
+        with patch("src.fetchers.youtube._make_yta", return_value=mock_yta):
+            text, segments = _get_transcript("abc123")
+
+        assert text == "we trained the model"
+        assert segments == ((1, "we trained the"),)
+
     def test_successful_fetch_returns_segments(self):
         snippets = make_snippets(("Hello", 0.0), ("world", 45.0))
         mock_yta = self._mock_yta(fetch_return=snippets)
@@ -313,8 +276,8 @@ class TestGetChannelEntries:
         mock_result = MagicMock(returncode=1, stdout="", stderr="Error: video not found")
         with patch("subprocess.run", return_value=mock_result) as mock_run, \
              patch("src.fetchers.youtube.time.sleep"):
-            result = _get_channel_entries("https://www.youtube.com/@Test", 3)
-            assert result == []
+            with pytest.raises(ChannelFetchError, match="video not found"):
+                _get_channel_entries("https://www.youtube.com/@Test", 3)
             assert mock_run.call_count == 1  # no retry for non-network errors
 
     def test_yt_dlp_dns_error_retries(self):
@@ -332,23 +295,23 @@ class TestGetChannelEntries:
             assert mock_run.call_count == 2
 
     def test_yt_dlp_dns_error_all_retries_exhausted(self):
-        """All retries exhausted on DNS error returns empty list."""
+        """All retries exhausted on DNS error raises ChannelFetchError."""
         import src.fetchers.youtube as yt_mod
         dns_error = MagicMock(returncode=1, stdout="", stderr="nodename nor servname provided")
         with patch("subprocess.run", return_value=dns_error) as mock_run, \
              patch("src.fetchers.youtube.time.sleep"):
-            result = _get_channel_entries("https://www.youtube.com/@Test", 3)
-            assert result == []
+            with pytest.raises(ChannelFetchError):
+                _get_channel_entries("https://www.youtube.com/@Test", 3)
             assert mock_run.call_count == yt_mod._CHANNEL_FETCH_RETRIES
 
     def test_timeout_retries(self):
-        """Timeout should be retried, then return empty list."""
+        """Timeout should be retried, then raise ChannelFetchError."""
         import subprocess
         import src.fetchers.youtube as yt_mod
         with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 60)) as mock_run, \
              patch("src.fetchers.youtube.time.sleep"):
-            result = _get_channel_entries("https://www.youtube.com/@Test", 3)
-            assert result == []
+            with pytest.raises(ChannelFetchError, match="Timeout"):
+                _get_channel_entries("https://www.youtube.com/@Test", 3)
             assert mock_run.call_count == yt_mod._CHANNEL_FETCH_RETRIES
 
     def test_yt_dlp_not_found(self):
@@ -402,6 +365,23 @@ class TestFetchNewVideos:
                 assert len(result) == 1
                 assert result[0].transcript is None
 
+    def test_metadata_only_skips_transcripts(self, sample_source, sample_entry):
+        with patch("src.fetchers.youtube._get_channel_entries", return_value=[sample_entry]):
+            with patch("src.fetchers.youtube._get_transcript") as mock_transcript:
+                with patch("src.fetchers.youtube.time.sleep") as mock_sleep:
+                    result = fetch_new_videos(
+                        sample_source,
+                        processed_ids=set(),
+                        lookback_hours=26,
+                        max_videos=3,
+                        fetch_transcripts=False,
+                    )
+        mock_transcript.assert_not_called()
+        mock_sleep.assert_not_called()
+        assert [v.video_id for v in result] == ["abc123"]
+        assert result[0].transcript is None
+        assert result[0].duration_seconds == sample_entry["duration"]
+
     def test_skips_old_videos_but_falls_back_to_latest(self, sample_source):
         old_date = (datetime.now(timezone.utc) - timedelta(days=5)).strftime("%Y%m%d")
         old_entry = {
@@ -647,6 +627,73 @@ class TestGetVideoUploadDate:
         assert result is None
 
 
+class TestFetchVideosPublishedBetween:
+    def test_lists_range_newest_first_and_stops_at_start(self, sample_source):
+        entries = [{"id": vid, "title": vid, "duration": 60} for vid in ("new", "in2", "done", "in1", "old", "older")]
+        dates = {
+            "new": datetime(2026, 2, 20, tzinfo=timezone.utc),
+            "in2": datetime(2026, 2, 19, tzinfo=timezone.utc),
+            "done": datetime(2026, 2, 19, tzinfo=timezone.utc),
+            "in1": datetime(2026, 2, 18, tzinfo=timezone.utc),
+            "old": datetime(2026, 2, 17, tzinfo=timezone.utc),
+        }
+        with patch("src.fetchers.youtube._get_channel_entries", return_value=entries):
+            with patch("src.fetchers.youtube._get_video_upload_date", side_effect=dates.get) as mock_date:
+                result = fetch_videos_published_between(
+                    sample_source, {"done"},
+                    datetime(2026, 2, 18, tzinfo=timezone.utc), datetime(2026, 2, 20, tzinfo=timezone.utc),
+                    fetch_transcripts=False,
+                )
+
+        assert [(v.video_id, v.upload_date.day) for v in result] == [("in2", 19), ("in1", 18)]
+        assert mock_date.call_count == 5    # "older" never looked up
+
+
+class TestFetchVideo:
+    def _entry(self, **overrides):
+        return {
+            "id": "abc123", "title": "Old Video", "upload_date": "20250101", "duration": 900,
+            "channel": "Test Channel", "channel_url": "https://www.youtube.com/channel/UC123",
+            "uploader_url": "https://www.youtube.com/@TestChannel", **overrides,
+        }
+
+    def _other_source(self):
+        return YouTubeSource(channel_url="https://www.youtube.com/@Other", name="Other", category="News")
+
+    def test_attributed_to_matching_source_regardless_of_age(self, sample_source):
+        mock_result = MagicMock(returncode=0, stdout=json.dumps(self._entry(channel="Renamed")), stderr="")
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            with patch("src.fetchers.youtube._get_transcript", return_value=("text", ())):
+                with patch("src.fetchers.youtube.time.sleep"):
+                    video = fetch_video("abc123", [self._other_source(), sample_source])
+
+        assert "--dump-json" in mock_run.call_args[0][0]
+        assert (video.channel_name, video.category, video.transcript) == ("Test Channel", "AI", "text")
+        assert video.upload_date == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert video.duration_seconds == 900
+
+    def test_single_source_used_without_matching(self, sample_source):
+        mock_result = MagicMock(returncode=0, stdout=json.dumps(self._entry(channel="Guest", uploader_url="")), stderr="")
+        with patch("subprocess.run", return_value=mock_result):
+            video = fetch_video("abc123", [sample_source], fetch_transcript=False)
+
+        assert video.channel_name == "Test Channel"
+        assert video.transcript is None
+
+    def test_unknown_channel_raises(self, sample_source):
+        entry = self._entry(channel="Guest", channel_url="https://x", uploader_url="https://y")
+        mock_result = MagicMock(returncode=0, stdout=json.dumps(entry), stderr="")
+        with patch("subprocess.run", return_value=mock_result):
+            with pytest.raises(ValueError, match="--source"):
+                fetch_video("abc123", [sample_source, self._other_source()], fetch_transcript=False)
+
+    def test_lookup_failure_raises(self, sample_source):
+        mock_result = MagicMock(returncode=1, stdout="", stderr="Video unavailable")
+        with patch("subprocess.run", return_value=mock_result):
+            with pytest.raises(ValueError, match="Could not look up"):
+                fetch_video("abc123", [sample_source])
+
+
 class TestFetchNewVideosDateFallback:
     """Test that fetch_new_videos fetches the real date when flat-playlist omits it."""
 